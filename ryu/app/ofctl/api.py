@@ -16,6 +16,8 @@
 
 # client for ryu.app.ofctl.service
 
+import time
+
 from ryu.base import app_manager
 from . import event
 
@@ -89,4 +91,92 @@ def send_msg(app, msg, reply_cls=None, reply_multi=False):
                                                  reply_multi=reply_multi))()
 
 
+def send_msgs_async(app, requests, timeout=None):
+    """
+    Send OpenFlow messages without waiting for the replies.
+
+    :param app: Client RyuApp instance
+    :param requests: A list of OpenFlow controller-to-switch messages or
+        tuples of (msg, reply_cls) or (msg, reply_cls, reply_multi) as the
+        arguments of send_msg().  The messages can be for any datapaths.
+    :param timeout: Seconds to wait for the replies of each message.
+        None means no timeout.  The default is None.
+
+    Returns a list of futures, one for each request.  future.result()
+    waits for the reply and returns or raises what send_msg() does;
+    exception.RequestTimeout is raised if the timeout expires.
+    future.done() returns True once the reply is ready and
+    future.add_done_callback(fn) calls fn(future) then, in the thread of
+    ofctl_service.
+
+    The messages are sent as one event to ofctl_service, and the messages
+    for each datapath are written in a few batches.
+
+    Example::
+
+        # ...(snip)...
+        import ryu.app.ofctl.api as ofctl_api
+
+
+        class MyApp(app_manager.RyuApp):
+
+            def _my_handler(self, ev):
+                # ...(snip)...
+                futures = ofctl_api.send_msgs_async(
+                    self,
+                    [(parser.OFPPortDescStatsRequest(datapath=dp),
+                      parser.OFPPortDescStatsReply, True)
+                     for dp in datapaths],
+                    timeout=5)
+                done, not_done = ofctl_api.wait_all(futures)
+                for future in done:
+                    result = future.result()
+    """
+    reqs = []
+    for r in requests:
+        if isinstance(r, tuple):
+            req = event.SendMsgRequest(*r)
+        else:
+            req = event.SendMsgRequest(msg=r)
+        req.future = event.Future()
+        reqs.append(req)
+    app.send_event('ofctl_service',
+                   event.SendMsgsRequest(reqs, timeout=timeout))
+    return [req.future for req in reqs]
+
+
+def send_msg_async(app, msg, reply_cls=None, reply_multi=False,
+                   timeout=None):
+    """
+    Send an OpenFlow message without waiting for the replies.
+
+    The arguments are the same as send_msg() and send_msgs_async().
+    Returns a future; see send_msgs_async().
+    """
+    return send_msgs_async(app, [(msg, reply_cls, reply_multi)],
+                           timeout=timeout)[0]
+
+
+def wait_all(futures, timeout=None):
+    """
+    Wait for the futures returned by send_msgs_async() to be done.
+
+    :param futures: A list of futures
+    :param timeout: Seconds to wait for or None to wait for all.
+
+    Returns a tuple of the list of the futures done and the list of the
+    futures not done.
+    """
+    if timeout is not None:
+        end = time.time() + timeout
+    for future in futures:
+        if timeout is None:
+            future.wait()
+        elif not future.wait(max(0, end - time.time())):
+            break
+    done = [f for f in futures if f.done()]
+    not_done = [f for f in futures if not f.done()]
+    return (done, not_done)
+
+
 app_manager.require_app('ryu.app.ofctl.service', api_style=True)
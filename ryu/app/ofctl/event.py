@@ -17,6 +17,9 @@
 import numbers
 
 from ryu.controller import event
+from ryu.lib import hub
+
+from . import exception
 
 
 # base classes
@@ -47,6 +50,17 @@ class SendMsgRequest(_RequestBase):
         self.msg = msg
         self.reply_cls = reply_cls
         self.reply_multi = reply_multi
+        self.future = None
+
+
+# send msgs without waiting for the replies
+
+class SendMsgsRequest(_RequestBase):
+    def __init__(self, requests, timeout=None):
+        super(SendMsgsRequest, self).__init__()
+        # list of SendMsgRequest with future
+        self.requests = requests
+        self.timeout = timeout
 
 
 # generic reply
@@ -60,3 +74,38 @@ class Reply(_ReplyBase):
         if self.exception:
             raise self.exception
         return self.result
+
+
+# the reply of a SendMsgRequest in SendMsgsRequest
+
+class Future(object):
+    def __init__(self):
+        self._event = hub.Event()
+        self._reply = None
+        self._callbacks = []
+
+    def done(self):
+        return self._reply is not None
+
+    def wait(self, timeout=None):
+        return self._event.wait(timeout)
+
+    def result(self, timeout=None):
+        if not self._event.wait(timeout):
+            raise exception.RequestTimeout(result=None)
+        return self._reply()
+
+    def add_done_callback(self, fn):
+        if self._reply is not None:
+            fn(self)
+        else:
+            self._callbacks.append(fn)
+
+    def set_reply(self, rep):
+        assert self._reply is None
+        self._reply = rep
+        self._event.set()
+        callbacks = self._callbacks
+        self._callbacks = []
+        for fn in callbacks:
+            fn(self)
@@ -44,3 +44,9 @@ class InvalidDatapath(_ExceptionBase):
     """
 
     message = 'Datapath Invalid %(result)s'
+
+
+class RequestTimeout(_ExceptionBase):
+    """No reply is received within the timeout of the request."""
+
+    message = 'Request Timeout %(result)s'
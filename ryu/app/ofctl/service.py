@@ -16,7 +16,9 @@
 
 # ofctl service
 
+import collections
 import numbers
+import time
 
 from ryu.base import app_manager
 
@@ -24,6 +26,8 @@ from ryu.controller import ofp_event
 from ryu.controller.handler import CONFIG_DISPATCHER, MAIN_DISPATCHER,\
     DEAD_DISPATCHER
 from ryu.controller.handler import set_ev_cls
+from ryu.lib import hub
+from ryu.lib import timer_wheel
 
 from . import event
 from . import exception
@@ -43,6 +47,32 @@ class OfctlService(app_manager.RyuApp):
         self.name = 'ofctl_service'
         self._switches = {}
         self._observing_events = {}
+        # (_SwitchInfo, barrier xid) of the requests with timeout
+        self._wheel = timer_wheel.TimerWheel()
+        self._wheel_ev = hub.Event()
+
+    def start(self):
+        super(OfctlService, self).start()
+        self.threads.append(hub.spawn(self._timeout_loop))
+
+    def stop(self):
+        self.is_active = False
+        self._wheel_ev.set()
+        super(OfctlService, self).stop()
+
+    def _timeout_loop(self):
+        while self.is_active:
+            self._wheel_ev.wait(self._wheel.next_timeout(time.time()))
+            self._wheel_ev.clear()
+            self._expire(time.time())
+
+    def _expire(self, now):
+        for (info, barrier_xid) in self._wheel.pop_expired(now):
+            if barrier_xid not in info.barriers:
+                continue
+            req = info.xids[info.barriers[barrier_xid]]
+            self._cancel(info, barrier_xid,
+                         exception.RequestTimeout(result=req.msg))
 
     def _observe_msg(self, msg_cls):
         assert msg_cls is not None
@@ -64,7 +94,14 @@ class OfctlService(app_manager.RyuApp):
             self.unobserve_event(ev_cls)
             self.logger.debug('ofctl: stop observing %s', ev_cls)
 
+    def _reply(self, req, rep):
+        if req.future is not None:
+            req.future.set_reply(rep)
+        else:
+            self.reply_to_request(req, rep)
+
     def _cancel(self, info, barrier_xid, exception):
+        self._wheel.cancel((info, barrier_xid))
         xid = info.barriers.pop(barrier_xid)
         req = info.xids.pop(xid)
         msg = req.msg
@@ -77,8 +114,9 @@ class OfctlService(app_manager.RyuApp):
         if not is_barrier and req.reply_cls is not None:
             self._unobserve_msg(req.reply_cls)
 
-        self.logger.error('failed to send message <%s>', req.msg)
-        self.reply_to_request(req, event.Reply(exception=exception))
+        self.logger.error('failed to send message <%s>: %s', req.msg,
+                          exception)
+        self._reply(req, event.Reply(exception=exception))
 
     @staticmethod
     def _is_error(msg):
@@ -128,22 +166,13 @@ class OfctlService(app_manager.RyuApp):
                 result = self._switches[req.dpid].datapath
         self.reply_to_request(req, event.Reply(result=result))
 
-    @set_ev_cls(event.SendMsgRequest, MAIN_DISPATCHER)
-    def _handle_send_msg(self, req):
+    def _store(self, si, req):
+        # Register req and returns the barrier request which follows it.
         msg = req.msg
         datapath = msg.datapath
         parser = datapath.ofproto_parser
         is_barrier = isinstance(msg, parser.OFPBarrierRequest)
 
-        try:
-            si = self._switches[datapath.id]
-        except KeyError:
-            self.logger.error('unknown dpid %s' % (datapath.id,))
-            rep = event.Reply(exception=exception.
-                              InvalidDatapath(result=datapath.id))
-            self.reply_to_request(req, rep)
-            return
-
         def _store_xid(xid, barrier_xid):
             assert xid not in si.results
             assert xid not in si.xids
@@ -163,16 +192,68 @@ class OfctlService(app_manager.RyuApp):
             barrier = datapath.ofproto_parser.OFPBarrierRequest(datapath)
             datapath.set_xid(barrier)
             _store_xid(msg.xid, barrier.xid)
-            if not datapath.send_msg(msg):
-                return self._cancel(
-                    si, barrier.xid,
-                    exception.InvalidDatapath(result=datapath.id))
+        return barrier
+
+    @set_ev_cls(event.SendMsgRequest, MAIN_DISPATCHER)
+    def _handle_send_msg(self, req):
+        msg = req.msg
+        datapath = msg.datapath
+
+        try:
+            si = self._switches[datapath.id]
+        except KeyError:
+            self.logger.error('unknown dpid %s' % (datapath.id,))
+            rep = event.Reply(exception=exception.
+                              InvalidDatapath(result=datapath.id))
+            self._reply(req, rep)
+            return
+
+        barrier = self._store(si, req)
+        if barrier is not msg and not datapath.send_msg(msg):
+            return self._cancel(
+                si, barrier.xid,
+                exception.InvalidDatapath(result=datapath.id))
 
         if not datapath.send_msg(barrier):
             return self._cancel(
                 si, barrier.xid,
                 exception.InvalidDatapath(result=datapath.id))
 
+    @set_ev_cls(event.SendMsgsRequest, MAIN_DISPATCHER)
+    def _handle_send_msgs(self, req):
+        now = time.time()
+        # _SwitchInfo -> ([msgs], [(barrier xid, number of msgs up to it)])
+        sends = collections.OrderedDict()
+        for r in req.requests:
+            datapath = r.msg.datapath
+            try:
+                si = self._switches[datapath.id]
+            except KeyError:
+                self.logger.error('unknown dpid %s' % (datapath.id,))
+                rep = event.Reply(exception=exception.
+                                  InvalidDatapath(result=datapath.id))
+                self._reply(r, rep)
+                continue
+            (msgs, barriers) = sends.setdefault(si, ([], []))
+            barrier = self._store(si, r)
+            if barrier is not r.msg:
+                msgs.append(r.msg)
+            msgs.append(barrier)
+            barriers.append((barrier.xid, len(msgs)))
+            if req.timeout is not None:
+                self._wheel.schedule((si, barrier.xid), now + req.timeout)
+
+        # The messages of each switch are written in a few batches.
+        for (si, (msgs, barriers)) in sends.items():
+            queued = si.datapath.send_msgs(msgs)
+            for (barrier_xid, count) in barriers:
+                if count > queued:
+                    self._cancel(
+                        si, barrier_xid,
+                        exception.InvalidDatapath(result=si.datapath.id))
+        if req.timeout is not None:
+            self._wheel_ev.set()
+
     @set_ev_cls(ofp_event.EventOFPBarrierReply, MAIN_DISPATCHER)
     def _handle_barrier(self, ev):
         msg = ev.msg
@@ -188,6 +269,7 @@ class OfctlService(app_manager.RyuApp):
         except KeyError:
             self.logger.error('unknown barrier xid %s', msg.xid)
             return
+        self._wheel.cancel((si, msg.xid))
         result = si.results.pop(xid)
         req = si.xids.pop(xid)
         is_barrier = isinstance(req.msg, parser.OFPBarrierRequest)
@@ -206,7 +288,7 @@ class OfctlService(app_manager.RyuApp):
         else:
             rep = event.Reply(exception=exception.
                               UnexpectedMultiReply(result=result))
-        self.reply_to_request(req, rep)
+        self._reply(req, rep)
 
     @set_ev_cls(ofp_event.EventOFPErrorMsg, MAIN_DISPATCHER)
     def _handle_reply(self, ev):
@@ -28,6 +28,7 @@ from ryu.ofproto import ofproto_v1_2
 from ryu.ofproto import ofproto_v1_3
 from ryu.ofproto import ofproto_v1_4
 from ryu.ofproto import ofproto_v1_5
+from ryu.lib import ofctl_utils
 from ryu.lib import ofctl_v1_0
 from ryu.lib import ofctl_v1_2
 from ryu.lib import ofctl_v1_3
@@ -48,6 +49,9 @@ supported_ofctl = {
     ofproto_v1_5.OFP_VERSION: ofctl_v1_5,
 }
 
+# seconds to wait for the replies of all switches to /stats/*/all
+STATS_ALL_TIMEOUT = 5.0
+
 # REST API
 #
 
@@ -71,6 +75,10 @@ supported_ofctl = {
 # get flows stats of the switch filtered by the fields
 # POST /stats/flow/<dpid>
 #
+# get flows stats of all switches (optionally filtered by the fields)
+# GET /stats/flow/all
+# POST /stats/flow/all
+#
 # get aggregate flows stats of the switch
 # GET /stats/aggregateflow/<dpid>
 #
@@ -87,6 +95,12 @@ supported_ofctl = {
 # GET /stats/port/<dpid>[/<port>]
 # Note: Specification of port number is optional
 #
+# get ports stats of all switches
+# GET /stats/port/all
+# Note: The switches are requested concurrently, and the stats of each
+#       switch are sent as soon as they are received.  The switches which
+#       do not reply in time are reported with null.
+#
 # get queues stats of the switch
 # GET /stats/queue/<dpid>[/<port>[/<queue_id>]]
 # Note: Specification of port number and queue id are optional
@@ -215,6 +229,8 @@ def stats_method(method):
         # Invoke StatsController method
         try:
             ret = method(self, req, dp, ofctl, *args, **kwargs)
+            if isinstance(ret, Response):
+                return ret
             return Response(content_type='application/json',
                             body=json.dumps(ret))
         except ValueError:
@@ -292,6 +308,56 @@ def command_method(method):
     return wrapper
 
 
+def stats_all_method(method):
+    def wrapper(self, req, *args, **kwargs):
+        # Invoke StatsController method to get the name of lib/ofctl_*
+        # function and the arguments
+        try:
+            name, args = method(self, req, *args, **kwargs)
+        except ValueError:
+            LOG.exception('Invalid syntax: %s', req.body)
+            return Response(status=400)
+
+        funcs = {}
+        for version, ofctl in supported_ofctl.items():
+            if hasattr(ofctl, name):
+                funcs[version] = getattr(ofctl, name)
+        dps = list(self.dpset.dps.values())
+        results = ofctl_utils.get_stats_all(
+            dps, funcs, self.waiters, *args, timeout=STATS_ALL_TIMEOUT,
+            logger=LOG)
+        return Response(content_type='application/json',
+                        app_iter=_stats_all_iter(results))
+
+    return wrapper
+
+
+def _stats_all_iter(results):
+    # Generates a JSON object of dpid to stats, one switch at a time.
+    yield b'{'
+    sep = b''
+    for dp, ret in results:
+        if ret is None or isinstance(ret, Exception):
+            LOG.error('Failed to get stats from Datapath %s: %s', dp.id, ret)
+            ret = {str(dp.id): None}
+        for key, value in ret.items():
+            yield sep + ('%s: %s' % (json.dumps(key),
+                                     json.dumps(value))).encode('utf-8')
+            sep = b', '
+    yield b'}'
+
+
+def _stats_list_iter(dp, entries):
+    # Generates the same JSON as json.dumps({str(dp.id): list(entries)}),
+    # one entry at a time.
+    yield ('{%s: [' % json.dumps(str(dp.id))).encode('utf-8')
+    sep = ''
+    for entry in entries:
+        yield (sep + json.dumps(entry)).encode('utf-8')
+        sep = ', '
+    yield b']}'
+
+
 class StatsController(ControllerBase):
     def __init__(self, req, link, data, **config):
         super(StatsController, self).__init__(req, link, data, **config)
@@ -315,8 +381,19 @@ class StatsController(ControllerBase):
     @stats_method
     def get_flow_stats(self, req, dp, ofctl, **kwargs):
         flow = req.json if req.body else {}
+        if hasattr(ofctl, 'iter_flow_stats'):
+            # Stream the flow entries as the replies arrive rather than
+            # building the whole table.
+            flows = ofctl.iter_flow_stats(dp, self.waiters, flow)
+            return Response(content_type='application/json',
+                            app_iter=_stats_list_iter(dp, flows))
         return ofctl.get_flow_stats(dp, self.waiters, flow)
 
+    @stats_all_method
+    def get_flow_stats_all(self, req, **kwargs):
+        flow = req.json if req.body else {}
+        return 'get_flow_stats', (flow,)
+
     @stats_method
     def get_aggregate_flow_stats(self, req, dp, ofctl, **kwargs):
         flow = req.json if req.body else {}
@@ -337,6 +414,10 @@ class StatsController(ControllerBase):
 
         return ofctl.get_port_stats(dp, self.waiters, port)
 
+    @stats_all_method
+    def get_port_stats_all(self, req, **kwargs):
+        return 'get_port_stats', ()
+
     @stats_method
     def get_queue_stats(self, req, dp, ofctl,
                         port=None, queue_id=None, **kwargs):
@@ -527,6 +608,17 @@ class RestStatsApi(app_manager.RyuApp):
                        controller=StatsController, action='get_dpids',
                        conditions=dict(method=['GET']))
 
+        # Must be connected before '/flow/{dpid}' and '/port/{dpid}'
+        uri = path + '/flow/all'
+        mapper.connect('stats', uri,
+                       controller=StatsController, action='get_flow_stats_all',
+                       conditions=dict(method=['GET', 'POST']))
+
+        uri = path + '/port/all'
+        mapper.connect('stats', uri,
+                       controller=StatsController, action='get_port_stats_all',
+                       conditions=dict(method=['GET']))
+
         uri = path + '/desc/{dpid}'
         mapper.connect('stats', uri,
                        controller=StatsController, action='get_desc_stats',
@@ -756,7 +848,8 @@ class RestStatsApi(app_manager.RyuApp):
 
         if msg.flags & flags:
             return
-        del self.waiters[dp.id][msg.xid]
+        # The waiter is already dropped if its consumer stalled.
+        self.waiters[dp.id].pop(msg.xid, None)
         lock.set()
 
     @set_ev_cls([ofp_event.EventOFPSwitchFeatures,
@@ -19,14 +19,15 @@ An OpenFlow 1.0 L2 learning switch implementation.
 
 
 from ryu.base import app_manager
+from ryu.controller import mac_to_port
 from ryu.controller import ofp_event
 from ryu.controller.handler import MAIN_DISPATCHER
 from ryu.controller.handler import set_ev_cls
 from ryu.ofproto import ofproto_v1_0
 from ryu.lib.mac import haddr_to_bin
-from ryu.lib.packet import packet
-from ryu.lib.packet import ethernet
+from ryu.lib.mac import int_to_haddr
 from ryu.lib.packet import ether_types
+from ryu.lib.packet import header_fields
 
 
 class SimpleSwitch(app_manager.RyuApp):
@@ -34,6 +35,7 @@ class SimpleSwitch(app_manager.RyuApp):
 
     def __init__(self, *args, **kwargs):
         super(SimpleSwitch, self).__init__(*args, **kwargs)
+        # dpid -> mac_to_port.MacTable
         self.mac_to_port = {}
 
     def add_flow(self, datapath, in_port, dst, src, actions):
@@ -56,26 +58,27 @@ class SimpleSwitch(app_manager.RyuApp):
         datapath = msg.datapath
         ofproto = datapath.ofproto
 
-        pkt = packet.Packet(msg.data)
-        eth = pkt.get_protocol(ethernet.ethernet)
+        (eth_dst, eth_src, _vid, eth_type) = header_fields.extract(
+            msg.data)[:4]
 
-        if eth.ethertype == ether_types.ETH_TYPE_LLDP:
+        if eth_type == ether_types.ETH_TYPE_LLDP:
             # ignore lldp packet
             return
-        dst = eth.dst
-        src = eth.src
+        dst = int_to_haddr(eth_dst)
+        src = int_to_haddr(eth_src)
 
         dpid = datapath.id
-        self.mac_to_port.setdefault(dpid, {})
+        mac_table = self.mac_to_port.get(dpid)
+        if mac_table is None:
+            mac_table = self.mac_to_port[dpid] = mac_to_port.MacTable()
 
         self.logger.info("packet in %s %s %s %s", dpid, src, dst, msg.in_port)
 
         # learn a mac address to avoid FLOOD next time.
-        self.mac_to_port[dpid][src] = msg.in_port
+        mac_table.learn(eth_src, msg.in_port)
 
-        if dst in self.mac_to_port[dpid]:
-            out_port = self.mac_to_port[dpid][dst]
-        else:
+        out_port = mac_table.get(eth_dst)
+        if out_port is None:
             out_port = ofproto.OFPP_FLOOD
 
         actions = [datapath.ofproto_parser.OFPActionOutput(out_port)]
@@ -14,13 +14,14 @@
 # limitations under the License.
 
 from ryu.base import app_manager
+from ryu.controller import mac_to_port
 from ryu.controller import ofp_event
 from ryu.controller.handler import MAIN_DISPATCHER
 from ryu.controller.handler import set_ev_cls
 from ryu.ofproto import ofproto_v1_2
-from ryu.lib.packet import packet
-from ryu.lib.packet import ethernet
+from ryu.lib.mac import int_to_haddr
 from ryu.lib.packet import ether_types
+from ryu.lib.packet import header_fields
 
 
 class SimpleSwitch12(app_manager.RyuApp):
@@ -28,6 +29,7 @@ class SimpleSwitch12(app_manager.RyuApp):
 
     def __init__(self, *args, **kwargs):
         super(SimpleSwitch12, self).__init__(*args, **kwargs)
+        # dpid -> mac_to_port.MacTable
         self.mac_to_port = {}
 
     def add_flow(self, datapath, port, dst, src, actions):
@@ -55,26 +57,27 @@ class SimpleSwitch12(app_manager.RyuApp):
         ofproto = datapath.ofproto
         in_port = msg.match['in_port']
 
-        pkt = packet.Packet(msg.data)
-        eth = pkt.get_protocols(ethernet.ethernet)[0]
+        (eth_dst, eth_src, _vid, eth_type) = header_fields.extract(
+            msg.data)[:4]
 
-        if eth.ethertype == ether_types.ETH_TYPE_LLDP:
+        if eth_type == ether_types.ETH_TYPE_LLDP:
             # ignore lldp packet
             return
-        dst = eth.dst
-        src = eth.src
+        dst = int_to_haddr(eth_dst)
+        src = int_to_haddr(eth_src)
 
         dpid = datapath.id
-        self.mac_to_port.setdefault(dpid, {})
+        mac_table = self.mac_to_port.get(dpid)
+        if mac_table is None:
+            mac_table = self.mac_to_port[dpid] = mac_to_port.MacTable()
 
         self.logger.info("packet in %s %s %s %s", dpid, src, dst, in_port)
 
         # learn a mac address to avoid FLOOD next time.
-        self.mac_to_port[dpid][src] = in_port
+        mac_table.learn(eth_src, in_port)
 
-        if dst in self.mac_to_port[dpid]:
-            out_port = self.mac_to_port[dpid][dst]
-        else:
+        out_port = mac_table.get(eth_dst)
+        if out_port is None:
             out_port = ofproto.OFPP_FLOOD
 
         actions = [datapath.ofproto_parser.OFPActionOutput(out_port)]
@@ -14,6 +14,7 @@
 # limitations under the License.
 
 from ryu.base import app_manager
+from ryu.controller import mac_to_port
 from ryu.controller import ofp_event
 from ryu.controller.handler import CONFIG_DISPATCHER
 from ryu.controller.handler import MAIN_DISPATCHER
@@ -21,6 +22,8 @@ from ryu.controller.handler import set_ev_cls
 from ryu.ofproto import ofproto_v1_3
 from ryu.lib import lacplib
 from ryu.lib.dpid import str_to_dpid
+from ryu.lib.mac import haddr_to_int
+from ryu.lib.mac import int_to_haddr
 from ryu.lib.packet import packet
 from ryu.lib.packet import ethernet
 from ryu.app import simple_switch_13
@@ -32,6 +35,7 @@ class SimpleSwitchLacp13(simple_switch_13.SimpleSwitch13):
 
     def __init__(self, *args, **kwargs):
         super(SimpleSwitchLacp13, self).__init__(*args, **kwargs)
+        # dpid -> mac_to_port.MacTable
         self.mac_to_port = {}
         self._lacp = kwargs['lacplib']
         self._lacp.add(
@@ -63,16 +67,17 @@ class SimpleSwitchLacp13(simple_switch_13.SimpleSwitch13):
         src = eth.src
 
         dpid = datapath.id
-        self.mac_to_port.setdefault(dpid, {})
+        mac_table = self.mac_to_port.get(dpid)
+        if mac_table is None:
+            mac_table = self.mac_to_port[dpid] = mac_to_port.MacTable()
 
         self.logger.info("packet in %s %s %s %s", dpid, src, dst, in_port)
 
         # learn a mac address to avoid FLOOD next time.
-        self.mac_to_port[dpid][src] = in_port
+        mac_table.learn(haddr_to_int(src), in_port)
 
-        if dst in self.mac_to_port[dpid]:
-            out_port = self.mac_to_port[dpid][dst]
-        else:
+        out_port = mac_table.get(haddr_to_int(dst))
+        if out_port is None:
             out_port = ofproto.OFPP_FLOOD
 
         actions = [parser.OFPActionOutput(out_port)]
@@ -99,8 +104,8 @@ class SimpleSwitchLacp13(simple_switch_13.SimpleSwitch13):
         self.logger.info("slave state changed port: %d enabled: %s",
                          port_no, enabled)
         if dpid in self.mac_to_port:
-            for mac in self.mac_to_port[dpid]:
-                match = datapath.ofproto_parser.OFPMatch(eth_dst=mac)
+            for (mac, _port, _ts) in self.mac_to_port[dpid].export():
+                match = datapath.ofproto_parser.OFPMatch(
+                    eth_dst=int_to_haddr(mac))
                 self.del_flow(datapath, match)
-            del self.mac_to_port[dpid]
-        self.mac_to_port.setdefault(dpid, {})
+        self.mac_to_port[dpid] = mac_to_port.MacTable()
@@ -16,6 +16,7 @@
 import json
 
 from ryu.app import simple_switch_13
+from ryu.controller import mac_to_port
 from ryu.controller import ofp_event
 from ryu.controller.handler import CONFIG_DISPATCHER
 from ryu.controller.handler import set_ev_cls
@@ -24,6 +25,8 @@ from ryu.app.wsgi import Response
 from ryu.app.wsgi import route
 from ryu.app.wsgi import WSGIApplication
 from ryu.lib import dpid as dpid_lib
+from ryu.lib.mac import haddr_to_int
+from ryu.lib.mac import int_to_haddr
 
 simple_switch_instance_name = 'simple_switch_api_app'
 url = '/simpleswitch/mactable/{dpid}'
@@ -45,10 +48,20 @@ class SimpleSwitchRest13(simple_switch_13.SimpleSwitch13):
         super(SimpleSwitchRest13, self).switch_features_handler(ev)
         datapath = ev.msg.datapath
         self.switches[datapath.id] = datapath
-        self.mac_to_port.setdefault(datapath.id, {})
+        if datapath.id not in self.mac_to_port:
+            self.mac_to_port[datapath.id] = mac_to_port.MacTable()
+
+    def get_mac_to_port(self, dpid):
+        mac_table = self.mac_to_port.get(dpid)
+        if mac_table is None:
+            return {}
+        return dict((int_to_haddr(mac), port)
+                    for (mac, port, _ts) in mac_table.export())
 
     def set_mac_to_port(self, dpid, entry):
-        mac_table = self.mac_to_port.setdefault(dpid, {})
+        mac_table = self.mac_to_port.get(dpid)
+        if mac_table is None:
+            mac_table = self.mac_to_port[dpid] = mac_to_port.MacTable()
         datapath = self.switches.get(dpid)
 
         entry_port = entry['port']
@@ -56,9 +69,10 @@ class SimpleSwitchRest13(simple_switch_13.SimpleSwitch13):
 
         if datapath is not None:
             parser = datapath.ofproto_parser
-            if entry_port not in mac_table.values():
+            known = self.get_mac_to_port(dpid)
+            if entry_port not in known.values():
 
-                for mac, port in mac_table.items():
+                for mac, port in known.items():
 
                     # from known device to new device
                     actions = [parser.OFPActionOutput(entry_port)]
@@ -70,8 +84,8 @@ class SimpleSwitchRest13(simple_switch_13.SimpleSwitch13):
                     match = parser.OFPMatch(in_port=entry_port, eth_dst=mac)
                     self.add_flow(datapath, 1, match, actions)
 
-                mac_table.update({entry_mac: entry_port})
-        return mac_table
+                mac_table.learn(haddr_to_int(entry_mac), entry_port)
+        return self.get_mac_to_port(dpid)
 
 
 class SimpleSwitchController(ControllerBase):
@@ -90,7 +104,7 @@ class SimpleSwitchController(ControllerBase):
         if dpid not in simple_switch.mac_to_port:
             return Response(status=404)
 
-        mac_table = simple_switch.mac_to_port.get(dpid, {})
+        mac_table = simple_switch.get_mac_to_port(dpid)
         body = json.dumps(mac_table)
         return Response(content_type='application/json', body=body)
 
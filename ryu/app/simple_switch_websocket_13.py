@@ -50,6 +50,7 @@ from ryu.app.wsgi import WebSocketRPCServer
 from ryu.app.wsgi import WSGIApplication
 from ryu.controller import ofp_event
 from ryu.controller.handler import set_ev_cls
+from ryu.lib.mac import int_to_haddr
 from ryu.lib.packet import packet
 
 
@@ -81,7 +82,9 @@ class SimpleSwitchWebSocket13(simple_switch_13.SimpleSwitch13):
 
     @rpc_public
     def get_arp_table(self):
-        return self.mac_to_port
+        return dict((dpid, dict((int_to_haddr(mac), port)
+                                for (mac, port, _ts) in mac_table.export()))
+                    for (dpid, mac_table) in self.mac_to_port.items())
 
 
 class SimpleSwitchWebSocketController(ControllerBase):
@@ -29,19 +29,24 @@ import logging
 import sys
 import os
 import gc
+import time
 
 from ryu import cfg
+from ryu import flags  # For loading 'app-event-queue' option definition
 from ryu import utils
 from ryu.app import wsgi
 from ryu.controller.handler import register_instance, get_dependent_services
 from ryu.controller.controller import Datapath
 from ryu.controller import event
 from ryu.controller.event import EventRequestBase, EventReplyBase
+from ryu.lib import event_queue
 from ryu.lib import hub
 from ryu.ofproto import ofproto_protocol
 
 LOG = logging.getLogger('ryu.base.app_manager')
 
+CONF = cfg.CONF
+
 SERVICE_BRICKS = {}
 
 
@@ -150,15 +155,93 @@ class RyuApp(object):
         """
         return iter(cls._CONTEXTS.items())
 
+    EVENT_QUEUE_SIZE = 128
+    """
+    The capacity of the event queue of this RyuApp.
+    It can be changed by --app-event-queue option.
+    """
+
+    EVENT_QUEUE_POLICY = event_queue.POLICY_BLOCK
+    """
+    What to do when an event is sent while the event queue is full.
+    One of the following.  It can be changed by --app-event-queue option.
+
+    ============================== ==========================================
+    Policy                         Description
+    ============================== ==========================================
+    event_queue.POLICY_BLOCK       The sender waits for a free slot.
+                                   (The default)
+    event_queue.POLICY_DROP_OLD    The oldest queued event is dropped.
+    event_queue.POLICY_DROP_NEW    The new event is dropped.
+    event_queue.POLICY_COALESCE    The queued event which has the same
+                                   event_queue_key() as the new event is
+                                   replaced with it.  The sender waits if
+                                   there is no such event.
+    ============================== ==========================================
+
+    Choosing a policy other than block prevents a slow application from
+    stalling the senders, e.g. the receive loops of all switches on a flood
+    of packet-in.  Synchronous requests and their replies are never dropped.
+    """
+
+    EVENT_QUEUE_METRICS = False
+    """
+    Whether to record the latency of the event handlers of this RyuApp in
+    the histograms reported by event_queue_stats().  Timing every handler
+    call costs some time, so it is off by default.  It can be enabled by
+    --app-event-queue option.
+    """
+
+    EVENT_COALESCE = {}
+    """
+    A dictionary to specify events which this RyuApp wants to receive
+    coalesced.  Its key is an event class and its value is a tuple of
+    (key function, window in seconds).
+
+    When an event of the class is sent to this RyuApp, it is held for the
+    window, and the later events of the class which have the same key (the
+    return value of the key function) replace it.  Only the latest one is
+    queued at the end of the window.  The replaced events are counted in
+    event_queue_stats() and dropped.  If the key function returns None,
+    the event is queued at once after the held events of the class.
+
+    Example::
+
+        EVENT_COALESCE = {
+            ofp_event.EventOFPPortStatus: (ofp_event.port_status_key, 0.05),
+        }
+    """
+
+    GLOBAL_VIEW = None
+    """
+    Whether this RyuApp needs to know all the datapaths connected to the
+    controller, e.g. to discover the links between them or to serve a REST
+    API about them.  ryu-manager refuses to shard the datapaths across
+    worker processes (--ofp-workers), each of which knows only a part of
+    them, if such an application is loaded.
+
+    If None, the default, True only for the RyuApps which serve WSGI
+    applications (have ryu.app.wsgi.WSGIApplication in _CONTEXTS), as
+    only the first worker process serves them.
+    """
+
     def __init__(self, *_args, **_kwargs):
         super(RyuApp, self).__init__()
         self.name = self.__class__.__name__
         self.event_handlers = {}        # ev_cls -> handlers:list
         self.observers = {}     # ev_cls -> observer-name -> states:set
+        # Dispatch tables computed from the above on demand.
+        # Invalidated whenever a handler or an observer is (un)registered.
+        self._handlers_table = {}   # (ev_cls, state) -> handlers:list
+        self._observers_table = {}  # (ev_cls, state) -> observer-names:list
         self.threads = []
         self.main_thread = None
-        self.events = hub.Queue(128)
-        self._events_sem = hub.BoundedSemaphore(self.events.maxsize)
+        self.events = None
+        self.event_queue_metrics = self.EVENT_QUEUE_METRICS
+        self.set_event_queue(self.EVENT_QUEUE_SIZE, self.EVENT_QUEUE_POLICY)
+        self.handler_latency = {}   # handler name -> LatencyHistogram
+        self._coalesce_pending = {}  # (ev_cls, key) -> [ev, state]
+        self._coalesce_dropped = {}  # ev_cls name -> count
         if hasattr(self.__class__, 'LOGGER_NAME'):
             self.logger = logging.getLogger(self.__class__.LOGGER_NAME)
         else:
@@ -192,29 +275,85 @@ class RyuApp(object):
         """
         self.main_thread = thread
 
+    def set_event_queue(self, size=None, policy=None, metrics=None):
+        """
+        Replace the event queue with one of the given capacity and policy.
+        The queued events are moved to the new queue.
+        If metrics is given, it enables or disables recording the latency
+        of the event handlers.  See EVENT_QUEUE_METRICS.
+        """
+        if metrics is not None:
+            self.event_queue_metrics = metrics
+        old = self.events
+        if size is None:
+            size = old.maxsize
+        if policy is None:
+            policy = old.policy
+        self.events = event_queue.EventQueue(
+            size, policy, key=lambda item: self.event_queue_key(item[0]))
+        while old is not None and not old.empty():
+            self.events.put(old.get(), force=True)
+
+    def event_queue_key(self, ev):
+        """
+        Returns the key to coalesce ev with the queued events when
+        EVENT_QUEUE_POLICY is event_queue.POLICY_COALESCE, or None if ev
+        should not be coalesced.
+
+        The default implementation returns None for all events.
+
+        Example::
+
+            def event_queue_key(self, ev):
+                if isinstance(ev, ofp_event.EventOFPPortStatus):
+                    return (ev.__class__, ev.msg.datapath.id,
+                            ev.msg.desc.port_no)
+                return None
+        """
+        return None
+
+    def event_queue_stats(self):
+        """
+        Returns a dict of the metrics of the event queue: the current
+        depth, the high-water mark, the numbers of dropped, coalesced and
+        blocked events, and the latency histograms of the handlers (empty
+        unless EVENT_QUEUE_METRICS is enabled).
+        """
+        stats = self.events.stats()
+        stats['handler_latency'] = dict(
+            (name, h.to_dict()) for name, h in self.handler_latency.items())
+        stats['coalesce_pending'] = len(self._coalesce_pending)
+        stats['coalesce_dropped'] = dict(self._coalesce_dropped)
+        return stats
+
     def register_handler(self, ev_cls, handler):
         assert callable(handler)
         self.event_handlers.setdefault(ev_cls, [])
         self.event_handlers[ev_cls].append(handler)
+        self._handlers_table.clear()
 
     def unregister_handler(self, ev_cls, handler):
         assert callable(handler)
         self.event_handlers[ev_cls].remove(handler)
         if not self.event_handlers[ev_cls]:
             del self.event_handlers[ev_cls]
+        self._handlers_table.clear()
 
     def register_observer(self, ev_cls, name, states=None):
         states = states or set()
         ev_cls_observers = self.observers.setdefault(ev_cls, {})
         ev_cls_observers.setdefault(name, set()).update(states)
+        self._observers_table.clear()
 
     def unregister_observer(self, ev_cls, name):
         observers = self.observers.get(ev_cls, {})
         observers.pop(name)
+        self._observers_table.clear()
 
     def unregister_observer_all_event(self, name):
         for observers in self.observers.values():
             observers.pop(name, None)
+        self._observers_table.clear()
 
     def observe_event(self, ev_cls, states=None):
         brick = _lookup_service_brick_by_ev_cls(ev_cls)
@@ -237,9 +376,18 @@ class RyuApp(object):
                       The default is None.
         """
         ev_cls = ev.__class__
+        try:
+            return self._handlers_table[(ev_cls, state)]
+        except KeyError:
+            pass
+        handlers = self._handlers_table[(ev_cls, state)] = \
+            self._build_handlers(ev_cls, state)
+        return handlers
+
+    def _build_handlers(self, ev_cls, state):
         handlers = self.event_handlers.get(ev_cls, [])
         if state is None:
-            return handlers
+            return list(handlers)
 
         def test(h):
             if not hasattr(h, 'callers') or ev_cls not in h.callers:
@@ -252,11 +400,21 @@ class RyuApp(object):
                 return True
             return state in states
 
-        return filter(test, handlers)
+        return [h for h in handlers if test(h)]
 
     def get_observers(self, ev, state):
+        ev_cls = ev.__class__
+        try:
+            return self._observers_table[(ev_cls, state)]
+        except KeyError:
+            pass
+        observers = self._observers_table[(ev_cls, state)] = \
+            self._build_observers(ev_cls, state)
+        return observers
+
+    def _build_observers(self, ev_cls, state):
         observers = []
-        for k, v in self.observers.get(ev.__class__, {}).items():
+        for k, v in self.observers.get(ev_cls, {}).items():
             if not state or not v or state in v:
                 observers.append(k)
 
@@ -281,11 +439,13 @@ class RyuApp(object):
     def _event_loop(self):
         while self.is_active or not self.events.empty():
             ev, state = self.events.get()
-            self._events_sem.release()
             if ev == self._event_stop:
                 continue
             handlers = self.get_handlers(ev, state)
+            metrics = self.event_queue_metrics
             for handler in handlers:
+                if metrics:
+                    start = time.time()
                 try:
                     handler(ev)
                 except hub.TaskExit:
@@ -297,10 +457,56 @@ class RyuApp(object):
                                   'Backtrace from offending handler '
                                   '[%s] servicing event [%s] follows.',
                                   self.name, handler.__name__, ev.__class__.__name__)
+                if metrics:
+                    self._record_latency(handler, time.time() - start)
+
+    def _record_latency(self, handler, latency):
+        try:
+            histogram = self.handler_latency[handler.__name__]
+        except KeyError:
+            histogram = self.handler_latency[handler.__name__] = \
+                event_queue.LatencyHistogram()
+        histogram.add(latency)
+
+    def _coalesce_event(self, ev, state, key_func, window):
+        ev_cls = ev.__class__
+        key = key_func(ev)
+        if key is None:
+            # Keep the order of the events of the class.
+            for k in [k for k in self._coalesce_pending if k[0] is ev_cls]:
+                self._flush_coalesced(k)
+            self._queue_event(ev, state)
+            return
+        pending = self._coalesce_pending.get((ev_cls, key))
+        if pending is not None:
+            pending[0] = ev
+            pending[1] = state
+            name = ev_cls.__name__
+            self._coalesce_dropped[name] = \
+                self._coalesce_dropped.get(name, 0) + 1
+            return
+        self._coalesce_pending[(ev_cls, key)] = [ev, state]
+        hub.spawn_after(window, self._flush_coalesced, (ev_cls, key))
+
+    def _flush_coalesced(self, ev_cls_key):
+        pending = self._coalesce_pending.pop(ev_cls_key, None)
+        if pending is not None and self.is_active:
+            self._queue_event(*pending)
 
     def _send_event(self, ev, state):
-        self._events_sem.acquire()
-        self.events.put((ev, state))
+        spec = self.EVENT_COALESCE.get(ev.__class__)
+        if spec is not None:
+            self._coalesce_event(ev, state, *spec)
+        else:
+            self._queue_event(ev, state)
+
+    def _queue_event(self, ev, state):
+        if ev is self._event_stop:
+            self.events.put((ev, state), force=True)
+            return
+        block = isinstance(ev, (EventRequestBase, EventReplyBase))
+        if not self.events.put((ev, state), block=block):
+            LOG.debug('EVENT DROPPED %s %s', self.name, ev.__class__.__name__)
 
     def send_event(self, name, ev, state=None):
         """
@@ -493,11 +699,35 @@ class AppManager(object):
         if app_name is not None:
             assert app_name not in self.applications
         app = cls(*args, **kwargs)
+        self._configure_event_queue(app)
         register_app(app)
         assert app.name not in self.applications
         self.applications[app.name] = app
         return app
 
+    @staticmethod
+    def _configure_event_queue(app):
+        for opt in CONF.app_event_queue:
+            values = opt.split(':')
+            if values[0] != app.name:
+                continue
+            metrics = values[-1] == 'metrics'
+            if metrics:
+                values.pop()
+            if len(values) not in (2, 3):
+                raise ValueError('invalid app-event-queue: %s' % opt)
+            size = int(values[1])
+            policy = values[2] if len(values) == 3 else None
+            app.set_event_queue(size, policy, metrics)
+
+    def get_event_queue_stats(self):
+        """
+        Returns a dict of the application names to the metrics of their
+        event queues.  See RyuApp.event_queue_stats.
+        """
+        return dict((name, app.event_queue_stats())
+                    for name, app in self.applications.items())
+
     def instantiate(self, cls, *args, **kwargs):
         app = self._instantiate(None, cls, *args, **kwargs)
         self._update_bricks()
@@ -33,6 +33,7 @@ from ryu import version
 from ryu.app import wsgi
 from ryu.base.app_manager import AppManager
 from ryu.controller import controller
+from ryu.controller import shard
 from ryu.topology import switches
 
 
@@ -48,6 +49,9 @@ CONF.register_cli_opts([
                 '(use only for debugging)'),
     cfg.StrOpt('user-flags', default=None,
                help='Additional flags file for user applications'),
+    cfg.IntOpt('ofp-workers', default=0, min=0,
+               help='number of worker processes to shard OpenFlow switch '
+                    'connections across (default 0, use this process only)'),
 ])
 
 
@@ -85,7 +89,7 @@ def main(args=None, prog=None):
     else:
         hub.patch(thread=True)
 
-    if CONF.pid_file:
+    if CONF.pid_file and not shard.is_worker():
         with open(CONF.pid_file, 'w') as pid_file:
             pid_file.write(str(os.getpid()))
 
@@ -93,14 +97,32 @@ def main(args=None, prog=None):
     # keep old behavior, run ofp if no application is specified.
     if not app_lists:
         app_lists = ['ryu.controller.ofp_handler']
+    if shard.is_worker():
+        app_lists.append('ryu.controller.shard_bus')
 
     app_mgr = AppManager.get_instance()
     app_mgr.load_apps(app_lists)
+
+    if CONF.ofp_workers > 1 and not shard.is_worker():
+        apps = shard.global_view_apps(app_mgr)
+        if apps:
+            raise SystemExit('--ofp-workers can not be used with the '
+                             'applications which need all the datapaths: '
+                             '%s' % ', '.join(apps))
+        try:
+            shard.run_supervisor(CONF.ofp_workers, args)
+        except KeyboardInterrupt:
+            logger.debug("Keyboard Interrupt received. "
+                         "Stopping worker processes...")
+        return
+
     contexts = app_mgr.create_contexts()
     services = []
     services.extend(app_mgr.instantiate_apps(**contexts))
 
-    webapp = wsgi.start_service(app_mgr)
+    webapp = None
+    if shard.is_assigned(0):
+        webapp = wsgi.start_service(app_mgr)
     if webapp:
         thr = hub.spawn(webapp)
         services.append(thr)
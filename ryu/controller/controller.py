@@ -25,6 +25,7 @@ The main component of OpenFlow controller.
 import contextlib
 import logging
 import random
+import struct
 from socket import IPPROTO_TCP
 from socket import TCP_NODELAY
 from socket import SHUT_WR
@@ -43,16 +44,21 @@ from ryu.ofproto import ofproto_protocol
 from ryu.ofproto import ofproto_v1_0
 from ryu.ofproto import nx_match
 
+from ryu.controller import flow_batch
 from ryu.controller import ofp_event
+from ryu.controller import shard
 from ryu.controller.handler import HANDSHAKE_DISPATCHER, DEAD_DISPATCHER
 
 from ryu.lib.dpid import dpid_to_str
 from ryu.lib import ip
+from ryu.lib import recvbuf
 
 LOG = logging.getLogger('ryu.controller.controller')
 
 DEFAULT_OFP_HOST = '0.0.0.0'
 DEFAULT_OFP_SW_CON_INTERVAL = 1
+DEFAULT_OFP_SEND_QUEUE_SIZE = 16
+DEFAULT_OFP_SEND_BATCH_SIZE = 64 * 1024
 
 CONF = cfg.CONF
 CONF.register_cli_opts([
@@ -85,7 +91,32 @@ CONF.register_opts([
     cfg.IntOpt('maximum-unreplied-echo-requests',
                default=0,
                min=0,
-               help='Maximum number of unreplied echo requests before datapath is disconnected.')
+               help='Maximum number of unreplied echo requests before datapath is disconnected.'),
+    cfg.BoolOpt('ofp-recv-into',
+                default=False,
+                help='Frame received OpenFlow messages in a preallocated buffer '
+                     'filled by recv_into() instead of concatenating recv() results.'),
+    cfg.IntOpt('ofp-recv-buffer-size',
+               default=recvbuf.DEFAULT_SIZE,
+               min=ofproto_common.OFP_HEADER_SIZE,
+               help='Initial size, in bytes, of the receive buffer used when '
+                    'ofp-recv-into is enabled. The buffer grows as needed.'),
+    cfg.BoolOpt('ofp-lazy-parse',
+                default=False,
+                help='Decode the body of received messages which support it '
+                     '(e.g. match and data of PACKET_IN, body of flow stats '
+                     'replies) on first access instead of on receipt.'),
+    cfg.IntOpt('ofp-send-queue-size',
+               default=DEFAULT_OFP_SEND_QUEUE_SIZE,
+               min=1,
+               help='Maximum number of pending send requests per datapath '
+                    '(default %d)' % DEFAULT_OFP_SEND_QUEUE_SIZE),
+    cfg.IntOpt('ofp-send-batch-size',
+               default=DEFAULT_OFP_SEND_BATCH_SIZE,
+               min=1,
+               help='Maximum number of bytes of queued messages coalesced '
+                    'into a single write to a datapath '
+                    '(default %d)' % DEFAULT_OFP_SEND_BATCH_SIZE)
 ])
 
 
@@ -145,7 +176,10 @@ class OpenFlowController(object):
     # entry point
     def __call__(self):
         # LOG.debug('call')
-        for address in CONF.ofp_switch_address_list:
+        for i, address in enumerate(CONF.ofp_switch_address_list):
+            if not shard.is_assigned(i):
+                # Connected by another worker process.
+                continue
             addr = tuple(_split_addr(address))
             self.spawn_client_loop(addr)
 
@@ -252,6 +286,7 @@ class Datapath(ofproto_protocol.ProtocolDesc):
                                          example OFPFlowMod for flow-mod
                                          message.  Arguemnts depend on the
                                          message.
+    next_xid(self)                       Generate an OpenFlow XID.
     set_xid(self, msg)                   Generate an OpenFlow XID and put it
                                          in msg.xid.
     send_msg(self, msg)                  Queue an OpenFlow message to send to
@@ -262,8 +297,27 @@ class Datapath(ofproto_protocol.ProtocolDesc):
     send_flow_mod                        deprecated
     send_flow_del                        deprecated
     send_delete_all_flows                deprecated
+    send_msgs(self, msgs)                Queue OpenFlow messages to send to
+                                         the corresponding switch in bulk.
     send_barrier                         Queue an OpenFlow barrier message to
                                          send to the switch.
+    flow_batch(self, ...)                Return a FlowBatch to send flow,
+                                         group and meter mods in bulk and
+                                         wait for the switch to commit them.
+                                         See ryu.controller.flow_batch.
+    sent_bytes                           Number of bytes written to the
+                                         switch.
+    sent_msgs                            Number of messages written to the
+                                         switch.
+    send_flushes                         Number of writes to the switch.
+    send_msg_hooks                       A list of callables called with
+                                         (datapath, msg) for each message
+                                         queued by send_msg and send_msgs,
+                                         after it is serialized.
+    lazy_parsing                         True if the body of received
+                                         messages which support it is decoded
+                                         on first access (ofp-lazy-parse
+                                         option).
     send_nxt_set_flow_format             deprecated
     is_reserved_port                     deprecated
     ==================================== ======================================
@@ -280,13 +334,30 @@ class Datapath(ofproto_protocol.ProtocolDesc):
 
         # The limit is arbitrary. We need to limit queue size to
         # prevent it from eating memory up.
-        self.send_q = hub.Queue(16)
+        self.send_q = hub.Queue(CONF.ofp_send_queue_size)
         self._send_q_sem = hub.BoundedSemaphore(self.send_q.maxsize)
+        self.send_batch_size = CONF.ofp_send_batch_size
+        # A request dequeued by _send_loop() which did not fit in the
+        # previous write.
+        self._send_pending = None
+
+        # Statistics of the data written to the socket.
+        self.sent_bytes = 0
+        self.sent_msgs = 0
+        self.send_flushes = 0
 
         self.echo_request_interval = CONF.echo_request_interval
         self.max_unreplied_echo_requests = CONF.maximum_unreplied_echo_requests
         self.unreplied_echo_requests = []
 
+        self.recv_into = CONF.ofp_recv_into
+        self.recv_buffer_size = CONF.ofp_recv_buffer_size
+        self.lazy_parsing = bool(CONF.ofp_lazy_parse)
+
+        self.send_msg_hooks = []
+        # xid -> FlowBatch of the messages and barriers in flight
+        self._flow_batches = {}
+
         self.xid = random.randint(0, self.ofproto.MAX_XID)
         self.id = None  # datapath_id is unknown yet
         self._ports = None
@@ -318,6 +389,12 @@ class Datapath(ofproto_protocol.ProtocolDesc):
     # Low level socket handling layer
     @_deactivate
     def _recv_loop(self):
+        if self.recv_into:
+            self._recv_into_loop()
+        else:
+            self._recv_copy_loop()
+
+    def _recv_copy_loop(self):
         buf = bytearray()
         count = 0
         min_read_len = remaining_read_len = ofproto_common.OFP_HEADER_SIZE
@@ -353,21 +430,8 @@ class Datapath(ofproto_protocol.ProtocolDesc):
                     remaining_read_len = (msg_len - buf_len)
                     break
 
-                msg = ofproto_parser.msg(
-                    self, version, msg_type, msg_len, xid, buf[:msg_len])
-                # LOG.debug('queue msg %s cls %s', msg, msg.__class__)
-                if msg:
-                    ev = ofp_event.ofp_msg_to_ev(msg)
-                    self.ofp_brick.send_event_to_observers(ev, self.state)
-
-                    def dispatchers(x):
-                        return x.callers[ev.__class__].dispatchers
-
-                    handlers = [handler for handler in
-                                self.ofp_brick.get_handlers(ev) if
-                                self.state in dispatchers(handler)]
-                    for handler in handlers:
-                        handler(ev)
+                self._handle_msg(version, msg_type, msg_len, xid,
+                                 buf[:msg_len])
 
                 buf = buf[msg_len:]
                 buf_len = len(buf)
@@ -382,12 +446,103 @@ class Datapath(ofproto_protocol.ProtocolDesc):
                     count = 0
                     hub.sleep(0)
 
+    def _recv_into_loop(self):
+        # Unlike _recv_copy_loop(), received data is framed in place and
+        # only the unconsumed tail is ever moved, so a single read holding
+        # many small messages is framed in linear time.
+        rbuf = recvbuf.RecvBuffer(self.recv_buffer_size)
+        count = 0
+        min_read_len = ofproto_common.OFP_HEADER_SIZE
+
+        while self.state != DEAD_DISPATCHER:
+            try:
+                ret = rbuf.recv_into(self.socket, min_read_len)
+            except SocketTimeout:
+                continue
+            except ssl.SSLError:
+                # eventlet throws SSLError (which is a subclass of IOError)
+                # on SSL socket read timeout; re-try the loop in this case.
+                continue
+            except (EOFError, IOError):
+                break
+
+            if not ret:
+                break
+
+            while len(rbuf) >= min_read_len:
+                (version, msg_type, msg_len, xid) = struct.unpack_from(
+                    ofproto_common.OFP_HEADER_PACK_STR, rbuf.peek())
+                if msg_len < min_read_len:
+                    # Someone isn't playing nicely; log it, and try something sane.
+                    LOG.debug("Message with invalid length %s received from switch at address %s",
+                              msg_len, self.address)
+                    msg_len = min_read_len
+                if len(rbuf) < msg_len:
+                    break
+
+                # The parsed message is queued to the applications and can
+                # outlive the receive buffer, so hand the parser a private
+                # copy of this message only.
+                self._handle_msg(version, msg_type, msg_len, xid,
+                                 rbuf.consume(msg_len).tobytes())
+
+                # See _recv_copy_loop().
+                count += 1
+                if count > 2048:
+                    count = 0
+                    hub.sleep(0)
+
+    def _handle_msg(self, version, msg_type, msg_len, xid, buf):
+        msg = ofproto_parser.msg(self, version, msg_type, msg_len, xid, buf)
+        # LOG.debug('queue msg %s cls %s', msg, msg.__class__)
+        if msg:
+            ev = ofp_event.ofp_msg_to_ev(msg)
+            self.ofp_brick.send_event_to_observers(ev, self.state)
+            for handler in self.ofp_brick.get_handlers(ev, self.state):
+                handler(ev)
+
+    def _get_send_batch(self):
+        # Dequeue as many send requests as fit in self.send_batch_size
+        # bytes, blocking only for the first one.
+        if self._send_pending:
+            buf, close_socket, msg_count = self._send_pending
+            self._send_pending = None
+        else:
+            buf, close_socket, msg_count = self.send_q.get()
+            self._send_q_sem.release()
+        bufs = [buf]
+        size = len(buf)
+        while not close_socket:
+            try:
+                item = self.send_q.get(block=False)
+            except hub.QueueEmpty:
+                break
+            self._send_q_sem.release()
+            buf = item[0]
+            if size + len(buf) > self.send_batch_size:
+                self._send_pending = item
+                break
+            bufs.append(buf)
+            size += len(buf)
+            close_socket = item[1]
+            msg_count += item[2]
+        return bufs, close_socket, msg_count
+
     def _send_loop(self):
         try:
             while self.state != DEAD_DISPATCHER:
-                buf, close_socket = self.send_q.get()
-                self._send_q_sem.release()
+                bufs, close_socket, msg_count = self._get_send_batch()
+                # Coalesce the batch into one write.  Note: green and SSL
+                # sockets have no cooperative sendmsg(), so join the buffers
+                # rather than issuing a scatter/gather write.
+                if len(bufs) == 1:
+                    buf = bufs[0]
+                else:
+                    buf = bytearray().join(bufs)
                 self.socket.sendall(buf)
+                self.sent_bytes += len(buf)
+                self.sent_msgs += msg_count
+                self.send_flushes += 1
                 if close_socket:
                     break
         except SocketTimeout:
@@ -413,10 +568,13 @@ class Datapath(ofproto_protocol.ProtocolDesc):
             self._close_write()
 
     def send(self, buf, close_socket=False):
+        return self._send(buf, close_socket, 1)
+
+    def _send(self, buf, close_socket, msg_count):
         msg_enqueued = False
         self._send_q_sem.acquire()
         if self.send_q:
-            self.send_q.put((buf, close_socket))
+            self.send_q.put((buf, close_socket, msg_count))
             msg_enqueued = True
         else:
             self._send_q_sem.release()
@@ -425,20 +583,60 @@ class Datapath(ofproto_protocol.ProtocolDesc):
                       self.address)
         return msg_enqueued
 
-    def set_xid(self, msg):
+    def next_xid(self):
+        """
+        Allocate a new transaction id.
+        """
         self.xid += 1
         self.xid &= self.ofproto.MAX_XID
-        msg.set_xid(self.xid)
         return self.xid
 
+    def set_xid(self, msg):
+        xid = self.next_xid()
+        msg.set_xid(xid)
+        return xid
+
     def send_msg(self, msg, close_socket=False):
         assert isinstance(msg, self.ofproto_parser.MsgBase)
         if msg.xid is None:
             self.set_xid(msg)
         msg.serialize()
         # LOG.debug('send_msg %s', msg)
+        for hook in self.send_msg_hooks:
+            hook(self, msg)
         return self.send(msg.buf, close_socket=close_socket)
 
+    def send_msgs(self, msgs):
+        """
+        Queue OpenFlow messages to send to the switch.
+
+        Serialized messages are packed into send requests of up to
+        ofp-send-batch-size bytes, so a bulk of messages takes a few queue
+        operations and writes rather than one per message.
+        Returns the number of messages queued.
+        """
+        bufs = []
+        size = 0
+        queued = 0
+        for msg in msgs:
+            assert isinstance(msg, self.ofproto_parser.MsgBase)
+            if msg.xid is None:
+                self.set_xid(msg)
+            msg.serialize()
+            for hook in self.send_msg_hooks:
+                hook(self, msg)
+            if bufs and size + len(msg.buf) > self.send_batch_size:
+                if not self._send(bytearray().join(bufs), False, len(bufs)):
+                    return queued
+                queued += len(bufs)
+                bufs = []
+                size = 0
+            bufs.append(msg.buf)
+            size += len(msg.buf)
+        if bufs and self._send(bytearray().join(bufs), False, len(bufs)):
+            queued += len(bufs)
+        return queued
+
     def _echo_request_loop(self):
         if not self.max_unreplied_echo_requests:
             return
@@ -456,6 +654,20 @@ class Datapath(ofproto_protocol.ProtocolDesc):
         except ValueError:
             pass
 
+    def acknowledge_barrier_reply(self, xid):
+        batch = self._flow_batches.get(xid)
+        if batch is not None:
+            batch.barrier_reply(xid)
+
+    def acknowledge_error(self, msg):
+        batch = self._flow_batches.get(msg.xid)
+        if batch is not None:
+            batch.error(msg)
+
+    def _abort_flow_batches(self):
+        for batch in set(self._flow_batches.values()):
+            batch.abort()
+
     def serve(self):
         send_thr = hub.spawn(self._send_loop)
 
@@ -472,6 +684,7 @@ class Datapath(ofproto_protocol.ProtocolDesc):
             hub.kill(echo_thr)
             hub.joinall([send_thr, echo_thr])
             self.is_active = False
+            self._abort_flow_batches()
 
     #
     # Utility methods for convenience
@@ -525,6 +738,12 @@ class Datapath(ofproto_protocol.ProtocolDesc):
         barrier_request = self.ofproto_parser.OFPBarrierRequest(self)
         return self.send_msg(barrier_request)
 
+    def flow_batch(self, barrier_interval=None, max_outstanding=None):
+        """
+        Returns a new ryu.controller.flow_batch.FlowBatch for this switch.
+        """
+        return flow_batch.FlowBatch(self, barrier_interval, max_outstanding)
+
     def send_nxt_set_flow_format(self, flow_format):
         assert (flow_format == ofproto_v1_0.NXFF_OPENFLOW10 or
                 flow_format == ofproto_v1_0.NXFF_NXM)
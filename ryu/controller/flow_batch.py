@@ -0,0 +1,202 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Bulk programming of flow, group and meter mods with barriers.
+
+A FlowBatch buffers messages and writes them to the switch in chunks of
+barrier_interval messages, each followed by a barrier request.  At most
+max_outstanding barriers are unanswered at a time; adding more messages
+blocks until the switch catches up.  Error messages are matched to the
+messages by xid, and a message is confirmed when the barrier following it
+is answered.
+
+Example::
+
+    batch = datapath.flow_batch()
+    for match in matches:
+        batch.add(parser.OFPFlowMod(datapath, match=match, ...))
+    batch.commit()
+    if batch.wait(timeout=10):
+        for (msg, error) in batch.failed:
+            ...
+
+The barrier replies and the error messages are passed to the batch by
+ryu.controller.ofp_handler in the receive thread of the datapath, so
+add() and wait() must not be called from that thread (e.g. from the
+handlers of ofp_handler itself).
+"""
+
+import collections
+import logging
+
+from ryu.lib import hub
+
+LOG = logging.getLogger('ryu.controller.flow_batch')
+
+
+class FlowBatch(object):
+    """
+    A transaction of messages to a datapath.
+
+    ============== ======================================================
+    Attribute      Description
+    ============== ======================================================
+    datapath       Datapath to send the messages to
+    msgs           List of the messages added, in order
+    succeeded      List of the messages confirmed without errors
+    failed         List of (message, OFPErrorMsg) of the messages failed
+    unconfirmed    List of the messages which are neither confirmed nor
+                   failed when the datapath disconnected
+    ============== ======================================================
+    """
+
+    # messages between barriers
+    BARRIER_INTERVAL = 256
+    # unanswered barriers before add() blocks
+    MAX_OUTSTANDING = 4
+
+    def __init__(self, datapath, barrier_interval=None,
+                 max_outstanding=None):
+        self.datapath = datapath
+        self.barrier_interval = barrier_interval or self.BARRIER_INTERVAL
+        self.max_outstanding = max_outstanding or self.MAX_OUTSTANDING
+        self.msgs = []
+        self.succeeded = []
+        self.failed = []
+        self.unconfirmed = []
+
+        self._buffer = []
+        # barrier xid -> the messages sent before it
+        self._barriers = collections.OrderedDict()
+        self._errors = {}  # xid -> OFPErrorMsg
+        self._committed = False
+        self._aborted = False
+        self._acked = hub.Event()
+        self._done = hub.Event()
+
+    def add(self, msg):
+        """
+        Add a message.  The messages are sent when barrier_interval
+        messages are buffered, waiting for the switch if max_outstanding
+        barriers are unanswered.
+        """
+        self.msgs.append(msg)
+        if self._aborted:
+            self.unconfirmed.append(msg)
+            return
+        assert not self._committed
+        self._buffer.append(msg)
+        if len(self._buffer) >= self.barrier_interval:
+            self.flush()
+
+    def flush(self):
+        """
+        Send the messages buffered followed by a barrier request.
+        """
+        if not self._buffer or self._aborted:
+            return
+        while (len(self._barriers) >= self.max_outstanding and
+               not self._aborted):
+            self._acked.clear()
+            self._acked.wait()
+        if self._aborted:
+            return
+
+        dp = self.datapath
+        msgs = self._buffer
+        self._buffer = []
+        barrier = dp.ofproto_parser.OFPBarrierRequest(dp)
+        for msg in msgs:
+            if msg.xid is None:
+                dp.set_xid(msg)
+            dp._flow_batches[msg.xid] = self
+        dp.set_xid(barrier)
+        dp._flow_batches[barrier.xid] = self
+        self._barriers[barrier.xid] = msgs
+        if dp.send_msgs(msgs + [barrier]) < len(msgs) + 1:
+            LOG.debug('datapath %s is terminating; batch aborted', dp.id)
+            self.abort()
+
+    def commit(self):
+        """
+        Send the rest of the messages.  No more messages can be added.
+        """
+        self._committed = True
+        self.flush()
+        self._check_done()
+
+    def done(self):
+        return self._done.is_set()
+
+    def wait(self, timeout=None):
+        """
+        Wait until all the messages are confirmed, failed or the datapath
+        disconnects.  Returns False if timeout (seconds) expires.
+        """
+        return self._done.wait(timeout)
+
+    def _settle(self, msgs):
+        for msg in msgs:
+            self.datapath._flow_batches.pop(msg.xid, None)
+            error = self._errors.pop(msg.xid, None)
+            if error is None:
+                self.succeeded.append(msg)
+            else:
+                self.failed.append((msg, error))
+
+    def _check_done(self):
+        if self._committed and not self._barriers:
+            self._done.set()
+
+    def barrier_reply(self, xid):
+        # The messages are processed in order, so the barrier confirms
+        # the messages before it and the earlier barriers.
+        while self._barriers:
+            (barrier_xid, msgs) = self._barriers.popitem(last=False)
+            self.datapath._flow_batches.pop(barrier_xid, None)
+            self._settle(msgs)
+            if barrier_xid == xid:
+                break
+        self._acked.set()
+        self._check_done()
+
+    def error(self, msg):
+        self._errors[msg.xid] = msg
+
+    def abort(self):
+        """
+        Give up the messages not confirmed.  Called when the datapath
+        disconnects.
+        """
+        if self._aborted:
+            return
+        self._aborted = True
+        self._committed = True
+        flow_batches = self.datapath._flow_batches
+        for (barrier_xid, msgs) in self._barriers.items():
+            flow_batches.pop(barrier_xid, None)
+            for msg in msgs:
+                flow_batches.pop(msg.xid, None)
+                error = self._errors.pop(msg.xid, None)
+                if error is None:
+                    self.unconfirmed.append(msg)
+                else:
+                    self.failed.append((msg, error))
+        self._barriers.clear()
+        self.unconfirmed.extend(self._buffer)
+        self._buffer = []
+        self._acked.set()
+        self._done.set()
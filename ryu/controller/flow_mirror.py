@@ -0,0 +1,515 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Mirror the flow tables of the switches.
+
+FlowTableMirror keeps a local copy of the flow entries of each switch, so
+that applications can look up the installed flows without requesting the
+flow stats of the switch.
+
+The copy is updated from the FLOW_MOD messages sent by the applications
+(through Datapath.send_msg_hooks) and the FLOW_REMOVED messages from the
+switch.  What cannot be tracked this way, the entries removed by timeout
+without OFPFF_SEND_FLOW_REM, the flow mods rejected by the switch and the
+non-strict flow mods whose effect cannot be told from the matches, makes
+the entries of the cookie (or the whole table) "dirty".  The dirty parts
+are periodically fetched from the switch with flow stats requests filtered
+by the cookie.  The whole table is fetched when a switch connects.
+
+Only OpenFlow 1.3 or later is supported.  Flow mods sent without
+Datapath.send_msg() or send_msgs() (e.g. serialized messages sent by
+Datapath.send()) are not tracked.
+"""
+
+import collections
+import logging
+import time
+
+import six
+
+from ryu.base import app_manager
+from ryu.controller import ofp_event
+from ryu.controller.handler import DEAD_DISPATCHER
+from ryu.controller.handler import MAIN_DISPATCHER
+from ryu.controller.handler import set_ev_cls
+from ryu.lib import hub
+from ryu.ofproto import ofproto_v1_3
+from ryu.ofproto import ofproto_v1_5
+
+LOG = logging.getLogger('ryu.controller.flow_mirror')
+
+_ALL_COOKIES = 0xffffffffffffffff
+
+
+def _match_key(match):
+    return tuple(sorted((name, tuple(value) if isinstance(value, list)
+                         else value)
+                        for (name, value) in match.items()))
+
+
+def _covers(fields, match):
+    # Returns whether the match fields of a non-strict flow mod cover the
+    # match of an entry, or None if it cannot be told here.
+    entry_fields = dict(match.items())
+    result = True
+    for (name, value) in fields:
+        if name not in entry_fields:
+            return False
+        entry_value = entry_fields[name]
+        if entry_value == value:
+            continue
+        if not isinstance(value, tuple):
+            return False
+        (value, mask) = value
+        if isinstance(entry_value, tuple):
+            (entry_value, entry_mask) = entry_value
+        else:
+            entry_mask = None
+        if not all(isinstance(v, six.integer_types)
+                   for v in (value, mask, entry_value)):
+            # e.g. a masked address
+            result = None
+            continue
+        if entry_mask is not None and entry_mask & mask != mask:
+            return False
+        if entry_value & mask != value & mask:
+            return False
+    return result
+
+
+class FlowEntry(object):
+    """
+    A flow entry of FlowTableMirror.
+
+    ============== ======================================================
+    Attribute      Description
+    ============== ======================================================
+    table_id       ID of the table
+    priority       Priority level of the entry
+    match          Instance of OFPMatch
+    cookie         Opaque controller-issued identifier
+    instructions   List of OFPInstruction* instance
+    idle_timeout   Idle time before discarding (seconds)
+    hard_timeout   Max time before discarding (seconds)
+    flags          Bitmap of OFPFF_* flags
+    ============== ======================================================
+    """
+
+    def __init__(self, table_id, priority, match, cookie=0,
+                 instructions=None, idle_timeout=0, hard_timeout=0, flags=0):
+        self.table_id = table_id
+        self.priority = priority
+        self.match = match
+        self.cookie = cookie
+        self.instructions = instructions or []
+        self.idle_timeout = idle_timeout
+        self.hard_timeout = hard_timeout
+        self.flags = flags
+        self.key = (table_id, priority, _match_key(match))
+
+    @classmethod
+    def from_msg(cls, msg):
+        # msg is OFPFlowMod, OFPFlowStats or OFPFlowDesc
+        return cls(msg.table_id, msg.priority, msg.match, msg.cookie,
+                   msg.instructions, msg.idle_timeout, msg.hard_timeout,
+                   msg.flags)
+
+    def outputs_to(self, port=None, group=None):
+        for inst in self.instructions:
+            for action in getattr(inst, 'actions', ()):
+                if port is not None and getattr(action, 'port', None) == port:
+                    return True
+                if (group is not None and
+                        getattr(action, 'group_id', None) == group):
+                    return True
+        return False
+
+    def __repr__(self):
+        return ('FlowEntry(table_id=%s, priority=%s, match=%s, cookie=%#x)'
+                % (self.table_id, self.priority, self.match, self.cookie))
+
+
+class _FlowTable(object):
+    # The flow entries of a datapath, their indexes and the state of the
+    # reconciliation.
+    def __init__(self):
+        self.entries = {}   # key -> FlowEntry
+        self.tables = {}    # table_id -> {key: FlowEntry}
+        self.cookies = {}   # cookie -> {key: FlowEntry}
+        # The entries which can be removed by the switch silently.
+        self.volatile = {}  # key -> FlowEntry
+
+        # The scopes to fetch from the switch
+        self.dirty_all = True
+        self.dirty_cookies = set()
+        self.synced = False
+        # The flow mods are numbered, and those sent while requests are
+        # pending are logged to be applied again to the replies, which do
+        # not reflect them.
+        self.seq = 0
+        self.log = []  # [(seq, OFPFlowMod)]
+        # xid -> (cookie or None, seq, time, [FlowStats])
+        self.requests = {}
+        # The recent flow mods which may be rejected by the switch.
+        self.xids = collections.OrderedDict()  # xid -> cookie or None
+
+    def add(self, entry):
+        self.remove(entry.key)
+        key = entry.key
+        self.entries[key] = entry
+        self.tables.setdefault(entry.table_id, {})[key] = entry
+        self.cookies.setdefault(entry.cookie, {})[key] = entry
+        if ((entry.idle_timeout or entry.hard_timeout) and
+                not entry.flags & ofproto_v1_3.OFPFF_SEND_FLOW_REM):
+            self.volatile[key] = entry
+
+    def remove(self, key):
+        entry = self.entries.pop(key, None)
+        if entry is None:
+            return None
+        for (index, value) in ((self.tables, entry.table_id),
+                               (self.cookies, entry.cookie)):
+            keys = index[value]
+            del keys[key]
+            if not keys:
+                del index[value]
+        self.volatile.pop(key, None)
+        return entry
+
+    def clear(self):
+        self.entries.clear()
+        self.tables.clear()
+        self.cookies.clear()
+        self.volatile.clear()
+
+    def trim_log(self):
+        if not self.requests:
+            del self.log[:]
+            return
+        seq = min(r[1] for r in self.requests.values())
+        while self.log and self.log[0][0] <= seq:
+            self.log.pop(0)
+
+    def mark_dirty(self, cookie):
+        if cookie is None:
+            self.dirty_all = True
+        else:
+            self.dirty_cookies.add(cookie)
+
+
+class FlowTableMirror(app_manager.RyuApp):
+    """
+    FlowTableMirror application keeps a local copy of the flow tables of
+    the switches (OpenFlow 1.3 or later).
+
+    Usage Example::
+
+        from ryu.controller import flow_mirror
+
+
+        class MyApp(app_manager.RyuApp):
+            _CONTEXTS = {
+                'flow_mirror': flow_mirror.FlowTableMirror,
+            }
+
+            def __init__(self, *args, **kwargs):
+                super(MyApp, self).__init__(*args, **kwargs)
+                self.flow_mirror = kwargs['flow_mirror']
+
+            def _has_rule(self, dp, match):
+                return self.flow_mirror.get_flow(
+                    dp.id, 0, 100, match) is not None
+
+    The entries returned are shared with FlowTableMirror and must not be
+    modified.
+    """
+
+    # seconds between the reconciliations of the dirty entries
+    RECONCILE_INTERVAL = 10.0
+    # seconds to wait for a flow stats reply
+    REQUEST_TIMEOUT = 30.0
+    # fetch the whole table rather than more cookies than this
+    MAX_COOKIE_REQUESTS = 16
+    # the number of the recent flow mods watched for errors
+    MAX_TRACKED_XIDS = 1024
+
+    def __init__(self, *args, **kwargs):
+        super(FlowTableMirror, self).__init__(*args, **kwargs)
+        self.name = 'flow_mirror'
+        self.dps = {}     # dpid -> Datapath
+        self.flows = {}   # dpid -> _FlowTable
+        self.is_active = True
+        self.threads.append(hub.spawn(self._reconcile_loop))
+
+    def close(self):
+        self.is_active = False
+
+    #
+    # Query API
+    #
+
+    def synced(self, dpid):
+        """
+        Returns True if the whole flow table of dpid has been fetched and
+        nothing is known to be out of sync.
+        """
+        table = self.flows.get(dpid)
+        return (table is not None and table.synced and
+                not table.dirty_all and not table.dirty_cookies)
+
+    def get_flow(self, dpid, table_id, priority, match):
+        """
+        Returns the FlowEntry with exactly the given table_id, priority
+        and match (OFPMatch), or None.
+        """
+        table = self.flows.get(dpid)
+        if table is None:
+            return None
+        return table.entries.get((table_id, priority, _match_key(match)))
+
+    def get_flows(self, dpid, table_id=None, cookie=None,
+                  cookie_mask=_ALL_COOKIES, priority=None, match=None):
+        """
+        Returns the list of the FlowEntry of dpid filtered by the
+        arguments.  As with flow stats requests, match (OFPMatch) selects
+        the entries whose match is the same as or more specific than it.
+        """
+        table = self.flows.get(dpid)
+        if table is None:
+            return []
+        if cookie is not None and cookie_mask == _ALL_COOKIES:
+            entries = table.cookies.get(cookie, {})
+        elif table_id is not None:
+            entries = table.tables.get(table_id, {})
+        else:
+            entries = table.entries
+        fields = match.items() if match is not None else None
+        result = []
+        for entry in entries.values():
+            if table_id is not None and entry.table_id != table_id:
+                continue
+            if priority is not None and entry.priority != priority:
+                continue
+            if (cookie is not None and
+                    (entry.cookie ^ cookie) & cookie_mask):
+                continue
+            if fields is not None and not _covers(fields, entry.match):
+                continue
+            result.append(entry)
+        return result
+
+    def reconcile(self, dpid, cookie=None):
+        """
+        Fetch the entries of cookie (or all entries if cookie is None) of
+        dpid from the switch.
+        """
+        table = self.flows.get(dpid)
+        if table is not None:
+            self._request(self.dps[dpid], table, cookie)
+
+    #
+    # Tracking
+    #
+
+    @set_ev_cls(ofp_event.EventOFPStateChange,
+                [MAIN_DISPATCHER, DEAD_DISPATCHER])
+    def _state_change_handler(self, ev):
+        dp = ev.datapath
+        if ev.state == MAIN_DISPATCHER:
+            if dp.ofproto.OFP_VERSION < ofproto_v1_3.OFP_VERSION:
+                return
+            self.dps[dp.id] = dp
+            self.flows[dp.id] = table = _FlowTable()
+            if self._flow_mod_sent not in dp.send_msg_hooks:
+                dp.send_msg_hooks.append(self._flow_mod_sent)
+            self._request(dp, table, None)
+        elif ev.state == DEAD_DISPATCHER:
+            if dp.id is None or self.dps.get(dp.id) is not dp:
+                return
+            del self.dps[dp.id]
+            del self.flows[dp.id]
+            if self._flow_mod_sent in dp.send_msg_hooks:
+                dp.send_msg_hooks.remove(self._flow_mod_sent)
+
+    def _flow_mod_sent(self, dp, msg):
+        # Called by Datapath.send_msg() in the thread of the sender.
+        if not isinstance(msg, dp.ofproto_parser.OFPFlowMod):
+            return
+        table = self.flows.get(dp.id)
+        if table is None:
+            return
+        table.seq += 1
+        if table.requests:
+            table.log.append((table.seq, msg))
+        cookie = msg.cookie
+        if msg.command != dp.ofproto.OFPFC_ADD and \
+                msg.cookie_mask != _ALL_COOKIES:
+            cookie = None
+        table.xids[msg.xid] = cookie
+        if len(table.xids) > self.MAX_TRACKED_XIDS:
+            table.xids.popitem(last=False)
+        self._apply(dp.ofproto, table, msg)
+
+    def _apply(self, ofp, table, msg):
+        command = msg.command
+        if command == ofp.OFPFC_ADD:
+            table.add(FlowEntry.from_msg(msg))
+            return
+
+        if command in (ofp.OFPFC_MODIFY_STRICT, ofp.OFPFC_DELETE_STRICT):
+            entry = table.entries.get(
+                (msg.table_id, msg.priority, _match_key(msg.match)))
+            entries = [entry] if entry is not None else []
+            fields = None
+        else:
+            if msg.table_id == ofp.OFPTT_ALL:
+                entries = table.entries
+            else:
+                entries = table.tables.get(msg.table_id, {})
+            if msg.cookie_mask == _ALL_COOKIES:
+                entries = [e for e in entries.values()
+                           if e.cookie == msg.cookie]
+            else:
+                entries = list(entries.values())
+            fields = msg.match.items()
+
+        delete = command in (ofp.OFPFC_DELETE, ofp.OFPFC_DELETE_STRICT)
+        for entry in entries:
+            if (entry.cookie ^ msg.cookie) & msg.cookie_mask:
+                continue
+            if delete and (
+                    (msg.out_port != ofp.OFPP_ANY and
+                     not entry.outputs_to(port=msg.out_port)) or
+                    (msg.out_group != ofp.OFPG_ANY and
+                     not entry.outputs_to(group=msg.out_group))):
+                continue
+            if fields is not None:
+                covered = _covers(fields, entry.match)
+                if covered is None:
+                    table.mark_dirty(entry.cookie)
+                    continue
+                if not covered:
+                    continue
+            if delete:
+                table.remove(entry.key)
+            else:
+                entry.instructions = msg.instructions
+
+    @set_ev_cls(ofp_event.EventOFPFlowRemoved, MAIN_DISPATCHER)
+    def _flow_removed_handler(self, ev):
+        msg = ev.msg
+        table = self.flows.get(msg.datapath.id)
+        if table is None:
+            return
+        key = (msg.table_id, msg.priority, _match_key(msg.match))
+        entry = table.entries.get(key)
+        if entry is not None and entry.cookie == msg.cookie:
+            table.remove(key)
+
+    @set_ev_cls(ofp_event.EventOFPErrorMsg, MAIN_DISPATCHER)
+    def _error_msg_handler(self, ev):
+        msg = ev.msg
+        table = self.flows.get(msg.datapath.id)
+        if table is None or msg.xid not in table.xids:
+            return
+        # The flow mod may have been rejected.
+        table.mark_dirty(table.xids.pop(msg.xid))
+
+    #
+    # Reconciliation
+    #
+
+    def _request(self, dp, table, cookie):
+        for (scope, _seq, _time, _body) in table.requests.values():
+            if scope is None or scope == cookie:
+                return
+        ofp = dp.ofproto
+        parser = dp.ofproto_parser
+        if ofp.OFP_VERSION >= ofproto_v1_5.OFP_VERSION:
+            # The flow stats of OpenFlow 1.5 have no instructions.
+            request_cls = parser.OFPFlowDescStatsRequest
+        else:
+            request_cls = parser.OFPFlowStatsRequest
+        if cookie is None:
+            req = request_cls(dp)
+            table.dirty_all = False
+        else:
+            req = request_cls(dp, cookie=cookie, cookie_mask=_ALL_COOKIES)
+            table.dirty_cookies.discard(cookie)
+        dp.set_xid(req)
+        table.requests[req.xid] = (cookie, table.seq, time.time(), [])
+        dp.send_msg(req)
+
+    def _reconcile(self, dp, table, now):
+        for (xid, (cookie, _seq, sent, _body)) in list(
+                table.requests.items()):
+            if sent + self.REQUEST_TIMEOUT < now:
+                LOG.debug('flow stats request timed out: %s', dp.id)
+                del table.requests[xid]
+                table.mark_dirty(cookie)
+        table.trim_log()
+
+        if table.dirty_all:
+            self._request(dp, table, None)
+            return
+        cookies = table.dirty_cookies.union(
+            entry.cookie for entry in table.volatile.values())
+        if len(cookies) > self.MAX_COOKIE_REQUESTS:
+            self._request(dp, table, None)
+            return
+        for cookie in cookies:
+            self._request(dp, table, cookie)
+
+    def _reconcile_loop(self):
+        while self.is_active:
+            hub.sleep(self.RECONCILE_INTERVAL)
+            now = time.time()
+            for (dpid, table) in list(self.flows.items()):
+                dp = self.dps.get(dpid)
+                if dp is not None:
+                    self._reconcile(dp, table, now)
+
+    @set_ev_cls([ofp_event.EventOFPFlowStatsReply,
+                 ofp_event.EventOFPFlowDescStatsReply], MAIN_DISPATCHER)
+    def _flow_stats_reply_handler(self, ev):
+        msg = ev.msg
+        table = self.flows.get(msg.datapath.id)
+        if table is None or msg.xid not in table.requests:
+            return
+        (cookie, seq, _time, body) = table.requests[msg.xid]
+        body.extend(msg.body)
+        if msg.flags & msg.datapath.ofproto.OFPMPF_REPLY_MORE:
+            return
+        del table.requests[msg.xid]
+        self._replace(msg.datapath.ofproto, table, cookie, seq, body)
+        table.trim_log()
+
+    def _replace(self, ofp, table, cookie, seq, body):
+        # Replace the entries of cookie (or all entries if cookie is None)
+        # with the flow stats fetched, and apply the flow mods sent after
+        # the request again.  Applying the flow mods again to the entries
+        # which already reflect them gives the same entries.
+        if cookie is None:
+            table.clear()
+            table.synced = True
+        else:
+            for key in list(table.cookies.get(cookie, ())):
+                table.remove(key)
+        for stats in body:
+            table.add(FlowEntry.from_msg(stats))
+        for (s, msg) in table.log:
+            if s > seq:
+                self._apply(ofp, table, msg)
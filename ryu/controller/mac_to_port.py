@@ -14,30 +14,174 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import binascii
+import collections
 import logging
+import time
+
 from ryu.lib.mac import haddr_to_str
 
 LOG = logging.getLogger('ryu.controller.mac_to_port')
 
 
+class MacTable(object):
+    """
+    L2 learning table of a datapath.
+
+    MAC addresses are 48-bit integers (see ryu.lib.mac.haddr_to_int).
+    An entry not seen for ttl seconds expires, and the least recently seen
+    entry is evicted when max_entries are learned.  None disables either.
+
+    Example::
+
+        table = MacTable()
+        table.learn(haddr_to_int(eth.src), in_port)
+        out_port = table.get(haddr_to_int(eth.dst))
+    """
+
+    DEFAULT_TTL = 300
+    DEFAULT_MAX_ENTRIES = 65536
+    # An entry learned again on the same port within this many seconds
+    # keeps its timestamp, so that a busy host does not reorder the table
+    # on every packet.
+    REFRESH_INTERVAL = 1.0
+
+    def __init__(self, ttl=DEFAULT_TTL, max_entries=DEFAULT_MAX_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        # mac -> (port, timestamp), the least recently seen first
+        self._entries = collections.OrderedDict()
+        # statistics
+        self.expired = 0
+        self.evicted = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, mac):
+        return self.get(mac) is not None
+
+    def learn(self, mac, port, now=None):
+        """
+        Learn that mac is on port.  Returns the port previously learned,
+        or None.
+        """
+        if now is None:
+            now = time.time()
+        entries = self._entries
+        entry = entries.get(mac)
+        if entry is not None:
+            (old_port, timestamp) = entry
+            if old_port == port and now - timestamp < self.REFRESH_INTERVAL:
+                return old_port
+            del entries[mac]
+        else:
+            old_port = None
+            if (self.max_entries is not None and
+                    len(entries) >= self.max_entries):
+                entries.popitem(last=False)
+                self.evicted += 1
+        entries[mac] = (port, now)
+        return old_port
+
+    def get(self, mac, now=None):
+        """
+        Returns the port of mac, or None if it is unknown or expired.
+        """
+        entry = self._entries.get(mac)
+        if entry is None:
+            return None
+        if self.ttl is not None:
+            if now is None:
+                now = time.time()
+            if entry[1] + self.ttl <= now:
+                del self._entries[mac]
+                self.expired += 1
+                return None
+        return entry[0]
+
+    def delete(self, mac):
+        """
+        Forget mac.  Returns its port, or None.
+        """
+        entry = self._entries.pop(mac, None)
+        if entry is None:
+            return None
+        return entry[0]
+
+    def delete_port(self, port):
+        """
+        Forget the MAC addresses on port.  Returns the list of them.
+        """
+        macs = [mac for (mac, (port_, _ts)) in self._entries.items()
+                if port_ == port]
+        for mac in macs:
+            del self._entries[mac]
+        return macs
+
+    def expire(self, now=None):
+        """
+        Remove the expired entries.  Returns the list of (mac, port) of
+        them, e.g. to delete the flows installed for them.
+        """
+        if self.ttl is None:
+            return []
+        if now is None:
+            now = time.time()
+        deadline = now - self.ttl
+        entries = self._entries
+        expired = []
+        # The entries are ordered by the timestamp.
+        for (mac, (port, timestamp)) in entries.items():
+            if timestamp > deadline:
+                break
+            expired.append((mac, port))
+        for (mac, _port) in expired:
+            del entries[mac]
+        self.expired += len(expired)
+        return expired
+
+    def export(self):
+        """
+        Returns the list of (mac, port, timestamp) of all entries, the
+        least recently seen first.
+        """
+        return [(mac, port, timestamp)
+                for (mac, (port, timestamp)) in self._entries.items()]
+
+    def clear(self):
+        self._entries.clear()
+
+
+def _bin_to_int(mac):
+    return int(binascii.hexlify(mac), 16)
+
+
+def _int_to_bin(mac):
+    return binascii.unhexlify('%012x' % mac)
+
+
 class MacToPortTable(object):
     """MAC addr <-> (dpid, port name)"""
 
-    def __init__(self):
+    def __init__(self, ttl=MacTable.DEFAULT_TTL,
+                 max_entries=MacTable.DEFAULT_MAX_ENTRIES):
         super(MacToPortTable, self).__init__()
-        self.mac_to_port = {}
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.mac_to_port = {}  # dpid -> MacTable
 
     def dpid_add(self, dpid):
         LOG.debug('dpid_add: 0x%016x', dpid)
-        self.mac_to_port.setdefault(dpid, {})
+        if dpid not in self.mac_to_port:
+            self.mac_to_port[dpid] = MacTable(self.ttl, self.max_entries)
 
     def port_add(self, dpid, port, mac):
         """
         :returns: old port if learned. (this may be = port)
                   None otherwise
         """
-        old_port = self.mac_to_port[dpid].get(mac, None)
-        self.mac_to_port[dpid][mac] = port
+        old_port = self.mac_to_port[dpid].learn(_bin_to_int(mac), port)
 
         if old_port is not None and old_port != port:
             LOG.debug('port_add: 0x%016x 0x%04x %s',
@@ -47,11 +191,20 @@ class MacToPortTable(object):
 
     def port_get(self, dpid, mac):
         # LOG.debug('dpid 0x%016x mac %s', dpid, haddr_to_str(mac))
-        return self.mac_to_port[dpid].get(mac)
+        return self.mac_to_port[dpid].get(_bin_to_int(mac))
 
     def mac_list(self, dpid, port):
-        return [mac for (mac, port_) in self.mac_to_port.get(dpid).items()
-                if port_ == port]
+        return [_int_to_bin(mac) for (mac, port_, _ts)
+                in self.mac_to_port.get(dpid).export() if port_ == port]
 
     def mac_del(self, dpid, mac):
-        del self.mac_to_port[dpid][mac]
+        if self.mac_to_port[dpid].delete(_bin_to_int(mac)) is None:
+            raise KeyError(mac)
+
+    def expire(self, dpid):
+        """
+        Remove the expired entries of dpid.  Returns the list of
+        (mac, port) of them.
+        """
+        return [(_int_to_bin(mac), port)
+                for (mac, port) in self.mac_to_port[dpid].expire()]
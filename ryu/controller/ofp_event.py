@@ -105,6 +105,31 @@ for ofp_mods in ofproto.get_ofp_modules().values():
     _create_ofp_msg_ev_from_module(ofp_parser)
 
 
+def port_status_key(ev):
+    """
+    A key function for RyuApp.EVENT_COALESCE to coalesce
+    EventOFPPortStatus by (datapath id, port number).
+    """
+    return (ev.msg.datapath.id, ev.msg.desc.port_no)
+
+
+def stats_reply_key(ev):
+    """
+    A key function for RyuApp.EVENT_COALESCE to coalesce statistics reply
+    events by datapath id.
+    Replies which are followed by more replies of the same request are not
+    coalesced.
+    """
+    msg = ev.msg
+    ofp = msg.datapath.ofproto
+    reply_more = getattr(ofp, 'OFPMPF_REPLY_MORE', None)
+    if reply_more is None:
+        reply_more = ofp.OFPSF_REPLY_MORE
+    if msg.flags & reply_more:
+        return None
+    return msg.datapath.id
+
+
 class EventOFPStateChange(event.EventBase):
     """
     An event class for negotiation phase change notification.
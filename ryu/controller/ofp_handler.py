@@ -248,6 +248,12 @@ class OFPHandler(ryu.base.app_manager.RyuApp):
         datapath = msg.datapath
         datapath.acknowledge_echo_reply(msg.xid)
 
+    @set_ev_handler(ofp_event.EventOFPBarrierReply, MAIN_DISPATCHER)
+    def barrier_reply_handler(self, ev):
+        msg = ev.msg
+        datapath = msg.datapath
+        datapath.acknowledge_barrier_reply(msg.xid)
+
     @set_ev_handler(ofp_event.EventOFPPortStatus, MAIN_DISPATCHER)
     def port_status_handler(self, ev):
         msg = ev.msg
@@ -271,6 +277,7 @@ class OFPHandler(ryu.base.app_manager.RyuApp):
     def error_msg_handler(self, ev):
         msg = ev.msg
         ofp = msg.datapath.ofproto
+        msg.datapath.acknowledge_error(msg)
         self.logger.debug(
             "EventOFPErrorMsg received.\n"
             "version=%s, msg_type=%s, msg_len=%s, xid=%s\n"
@@ -0,0 +1,242 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Sharding of datapaths across multiple ryu-manager processes.
+
+When ryu-manager is started with "--ofp-workers N" (N > 1), the process
+becomes a supervisor which starts N worker processes running the same
+applications and ryu.controller.shard_bus.  The workers listen on the same OpenFlow port with
+SO_REUSEPORT (hub.StreamServer enables it), so the kernel distributes
+switch connections among them.  Active connections to the switches in
+"--ofp-switch-address-list" are divided among the workers, and only the
+first worker serves the WSGI (REST API) applications.
+
+Each worker only knows the switches connected to itself.  Events which are
+relevant to every worker (e.g., a change of the network state which an
+application detected on its switches) can be declared global with
+register_global_event().  Such events are relayed through the supervisor
+and delivered to the observers in the other workers as if they were
+generated there.  Global events are pickled, so their attributes must be
+picklable; in particular, they must not refer to Datapath instances.
+
+Ryu itself declares no global events.  In particular the topology events
+(EventSwitchEnter/Leave, EventLinkAdd/Delete, ...) are not relayed: they
+refer to Datapath instances, and a link can not be discovered by a worker
+which knows only one of its ends.  So applications which need to know all
+the datapaths (RyuApp.GLOBAL_VIEW), e.g. ryu.topology.switches and the
+applications using it, and the REST API applications, can not be sharded;
+ryu-manager refuses to start the workers if such an application is
+loaded.  Only the events which applications declare global themselves
+are carried by ryu.controller.shard_bus.
+
+Example::
+
+    from ryu.controller import event
+    from ryu.controller import shard
+
+    @shard.register_global_event
+    class EventTenantUpdate(event.EventBase):
+        def __init__(self, tenant_id, macs):
+            super(EventTenantUpdate, self).__init__()
+            self.tenant_id = tenant_id
+            self.macs = macs
+"""
+
+import logging
+import os
+import pickle
+import socket
+import struct
+import subprocess
+import sys
+
+import ryu.base.app_manager
+from ryu.lib import hub
+from ryu.lib import recvbuf
+
+LOG = logging.getLogger('ryu.controller.shard')
+
+# Set by the supervisor for the worker processes.
+WORKER_ID_ENV = 'RYU_SHARD_WORKER_ID'
+WORKERS_ENV = 'RYU_SHARD_WORKERS'
+BUS_FD_ENV = 'RYU_SHARD_BUS_FD'
+
+_FRAME_HEADER = struct.Struct('!I')
+_WORKER_CHECK_INTERVAL = 1
+
+_GLOBAL_EVENTS = set()
+
+
+def register_global_event(ev_cls):
+    """
+    Declare ev_cls to be relayed to all worker processes.
+
+    Can be used as a class decorator.
+    """
+    _GLOBAL_EVENTS.add(ev_cls)
+    return ev_cls
+
+
+def global_events():
+    return list(_GLOBAL_EVENTS)
+
+
+def global_view_apps(app_mgr):
+    """
+    Returns the names of the applications and the contexts loaded by
+    app_mgr (AppManager) which can not be sharded.
+    See RyuApp.GLOBAL_VIEW.
+    """
+    from ryu.app import wsgi
+
+    app_classes = list(app_mgr.applications_cls.values())
+    # The RyuApps among the contexts.  Not issubclass(cls, RyuApp), which
+    # is False for the classes defined before app_manager is reloaded.
+    app_classes.extend(cls for cls in app_mgr.contexts_cls.values()
+                       if hasattr(cls, 'GLOBAL_VIEW'))
+    names = []
+    for cls in app_classes:
+        global_view = cls.GLOBAL_VIEW
+        if global_view is None:
+            global_view = any(issubclass(context_cls, wsgi.WSGIApplication)
+                              for _, context_cls in cls.context_iteritems())
+        if global_view:
+            names.append('%s.%s' % (cls.__module__, cls.__name__))
+    return names
+
+
+def worker_id():
+    """
+    Returns the index of this worker process, or None if datapaths are not
+    sharded.
+    """
+    value = os.environ.get(WORKER_ID_ENV)
+    if value is None:
+        return None
+    return int(value)
+
+
+def is_worker():
+    return worker_id() is not None
+
+
+def is_assigned(index):
+    """
+    Returns True if the index-th item of a list shared by all workers
+    (e.g. the addresses of switches to connect to) belongs to this process.
+    Always True if datapaths are not sharded.
+    """
+    if not is_worker():
+        return True
+    return index % int(os.environ[WORKERS_ENV]) == worker_id()
+
+
+def source_bricks(ev_cls):
+    # Same as how AppManager finds the applications generating ev_cls.
+    bricks = []
+    app_manager = ryu.base.app_manager
+    brick = app_manager._lookup_service_brick_by_ev_cls(ev_cls)
+    if brick is not None:
+        bricks.append(brick)
+    for brick in app_manager.SERVICE_BRICKS.values():
+        if ev_cls in brick._EVENTS and brick not in bricks:
+            bricks.append(brick)
+    return bricks
+
+
+def frames(sock):
+    # Generates the frames received from sock until it is closed.
+    rbuf = recvbuf.RecvBuffer()
+    while True:
+        if not rbuf.recv_into(sock, _FRAME_HEADER.size):
+            return
+        while len(rbuf) >= _FRAME_HEADER.size:
+            (length,) = _FRAME_HEADER.unpack_from(rbuf.peek())
+            frame_len = _FRAME_HEADER.size + length
+            if len(rbuf) < frame_len:
+                break
+            yield rbuf.consume(frame_len).tobytes()
+
+
+def encode(ev):
+    data = pickle.dumps(ev, pickle.HIGHEST_PROTOCOL)
+    return _FRAME_HEADER.pack(len(data)) + data
+
+
+def decode(frame):
+    return pickle.loads(frame[_FRAME_HEADER.size:])
+
+
+class _Worker(object):
+    def __init__(self, index, workers, args):
+        self.index = index
+        self.sock, child_sock = socket.socketpair()
+        self.send_lock = hub.Semaphore()
+
+        fd = child_sock.fileno()
+        if hasattr(os, 'set_inheritable'):
+            os.set_inheritable(fd, True)
+        env = dict(os.environ)
+        env[WORKER_ID_ENV] = str(index)
+        env[WORKERS_ENV] = str(workers)
+        env[BUS_FD_ENV] = str(fd)
+        cmd = [sys.executable, '-m', 'ryu.cmd.manager'] + list(args)
+        self.proc = subprocess.Popen(cmd, env=env, close_fds=False)
+        child_sock.close()
+        LOG.info('started worker %d (pid %d)', index, self.proc.pid)
+
+    def send(self, frame):
+        with self.send_lock:
+            try:
+                self.sock.sendall(frame)
+            except (EOFError, IOError):
+                pass
+
+
+def _relay_loop(worker, workers):
+    for frame in frames(worker.sock):
+        for w in workers:
+            if w is not worker:
+                w.send(frame)
+
+
+def run_supervisor(num_workers, args=None):
+    """
+    Start num_workers ryu-manager processes with the given command line
+    arguments, relay global events among them and wait for them to exit.
+    """
+    if args is None:
+        args = sys.argv[1:]
+
+    workers = []
+    try:
+        for i in range(num_workers):
+            workers.append(_Worker(i, num_workers, args))
+        threads = [hub.spawn(_relay_loop, w, workers) for w in workers]
+        running = list(workers)
+        while running:
+            hub.sleep(_WORKER_CHECK_INTERVAL)
+            for w in list(running):
+                if w.proc.poll() is not None:
+                    LOG.info('worker %d exited with %d',
+                             w.index, w.proc.returncode)
+                    running.remove(w)
+        hub.joinall(threads)
+    finally:
+        for w in workers:
+            if w.proc.poll() is None:
+                w.proc.terminate()
+                w.proc.wait()
@@ -0,0 +1,69 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Relay of global events between the worker processes sharding datapaths.
+
+See ryu.controller.shard.
+"""
+
+import os
+import socket
+
+from ryu.base import app_manager
+from ryu.controller import shard
+from ryu.lib import hub
+
+
+class EventBus(app_manager.RyuApp):
+    """
+    Relay global events between this worker and the other workers.
+
+    ryu-manager loads this application in each worker process.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(EventBus, self).__init__(*args, **kwargs)
+        fd = int(os.environ[shard.BUS_FD_ENV])
+        self.sock = socket.fromfd(fd, socket.AF_UNIX, socket.SOCK_STREAM)
+        os.close(fd)
+
+    def start(self):
+        super(EventBus, self).start()
+        for ev_cls in shard.global_events():
+            self.register_handler(ev_cls, self._global_event_handler)
+            for brick in shard.source_bricks(ev_cls):
+                brick.register_observer(ev_cls, self.name)
+        self.threads.append(hub.spawn(self._recv_loop))
+
+    def close(self):
+        self.sock.close()
+
+    def _global_event_handler(self, ev):
+        try:
+            frame = shard.encode(ev)
+        except Exception:
+            self.logger.exception('failed to relay %s', ev.__class__.__name__)
+            return
+        self.sock.sendall(frame)
+
+    def _recv_loop(self):
+        for frame in shard.frames(self.sock):
+            ev = shard.decode(frame)
+            # Deliver to the local observers, but not back to this bus.
+            for brick in shard.source_bricks(ev.__class__):
+                for observer in brick.get_observers(ev, None):
+                    if observer != self.name:
+                        brick.send_event(observer, ev)
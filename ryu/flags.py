@@ -23,6 +23,17 @@ from ryu import cfg
 
 CONF = cfg.CONF
 
+CONF.register_cli_opts([
+    # base/app_manager
+    cfg.MultiStrOpt('app-event-queue', default=[],
+                    help='event queue of an application in the form of '
+                         '<app name>:<size>[:<policy>][:metrics], where '
+                         'policy is one of block, drop-oldest, drop-newest, '
+                         'coalesce, and metrics records the latency of the '
+                         'event handlers (use multiple times for multiple '
+                         'applications)'),
+])
+
 CONF.register_cli_opts([
     # tests/switch/tester
     cfg.StrOpt('target', default='0000000000000001', help='target sw dp-id'),
@@ -0,0 +1,1196 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Implementation of ryu.lib.hub on an asyncio event loop.
+
+Don't use this module directly.  Set RYU_HUB_TYPE=asyncio and use
+ryu.lib.hub instead.
+
+Ryu applications are written as blocking code running in green threads,
+so this hub keeps green threads (greenlets) but replaces eventlet's
+scheduler and I/O with an asyncio event loop: the loop runs in a
+dedicated "hub" greenlet, and a green thread which has to wait registers
+a callback on the loop (a timer, or a reader or a writer of a file
+descriptor) which switches back to it, and switches to the hub.  Since
+the loop is created with asyncio.new_event_loop(), an alternative loop
+implementation like uvloop is used if its policy is installed (e.g.
+uvloop.install()) before the first use of the hub.
+
+patch() makes time.sleep(), select.select() and socket.socket cooperate
+with the green threads, like eventlet.monkey_patch() does; the sockets
+created by this hub (listen(), connect(), StreamServer and StreamClient)
+cooperate without it.  The other modules eventlet can patch (e.g. os and
+threading) are not patched and patch() logs a warning if they are asked
+for: a green thread blocked in them blocks all the green threads.  SSL
+sockets created with the ssl module are not cooperative either.
+The patched functions block as before in the threads other than the one
+running the hub.
+"""
+
+import asyncio
+import base64
+import collections
+import errno
+import hashlib
+import io
+import logging
+import os
+import select
+import socket
+import ssl
+import struct
+import sys
+import time
+import traceback
+import wsgiref.simple_server
+
+import greenlet
+
+from ryu.lib import ip
+
+LOG = logging.getLogger('ryu.lib.hub')
+
+TaskExit = greenlet.GreenletExit
+getcurrent = greenlet.getcurrent
+
+# The originals of the functions replaced by patch().
+_time_sleep = time.sleep
+_select_select = select.select
+_socket_socket = socket.socket
+
+
+class _Hub(object):
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self.greenlet = greenlet.greenlet(self._run)
+        self.root = _get_root()
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        while True:
+            self.loop.run_forever()
+
+    def switch(self):
+        """
+        Suspend the current green thread until a callback switches back
+        to it.  Returns the value given by the callback.
+        """
+        cur = greenlet.getcurrent()
+        if cur is self.greenlet:
+            raise RuntimeError('cannot block in the hub')
+        return self.greenlet.switch()
+
+
+def _get_root():
+    # Returns the main greenlet of the current thread.
+    g = greenlet.getcurrent()
+    while g.parent is not None:
+        g = g.parent
+    return g
+
+
+_hub = None
+
+
+def _get_hub():
+    global _hub
+    if _hub is None or _hub.greenlet.dead:
+        _hub = _Hub()
+    return _hub
+
+
+def get_loop():
+    """
+    Returns the asyncio event loop of the hub.
+    """
+    return _get_hub().loop
+
+
+def _switch_later(seconds, g, *args):
+    loop = _get_hub().loop
+    if seconds > 0:
+        return loop.call_later(seconds, g.switch, *args)
+    return loop.call_soon(g.switch, *args)
+
+
+def sleep(seconds=0):
+    hub = _get_hub()
+    handle = _switch_later(seconds, greenlet.getcurrent())
+    try:
+        hub.switch()
+    finally:
+        handle.cancel()
+
+
+def _in_hub_thread():
+    return _hub is None or _hub.root is _get_root()
+
+
+def _patched_sleep(seconds=0):
+    if not _in_hub_thread():
+        return _time_sleep(seconds)
+    return sleep(seconds)
+
+
+def _patched_select(rlist, wlist, xlist, timeout=None):
+    if not _in_hub_thread():
+        return _select_select(rlist, wlist, xlist, timeout)
+    ready = _select_select(rlist, wlist, xlist, 0)
+    if any(ready) or timeout == 0:
+        return ready
+
+    # Like eventlet, returns only the first file which becomes ready.
+    # The exceptional conditions of xlist are not waited for.
+    cur = greenlet.getcurrent()
+    hub = _get_hub()
+    readers = []
+    writers = []
+    handle = None
+    try:
+        for f in rlist:
+            hub.loop.add_reader(f, cur.switch, ([f], [], []))
+            readers.append(f)
+        for f in wlist:
+            hub.loop.add_writer(f, cur.switch, ([], [f], []))
+            writers.append(f)
+        if timeout is not None:
+            handle = hub.loop.call_later(timeout, cur.switch, ([], [], []))
+        return hub.switch()
+    finally:
+        if handle is not None:
+            handle.cancel()
+        for f in readers:
+            hub.loop.remove_reader(f)
+        for f in writers:
+            hub.loop.remove_writer(f)
+
+
+def _patch_time():
+    time.sleep = _patched_sleep
+
+
+def _patch_select():
+    select.select = _patched_select
+
+
+def _patch_socket():
+    socket.socket = _PatchedSocket
+
+
+_PATCHERS = {
+    'select': _patch_select,
+    'socket': _patch_socket,
+    'time': _patch_time,
+}
+
+# Modules eventlet.monkey_patch() patches by default.
+_PATCH_DEFAULTS = ('os', 'select', 'socket', 'thread', 'time')
+
+
+def patch(**on):
+    """
+    Patch the standard library to cooperate with green threads.
+
+    Takes the keyword arguments of eventlet.monkey_patch(): patches all
+    the modules except those set to False, or only those set to True if
+    any.  See the module document for the modules supported.
+    """
+    default = on.pop('all', not any(on.values()))
+    names = set(_PATCH_DEFAULTS) | set(on)
+    names = sorted(name for name in names if on.get(name, default))
+    unsupported = [name for name in names if name not in _PATCHERS]
+    for name in names:
+        if name in _PATCHERS:
+            _PATCHERS[name]()
+    if unsupported:
+        LOG.warning('hub: the asyncio hub does not patch %s; blocking '
+                    'calls of them block all green threads',
+                    ', '.join(unsupported))
+
+
+#
+# Green threads
+#
+
+class GreenThread(object):
+    def __init__(self, func, args, kwargs):
+        hub = _get_hub()
+        self._greenlet = greenlet.greenlet(self._main, parent=hub.greenlet)
+        self._func = func
+        self._args = args
+        self._kwargs = kwargs
+        self._waiters = _WaitQueue()
+        self._done = False
+        self._result = None
+        self._exc_info = None
+        self._handle = None
+
+    def _start(self, seconds):
+        self._handle = _switch_later(seconds, self._greenlet)
+
+    def _main(self):
+        self._handle = None
+        try:
+            self._result = self._func(*self._args, **self._kwargs)
+        except BaseException:
+            self._exc_info = sys.exc_info()
+        finally:
+            self._func = self._args = self._kwargs = None
+            self._finish()
+
+    def _finish(self):
+        self._done = True
+        self._waiters.notify_all()
+
+    def dead(self):
+        return self._done
+
+    def wait(self):
+        """
+        Wait for the thread to exit and return the result or raise the
+        exception of it.
+        """
+        if not self._done:
+            self._waiters.wait()
+        if self._exc_info is not None:
+            exc = self._exc_info[1]
+            raise exc.with_traceback(self._exc_info[2])
+        return self._result
+
+    def kill(self, *throw_args):
+        if self._done:
+            return
+        if not self._greenlet:
+            # Not started yet.
+            if self._handle is not None:
+                self._handle.cancel()
+                self._handle = None
+            self._exc_info = (TaskExit, TaskExit(), None)
+            self._finish()
+            return
+        if not throw_args:
+            throw_args = (TaskExit, )
+        cur = greenlet.getcurrent()
+        hub = _get_hub()
+        if cur is self._greenlet:
+            raise throw_args[0]
+        if cur is not hub.greenlet:
+            # Come back after the thread handles the exception.
+            hub.loop.call_soon(cur.switch)
+        self._greenlet.throw(*throw_args)
+
+
+def _launcher(func, raise_error):
+    def _launch(*args, **kwargs):
+        # Mimic gevent's default raise_error=False behaviour
+        # by not propagating an exception to the joiner.
+        try:
+            return func(*args, **kwargs)
+        except TaskExit:
+            pass
+        except BaseException as e:
+            if raise_error:
+                raise e
+            # Log uncaught exception.
+            # Note: this is an intentional divergence from gevent
+            # behaviour; gevent silently ignores such exceptions.
+            LOG.error('hub: uncaught exception: %s',
+                      traceback.format_exc())
+    return _launch
+
+
+def spawn(*args, **kwargs):
+    raise_error = kwargs.pop('raise_error', False)
+    func = _launcher(args[0], raise_error)
+    thread = GreenThread(func, args[1:], kwargs)
+    thread._start(0)
+    return thread
+
+
+def spawn_after(seconds, *args, **kwargs):
+    raise_error = kwargs.pop('raise_error', False)
+    func = _launcher(args[0], raise_error)
+    thread = GreenThread(func, args[1:], kwargs)
+    thread._start(seconds)
+    return thread
+
+
+def kill(thread):
+    thread.kill()
+
+
+def joinall(threads):
+    for t in threads:
+        # This try-except is necessary when killing an inactive
+        # greenthread.
+        try:
+            t.wait()
+        except TaskExit:
+            pass
+
+
+class Timeout(BaseException):
+    """
+    Raise exception (or this Timeout itself if exception is None) in the
+    current green thread after seconds unless it's cancelled.
+    Can be used as a context manager.
+    """
+
+    def __init__(self, seconds=None, exception=None):
+        super(Timeout, self).__init__(seconds)
+        self.seconds = seconds
+        self.exception = exception
+        self._handle = None
+        self.start()
+
+    def start(self):
+        self.cancel()
+        if self.seconds is None:
+            return
+        self._handle = _get_hub().loop.call_later(
+            self.seconds, self._expire, greenlet.getcurrent())
+
+    def _expire(self, g):
+        self._handle = None
+        if g.dead:
+            return
+        if self.exception is None or self.exception is False:
+            g.throw(self)
+        else:
+            g.throw(self.exception)
+
+    @property
+    def pending(self):
+        return self._handle is not None and not self._handle.cancelled()
+
+    def cancel(self):
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, typ, value, tb):
+        self.cancel()
+        if value is self and self.exception is False:
+            return True
+        return False
+
+    def __str__(self):
+        if self.seconds is None:
+            return ''
+        return '%s second%s' % (self.seconds,
+                                '' if self.seconds == 1 else 's')
+
+
+#
+# Synchronization primitives
+#
+
+class _Waiter(object):
+    __slots__ = ('greenlet', 'notified', 'handle')
+
+    def __init__(self, g):
+        self.greenlet = g
+        self.notified = False
+        # The callback scheduled by _WaitQueue.notify() to wake up the
+        # green thread, until it is called.
+        self.handle = None
+
+
+class _WaitQueue(object):
+    def __init__(self):
+        self._waiters = collections.deque()
+
+    def __len__(self):
+        return len(self._waiters)
+
+    def wait(self, timeout=None):
+        """
+        Wait until notified.  Returns False on timeout.
+        """
+        waiter = _Waiter(greenlet.getcurrent())
+        self._waiters.append(waiter)
+        hub = _get_hub()
+        timer = None
+        if timeout is not None:
+            timer = hub.loop.call_later(timeout, waiter.greenlet.switch)
+        try:
+            hub.switch()
+        except BaseException:
+            if not waiter.notified:
+                self._waiters.remove(waiter)
+            elif waiter.handle is not None:
+                # Notified, but interrupted before woken up.  Cancel the
+                # wake up, which would resume this thread wherever it
+                # blocks next, and pass the notification on.
+                waiter.handle.cancel()
+                self.notify()
+            raise
+        finally:
+            if timer is not None:
+                timer.cancel()
+        if not waiter.notified:
+            self._waiters.remove(waiter)
+            return False
+        if waiter.handle is not None:
+            # Timed out in the same iteration of the loop as notified.
+            waiter.handle.cancel()
+            waiter.handle = None
+        return True
+
+    def notify(self):
+        if self._waiters:
+            waiter = self._waiters.popleft()
+            waiter.notified = True
+            waiter.handle = _get_hub().loop.call_soon(self._wake, waiter)
+
+    @staticmethod
+    def _wake(waiter):
+        waiter.handle = None
+        waiter.greenlet.switch()
+
+    def notify_all(self):
+        for _ in range(len(self._waiters)):
+            self.notify()
+
+
+class Semaphore(object):
+    def __init__(self, value=1):
+        if value < 0:
+            raise ValueError('Semaphore must be initialized with a positive '
+                             'number, got %s' % value)
+        self.counter = value
+        self._waiters = _WaitQueue()
+
+    def locked(self):
+        return self.counter <= 0
+
+    def acquire(self, blocking=True, timeout=None):
+        if not blocking and self.locked():
+            return False
+        while self.counter <= 0:
+            if not self._waiters.wait(timeout):
+                return False
+        self.counter -= 1
+        return True
+
+    def release(self, blocking=True):
+        self.counter += 1
+        self._waiters.notify()
+        return True
+
+    def __enter__(self):
+        self.acquire()
+
+    def __exit__(self, typ, val, tb):
+        self.release()
+
+    @property
+    def balance(self):
+        return self.counter - len(self._waiters)
+
+
+class BoundedSemaphore(Semaphore):
+    def __init__(self, value=1):
+        super(BoundedSemaphore, self).__init__(value)
+        self.original_counter = value
+
+    def release(self, blocking=True):
+        if self.counter >= self.original_counter:
+            raise ValueError('Semaphore released too many times')
+        return super(BoundedSemaphore, self).release(blocking)
+
+
+class QueueEmpty(Exception):
+    pass
+
+
+class QueueFull(Exception):
+    pass
+
+
+class Queue(object):
+    """
+    A FIFO queue for green threads.  Unbounded if maxsize is None or 0.
+    """
+
+    def __init__(self, maxsize=None):
+        self.maxsize = maxsize
+        self._items = collections.deque()
+        self._getters = _WaitQueue()
+        self._putters = _WaitQueue()
+
+    def qsize(self):
+        return len(self._items)
+
+    def empty(self):
+        return not self._items
+
+    def full(self):
+        return bool(self.maxsize) and len(self._items) >= self.maxsize
+
+    def put(self, item, block=True, timeout=None):
+        while self.full():
+            if not block or not self._putters.wait(timeout):
+                raise QueueFull()
+        self._items.append(item)
+        self._getters.notify()
+
+    def put_nowait(self, item):
+        self.put(item, False)
+
+    def get(self, block=True, timeout=None):
+        while not self._items:
+            if not block or not self._getters.wait(timeout):
+                raise QueueEmpty()
+        item = self._items.popleft()
+        self._putters.notify()
+        return item
+
+    def get_nowait(self):
+        return self.get(False)
+
+
+class Event(object):
+    def __init__(self):
+        self._cond = False
+        self._waiters = _WaitQueue()
+
+    def is_set(self):
+        return self._cond
+
+    def set(self):
+        self._cond = True
+        self._waiters.notify_all()
+
+    def clear(self):
+        self._cond = False
+
+    def wait(self, timeout=None):
+        if not self._cond:
+            self._waiters.wait(timeout)
+        return self._cond
+
+
+#
+# Sockets
+#
+
+def _wait_fd(fd, write, timeout):
+    if not _in_hub_thread():
+        if write:
+            ready = _select_select([], [fd], [], timeout)
+        else:
+            ready = _select_select([fd], [], [], timeout)
+        if not any(ready):
+            raise socket.timeout('timed out')
+        return
+
+    cur = greenlet.getcurrent()
+    hub = _get_hub()
+    if write:
+        hub.loop.add_writer(fd, cur.switch, True)
+    else:
+        hub.loop.add_reader(fd, cur.switch, True)
+    handle = None
+    if timeout is not None:
+        handle = hub.loop.call_later(timeout, cur.switch, False)
+    try:
+        if not hub.switch():
+            raise socket.timeout('timed out')
+    finally:
+        if handle is not None:
+            handle.cancel()
+        if write:
+            hub.loop.remove_writer(fd)
+        else:
+            hub.loop.remove_reader(fd)
+
+
+class GreenSocket(object):
+    """
+    A wrapper of a (possibly SSL) socket which blocks only the current
+    green thread.
+    """
+
+    def __init__(self, sock):
+        if isinstance(sock, GreenSocket):
+            sock = sock.fd
+        sock.setblocking(False)
+        self.fd = sock
+        self._timeout = None
+
+    def __getattr__(self, name):
+        return getattr(self.fd, name)
+
+    def _io(self, write, func, *args):
+        while True:
+            try:
+                return func(*args)
+            except ssl.SSLWantReadError:
+                _wait_fd(self.fd, False, self._timeout)
+            except ssl.SSLWantWriteError:
+                _wait_fd(self.fd, True, self._timeout)
+            except (BlockingIOError, InterruptedError):
+                _wait_fd(self.fd, write, self._timeout)
+
+    def settimeout(self, timeout):
+        self._timeout = timeout
+
+    def gettimeout(self):
+        return self._timeout
+
+    def setblocking(self, flag):
+        self._timeout = None if flag else 0.0
+
+    def accept(self):
+        sock, addr = self._io(False, self.fd.accept)
+        return GreenSocket(sock), addr
+
+    def connect(self, address):
+        err = self.fd.connect_ex(address)
+        if err in (errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EALREADY):
+            _wait_fd(self.fd, True, self._timeout)
+            err = self.fd.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+        if err not in (0, errno.EISCONN):
+            raise socket.error(err, os.strerror(err))
+
+    def recv(self, bufsize, flags=0):
+        return self._io(False, self.fd.recv, bufsize, flags)
+
+    def recv_into(self, buf, nbytes=0, flags=0):
+        return self._io(False, self.fd.recv_into, buf, nbytes, flags)
+
+    def recvfrom(self, bufsize, flags=0):
+        return self._io(False, self.fd.recvfrom, bufsize, flags)
+
+    def send(self, data, flags=0):
+        return self._io(True, self.fd.send, data, flags)
+
+    def sendall(self, data, flags=0):
+        view = memoryview(data).cast('B')
+        while view:
+            sent = self.send(view, flags)
+            view = view[sent:]
+
+    def sendto(self, data, *args):
+        return self._io(True, self.fd.sendto, data, *args)
+
+    def do_handshake(self):
+        return self._io(False, self.fd.do_handshake)
+
+    def makefile(self, mode='r', buffering=None, **kwargs):
+        # socket.SocketIO calls only recv_into(), send() and
+        # _decref_socketios() of this object.
+        raw = socket.SocketIO(self, mode.replace('b', ''))
+        if 'r' in mode:
+            return io.BufferedReader(raw)
+        return io.BufferedWriter(raw)
+
+    def _decref_socketios(self):
+        pass
+
+    def close(self):
+        self.fd.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class _PatchedSocket(_socket_socket):
+    """
+    socket.socket replaced by patch(), which blocks only the current
+    green thread.  The file descriptor is always non-blocking and the
+    timeout is kept apart.
+    """
+
+    __slots__ = ('_green_timeout', )
+
+    def __init__(self, *args, **kwargs):
+        super(_PatchedSocket, self).__init__(*args, **kwargs)
+        self._green_timeout = socket.getdefaulttimeout()
+        super(_PatchedSocket, self).settimeout(0.0)
+
+    @property
+    def timeout(self):
+        return self._green_timeout
+
+    def settimeout(self, timeout):
+        if timeout is not None and timeout < 0:
+            raise ValueError('Timeout value out of range')
+        self._green_timeout = timeout
+
+    def gettimeout(self):
+        return self._green_timeout
+
+    def setblocking(self, flag):
+        self._green_timeout = None if flag else 0.0
+
+    def getblocking(self):
+        return self._green_timeout != 0.0
+
+    def _io(self, write, func, *args):
+        while True:
+            try:
+                return func(*args)
+            except (BlockingIOError, InterruptedError):
+                if self._green_timeout == 0.0:
+                    raise
+                _wait_fd(self, write, self._green_timeout)
+
+    def _accept(self):
+        # socket.accept() creates a socket of the class socket.socket,
+        # which is this class while patched.
+        return self._io(False, super(_PatchedSocket, self)._accept)
+
+    def connect(self, address):
+        err = super(_PatchedSocket, self).connect_ex(address)
+        if err in (errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EALREADY):
+            if self._green_timeout == 0.0:
+                raise BlockingIOError(err, os.strerror(err))
+            _wait_fd(self, True, self._green_timeout)
+            err = self.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+        if err not in (0, errno.EISCONN):
+            raise socket.error(err, os.strerror(err))
+
+    def connect_ex(self, address):
+        try:
+            self.connect(address)
+        except socket.timeout:
+            return errno.EAGAIN
+        except socket.error as e:
+            return e.errno
+        return 0
+
+    def recv(self, *args):
+        return self._io(False, super(_PatchedSocket, self).recv, *args)
+
+    def recv_into(self, *args):
+        return self._io(False, super(_PatchedSocket, self).recv_into,
+                        *args)
+
+    def recvfrom(self, *args):
+        return self._io(False, super(_PatchedSocket, self).recvfrom, *args)
+
+    def recvfrom_into(self, *args):
+        return self._io(False, super(_PatchedSocket, self).recvfrom_into,
+                        *args)
+
+    def send(self, *args):
+        return self._io(True, super(_PatchedSocket, self).send, *args)
+
+    def sendall(self, data, flags=0):
+        view = memoryview(data).cast('B')
+        while view:
+            sent = self.send(view, flags)
+            view = view[sent:]
+
+    def sendto(self, *args):
+        return self._io(True, super(_PatchedSocket, self).sendto, *args)
+
+
+def _wrap_ssl(sock, ssl_ctx, server_side, **kwargs):
+    sslsock = ssl_ctx.wrap_socket(sock.fd, server_side=server_side,
+                                  do_handshake_on_connect=False, **kwargs)
+    sock = GreenSocket(sslsock)
+    sock.do_handshake()
+    return sock
+
+
+def _make_ssl_ctx(ssl_args, server_side):
+    ssl_args = dict(ssl_args)
+    ctx = ssl_args.pop('ssl_ctx', None)
+    if ctx is None:
+        ctx = ssl.SSLContext(ssl_args.pop('ssl_version', ssl.PROTOCOL_TLS))
+    else:
+        ssl_args.pop('ssl_version', None)
+    if 'certfile' in ssl_args:
+        ctx.load_cert_chain(ssl_args.pop('certfile'),
+                            ssl_args.pop('keyfile', None))
+    if 'cert_reqs' in ssl_args:
+        ctx.verify_mode = ssl_args.pop('cert_reqs')
+    if 'ca_certs' in ssl_args:
+        ctx.load_verify_locations(ssl_args.pop('ca_certs'))
+    ssl_args.pop('server_side', None)
+    return ctx, ssl_args
+
+
+def listen(addr, family=socket.AF_INET, backlog=50, reuse_addr=True,
+           reuse_port=None):
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    if reuse_addr and sys.platform[:3] != 'win':
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    # Same as eventlet.listen(); StreamServer of multiple processes can
+    # listen on the same port.
+    if family in (socket.AF_INET, socket.AF_INET6) and \
+            hasattr(socket, 'SO_REUSEPORT') and reuse_port is not False:
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        except (OSError, socket.error):
+            pass
+    sock.bind(addr)
+    sock.listen(backlog)
+    return GreenSocket(sock)
+
+
+def connect(addr, family=socket.AF_INET, bind=None, timeout=None):
+    sock = GreenSocket(socket.socket(family, socket.SOCK_STREAM))
+    sock.settimeout(timeout)
+    try:
+        if bind is not None:
+            sock.bind(bind)
+        sock.connect(addr)
+    except BaseException:
+        sock.close()
+        raise
+    sock.settimeout(None)
+    return sock
+
+
+class StreamServer(object):
+    def __init__(self, listen_info, handle=None, backlog=None,
+                 spawn='default', **ssl_args):
+        assert backlog is None
+        assert spawn == 'default'
+
+        if ip.valid_ipv6(listen_info[0]):
+            self.server = listen(listen_info, family=socket.AF_INET6)
+        elif os.path.isdir(os.path.dirname(listen_info[0])):
+            # Case for Unix domain socket
+            self.server = listen(listen_info[0], family=socket.AF_UNIX)
+        else:
+            self.server = listen(listen_info)
+
+        if ssl_args:
+            ctx, kwargs = _make_ssl_ctx(ssl_args, True)
+
+            def wrap_and_handle(sock, addr):
+                handle(_wrap_ssl(sock, ctx, True, **kwargs), addr)
+
+            self.handle = wrap_and_handle
+        else:
+            self.handle = handle
+
+    def serve_forever(self):
+        while True:
+            sock, addr = self.server.accept()
+            spawn(self.handle, sock, addr)
+
+
+class StreamClient(object):
+    def __init__(self, addr, timeout=None, **ssl_args):
+        assert ip.valid_ipv4(addr[0]) or ip.valid_ipv6(addr[0])
+        self.addr = addr
+        self.timeout = timeout
+        self.ssl_args = ssl_args
+        self._is_active = True
+
+    def connect(self):
+        if ip.valid_ipv6(self.addr[0]):
+            family = socket.AF_INET6
+        else:
+            family = socket.AF_INET
+        try:
+            client = connect(self.addr, family, timeout=self.timeout)
+        except socket.error:
+            return None
+
+        if self.ssl_args:
+            ctx, kwargs = _make_ssl_ctx(self.ssl_args, False)
+            client = _wrap_ssl(client, ctx, False, **kwargs)
+
+        return client
+
+    def connect_loop(self, handle, interval):
+        while self._is_active:
+            sock = self.connect()
+            if sock:
+                handle(sock, self.addr)
+            sleep(interval)
+
+    def stop(self):
+        self._is_active = False
+
+
+# Keys of the WSGI environ set by WSGIServer: the connection, and a flag
+# set by the application which took over the connection.
+_ENV_SOCKET = 'ryu.hub.socket'
+_ENV_HANDLED = 'ryu.hub.handled'
+
+
+class _WSGIServerHandler(wsgiref.simple_server.ServerHandler):
+    def finish_response(self):
+        if self.environ.get(_ENV_HANDLED):
+            # The response has been written by the application, e.g.
+            # WebSocketWSGI.  The result (e.g. ALREADY_HANDLED of
+            # eventlet) is not a response body.
+            self.request_handler.close_connection = True
+            return
+        super(_WSGIServerHandler, self).finish_response()
+
+
+class _WSGIRequestHandler(wsgiref.simple_server.WSGIRequestHandler):
+    def log_message(self, format, *args):
+        LOG.info('%s - - %s', self.address_string(), format % args)
+
+    def get_environ(self):
+        env = super(_WSGIRequestHandler, self).get_environ()
+        env[_ENV_SOCKET] = self.connection
+        return env
+
+    def handle(self):
+        # Same as WSGIRequestHandler.handle() except for the handler class.
+        self.raw_requestline = self.rfile.readline(65537)
+        if len(self.raw_requestline) > 65536:
+            self.requestline = ''
+            self.request_version = ''
+            self.command = ''
+            self.send_error(414)
+            return
+
+        if not self.parse_request():
+            return
+
+        handler = _WSGIServerHandler(
+            self.rfile, self.wfile, self.get_stderr(), self.get_environ(),
+            multithread=False)
+        handler.request_handler = self
+        handler.run(self.server.get_app())
+
+
+class _WSGIServerInfo(object):
+    # What WSGIRequestHandler needs of a server.
+    def __init__(self, app, server_name, server_port):
+        self.application = app
+        self.base_environ = {
+            'SERVER_NAME': server_name,
+            'GATEWAY_INTERFACE': 'CGI/1.1',
+            'SERVER_PORT': str(server_port),
+            'REMOTE_HOST': '',
+            'CONTENT_LENGTH': '',
+            'SCRIPT_NAME': '',
+        }
+
+    def get_app(self):
+        return self.application
+
+
+class WSGIServer(StreamServer):
+    def serve_forever(self):
+        addr = self.server.getsockname()
+        if isinstance(addr, tuple):
+            info = _WSGIServerInfo(self.handle, socket.getfqdn(addr[0]),
+                                   addr[1])
+        else:
+            info = _WSGIServerInfo(self.handle, addr, '')
+
+        def handle(sock, client_addr):
+            try:
+                _WSGIRequestHandler(sock, client_addr, info)
+            except (socket.error, ssl.SSLError) as e:
+                LOG.debug('hub: WSGI connection error: %s', e)
+            finally:
+                sock.close()
+
+        while True:
+            sock, client_addr = self.server.accept()
+            spawn(handle, sock, client_addr)
+
+
+# RFC 6455
+_WS_GUID = b'258EAFA5-E914-47DA-95CA-C5AB0DC85B11'
+_WS_VERSION = '13'
+_WS_OP_CONT = 0x0
+_WS_OP_TEXT = 0x1
+_WS_OP_BINARY = 0x2
+_WS_OP_CLOSE = 0x8
+_WS_OP_PING = 0x9
+_WS_OP_PONG = 0xa
+_WS_CLOSE_NORMAL = 1000
+_WS_CLOSE_PROTOCOL_ERROR = 1002
+_WS_CLOSE_TOO_BIG = 1009
+
+
+class _WebSocketError(Exception):
+    def __init__(self, code):
+        super(_WebSocketError, self).__init__(code)
+        self.code = code
+
+
+class WebSocket(object):
+    """
+    A server side WebSocket connection given to the handler of
+    WebSocketWSGI.  Has the methods and the attributes of
+    eventlet.websocket.WebSocket used by Ryu.
+    """
+
+    def __init__(self, sock, rfile, environ):
+        self.socket = sock
+        self.environ = environ
+        self.path = environ.get('PATH_INFO')
+        self.origin = environ.get('HTTP_ORIGIN')
+        self.protocol = None
+        self._rfile = rfile
+        self._send_lock = Semaphore()
+        self._closed = False
+
+    def _read(self, size):
+        buf = self._rfile.read(size)
+        if len(buf) < size:
+            raise EOFError()
+        return buf
+
+    def _read_frame(self, max_size):
+        b0, b1 = struct.unpack('!BB', self._read(2))
+        if b0 & 0x70 or not b1 & 0x80:
+            # Reserved bits set, or not masked by the client.
+            raise _WebSocketError(_WS_CLOSE_PROTOCOL_ERROR)
+        length = b1 & 0x7f
+        if length == 126:
+            length = struct.unpack('!H', self._read(2))[0]
+        elif length == 127:
+            length = struct.unpack('!Q', self._read(8))[0]
+        if length > max_size:
+            raise _WebSocketError(_WS_CLOSE_TOO_BIG)
+        mask = self._read(4)
+        data = self._read(length)
+        if length:
+            mask = (mask * (length // 4 + 1))[:length]
+            data = (int.from_bytes(data, 'big') ^
+                    int.from_bytes(mask, 'big')).to_bytes(length, 'big')
+        return bool(b0 & 0x80), b0 & 0x0f, data
+
+    def _send_frame(self, opcode, data):
+        length = len(data)
+        if length < 126:
+            header = struct.pack('!BB', 0x80 | opcode, length)
+        elif length < 0x10000:
+            header = struct.pack('!BBH', 0x80 | opcode, 126, length)
+        else:
+            header = struct.pack('!BBQ', 0x80 | opcode, 127, length)
+        with self._send_lock:
+            self.socket.sendall(header + data)
+
+    def send(self, message):
+        """
+        Send a message; a text message if str, or a binary one if bytes.
+        """
+        if isinstance(message, str):
+            self._send_frame(_WS_OP_TEXT, message.encode('utf-8'))
+        else:
+            self._send_frame(_WS_OP_BINARY, bytes(message))
+
+    def wait(self, max_size=16 * 1024 * 1024):
+        """
+        Wait for a message and return it; str for a text message, or bytes
+        for a binary one.  Returns None when the connection is closed.
+        """
+        opcode = None
+        fragments = []
+        size = 0
+        try:
+            while not self._closed:
+                fin, op, data = self._read_frame(max_size - size)
+                if op == _WS_OP_CLOSE:
+                    self.close()
+                    return None
+                elif op == _WS_OP_PING:
+                    self._send_frame(_WS_OP_PONG, data)
+                    continue
+                elif op == _WS_OP_PONG:
+                    continue
+                elif op == _WS_OP_CONT:
+                    if opcode is None:
+                        raise _WebSocketError(_WS_CLOSE_PROTOCOL_ERROR)
+                elif op in (_WS_OP_TEXT, _WS_OP_BINARY):
+                    if opcode is not None:
+                        raise _WebSocketError(_WS_CLOSE_PROTOCOL_ERROR)
+                    opcode = op
+                else:
+                    raise _WebSocketError(_WS_CLOSE_PROTOCOL_ERROR)
+                fragments.append(data)
+                size += len(data)
+                if fin:
+                    message = b''.join(fragments)
+                    if opcode == _WS_OP_TEXT:
+                        return message.decode('utf-8')
+                    return message
+        except _WebSocketError as e:
+            self.close(e.code)
+        except UnicodeDecodeError:
+            self.close(_WS_CLOSE_PROTOCOL_ERROR)
+        except (EOFError, socket.error, ssl.SSLError):
+            self._closed = True
+        return None
+
+    def close(self, code=_WS_CLOSE_NORMAL):
+        """
+        Send a close frame, unless already closed.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._send_frame(_WS_OP_CLOSE, struct.pack('!H', code))
+        except (socket.error, ssl.SSLError):
+            pass
+
+
+class WebSocketWSGI(object):
+    """
+    A WSGI application which upgrades the request to a WebSocket
+    connection and calls `handler` with the WebSocket.  Can be used only
+    with WSGIServer of this hub.
+    """
+
+    def __init__(self, handler):
+        self.handler = handler
+
+    def __call__(self, environ, start_response):
+        # The response is written to the socket directly, as the caller
+        # may not return the result of this (see ryu.app.wsgi.websocket).
+        sock = environ[_ENV_SOCKET]
+        environ[_ENV_HANDLED] = True
+        key = environ.get('HTTP_SEC_WEBSOCKET_KEY')
+        if (environ.get('HTTP_UPGRADE', '').lower() != 'websocket' or
+                environ.get('HTTP_SEC_WEBSOCKET_VERSION') != _WS_VERSION or
+                not key):
+            sock.sendall(b'HTTP/1.1 400 Bad Request\r\n'
+                         b'Connection: close\r\n'
+                         b'Content-Length: 0\r\n'
+                         b'Sec-WebSocket-Version: 13\r\n\r\n')
+            return []
+
+        accept = base64.b64encode(
+            hashlib.sha1(key.encode('latin-1') + _WS_GUID).digest())
+        sock.sendall(b'HTTP/1.1 101 Switching Protocols\r\n'
+                     b'Upgrade: websocket\r\n'
+                     b'Connection: Upgrade\r\n'
+                     b'Sec-WebSocket-Accept: ' + accept + b'\r\n\r\n')
+
+        ws = WebSocket(sock, environ['wsgi.input'], environ)
+        try:
+            self.handler(ws)
+        except (socket.error, ssl.SSLError) as e:
+            LOG.debug('hub: WebSocket connection error: %s', e)
+        finally:
+            ws.close()
+        return []
@@ -0,0 +1,195 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Bounded event queue with overflow policies and metrics.
+
+The policy decides what put() does when the queue is full:
+
+================ ===========================================================
+Policy           Behavior
+================ ===========================================================
+POLICY_BLOCK     Wait until a slot becomes free.
+POLICY_DROP_OLD  Drop the oldest queued item and queue the new one.
+POLICY_DROP_NEW  Drop the new item.
+POLICY_COALESCE  Replace the queued item which has the same key as the new
+                 one, keeping its position in the queue.  Wait like
+                 POLICY_BLOCK if there is no such item.
+================ ===========================================================
+
+Items put with force=True are queued regardless of the policy and the
+capacity.
+"""
+
+import bisect
+import collections
+
+from ryu.lib import hub
+
+POLICY_BLOCK = 'block'
+POLICY_DROP_OLD = 'drop-oldest'
+POLICY_DROP_NEW = 'drop-newest'
+POLICY_COALESCE = 'coalesce'
+
+POLICIES = [POLICY_BLOCK, POLICY_DROP_OLD, POLICY_DROP_NEW, POLICY_COALESCE]
+
+# Upper bounds (in seconds) of the buckets of LatencyHistogram.
+LATENCY_BUCKETS = [0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5]
+
+
+class LatencyHistogram(object):
+    def __init__(self, buckets=None):
+        self.buckets = list(buckets or LATENCY_BUCKETS)
+        # The last one counts the samples exceeding the last bucket.
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def to_dict(self):
+        return {
+            'buckets': self.buckets,
+            'counts': list(self.counts),
+            'count': self.count,
+            'total': self.total,
+            'max': self.max,
+        }
+
+
+class EventQueue(object):
+    """
+    A queue of at most maxsize items for green threads.
+
+    key is a function which returns the key of an item for POLICY_COALESCE,
+    or None if the item can not be coalesced.
+    """
+
+    def __init__(self, maxsize, policy=POLICY_BLOCK, key=None):
+        if policy not in POLICIES:
+            raise ValueError('unknown queue policy: %s' % policy)
+        assert maxsize > 0
+        self.maxsize = maxsize
+        self.policy = policy
+        self._key = key
+        # Items are queued as [item, key] so that POLICY_COALESCE can
+        # replace them.
+        self._items = collections.deque()
+        self._keys = {}  # key -> queued [item, key]
+        self._slots = hub.Semaphore(maxsize)
+        self._avail = hub.Semaphore(0)
+        self._overflow = 0  # number of items queued beyond maxsize
+        self.high_water = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.blocked = 0
+
+    def qsize(self):
+        return len(self._items)
+
+    def __len__(self):
+        return len(self._items)
+
+    def empty(self):
+        return not self._items
+
+    def full(self):
+        return len(self._items) >= self.maxsize
+
+    def _append(self, item, key):
+        cell = [item, key]
+        self._items.append(cell)
+        if key is not None:
+            self._keys[key] = cell
+        if len(self._items) > self.high_water:
+            self.high_water = len(self._items)
+        self._avail.release()
+
+    def _popleft(self):
+        cell = self._items.popleft()
+        key = cell[1]
+        if key is not None and self._keys.get(key) is cell:
+            del self._keys[key]
+        return cell[0]
+
+    def put(self, item, force=False, block=False):
+        """
+        Queue item according to the policy.
+        Returns False if item is dropped.
+
+        If force is True, item is queued even if the queue is full.
+        If block is True, POLICY_BLOCK is used instead of the policy.
+        """
+        key = None
+        if self.policy == POLICY_COALESCE and self._key is not None:
+            key = self._key(item)
+
+        if self._slots.acquire(blocking=False):
+            self._append(item, key)
+            return True
+
+        if force:
+            self._overflow += 1
+            self._append(item, key)
+            return True
+
+        policy = POLICY_BLOCK if block else self.policy
+        if policy == POLICY_DROP_NEW:
+            self.dropped += 1
+            return False
+        if policy == POLICY_DROP_OLD and self._avail.acquire(blocking=False):
+            self._popleft()
+            self.dropped += 1
+            # Reuse the slot of the dropped one.
+            self._append(item, key)
+            return True
+        if policy == POLICY_COALESCE and key in self._keys:
+            self._keys[key][0] = item
+            self.coalesced += 1
+            return True
+
+        self.blocked += 1
+        self._slots.acquire()
+        self._append(item, key)
+        return True
+
+    def get(self):
+        """
+        Remove and return the oldest item, waiting for one if empty.
+        """
+        self._avail.acquire()
+        item = self._popleft()
+        if self._overflow:
+            self._overflow -= 1
+        else:
+            self._slots.release()
+        return item
+
+    def stats(self):
+        return {
+            'maxsize': self.maxsize,
+            'policy': self.policy,
+            'depth': len(self._items),
+            'high_water': self.high_water,
+            'dropped': self.dropped,
+            'coalesced': self.coalesced,
+            'blocked': self.blocked,
+        }
@@ -106,6 +106,7 @@ if HUB_TYPE == 'eventlet':
 
     Queue = eventlet.queue.LightQueue
     QueueEmpty = eventlet.queue.Empty
+    QueueFull = eventlet.queue.Full
     Semaphore = eventlet.semaphore.Semaphore
     BoundedSemaphore = eventlet.semaphore.BoundedSemaphore
     TaskExit = greenlet.GreenletExit
@@ -233,3 +234,30 @@ if HUB_TYPE == 'eventlet':
                     pass
 
             return self._cond
+
+elif HUB_TYPE == 'asyncio':
+    import socket
+
+    from ryu.lib import _asyncio_hub
+
+    getcurrent = _asyncio_hub.getcurrent
+    patch = _asyncio_hub.patch
+    sleep = _asyncio_hub.sleep
+    listen = _asyncio_hub.listen
+    connect = _asyncio_hub.connect
+    spawn = _asyncio_hub.spawn
+    spawn_after = _asyncio_hub.spawn_after
+    kill = _asyncio_hub.kill
+    joinall = _asyncio_hub.joinall
+    Queue = _asyncio_hub.Queue
+    QueueEmpty = _asyncio_hub.QueueEmpty
+    QueueFull = _asyncio_hub.QueueFull
+    Semaphore = _asyncio_hub.Semaphore
+    BoundedSemaphore = _asyncio_hub.BoundedSemaphore
+    TaskExit = _asyncio_hub.TaskExit
+    StreamServer = _asyncio_hub.StreamServer
+    StreamClient = _asyncio_hub.StreamClient
+    WSGIServer = _asyncio_hub.WSGIServer
+    WebSocketWSGI = _asyncio_hub.WebSocketWSGI
+    Timeout = _asyncio_hub.Timeout
+    Event = _asyncio_hub.Event
@@ -58,6 +58,12 @@ def haddr_to_int(addr):
         raise ValueError
 
 
+def int_to_haddr(value):
+    """Format mac address in integer value into human readable form"""
+    h = '%012x' % value
+    return ':'.join(h[i:i + 2] for i in range(0, 12, 2))
+
+
 def haddr_to_bin(string):
     """Parse mac address string in human readable format into
     internal representation"""
@@ -15,6 +15,7 @@
 
 import base64
 import logging
+import time
 
 import netaddr
 import six
@@ -26,6 +27,7 @@ from ryu.ofproto import ofproto_v1_2
 
 LOG = logging.getLogger(__name__)
 DEFAULT_TIMEOUT = 1.0
+REPLY_QUEUE_SIZE = 16
 
 # NOTE(jkoelker) Constants for converting actions
 OUTPUT = 'OUTPUT'
@@ -262,6 +264,134 @@ def send_stats_request(dp, stats, waiters, msgs, logger=None):
         del waiters_per_dp[stats.xid]
 
 
+class _ReplyQueue(object):
+    # Stands for the list of the replies of a waiter, and passes them to
+    # the consumer of send_stats_request_iter() as they are appended.
+    # At most REPLY_QUEUE_SIZE replies are kept; append() blocks the
+    # receiving handler until the consumer reads, and gives up on the
+    # consumer if it does not read within DEFAULT_TIMEOUT.
+    def __init__(self, waiters_per_dp, xid, logger=None):
+        self._queue = hub.Queue(REPLY_QUEUE_SIZE)
+        self._waiters_per_dp = waiters_per_dp
+        self._xid = xid
+        self._logger = logger
+        self.stalled = False
+
+    def append(self, msg):
+        if self.stalled:
+            return
+        try:
+            self._queue.put(msg, timeout=DEFAULT_TIMEOUT)
+        except hub.QueueFull:
+            # Drop the waiter, so that the rest of the replies are
+            # discarded instead of being queued.
+            self.stalled = True
+            self._waiters_per_dp.pop(self._xid, None)
+            get_logger(self._logger).warning(
+                'Consumer of the replies with xid(%x) stalled, '
+                'discarding the rest of them', self._xid)
+
+
+def send_stats_request_iter(dp, stats, waiters, logger=None):
+    """
+    Send a stats request like send_stats_request(), and return an iterator
+    of the reply messages which generates each message as it arrives,
+    so that the messages are not kept after they are consumed.
+
+    If the iterator is not advanced for DEFAULT_TIMEOUT while the replies
+    are arriving, the request is abandoned and the iterator stops early.
+    """
+    dp.set_xid(stats)
+    waiters_per_dp = waiters.setdefault(dp.id, {})
+    lock = hub.Event()
+    msgs = _ReplyQueue(waiters_per_dp, stats.xid, logger)
+    waiters_per_dp[stats.xid] = (lock, msgs)
+    send_msg(dp, stats, logger)
+    return _iter_replies(waiters_per_dp, stats.xid, lock, msgs)
+
+
+def _iter_replies(waiters_per_dp, xid, lock, msgs):
+    queue = msgs._queue
+    try:
+        while not ((lock.is_set() or msgs.stalled) and queue.empty()):
+            try:
+                msg = queue.get(timeout=DEFAULT_TIMEOUT)
+            except hub.QueueEmpty:
+                break
+            yield msg
+    finally:
+        if not lock.is_set():
+            waiters_per_dp.pop(xid, None)
+
+
+def get_stats_all(dps, method, *args, **kwargs):
+    """
+    Call method(dp, *args) for each datapath of dps concurrently, and
+    generate (dp, result) in the order of completion.
+
+    method is one of the get_*() functions of ryu.lib.ofctl_v1_*,
+    chosen by get_stats_all() according to the OpenFlow version of each
+    datapath if it is given as a dict of version to function.
+
+    Each request waits for the replies with the timeout of
+    send_stats_request().  If the keyword argument "timeout" is given,
+    the datapaths which have not answered after "timeout" seconds in total
+    are generated with None.  If method raises an exception, the exception
+    is generated instead of the result.
+
+    e.g.::
+
+        methods = dict((ver, ofctl.get_port_stats)
+                       for ver, ofctl in supported_ofctl.items())
+        for dp, ports in get_stats_all(dps, methods, waiters):
+            ...
+    """
+    timeout = kwargs.pop('timeout', None)
+    logger = get_logger(kwargs.pop('logger', None))
+    results = hub.Queue()
+
+    def _get_stats(dp, func):
+        try:
+            result = func(dp, *args, **kwargs)
+        except Exception as e:
+            logger.debug('stats request to datapath(' + dpid._DPID_FMT +
+                         ') failed: %s', dp.id, e)
+            result = e
+        results.put((dp, result))
+
+    pending = {}
+    for dp in dps:
+        func = method
+        if isinstance(method, dict):
+            func = method.get(dp.ofproto.OFP_VERSION)
+            if func is None:
+                yield dp, ValueError('Unsupported OF version: %s'
+                                     % dp.ofproto.OFP_VERSION)
+                continue
+        pending[dp.id] = dp
+        hub.spawn(_get_stats, dp, func)
+
+    if timeout is not None:
+        deadline = time.time() + timeout
+    while pending:
+        if timeout is None:
+            dp, result = results.get()
+        else:
+            try:
+                dp, result = results.get(
+                    timeout=max(0, deadline - time.time()))
+            except hub.QueueEmpty:
+                # The requests left are not cancelled; send_stats_request()
+                # cleans up their waiters after its own timeout.
+                for dp in pending.values():
+                    logger.debug('stats request to datapath(' +
+                                 dpid._DPID_FMT + ') timed out', dp.id)
+                    yield dp, None
+                return
+        del pending[dp.id]
+        yield dp, result
+
+
 def str_to_int(str_num):
     return int(str(str_num), 0)
 
@@ -437,7 +437,7 @@ def get_queue_config(dp, waiters, port=None, to_user=True):
     return wrap_dpid_dict(dp, configs, to_user)
 
 
-def get_flow_stats(dp, waiters, flow=None, to_user=True):
+def _flow_stats_request(dp, flow):
     flow = flow if flow else {}
     table_id = UTIL.ofp_table_from_user(
         flow.get('table_id', dp.ofproto.OFPTT_ALL))
@@ -457,10 +457,10 @@ def get_flow_stats(dp, waiters, flow=None, to_user=True):
         dp, flags, table_id, out_port, out_group, cookie, cookie_mask,
         match)
 
-    msgs = []
-    ofctl_utils.send_stats_request(dp, stats, waiters, msgs, LOG)
+    return stats, priority
 
-    flows = []
+
+def _iter_flows(msgs, priority, to_user):
     for msg in msgs:
         for stats in msg.body:
             if 0 <= priority != stats.priority:
@@ -488,11 +488,30 @@ def get_flow_stats(dp, waiters, flow=None, to_user=True):
                 s['match'] = stats.match
                 s['table_id'] = stats.table_id
 
-            flows.append(s)
+            yield s
+
+
+def get_flow_stats(dp, waiters, flow=None, to_user=True):
+    stats, priority = _flow_stats_request(dp, flow)
+    msgs = []
+    ofctl_utils.send_stats_request(dp, stats, waiters, msgs, LOG)
+
+    flows = list(_iter_flows(msgs, priority, to_user))
 
     return wrap_dpid_dict(dp, flows, to_user)
 
 
+def iter_flow_stats(dp, waiters, flow=None, to_user=True):
+    """
+    Same as get_flow_stats() but returns an iterator of the flow
+    entries, converted as the replies arrive, instead of a dict.
+    """
+    stats, priority = _flow_stats_request(dp, flow)
+    msgs = ofctl_utils.send_stats_request_iter(dp, stats, waiters, LOG)
+
+    return _iter_flows(msgs, priority, to_user)
+
+
 def get_aggregate_flow_stats(dp, waiters, flow=None, to_user=True):
     flow = flow if flow else {}
     table_id = UTIL.ofp_table_from_user(
@@ -315,7 +315,7 @@ def get_queue_desc(dp, waiters, port_no=None, queue_id=None, to_user=True):
     return wrap_dpid_dict(dp, configs, to_user)
 
 
-def get_flow_stats(dp, waiters, flow=None, to_user=True):
+def _flow_stats_request(dp, flow):
     flow = flow if flow else {}
     table_id = UTIL.ofp_table_from_user(
         flow.get('table_id', dp.ofproto.OFPTT_ALL))
@@ -335,10 +335,10 @@ def get_flow_stats(dp, waiters, flow=None, to_user=True):
         dp, flags, table_id, out_port, out_group, cookie, cookie_mask,
         match)
 
-    msgs = []
-    ofctl_utils.send_stats_request(dp, stats, waiters, msgs, LOG)
+    return stats, priority
 
-    flows = []
+
+def _iter_flows(msgs, priority, to_user):
     for msg in msgs:
         for stats in msg.body:
             if 0 <= priority != stats.priority:
@@ -347,11 +347,30 @@ def get_flow_stats(dp, waiters, flow=None, to_user=True):
             s = stats.to_jsondict()[stats.__class__.__name__]
             s['instructions'] = instructions_to_str(stats.instructions)
             s['match'] = match_to_str(stats.match)
-            flows.append(s)
+            yield s
+
+
+def get_flow_stats(dp, waiters, flow=None, to_user=True):
+    stats, priority = _flow_stats_request(dp, flow)
+    msgs = []
+    ofctl_utils.send_stats_request(dp, stats, waiters, msgs, LOG)
+
+    flows = list(_iter_flows(msgs, priority, to_user))
 
     return wrap_dpid_dict(dp, flows, to_user)
 
 
+def iter_flow_stats(dp, waiters, flow=None, to_user=True):
+    """
+    Same as get_flow_stats() but returns an iterator of the flow
+    entries, converted as the replies arrive, instead of a dict.
+    """
+    stats, priority = _flow_stats_request(dp, flow)
+    msgs = ofctl_utils.send_stats_request_iter(dp, stats, waiters, LOG)
+
+    return _iter_flows(msgs, priority, to_user)
+
+
 def get_aggregate_flow_stats(dp, waiters, flow=None, to_user=True):
     flow = flow if flow else {}
     table_id = UTIL.ofp_table_from_user(
@@ -0,0 +1,152 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Header-only extraction of the common L2/L3/L4 fields of a frame.
+
+extract() reads the fields which learning and routing applications
+usually look at directly from the buffer, without instantiating the
+protocol classes of ryu.lib.packet.  It returns a flat tuple::
+
+    (eth_dst, eth_src, vlan_vid, eth_type,
+     ip_src, ip_dst, ip_proto, l4_src, l4_dst)
+
+=========== ============================================================
+Field       Description
+=========== ============================================================
+eth_dst     Destination MAC address as an integer
+eth_src     Source MAC address as an integer
+vlan_vid    VLAN ID of the outermost 802.1Q/802.1ad tag, or None
+eth_type    Ethertype after the VLAN tags (ETH_TYPE_IEEE802_3 for 802.3
+            frames as ryu.lib.packet.ethernet does)
+ip_src      IPv4 or IPv6 source address as an integer, or the sender
+            protocol address of ARP
+ip_dst      IPv4 or IPv6 destination address as an integer, or the target
+            protocol address of ARP
+ip_proto    IP protocol number (the next header of the fixed IPv6
+            header), or the opcode of ARP
+l4_src      Source port of TCP, UDP and SCTP, or the type of ICMP and
+            ICMPv6
+l4_dst      Destination port of TCP, UDP and SCTP, or the code of ICMP and
+            ICMPv6
+=========== ============================================================
+
+The fields which are not present, or not reached because the frame is
+truncated, are None.  L4 fields are not extracted from non-first IPv4
+fragments nor after IPv6 extension headers.  None is returned if the
+frame is shorter than an Ethernet header.
+
+The full decode is still available with ryu.lib.packet.packet.Packet
+when the application needs more than these fields.
+
+Example::
+
+    (eth_dst, eth_src, _vid, eth_type) = header_fields.extract(msg.data)[:4]
+    if eth_type == ether_types.ETH_TYPE_LLDP:
+        return
+    pkt = packet.Packet(msg.data)  # only when needed
+"""
+
+import struct
+
+from . import ether_types
+from . import in_proto
+
+# indexes of the tuple returned by extract()
+ETH_DST = 0
+ETH_SRC = 1
+VLAN_VID = 2
+ETH_TYPE = 3
+IP_SRC = 4
+IP_DST = 5
+IP_PROTO = 6
+L4_SRC = 7
+L4_DST = 8
+
+# dst (16 + 32 bits), src (16 + 32 bits), ethertype
+_ETHERNET = struct.Struct('!HIHIH')
+# tci, ethertype
+_VLAN = struct.Struct('!HH')
+# version and ihl, flags and offset, proto, src, dst
+_IPV4 = struct.Struct('!B5xHxB2xII')
+# next header, src (2 * 64 bits), dst (2 * 64 bits)
+_IPV6 = struct.Struct('!6xBxQQQQ')
+# opcode, spa, tpa
+_ARP = struct.Struct('!6xH6xI6xI')
+# src port, dst port
+_PORTS = struct.Struct('!HH')
+# type, code
+_ICMP = struct.Struct('!BB')
+
+_VLAN_TYPES = (ether_types.ETH_TYPE_8021Q, ether_types.ETH_TYPE_8021AD)
+_PORTS_PROTOS = (in_proto.IPPROTO_TCP, in_proto.IPPROTO_UDP,
+                 in_proto.IPPROTO_SCTP)
+_ICMP_PROTOS = (in_proto.IPPROTO_ICMP, in_proto.IPPROTO_ICMPV6)
+
+
+def extract(data):
+    """
+    Returns the tuple of the header fields of the Ethernet frame data
+    (bytes or bytearray), or None if it is too short.
+    """
+    try:
+        (dst_hi, dst_lo, src_hi, src_lo,
+         eth_type) = _ETHERNET.unpack_from(data)
+    except struct.error:
+        return None
+    eth_dst = dst_hi << 32 | dst_lo
+    eth_src = src_hi << 32 | src_lo
+    if eth_type <= ether_types.ETH_TYPE_IEEE802_3:
+        return (eth_dst, eth_src, None, ether_types.ETH_TYPE_IEEE802_3,
+                None, None, None, None, None)
+
+    vid = ip_src = ip_dst = proto = l4_src = l4_dst = None
+    offset = _ETHERNET.size
+    try:
+        while eth_type in _VLAN_TYPES:
+            (tci, eth_type) = _VLAN.unpack_from(data, offset)
+            offset += _VLAN.size
+            if vid is None:
+                vid = tci & 0xfff
+
+        if eth_type == ether_types.ETH_TYPE_IP:
+            (ver_ihl, frag, proto, ip_src,
+             ip_dst) = _IPV4.unpack_from(data, offset)
+            if frag & 0x1fff:
+                proto_offset = None
+            else:
+                proto_offset = offset + (ver_ihl & 0xf) * 4
+        elif eth_type == ether_types.ETH_TYPE_IPV6:
+            (proto, src_hi, src_lo, dst_hi,
+             dst_lo) = _IPV6.unpack_from(data, offset)
+            ip_src = src_hi << 64 | src_lo
+            ip_dst = dst_hi << 64 | dst_lo
+            proto_offset = offset + _IPV6.size
+        elif eth_type == ether_types.ETH_TYPE_ARP:
+            (proto, ip_src, ip_dst) = _ARP.unpack_from(data, offset)
+            proto_offset = None
+        else:
+            proto_offset = None
+
+        if proto_offset is not None:
+            if proto in _PORTS_PROTOS:
+                (l4_src, l4_dst) = _PORTS.unpack_from(data, proto_offset)
+            elif proto in _ICMP_PROTOS:
+                (l4_src, l4_dst) = _ICMP.unpack_from(data, proto_offset)
+    except struct.error:
+        # truncated
+        pass
+    return (eth_dst, eth_src, vid, eth_type,
+            ip_src, ip_dst, proto, l4_src, l4_dst)
@@ -0,0 +1,121 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Growable receive buffer for stream framing.
+
+Data is read directly into a preallocated bytearray with socket.recv_into()
+and consumed by advancing an offset, so framing a stream of many small
+messages does not copy the remaining data once per message.  Only the
+unconsumed tail is moved, and only when there is no more room at the end
+of the buffer.
+
+Example::
+
+    rbuf = RecvBuffer()
+    while True:
+        if not rbuf.recv_into(sock, HEADER_LEN):
+            break
+        while len(rbuf) >= HEADER_LEN:
+            msg_len = parse_len(rbuf.peek(HEADER_LEN))
+            if len(rbuf) < msg_len:
+                break
+            handle(rbuf.consume(msg_len))
+
+Views returned by peek() and consume() refer to the internal storage and
+are only valid until the next call of recv_into().  Copy them (e.g. with
+bytes()) if the data needs to outlive the current batch.
+"""
+
+DEFAULT_SIZE = 64 * 1024
+
+
+class RecvBuffer(object):
+    def __init__(self, size=DEFAULT_SIZE):
+        assert size > 0
+        self._buf = bytearray(size)
+        self._view = memoryview(self._buf)
+        self._start = 0  # offset of the first unconsumed byte
+        self._end = 0  # offset next to the last received byte
+
+    def __len__(self):
+        return self._end - self._start
+
+    @property
+    def capacity(self):
+        return len(self._buf)
+
+    def _reserve(self, size):
+        # Make room for at least "size" bytes after self._end.
+        if len(self._buf) - self._end >= size:
+            return
+        data_len = self._end - self._start
+        if len(self._buf) - data_len < size:
+            capacity = len(self._buf)
+            while capacity - data_len < size:
+                capacity *= 2
+            buf = bytearray(capacity)
+            buf[:data_len] = self._view[self._start:self._end]
+            self._buf = buf
+            self._view = memoryview(buf)
+        elif data_len:
+            self._view[:data_len] = self._view[self._start:self._end]
+        self._start = 0
+        self._end = data_len
+
+    def recv_into(self, sock, min_size):
+        """
+        Receive data from sock into the buffer.
+
+        Ensures there is room for at least min_size bytes, but reads as much
+        as the free space allows.  Returns the number of bytes received,
+        which is 0 when the peer closed the connection.
+        """
+        self._reserve(min_size)
+        ret = sock.recv_into(self._view[self._end:])
+        self._end += ret
+        return ret
+
+    def feed(self, data):
+        """
+        Append data to the buffer.
+        """
+        size = len(data)
+        self._reserve(size)
+        self._view[self._end:self._end + size] = data
+        self._end += size
+
+    def peek(self, size=None):
+        """
+        Return a view of the first size unconsumed bytes without consuming
+        them.  Returns all unconsumed bytes if size is None.
+        """
+        if size is None:
+            return self._view[self._start:self._end]
+        assert size <= len(self)
+        return self._view[self._start:self._start + size]
+
+    def consume(self, size):
+        """
+        Return a view of the first size unconsumed bytes and mark them as
+        consumed.
+        """
+        assert size <= len(self)
+        start = self._start
+        self._start += size
+        if self._start == self._end:
+            # Rewind to avoid compacting when the buffer is fully consumed.
+            self._start = self._end = 0
+        return self._view[start:start + size]
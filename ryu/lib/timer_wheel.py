@@ -0,0 +1,217 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Hierarchical timer wheel.
+
+Tracks the deadlines of many keys with O(1) schedule and cancel.  Time is
+divided into ticks of "resolution" seconds.  The level l wheel has "size"
+slots of size ** l ticks each; a key is put in the lowest level whose span
+covers its deadline, and moved down to the lower levels ("cascaded") as
+the time advances.  Deadlines are rounded down to the tick, so a key can
+expire up to one tick early.
+
+Example::
+
+    wheel = TimerWheel()
+    wheel.schedule(port, time.time() + 0.9)
+    ...
+    for port in wheel.pop_expired(time.time()):
+        send(port)
+    timeout = wheel.next_timeout(time.time())
+"""
+
+import math
+import time
+
+DEFAULT_RESOLUTION = 0.01
+DEFAULT_SIZE = 64
+DEFAULT_LEVELS = 4
+
+_DUE = -1  # level of the keys whose deadline has passed
+
+
+class TimerWheel(object):
+    """
+    A timer wheel starting at the time start (time.time() by default).
+    """
+
+    def __init__(self, resolution=DEFAULT_RESOLUTION, size=DEFAULT_SIZE,
+                 levels=DEFAULT_LEVELS, start=None):
+        assert resolution > 0 and size > 1 and levels > 0
+        self.resolution = resolution
+        self.size = size
+        self.levels = levels
+        # The number of ticks of a slot of each level, and of the whole.
+        self._spans = [size ** l for l in range(levels + 1)]
+        # Slots are dicts used as ordered sets.
+        self._wheels = [[{} for _ in range(size)] for _ in range(levels)]
+        self._due = {}
+        self._timers = {}  # key -> (deadline tick, level, slot)
+        if start is None:
+            start = time.time()
+        self._tick = self._to_tick(start)
+
+    def __len__(self):
+        return len(self._timers)
+
+    def __contains__(self, key):
+        return key in self._timers
+
+    def _to_tick(self, when):
+        return int(math.floor(when / self.resolution))
+
+    def _insert(self, key, tick):
+        delta = tick - self._tick
+        if delta <= 0:
+            self._due[key] = None
+            self._timers[key] = (tick, _DUE, None)
+            return
+        spans = self._spans
+        for level in range(self.levels):
+            if delta < spans[level + 1]:
+                break
+        else:
+            # Beyond the whole wheel.  Park it in the farthest slot of the
+            # top level; it is put back when the slot is cascaded.
+            level = self.levels - 1
+            delta = spans[self.levels] - 1
+        slot = ((self._tick + delta) // spans[level]) % self.size
+        self._wheels[level][slot][key] = None
+        self._timers[key] = (tick, level, slot)
+
+    def schedule(self, key, when):
+        """
+        Set the deadline of key to when (in seconds, e.g. time.time()),
+        replacing the current deadline of key if any.
+        """
+        self.cancel(key)
+        self._insert(key, self._to_tick(when))
+
+    def cancel(self, key):
+        """
+        Remove key.  Returns False if key is not scheduled.
+        """
+        timer = self._timers.pop(key, None)
+        if timer is None:
+            return False
+        (_tick, level, slot) = timer
+        if level == _DUE:
+            del self._due[key]
+        else:
+            del self._wheels[level][slot][key]
+        return True
+
+    def deadline(self, key):
+        """
+        Returns the deadline of key rounded down to the tick, or None.
+        """
+        timer = self._timers.get(key)
+        if timer is None:
+            return None
+        return timer[0] * self.resolution
+
+    def clear(self):
+        for wheel in self._wheels:
+            for slot in wheel:
+                slot.clear()
+        self._due.clear()
+        self._timers.clear()
+
+    def _cascade(self, level):
+        slot = (self._tick // self._spans[level]) % self.size
+        keys = self._wheels[level][slot]
+        if not keys:
+            return
+        self._wheels[level][slot] = {}
+        for key in keys:
+            self._insert(key, self._timers[key][0])
+
+    def _next_tick(self, target):
+        # Returns the next tick up to target at which a slot of level 0
+        # expires or a non-empty slot of an upper level is cascaded.
+        tick = self._tick
+        size = self.size
+        wheel = self._wheels[0]
+        for i in range(1, min(size, target - tick) + 1):
+            if wheel[(tick + i) % size]:
+                target = tick + i
+                break
+        for level in range(1, self.levels):
+            span = self._spans[level]
+            wheel = self._wheels[level]
+            # The slots of a level repeat after size cascades.
+            start = (tick // span + 1) * span
+            for t in range(start, min(target, start + span * size), span):
+                if wheel[(t // span) % size]:
+                    target = t
+                    break
+        return target
+
+    def pop_expired(self, now):
+        """
+        Advance the time to now and remove and return the list of the keys
+        whose deadlines have passed.
+        """
+        target = self._to_tick(now)
+        if not self._timers:
+            self._tick = max(self._tick, target)
+            return []
+
+        expired = []
+        while True:
+            if self._due:
+                for key in self._due:
+                    del self._timers[key]
+                expired.extend(self._due)
+                self._due = {}
+            if self._tick >= target:
+                break
+            if not self._timers:
+                self._tick = target
+                break
+            # Skip the ticks with nothing to expire or cascade, so that
+            # catching up after a long idle time is cheap.
+            self._tick = self._next_tick(target)
+            for level in range(self.levels - 1, 0, -1):
+                if self._tick % self._spans[level] == 0:
+                    self._cascade(level)
+            slot = self._tick % self.size
+            keys = self._wheels[0][slot]
+            if keys:
+                self._wheels[0][slot] = {}
+                for key in keys:
+                    del self._timers[key]
+                expired.extend(keys)
+        return expired
+
+    def next_timeout(self, now):
+        """
+        Returns the seconds until pop_expired() should be called next, or
+        None if there are no keys.  It may be earlier than the nearest
+        deadline when the keys need to be cascaded.
+        """
+        if not self._timers:
+            return None
+        if self._due:
+            return 0
+        # The keys in the upper levels expire after their next cascade.
+        tick = (self._tick // self.size + 1) * self.size
+        wheel = self._wheels[0]
+        for i in range(1, tick - self._tick):
+            if wheel[(self._tick + i) % self.size]:
+                tick = self._tick + i
+                break
+        return max(0, tick * self.resolution - now)
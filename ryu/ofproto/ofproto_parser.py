@@ -184,6 +184,34 @@ class StringifyMixin(stringify.StringifyMixin):
         return obj_cls
 
 
+class LazyAttribute(object):
+    """
+    A descriptor for a message attribute which can be decoded on demand.
+
+    The value is stored in the instance attribute prefixed with "_".
+    The owner class should list the name in _opt_attributes so that the
+    attribute is stringified.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.attr = '_' + name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        decoders = obj.__dict__.get('_lazy_decoders')
+        if decoders and self.name in decoders:
+            obj.__dict__[self.attr] = decoders.pop(self.name)(obj)
+        return obj.__dict__.get(self.attr)
+
+    def __set__(self, obj, value):
+        decoders = obj.__dict__.get('_lazy_decoders')
+        if decoders:
+            decoders.pop(self.name, None)
+        obj.__dict__[self.attr] = value
+
+
 class MsgBase(StringifyMixin):
     """
     This is a base class for OpenFlow message classes.
@@ -227,6 +255,26 @@ class MsgBase(StringifyMixin):
     def set_buf(self, buf):
         self.buf = buffer(buf)
 
+    def set_lazy_attributes(self, **decoders):
+        """
+        Set attributes decoded from self.buf by the given functions.
+
+        Each keyword argument maps the name of an attribute to a function
+        which takes this message and returns the value.  If lazy parsing
+        is enabled for the datapath (its lazy_parsing attribute is true)
+        and the attribute is a LazyAttribute, the function is called on
+        the first access to the attribute.  Otherwise, it is called
+        immediately.
+        """
+        cls = self.__class__
+        lazy = getattr(self.datapath, 'lazy_parsing', False)
+        for name, decoder in decoders.items():
+            if (lazy and
+                    isinstance(getattr(cls, name, None), LazyAttribute)):
+                self.__dict__.setdefault('_lazy_decoders', {})[name] = decoder
+            else:
+                setattr(self, name, decoder(self))
+
     def __str__(self):
         def hexify(x):
             return hex(x) if isinstance(x, six.integer_types) else x
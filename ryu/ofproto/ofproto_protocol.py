@@ -51,6 +51,10 @@ class ProtocolDesc(object):
     OpenFlow protocol version flavor descriptor
     """
 
+    # Whether the attributes of received messages which support it are
+    # decoded on first access.  See MsgBase.set_lazy_attributes().
+    lazy_parsing = False
+
     def __init__(self, version=None):
         if version is None:
             version = max(_supported_versions)
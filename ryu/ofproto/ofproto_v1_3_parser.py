@@ -1049,14 +1049,10 @@ class OFPMatch(StringifyMixin):
         if self._composed_with_old_api():
             return self.serialize_old(buf, offset)
 
-        fields = [ofproto.oxm_from_user(k, uv) for (k, uv)
-                  in self._fields2]
-
         hdr_pack_str = '!HH'
         field_offset = offset + struct.calcsize(hdr_pack_str)
-        for (n, value, mask) in fields:
-            field_offset += ofproto.oxm_serialize(n, value, mask, buf,
-                                                  field_offset)
+        field_offset += ofproto.oxm_serialize_fields(self._fields2, buf,
+                                                     field_offset)
 
         length = field_offset - offset
         msg_pack_into(hdr_pack_str, buf, offset,
@@ -1325,17 +1321,23 @@ class OFPMatch(StringifyMixin):
         except struct.error as e:
             exc = e
 
-        fields = []
         try:
-            while length > 0:
-                n, value, mask, field_len = ofproto.oxm_parse(buf, offset)
-                k, uv = ofproto.oxm_to_user(n, value, mask)
-                fields.append((k, uv))
-                offset += field_len
-                length -= field_len
-        except struct.error as e:
-            exc = e
-            residue = buf[offset:]
+            fields = ofproto.oxm_parse_fields(buf, offset, length)
+        except struct.error:
+            # Parse again field by field to keep the fields preceding
+            # the truncated one.
+            fields = []
+            try:
+                while length > 0:
+                    n, value, mask, field_len = ofproto.oxm_parse(buf,
+                                                                  offset)
+                    k, uv = ofproto.oxm_to_user(n, value, mask)
+                    fields.append((k, uv))
+                    offset += field_len
+                    length -= field_len
+            except struct.error as e:
+                exc = e
+                residue = buf[offset:]
         match._fields2 = fields
         if exc is not None:
             raise exception.OFPTruncatedMessage(match, residue, exc)
@@ -2308,6 +2310,11 @@ class OFPPacketIn(MsgBase):
                               utils.hex_array(msg.data))
     """
 
+    _opt_attributes = ['match', 'data']
+
+    match = ofproto_parser.LazyAttribute('match')
+    data = ofproto_parser.LazyAttribute('data')
+
     def __init__(self, datapath, buffer_id=None, total_len=None, reason=None,
                  table_id=None, cookie=None, match=None, data=None):
         super(OFPPacketIn, self).__init__(datapath)
@@ -2328,18 +2335,29 @@ class OFPPacketIn(MsgBase):
             ofproto.OFP_PACKET_IN_PACK_STR,
             msg.buf, ofproto.OFP_HEADER_SIZE)
 
-        msg.match = OFPMatch.parser(msg.buf, ofproto.OFP_PACKET_IN_SIZE -
-                                    ofproto.OFP_MATCH_SIZE)
-
-        match_len = utils.round_up(msg.match.length, 8)
-        msg.data = msg.buf[(ofproto.OFP_PACKET_IN_SIZE -
-                            ofproto.OFP_MATCH_SIZE + match_len + 2):]
+        msg.set_lazy_attributes(match=cls._parse_match,
+                                data=cls._parse_data)
+        return msg
 
-        if msg.total_len < len(msg.data):
+    def _parse_match(self):
+        return OFPMatch.parser(self.buf, ofproto.OFP_PACKET_IN_SIZE -
+                               ofproto.OFP_MATCH_SIZE)
+
+    def _parse_data(self):
+        # Take the match length from the header of ofp_match so that
+        # the match need not be parsed.
+        (match_len,) = struct.unpack_from(
+            '!H', self.buf,
+            ofproto.OFP_PACKET_IN_SIZE - ofproto.OFP_MATCH_SIZE + 2)
+        match_len = utils.round_up(match_len, 8)
+        data = self.buf[(ofproto.OFP_PACKET_IN_SIZE -
+                         ofproto.OFP_MATCH_SIZE + match_len + 2):]
+
+        if self.total_len < len(data):
             # discard padding for 8-byte alignment of OFP packet
-            msg.data = msg.data[:msg.total_len]
+            data = data[:self.total_len]
 
-        return msg
+        return data
 
 
 @_register_parser
@@ -3936,19 +3954,21 @@ class OFPMultipartReply(MsgBase):
             datapath, version, msg_type, msg_len, xid, buf)
         msg.type = type_
         msg.flags = flags
+        msg.set_lazy_attributes(body=stats_type_cls._parse_body)
+        return msg
 
+    def _parse_body(self):
+        cls = self.__class__
         offset = ofproto.OFP_MULTIPART_REPLY_SIZE
         body = []
-        while offset < msg_len:
-            b = stats_type_cls.cls_stats_body_cls.parser(msg.buf, offset)
+        while offset < self.msg_len:
+            b = cls.cls_stats_body_cls.parser(self.buf, offset)
             body.append(b)
             offset += b.length if hasattr(b, 'length') else b.len
 
-        if stats_type_cls.cls_body_single_struct:
-            msg.body = body[0]
-        else:
-            msg.body = body
-        return msg
+        if cls.cls_body_single_struct:
+            return body[0]
+        return body
 
 
 class OFPDescStats(ofproto_parser.namedtuple('OFPDescStats', (
@@ -4192,6 +4212,10 @@ class OFPFlowStatsReply(OFPMultipartReply):
             self.logger.debug('FlowStats: %s', flows)
     """
 
+    _opt_attributes = ['body']
+
+    body = ofproto_parser.LazyAttribute('body')
+
     def __init__(self, datapath, type_=None, **kwargs):
         super(OFPFlowStatsReply, self).__init__(datapath, **kwargs)
 
@@ -74,7 +74,9 @@ from ryu.ofproto.oxx_fields import (
     _normalize_user,
     _parse,
     _parse_header,
+    _parse_fields,
     _serialize,
+    _serialize_fields,
     _serialize_header)
 from ryu.ofproto import ofproto_common
 
@@ -204,6 +206,11 @@ def generate(modname):
              functools.partial(_serialize, oxx, mod))
     add_attr('oxm_serialize_header',
              functools.partial(_serialize_header, oxx, mod))
+    add_attr('oxm_parse_fields',
+             functools.partial(_parse_fields, oxx, mod, num_to_field, {}))
+    add_attr('oxm_serialize_fields',
+             functools.partial(_serialize_fields, oxx, mod, name_to_field,
+                               {}))
 
     add_attr('oxm_to_jsondict', _to_jsondict)
     add_attr('oxm_from_jsondict', _from_jsondict)
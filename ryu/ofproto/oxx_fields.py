@@ -263,3 +263,214 @@ def _serialize(oxx, mod, n, value, mask, buf, offset):
                       (n << 9) | (0 << 8) | (exp_hdr_len + value_len),
                       bytes(exp_hdr), value)
     return struct.calcsize(pack_str)
+
+
+# Compiled codecs for sequences of fields.
+#
+# Encoding or decoding a list of fields with _serialize/_parse and
+# _from_user/_to_user looks up every field by name or number and packs it
+# with a format string built on the fly.  Since a program usually builds
+# many matches with the same fields in the same order, the following
+# functions instead compile a codec for each ordered sequence of fields
+# (the signature) the first time it is seen, which packs or unpacks all of
+# the fields with a single precompiled struct.Struct.  Integer fields are
+# packed as native struct integers without the conversion to bytes.
+#
+# Signatures whose fields have no fixed size (e.g. unknown fields) are not
+# compiled.  Fields which the compiled codecs can not handle as is
+# (e.g. integers out of range) fall back to the generic functions, so the
+# results are always the same as theirs.
+
+_FIELD_HEADER = struct.Struct('!I')
+_INT_FORMATS = {1: 'B', 2: 'H', 4: 'I', 8: 'Q'}
+_CODEC_CACHE_SIZE = 1024
+
+
+def _value_format(t, size):
+    if isinstance(t, type_desc.IntDescr) and t.size in _INT_FORMATS:
+        return _INT_FORMATS[t.size], True
+    return '%ds' % size, False
+
+
+def _bytes_from_user(t):
+    from_user = t.from_user
+    size = t.size
+
+    def conv(value):
+        binary = from_user(value)
+        if not isinstance(binary, bytes) or len(binary) != size:
+            raise ValueError('unexpected value %r' % (value,))
+        return binary
+    return conv
+
+
+class _FieldsSerializer(object):
+    def __init__(self, fmt, args, plan):
+        self._struct = struct.Struct(fmt)
+        self._args = args
+        # [(conv or None, value index, mask index or None), ...]
+        self._plan = plan
+
+    def serialize(self, fields, buf, offset):
+        args = list(self._args)
+        for (_k, uv), (conv, vi, mi) in zip(fields, self._plan):
+            if mi is None:
+                args[vi] = uv if conv is None else conv(uv)
+            else:
+                (value, mask) = uv
+                if conv is None:
+                    args[vi] = value
+                    args[mi] = mask
+                else:
+                    args[vi] = conv(value)
+                    args[mi] = conv(mask)
+        size = self._struct.size
+        if len(buf) < offset + size:
+            buf += bytearray(offset + size - len(buf))
+        self._struct.pack_into(buf, offset, *args)
+        return size
+
+
+class _FieldsParser(object):
+    def __init__(self, fmt, plan):
+        self._struct = struct.Struct(fmt)
+        # [(name, conv or None, masked), ...]
+        self._plan = plan
+
+    def parse(self, buf, offset):
+        values = self._struct.unpack_from(buf, offset)
+        fields = []
+        i = 0
+        for name, conv, masked in self._plan:
+            value = values[i]
+            if conv is not None:
+                value = conv(value)
+            if masked:
+                mask = values[i + 1]
+                if conv is not None:
+                    mask = conv(mask)
+                fields.append((name, (value, mask)))
+                i += 2
+            else:
+                fields.append((name, value))
+                i += 1
+        return fields
+
+
+def _compile_serializer(oxx, mod, name_to_field, signature):
+    fmt = '!'
+    args = []
+    plan = []
+    for name, masked in signature:
+        try:
+            f = name_to_field[name]
+        except KeyError:
+            return None
+        t = f.type
+        n, exp_hdr = _make_exp_hdr(oxx, mod, f.num)
+        exp_hdr_len = len(exp_hdr)
+        value_fmt, is_int = _value_format(t, t.size)
+        conv = None if is_int else _bytes_from_user(t)
+        if masked:
+            fmt += 'I%ds%s%s' % (exp_hdr_len, value_fmt, value_fmt)
+            args += [(n << 9) | (1 << 8) | (exp_hdr_len + t.size * 2),
+                     bytes(exp_hdr), None, None]
+            plan.append((conv, len(args) - 2, len(args) - 1))
+        else:
+            fmt += 'I%ds%s' % (exp_hdr_len, value_fmt)
+            args += [(n << 9) | (0 << 8) | (exp_hdr_len + t.size),
+                     bytes(exp_hdr), None]
+            plan.append((conv, len(args) - 1, None))
+    return _FieldsSerializer(fmt, args, plan)
+
+
+def _compile_parser(mod, num_to_field, headers):
+    fmt = '!'
+    plan = []
+    for header in headers:
+        if header >> 16 == OFPXXC_EXPERIMENTER:
+            # The header does not identify the field.
+            return None
+        num = header >> 9
+        hasmask = mod.oxm_tlv_header_extract_hasmask(header)
+        oxx_length = header & 0xff
+        if hasmask:
+            if oxx_length % 2:
+                return None
+            value_len = oxx_length // 2
+        else:
+            value_len = oxx_length
+        if value_len == 0:
+            return None
+        f = num_to_field.get(num)
+        if f is None:
+            t = type_desc.UnknownType
+            name = 'field_%d' % (num,)
+        else:
+            t = f.type
+            name = f.name
+            if t.size != value_len:
+                return None
+        value_fmt, is_int = _value_format(t, value_len)
+        conv = None if is_int else t.to_user
+        fmt += '4x' + value_fmt
+        if hasmask:
+            fmt += value_fmt
+        plan.append((name, conv, hasmask))
+    return _FieldsParser(fmt, plan)
+
+
+def _get_codec(cache, key, compile_, *args):
+    try:
+        return cache[key]
+    except KeyError:
+        pass
+    if len(cache) >= _CODEC_CACHE_SIZE:
+        cache.clear()
+    codec = cache[key] = compile_(*args + (key,))
+    return codec
+
+
+def _serialize_fields(oxx, mod, name_to_field, cache, fields, buf, offset):
+    signature = tuple((k, isinstance(uv, (tuple, list))) for (k, uv)
+                      in fields)
+    serializer = _get_codec(cache, signature, _compile_serializer,
+                            oxx, mod, name_to_field)
+    if serializer is not None:
+        try:
+            return serializer.serialize(fields, buf, offset)
+        except Exception:
+            # Let the generic functions handle or report it.
+            pass
+    from_user = getattr(mod, oxx + '_from_user')
+    field_offset = offset
+    for (k, uv) in fields:
+        (n, value, mask) = from_user(k, uv)
+        field_offset += _serialize(oxx, mod, n, value, mask, buf,
+                                   field_offset)
+    return field_offset - offset
+
+
+def _parse_fields(oxx, mod, num_to_field, cache, buf, offset, length):
+    parser = None
+    try:
+        headers = []
+        field_offset = offset
+        while length > field_offset - offset:
+            (header, ) = _FIELD_HEADER.unpack_from(buf, field_offset)
+            headers.append(header)
+            field_offset += _FIELD_HEADER.size + (header & 0xff)
+        parser = _get_codec(cache, tuple(headers), _compile_parser,
+                            mod, num_to_field)
+        if parser is not None:
+            return parser.parse(buf, offset)
+    except struct.error:
+        pass
+    to_user = getattr(mod, oxx + '_to_user')
+    fields = []
+    while length > 0:
+        n, value, mask, field_len = _parse(mod, buf, offset)
+        fields.append(to_user(n, value, mask))
+        offset += field_len
+        length -= field_len
+    return fields
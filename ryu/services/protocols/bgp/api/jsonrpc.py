@@ -74,9 +74,11 @@ class BgpWSJsonRpc(app_manager.RyuApp):
         return call('neighbors.get')
 
     @rpc_public('show.rib')
-    def _show_rib(self, family='ipv4'):
+    def _show_rib(self, family='ipv4', prefix=None):
         show = {}
         show['params'] = ['rib', family]
+        if prefix:
+            show['params'].append(prefix)
         return call('operator.show', **show)
 
 
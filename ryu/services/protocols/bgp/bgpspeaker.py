@@ -1111,12 +1111,17 @@ class BGPSpeaker(object):
 
         return call('operator.show', **show)
 
-    def rib_get(self, family='all', format='json'):
+    def rib_get(self, family='all', format='json', prefix=None):
         """ This method returns the BGP routing information in a json
         format. This will be improved soon.
 
         ``family`` specifies the address family of the RIB (e.g. 'ipv4').
 
+        ``prefix`` specifies a prefix formatted as those of the RIB
+        (e.g. '10.0.0.0/8' for 'ipv4' or '65000:100:10.0.0.0/8' for
+        'vpnv4'). If given, only the routes of the prefixes covered by it
+        return. It is supported for 'ipv4', 'ipv6', 'vpnv4' and 'vpnv6'.
+
         ``format`` specifies the format of the response.
         This parameter must be one of the following.
 
@@ -1127,6 +1132,8 @@ class BGPSpeaker(object):
             'params': ['rib', family],
             'format': format
         }
+        if prefix:
+            show['params'].append(prefix)
 
         return call('operator.show', **show)
 
@@ -165,6 +165,10 @@ class CoreService(Factory, Activity):
     def table_manager(self):
         return self._table_manager
 
+    @property
+    def bgp_processor(self):
+        return self._bgp_processor
+
     @property
     def importmap_manager(self):
         return self._importmap_manager
@@ -39,6 +39,9 @@ from ryu.services.protocols.bgp.constants import VRF_TABLE
 from ryu.services.protocols.bgp.model import OutgoingRoute
 from ryu.services.protocols.bgp.processor import BPR_ONLY_PATH
 from ryu.services.protocols.bgp.processor import BPR_UNKNOWN
+from ryu.services.protocols.bgp.processor import best_path_key
+from ryu.services.protocols.bgp.processor import compute_best_path_by_key
+from ryu.services.protocols.bgp.utils.radix import RadixTree
 
 
 LOG = logging.getLogger('bgpspeaker.info_base.base')
@@ -54,8 +57,18 @@ class Table(object):
     """
     ROUTE_FAMILY = RF_IPv4_UC
 
+    # Width of the prefixes returned by _radix_key() if the destinations
+    # can be indexed by their prefixes in a radix tree for prefix lookups,
+    # None otherwise.
+    RADIX_KEY_WIDTH = None
+
     def __init__(self, scope_id, core_service, signal_bus):
         self._destinations = dict()
+        # Index of the destinations by their prefixes, built by the first
+        # prefix lookup and kept up to date after that.  Each prefix maps
+        # to the sorted tuple of its destinations, since NLRIs which
+        # differ only in host bits share a prefix.
+        self._prefix_index = None
         # Scope in which this table exists.
         # If this table represents the VRF, then this could be a VPN ID.
         # For global/VPN tables this should be None
@@ -85,6 +98,53 @@ class Table(object):
     def values(self):
         return iter(self._destinations.values())
 
+    def sorted_values(self):
+        """Returns the list of the destinations sorted by their prefixes,
+        in numeric order if the table supports prefix lookups.  The
+        destinations of the same prefix are sorted by their NLRI strings.
+        """
+        if not self.RADIX_KEY_WIDTH:
+            return sorted(self.values())
+        return [dest for dests in self._index().values() for dest in dests]
+
+    def _index(self):
+        if not self.RADIX_KEY_WIDTH:
+            raise NotImplementedError(
+                'Prefix lookups are not supported by %s' % self)
+        if self._prefix_index is None:
+            self._prefix_index = RadixTree(self.RADIX_KEY_WIDTH)
+            for dest in self.values():
+                self._index_dest(dest)
+        return self._prefix_index
+
+    def longest_match(self, prefix):
+        """Returns the destination of the longest prefix which covers
+        given prefix, or None if there is no such destination.
+
+        *prefix* is formatted as the NLRI strings of this table, e.g.
+        '10.0.0.0/8' or '65000:100:10.0.0.0/8'.
+        """
+        match = self._index().longest_match(self._prefix_key(prefix))
+        if match is None:
+            return None
+        return match[1][0]
+
+    def covering(self, prefix):
+        """Returns the list of the destinations whose prefixes cover given
+        prefix, from the shortest prefix to the longest.
+        """
+        return [dest for _, dests in
+                self._index().covering(self._prefix_key(prefix))
+                for dest in dests]
+
+    def covered(self, prefix):
+        """Returns the list of the destinations whose prefixes are covered
+        by given prefix, sorted by their prefixes.
+        """
+        return [dest for _, dests in
+                self._index().covered(self._prefix_key(prefix))
+                for dest in dests]
+
     def insert(self, path):
         self._validate_path(path)
         self._validate_nlri(path.nlri)
@@ -165,11 +225,27 @@ class Table(object):
         self._validate_nlri(nlri)
         dest = self._get_dest(nlri)
         if dest:
-            self._destinations.pop(dest)
+            self.delete_dest(dest)
         return dest
 
     def delete_dest(self, dest):
         del self._destinations[self._table_key(dest.nlri)]
+        if self._prefix_index is not None:
+            radix_key = self._radix_key(dest.nlri)
+            dests = tuple(d for d in self._prefix_index.get(radix_key, ())
+                          if d is not dest)
+            if dests:
+                self._prefix_index[radix_key] = dests
+            else:
+                self._prefix_index.pop(radix_key, None)
+
+    def _index_dest(self, dest):
+        radix_key = self._radix_key(dest.nlri)
+        dests = self._prefix_index.get(radix_key)
+        if dests is None:
+            self._prefix_index[radix_key] = (dest,)
+        else:
+            self._prefix_index[radix_key] = tuple(sorted(dests + (dest,)))
 
     def _validate_nlri(self, nlri):
         """Validated *nlri* is the type that this table stores/supports.
@@ -193,6 +269,8 @@ class Table(object):
         if dest is None:
             dest = self._create_dest(nlri)
             self._destinations[table_key] = dest
+            if self._prefix_index is not None:
+                self._index_dest(dest)
         return dest
 
     def _get_dest(self, nlri):
@@ -216,6 +294,20 @@ class Table(object):
         """
         raise NotImplementedError()
 
+    def _radix_key(self, nlri):
+        """Return the key of this NLRI in the prefix index, a prefix
+        (bits, length) of RADIX_KEY_WIDTH bits.
+        """
+        return self._prefix_key(nlri.formatted_nlri_str)
+
+    def _prefix_key(self, prefix):
+        """Return the key in the prefix index of given prefix formatted as
+        the NLRI strings of this table.
+
+        Raises ValueError if *prefix* is invalid.
+        """
+        raise NotImplementedError()
+
 
 class NonVrfPathProcessingMixin(object):
     """Mixin reacting to best-path selection algorithm on main table
@@ -603,17 +695,24 @@ class Destination(object):
         # We pick the first path as current best path. This helps in breaking
         # tie between two new paths learned in one cycle for which best-path
         # calculation steps lead to tie.
+        local_asn = self._core_service.asn
+        local_bgp_id = self._core_service.router_id
         current_best_path = self._known_path_list[0]
         best_path_reason = BPR_ONLY_PATH
+        if len(self._known_path_list) == 1:
+            return current_best_path, best_path_reason
+
+        current_key = current_best_path.get_best_path_key(local_asn,
+                                                          local_bgp_id)
         for next_path in self._known_path_list[1:]:
-            from ryu.services.protocols.bgp.processor import compute_best_path
             # Compare next path with current best path.
-            new_best_path, reason = \
-                compute_best_path(self._core_service.asn, current_best_path,
-                                  next_path)
+            next_key = next_path.get_best_path_key(local_asn, local_bgp_id)
+            new_best_path, reason = compute_best_path_by_key(
+                current_best_path, current_key, next_path, next_key)
             best_path_reason = reason
-            if new_best_path is not None:
-                current_best_path = new_best_path
+            if new_best_path is next_path:
+                current_best_path = next_path
+                current_key = next_key
 
         return current_best_path, best_path_reason
 
@@ -697,7 +796,8 @@ class Path(object):
     """
     __slots__ = ('_source', '_path_attr_map', '_nlri', '_source_version_num',
                  '_exported_from', '_nexthop', 'next_path', 'prev_path',
-                 '_is_withdraw', 'med_set_by_target_neighbor')
+                 '_is_withdraw', 'med_set_by_target_neighbor',
+                 '_best_path_key')
     ROUTE_FAMILY = RF_IPv4_UC
 
     def __init__(self, source, nlri, src_ver_num, pattrs=None, nexthop=None,
@@ -765,6 +865,9 @@ class Path(object):
         # The Destination from which this path was exported, if any.
         self._exported_from = None
 
+        # Key of this path for best path selection, computed on demand.
+        self._best_path_key = None
+
     @property
     def source_version_num(self):
         return self._source_version_num
@@ -804,6 +907,17 @@ class Path(object):
         """
         return self._path_attr_map.get(pattr_type, default)
 
+    def get_best_path_key(self, local_asn, local_bgp_id):
+        """Returns the key of this path for best path selection.
+
+        The key is computed once by processor.best_path_key(), as path
+        attributes do not change once the path is created.
+        """
+        if self._best_path_key is None:
+            self._best_path_key = best_path_key(local_asn, local_bgp_id,
+                                                self)
+        return self._best_path_key
+
     def clone(self, for_withdrawal=False):
         pathattrs = None
         if not for_withdrawal:
@@ -26,6 +26,7 @@ from ryu.services.protocols.bgp.info_base.base import Table
 from ryu.services.protocols.bgp.info_base.base import Destination
 from ryu.services.protocols.bgp.info_base.base import NonVrfPathProcessingMixin
 from ryu.services.protocols.bgp.info_base.base import PrefixFilter
+from ryu.services.protocols.bgp.utils import radix
 
 LOG = logging.getLogger('bgpspeaker.info_base.ipv6')
 
@@ -55,6 +56,7 @@ class Ipv6Table(Table):
     """
     ROUTE_FAMILY = RF_IPv6_UC
     VPN_DEST_CLASS = IPv6Dest
+    RADIX_KEY_WIDTH = radix.IPV6_WIDTH
 
     def __init__(self, core_service, signal_bus):
         super(Ipv6Table, self).__init__(None, core_service, signal_bus)
@@ -65,6 +67,12 @@ class Ipv6Table(Table):
         """
         return nlri.prefix
 
+    def _radix_key(self, nlri):
+        return radix.ipv6_prefix_key(nlri.addr, nlri.length)
+
+    def _prefix_key(self, prefix):
+        return radix.prefix_str_key(prefix, radix.IPV6_WIDTH)
+
     def _create_dest(self, nlri):
         return self.VPN_DEST_CLASS(self, nlri)
 
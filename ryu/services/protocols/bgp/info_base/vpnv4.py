@@ -25,6 +25,7 @@ from ryu.lib.packet.bgp import RF_IPv4_VPN
 from ryu.services.protocols.bgp.info_base.vpn import VpnDest
 from ryu.services.protocols.bgp.info_base.vpn import VpnPath
 from ryu.services.protocols.bgp.info_base.vpn import VpnTable
+from ryu.services.protocols.bgp.utils import radix
 
 LOG = logging.getLogger('bgpspeaker.info_base.vpnv4')
 
@@ -45,6 +46,16 @@ class Vpnv4Table(VpnTable):
     """
     ROUTE_FAMILY = RF_IPv4_VPN
     VPN_DEST_CLASS = Vpnv4Dest
+    RADIX_KEY_WIDTH = radix.RD_WIDTH + radix.IPV4_WIDTH
+
+    def _radix_key(self, vpn_nlri):
+        addr, length = vpn_nlri.prefix.split('/')
+        return radix.rd_prefix_key(
+            vpn_nlri.addr[-2], radix.ipv4_prefix_key(addr, int(length)),
+            radix.IPV4_WIDTH)
+
+    def _prefix_key(self, prefix):
+        return radix.vpn_prefix_str_key(prefix, radix.IPV4_WIDTH)
 
 
 class Vpnv4Path(VpnPath):
@@ -25,6 +25,7 @@ from ryu.lib.packet.bgp import RF_IPv6_VPN
 from ryu.services.protocols.bgp.info_base.vpn import VpnDest
 from ryu.services.protocols.bgp.info_base.vpn import VpnPath
 from ryu.services.protocols.bgp.info_base.vpn import VpnTable
+from ryu.services.protocols.bgp.utils import radix
 
 LOG = logging.getLogger('bgpspeaker.info_base.vpnv6')
 
@@ -45,6 +46,16 @@ class Vpnv6Table(VpnTable):
     """
     ROUTE_FAMILY = RF_IPv6_VPN
     VPN_DEST_CLASS = Vpnv6Dest
+    RADIX_KEY_WIDTH = radix.RD_WIDTH + radix.IPV6_WIDTH
+
+    def _radix_key(self, vpn_nlri):
+        addr, length = vpn_nlri.prefix.split('/')
+        return radix.rd_prefix_key(
+            vpn_nlri.addr[-2], radix.ipv6_prefix_key(addr, int(length)),
+            radix.IPV6_WIDTH)
+
+    def _prefix_key(self, prefix):
+        return radix.vpn_prefix_str_key(prefix, radix.IPV6_WIDTH)
 
 
 class Vpnv6Path(VpnPath):
@@ -31,6 +31,7 @@ from ryu.services.protocols.bgp.info_base.vrf import VrfDest
 from ryu.services.protocols.bgp.info_base.vrf import VrfNlriImportMap
 from ryu.services.protocols.bgp.info_base.vrf import VrfPath
 from ryu.services.protocols.bgp.info_base.vrf import VrfTable
+from ryu.services.protocols.bgp.utils import radix
 
 LOG = logging.getLogger('bgpspeaker.info_base.vrf4')
 
@@ -53,6 +54,13 @@ class Vrf4Table(VrfTable):
     NLRI_CLASS = IPAddrPrefix
     VRF_PATH_CLASS = Vrf4Path
     VRF_DEST_CLASS = Vrf4Dest
+    RADIX_KEY_WIDTH = radix.IPV4_WIDTH
+
+    def _radix_key(self, nlri):
+        return radix.ipv4_prefix_key(nlri.addr, nlri.length)
+
+    def _prefix_key(self, prefix):
+        return radix.prefix_str_key(prefix, radix.IPV4_WIDTH)
 
 
 class Vrf4NlriImportMap(VrfNlriImportMap):
@@ -31,6 +31,7 @@ from ryu.services.protocols.bgp.info_base.vrf import VrfDest
 from ryu.services.protocols.bgp.info_base.vrf import VrfNlriImportMap
 from ryu.services.protocols.bgp.info_base.vrf import VrfPath
 from ryu.services.protocols.bgp.info_base.vrf import VrfTable
+from ryu.services.protocols.bgp.utils import radix
 
 LOG = logging.getLogger('bgpspeaker.info_base.vrf6')
 
@@ -54,6 +55,13 @@ class Vrf6Table(VrfTable):
     NLRI_CLASS = IP6AddrPrefix
     VRF_PATH_CLASS = Vrf6Path
     VRF_DEST_CLASS = Vrf6Dest
+    RADIX_KEY_WIDTH = radix.IPV6_WIDTH
+
+    def _radix_key(self, nlri):
+        return radix.ipv6_prefix_key(nlri.addr, nlri.length)
+
+    def _prefix_key(self, prefix):
+        return radix.prefix_str_key(prefix, radix.IPV6_WIDTH)
 
 
 class Vrf6NlriImportMap(VrfNlriImportMap):
@@ -6,6 +6,7 @@ from ryu.services.protocols.bgp.operator.commands.show import count
 from ryu.services.protocols.bgp.operator.commands.show import importmap
 from ryu.services.protocols.bgp.operator.commands.show import memory
 from ryu.services.protocols.bgp.operator.commands.show import neighbor
+from ryu.services.protocols.bgp.operator.commands.show import processor
 from ryu.services.protocols.bgp.operator.commands.show import rib
 from ryu.services.protocols.bgp.operator.commands.show import vrf
 
@@ -23,7 +24,8 @@ class ShowCmd(Command):
             'vrf': self.Vrf,
             'memory': self.Memory,
             'neighbor': self.Neighbor,
-            'importmap': self.Importmap
+            'importmap': self.Importmap,
+            'processor': self.Processor
         }
 
     def action(self, params):
@@ -47,6 +49,9 @@ class ShowCmd(Command):
     class Neighbor(neighbor.Neighbor):
         pass
 
+    class Processor(processor.Processor):
+        pass
+
     class Logging(Command):
         command = 'logging'
         help_msg = 'shows if logging is on/off and current logging level.'
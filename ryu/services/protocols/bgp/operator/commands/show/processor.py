@@ -0,0 +1,15 @@
+from ryu.services.protocols.bgp.operator.command import Command
+from ryu.services.protocols.bgp.operator.command import CommandsResponse
+from ryu.services.protocols.bgp.operator.command import STATUS_OK
+from ryu.services.protocols.bgp.operator.commands.responses import \
+    WrongParamResp
+
+
+class Processor(Command):
+    help_msg = 'show stats of the queue and the cycles of the BGP processor'
+    command = 'processor'
+
+    def action(self, params):
+        if len(params) != 0:
+            return WrongParamResp()
+        return CommandsResponse(STATUS_OK, self.api.get_processor_stats())
@@ -82,7 +82,7 @@ class InternalApi(object):
     def _get_vrf_tables(self):
         return CORE_MANAGER.get_core_service().table_manager.get_vrf_tables()
 
-    def get_single_rib_routes(self, addr_family):
+    def get_single_rib_routes(self, addr_family, prefix=None):
         rfs = {
             'ipv4': RF_IPv4_UC,
             'ipv6': RF_IPv6_UC,
@@ -103,11 +103,20 @@ class InternalApi(object):
         rf = rfs.get(addr_family)
         table_manager = self.get_core_service().table_manager
         gtable = table_manager.get_global_table_by_route_family(rf)
-        if gtable is not None:
-            return [self._dst_to_dict(dst)
-                    for dst in sorted(gtable.values())]
-        else:
+        if gtable is None:
             return []
+        if prefix is None:
+            dsts = gtable.sorted_values()
+        else:
+            # Routes of the prefixes covered by the given prefix.
+            try:
+                dsts = gtable.covered(prefix)
+            except NotImplementedError:
+                raise WrongParamError('Prefix lookups are not supported for'
+                                      ' family: %s' % addr_family)
+            except ValueError:
+                raise WrongParamError('Invalid prefix: %s' % prefix)
+        return [self._dst_to_dict(dst) for dst in dsts]
 
     def _dst_to_dict(self, dst):
         ret = {'paths': [],
@@ -199,6 +208,12 @@ class InternalApi(object):
             raise WrongParamError(str(e))
         return None
 
+    def get_processor_stats(self):
+        processor = self.get_core_service().bgp_processor
+        if processor is None:
+            return {}
+        return processor.get_stats_summary_dict()
+
     def get_core_service(self):
         return CORE_MANAGER.get_core_service()
 
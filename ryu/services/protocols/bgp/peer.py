@@ -16,6 +16,8 @@
  BGP peer related classes and utils.
 """
 from collections import namedtuple
+from collections import OrderedDict
+import copy
 import logging
 import socket
 import time
@@ -38,6 +40,7 @@ from ryu.services.protocols.bgp.rtconf.neighbors import NeighborConfListener
 from ryu.services.protocols.bgp.rtconf.neighbors import CONNECT_MODE_PASSIVE
 from ryu.services.protocols.bgp.signals.emit import BgpSignalBus
 from ryu.services.protocols.bgp.speaker import BgpProtocol
+from ryu.services.protocols.bgp.speaker import BGP_MAX_MSG_LEN
 from ryu.services.protocols.bgp.info_base.ipv4 import Ipv4Path
 from ryu.services.protocols.bgp.info_base.vpnv4 import Vpnv4Path
 from ryu.services.protocols.bgp.info_base.vpnv6 import Vpnv6Path
@@ -171,6 +174,8 @@ class PeerState(object):
             'fms_established_transitions': 0,
         }
         self._signal_bus = signal_bus
+        # Rate of sent UPDATE messages.
+        self._sent_updates_meter = stats.RateMeter()
 
         # TODO(JK): refactor other counters to use signals also
         self._signal_bus.register_listener(
@@ -242,12 +247,21 @@ class PeerState(object):
         counter = self.counters.setdefault(counter_name, 0)
         counter += incr_by
         self.counters[counter_name] = counter
+        if counter_name == PeerCounterNames.SENT_UPDATES:
+            self._sent_updates_meter.incr(incr_by)
 
     def get_count(self, counter_name):
         if counter_name not in self.counters:
             raise ValueError('Un-recognized counter name: %s' % counter_name)
         return self.counters.get(counter_name, 0)
 
+    @property
+    def sent_updates_rate(self):
+        """Returns the number of UPDATE messages sent to this peer per
+        second.
+        """
+        return self._sent_updates_meter.rate
+
     @property
     def total_msg_sent(self):
         """Returns total number of UPDATE, NOTIFICATION and ROUTE_REFRESH
@@ -277,6 +291,7 @@ class PeerState(object):
             stats.UPDATE_MSG_OUT: self.get_count(
                 PeerCounterNames.SENT_UPDATES
             ),
+            stats.UPDATE_MSG_OUT_RATE: self.sent_updates_rate,
             stats.TOTAL_MSG_IN: self.total_msg_recv,
             stats.TOTAL_MSG_OUT: self.total_msg_sent,
             stats.FMS_EST_TRANS: self.get_count(
@@ -299,6 +314,10 @@ class Peer(Source, Sink, NeighborConfListener, Activity):
 
     RTC_EOR_TIMER_NAME = 'RTC_EOR_Timer'
 
+    # Max. number of outgoing routes taken from the outgoing queue at once
+    # and packed into Update messages.
+    OUTGOING_ROUTE_BATCH_SIZE = 1000
+
     def __init__(self, common_conf, neigh_conf,
                  core_service, signal_bus, peer_manager):
         peer_activity_name = 'Peer: %s' % neigh_conf.ip_address
@@ -374,6 +393,9 @@ class Peer(Source, Sink, NeighborConfListener, Activity):
         # attribute maps
         self._attribute_maps = {}
 
+        # Update group this peer belongs to, see update_group property.
+        self._update_group = None
+
     @property
     def remote_as(self):
         return self._neigh_conf.remote_as
@@ -484,6 +506,49 @@ class Peer(Source, Sink, NeighborConfListener, Activity):
         self._attribute_maps[key] = _attr_maps
         self.on_update_attribute_maps()
 
+    @property
+    def update_group(self):
+        """The update group of the peers which share the same outbound
+        policy with this peer.
+
+        Joins the group on first access after the policy is changed.
+        """
+        if self._update_group is None:
+            self._update_group = self._peer_manager.join_update_group(
+                self, self._update_group_key())
+        return self._update_group
+
+    def leave_update_group(self):
+        """Leaves the current update group. Called when the settings or the
+        negotiated capabilities which affect outgoing UPDATE messages are
+        changed.
+        """
+        if self._update_group is not None:
+            self._peer_manager.leave_update_group(self, self._update_group)
+            self._update_group = None
+
+    def _update_group_key(self):
+        """Returns the settings and the negotiated capabilities which affect
+        the filtering and the construction of UPDATE messages sent to this
+        peer.
+        """
+        attribute_maps = tuple(sorted(
+            (key, repr(at_maps[const.ATTR_MAPS_ORG_KEY]))
+            for key, at_maps in self._attribute_maps.items()))
+        return (
+            self.is_route_server_client,
+            self.is_route_reflector_client,
+            self.is_ebgp_peer(),
+            self.local_as,
+            self._neigh_conf.next_hop or self.host_bind_ip,
+            self._neigh_conf.is_next_hop_self,
+            self._neigh_conf.multi_exit_disc,
+            tuple(self._neigh_conf.soo_list or ()),
+            self.is_four_octet_as_number_cap_valid(),
+            repr(self._out_filters),
+            attribute_maps,
+        )
+
     def is_mpbgp_cap_valid(self, route_family):
         if not self.in_established:
             raise ValueError('Invalid request: Peer not in established state')
@@ -571,6 +636,7 @@ class Peer(Source, Sink, NeighborConfListener, Activity):
 
     def on_update_med(self, conf_evt):
         LOG.debug('on_update_med fired')
+        self.leave_update_group()
         if self._protocol is not None and self._protocol.started:
             negotiated_afs = self._protocol.negotiated_afs
             for af in negotiated_afs:
@@ -638,6 +704,7 @@ class Peer(Source, Sink, NeighborConfListener, Activity):
 
     def on_update_out_filter(self):
         LOG.debug('on_update_out_filter fired')
+        self.leave_update_group()
         for sent_path in self._adj_rib_out.values():
             LOG.debug('sent_path: %s', sent_path)
             path = sent_path.path
@@ -663,6 +730,7 @@ class Peer(Source, Sink, NeighborConfListener, Activity):
     def on_update_attribute_maps(self):
         # resend sent_route in case of filter matching
         LOG.debug('on_update_attribute_maps fired')
+        self.leave_update_group()
         for sent_path in self._adj_rib_out.values():
             LOG.debug('resend path: %s', sent_path)
             path = sent_path.path
@@ -706,40 +774,50 @@ class Peer(Source, Sink, NeighborConfListener, Activity):
                               self._enqueue_eor_msg, rr_msg)
             LOG.debug('Enhanced RR max. EOR timer set.')
 
-    def _send_outgoing_route(self, outgoing_route):
-        """Constructs `Update` message from given `outgoing_route` and sends
-        it to peer.
+    def _send_outgoing_routes(self, outgoing_routes):
+        """Constructs `Update` messages from given `outgoing_routes` and
+        sends them to peer.
 
-        Also, checks if any policies prevent sending this message.
-        Populates Adj-RIB-out with corresponding `SentRoute`.
+        Also, checks if any policies prevent sending these routes.
+        Populates Adj-RIB-out with corresponding `SentRoute`s. The prefixes
+        which have the same path attributes are packed into one message
+        up to BGP_MAX_MSG_LEN octets. The messages are constructed and
+        serialized once for the peers in the same update group.
         """
+        update_group = self.update_group
+        # nlri_str -> Update message; only the last route of a prefix is
+        # sent if it appears more than once.
+        updates = OrderedDict()
+        tm = self._core_service.table_manager
+        for outgoing_route in outgoing_routes:
+            path = outgoing_route.path
+            block, blocked_cause, update_msg = \
+                update_group.construct_update(self, outgoing_route)
 
-        path = outgoing_route.path
-        block, blocked_cause = self._apply_out_filter(path)
-
-        nlri_str = outgoing_route.path.nlri.formatted_nlri_str
-        sent_route = SentRoute(outgoing_route.path, self, block)
-        self._adj_rib_out[nlri_str] = sent_route
-        self._signal_bus.adj_rib_out_changed(self, sent_route)
-
-        # TODO(PH): optimized by sending several prefixes per update.
-        # Construct and send update message.
-        if not block:
-            update_msg = self._construct_update(outgoing_route)
-            self._protocol.send(update_msg)
+            nlri_str = path.nlri.formatted_nlri_str
+            sent_route = SentRoute(path, self, block)
+            self._adj_rib_out[nlri_str] = sent_route
+            self._signal_bus.adj_rib_out_changed(self, sent_route)
+
+            updates.pop(nlri_str, None)
+            if not block:
+                updates[nlri_str] = update_msg
+            else:
+                LOG.debug('prefix : %s is not sent by filter : %s',
+                          path.nlri, blocked_cause)
+
+            # We have to create sent_route for every OutgoingRoute which is
+            # not a withdraw or was for route-refresh msg.
+            if (not path.is_withdraw and
+                    not outgoing_route.for_route_refresh):
+                # Update the destination with new sent route.
+                tm.remember_sent_route(sent_route)
+
+        for update_msg, buf in update_group.pack_updates(
+                list(updates.values()), BGP_MAX_MSG_LEN):
+            self._protocol.send(update_msg, buf)
             # Collect update statistics.
             self.state.incr(PeerCounterNames.SENT_UPDATES)
-        else:
-            LOG.debug('prefix : %s is not sent by filter : %s',
-                      path.nlri, blocked_cause)
-
-        # We have to create sent_route for every OutgoingRoute which is
-        # not a withdraw or was for route-refresh msg.
-        if (not outgoing_route.path.is_withdraw and
-                not outgoing_route.for_route_refresh):
-            # Update the destination with new sent route.
-            tm = self._core_service.table_manager
-            tm.remember_sent_route(sent_route)
 
     def _process_outgoing_msg_list(self):
         while True:
@@ -766,7 +844,8 @@ class Peer(Source, Sink, NeighborConfListener, Activity):
             if isinstance(outgoing_msg, BGPRouteRefresh):
                 self._send_outgoing_route_refresh_msg(outgoing_msg)
             elif isinstance(outgoing_msg, OutgoingRoute):
-                self._send_outgoing_route(outgoing_msg)
+                self._send_outgoing_routes(
+                    self._pop_outgoing_routes(outgoing_msg))
 
             # EOR are enqueued as plain Update messages.
             elif isinstance(outgoing_msg, BGPUpdate):
@@ -775,6 +854,22 @@ class Peer(Source, Sink, NeighborConfListener, Activity):
                           outgoing_msg)
                 self.state.incr(PeerCounterNames.SENT_UPDATES)
 
+    def _pop_outgoing_routes(self, first_route):
+        """Returns `first_route` followed by the OutgoingRoutes which come
+        next in the outgoing queue, up to OUTGOING_ROUTE_BATCH_SIZE routes.
+        """
+        outgoing_routes = [first_route]
+        while len(outgoing_routes) < self.OUTGOING_ROUTE_BATCH_SIZE:
+            outgoing_msg = self.outgoing_msg_list.pop_first()
+            if outgoing_msg is None:
+                break
+            if not isinstance(outgoing_msg, OutgoingRoute):
+                # Keep the order with Route Refresh and EOR messages.
+                self.outgoing_msg_list.prepend(outgoing_msg)
+                break
+            outgoing_routes.append(outgoing_msg)
+        return outgoing_routes
+
     def request_route_refresh(self, *route_families):
         """Request route refresh to peer for given `route_families`.
 
@@ -1073,7 +1168,7 @@ class Peer(Source, Sink, NeighborConfListener, Activity):
             path_aspath = pathattr_map.get(BGP_ATTR_TYPE_AS_PATH)
             assert path_aspath, 'Missing AS_PATH mandatory attribute.'
             # Deep copy AS_PATH attr value
-            as_path_list = path_aspath.path_seg_list
+            as_path_list = copy.deepcopy(path_aspath.path_seg_list)
             # If this is a iBGP peer.
             if not self.is_ebgp_peer():
                 # When a given BGP speaker advertises the route to an internal
@@ -1984,6 +2079,8 @@ class Peer(Source, Sink, NeighborConfListener, Activity):
             # transition to established state.
             if self.state.bgp_state == const.BGP_FSM_OPEN_CONFIRM:
                 self.state.bgp_state = const.BGP_FSM_ESTABLISHED
+                # Capabilities are negotiated for the new session.
+                self.leave_update_group()
                 self._enqueue_init_updates()
 
         elif msg.type == BGP_MSG_UPDATE:
@@ -2319,6 +2416,7 @@ class Peer(Source, Sink, NeighborConfListener, Activity):
             }
         )
         self.state.bgp_state = const.BGP_FSM_IDLE
+        self.leave_update_group()
         if self._protocol:
             self._protocol.stop()
             self._protocol = None
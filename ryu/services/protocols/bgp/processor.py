@@ -17,12 +17,14 @@
 """
 
 import logging
+import time
 
 from ryu.services.protocols.bgp.base import Activity
 from ryu.services.protocols.bgp.base import add_bgp_error_metadata
 from ryu.services.protocols.bgp.base import BGP_PROCESSOR_ERROR_CODE
 from ryu.services.protocols.bgp.base import BGPSException
 from ryu.services.protocols.bgp.utils import circlist
+from ryu.services.protocols.bgp.utils import stats
 from ryu.services.protocols.bgp.utils.evtlet import EventletIOFactory
 
 from ryu.lib.packet.bgp import RF_RTC_UC
@@ -60,8 +62,20 @@ class BgpProcessor(Activity):
     works to achieve the desired work flow.
     """
 
-    # Max. number of destinations processed per cycle.
+    # Max. number of destinations processed in the first cycle. Unless
+    # fixed by `work_units_per_cycle`, the number is then adapted so that a
+    # cycle takes about TARGET_CYCLE_TIME, within the bounds below.
     MAX_DEST_PROCESSED_PER_CYCLE = 100
+    MIN_WORK_UNITS_PER_CYCLE = 10
+    MAX_WORK_UNITS_PER_CYCLE = 5000
+
+    # Time in seconds a cycle should take before giving other greenthreads
+    # a chance to run.
+    TARGET_CYCLE_TIME = 0.05
+
+    # Weight of the latest cycle in the averages of the cycle time and of
+    # the time spent per destination.
+    _AVG_WEIGHT = 0.2
 
     #
     # DestQueue
@@ -81,8 +95,19 @@ class BgpProcessor(Activity):
         self._dest_queue = BgpProcessor._DestQueue()
         self._rtdest_queue = BgpProcessor._DestQueue()
         self.dest_que_evt = EventletIOFactory.create_custom_event()
+        self.adaptive = not work_units_per_cycle
         self.work_units_per_cycle =\
             work_units_per_cycle or BgpProcessor.MAX_DEST_PROCESSED_PER_CYCLE
+        # Number of destinations in `_dest_queue`.
+        self.queue_depth = 0
+        self.max_queue_depth = 0
+        # Stats of the cycles of _process_dest().
+        self.cycles = 0
+        self.dest_processed = 0
+        self.last_cycle_time = 0.0
+        self.max_cycle_time = 0.0
+        self.avg_cycle_time = 0.0
+        self._avg_dest_time = None
 
     def _run(self, *args, **kwargs):
         # Sit in tight loop, getting destinations from the queue and processing
@@ -108,14 +133,63 @@ class BgpProcessor(Activity):
     def _process_dest(self):
         dest_processed = 0
         LOG.debug('Processing destination...')
+        start = time.time()
         while (dest_processed < self.work_units_per_cycle and
                not self._dest_queue.is_empty()):
             # We process the first destination in the queue.
             next_dest = self._dest_queue.pop_first()
             if next_dest:
+                self.queue_depth -= 1
                 next_dest.process()
                 dest_processed += 1
 
+        if dest_processed:
+            self._end_cycle(dest_processed, time.time() - start)
+
+    def _end_cycle(self, dest_processed, elapsed):
+        """Updates the stats with a cycle which processed `dest_processed`
+        destinations in `elapsed` seconds, and adapts the number of
+        destinations processed per cycle.
+        """
+        weight = self._AVG_WEIGHT
+        self.cycles += 1
+        self.dest_processed += dest_processed
+        self.last_cycle_time = elapsed
+        self.max_cycle_time = max(self.max_cycle_time, elapsed)
+        self.avg_cycle_time += (elapsed - self.avg_cycle_time) * weight
+        LOG.debug('Processed %d destinations in %.6f sec, %d left',
+                  dest_processed, elapsed, self.queue_depth)
+        if not self.adaptive:
+            return
+
+        dest_time = elapsed / dest_processed
+        if self._avg_dest_time is None:
+            self._avg_dest_time = dest_time
+        else:
+            self._avg_dest_time += (dest_time - self._avg_dest_time) * weight
+        # Destinations which can be processed in TARGET_CYCLE_TIME. When the
+        # queue is shorter, all of them are processed in one cycle anyway.
+        if self._avg_dest_time > 0:
+            work_units = int(self.TARGET_CYCLE_TIME / self._avg_dest_time)
+        else:
+            work_units = self.MAX_WORK_UNITS_PER_CYCLE
+        self.work_units_per_cycle = max(
+            self.MIN_WORK_UNITS_PER_CYCLE,
+            min(work_units, self.MAX_WORK_UNITS_PER_CYCLE))
+
+    def get_stats_summary_dict(self):
+        """Returns stats of the queue and the processing cycles."""
+        return {
+            stats.PROCESSOR_QUEUE_DEPTH: self.queue_depth,
+            stats.PROCESSOR_MAX_QUEUE_DEPTH: self.max_queue_depth,
+            stats.PROCESSOR_CYCLES: self.cycles,
+            stats.PROCESSOR_DEST_PROCESSED: self.dest_processed,
+            stats.PROCESSOR_WORK_UNITS: self.work_units_per_cycle,
+            stats.PROCESSOR_LAST_CYCLE_TIME: self.last_cycle_time,
+            stats.PROCESSOR_AVG_CYCLE_TIME: self.avg_cycle_time,
+            stats.PROCESSOR_MAX_CYCLE_TIME: self.max_cycle_time,
+        }
+
     def _process_rtdest(self):
         LOG.debug('Processing RT NLRI destination...')
         if self._rtdest_queue.is_empty():
@@ -150,6 +224,10 @@ class BgpProcessor(Activity):
         # it is already on the queue.
         if not dest_queue.is_on_list(destination):
             dest_queue.append(destination)
+            if dest_queue is self._dest_queue:
+                self.queue_depth += 1
+                self.max_queue_depth = max(self.max_queue_depth,
+                                           self.queue_depth)
 
         # Wake-up processing thread if sleeping.
         self.dest_que_evt.set()
@@ -266,6 +344,127 @@ def compute_best_path(local_asn, path1, path2):
     return best_path, best_path_reason
 
 
+# Reasons a path is chosen as best path by each item of best path keys.
+_BEST_PATH_KEY_REASONS = (BPR_LOCAL_PREF, BPR_LOCAL_ORIGIN, BPR_ASPATH,
+                          BPR_ORIGIN, BPR_MED, BPR_ASN, BPR_ROUTER_ID,
+                          BPR_CLUSTER_LIST)
+
+_ORIGIN_PREF = {
+    BGP_ATTR_ORIGIN_IGP: 3,
+    BGP_ATTR_ORIGIN_EGP: 2,
+    BGP_ATTR_ORIGIN_INCOMPLETE: 1,
+}
+
+# Interned best path keys. Paths with the same attributes from the same
+# peer share their keys.
+_best_path_keys = {}
+_MAX_INTERNED_BEST_PATH_KEYS = 65536
+
+# Router IDs converted to integers.
+_router_id_ints = {}
+
+
+def _router_id_to_int(router_id):
+    value = _router_id_ints.get(router_id)
+    if value is None:
+        from ryu.services.protocols.bgp.utils.bgp import from_inet_ptoi
+        value = from_inet_ptoi(router_id)
+        if len(_router_id_ints) >= _MAX_INTERNED_BEST_PATH_KEYS:
+            _router_id_ints.clear()
+        _router_id_ints[router_id] = value
+    return value
+
+
+def best_path_key(local_asn, local_bgp_id, path):
+    """Returns the key of `path` for compute_best_path_by_key().
+
+    The key is the tuple of the values compared by the steps of
+    compute_best_path() which use the path attributes, in the same order,
+    converted so that the greater values are preferred. The local
+    preference is None if the path has no LOCAL_PREF, and the router ID is
+    None for eBGP paths, as compute_best_path() does not compare them in
+    these cases. Paths whose source is neither a peer nor NC (e.g.
+    VRF_TABLE) are keyed as paths from the local speaker.
+
+    Parameters:
+        -`local_asn`: asn of local bgpspeaker
+        -`local_bgp_id`: BGP identifier of local bgpspeaker
+        -`path`: path to compute the key of
+    """
+    source = path.source
+    if source is None or not hasattr(source, 'remote_as'):
+        asn = local_asn
+    else:
+        asn = source.remote_as
+    is_ebgp = asn != local_asn
+
+    local_pref = path.get_pattr(BGP_ATTR_TYPE_LOCAL_PREF)
+    if local_pref:
+        local_pref = local_pref.value
+    else:
+        local_pref = None
+
+    as_path = path.get_pattr(BGP_ATTR_TYPE_AS_PATH)
+    assert as_path
+    as_path_len = as_path.get_as_path_len()
+    assert as_path_len is not None
+
+    origin = path.get_pattr(BGP_ATTR_TYPE_ORIGIN)
+    assert origin is not None
+    origin_pref = _ORIGIN_PREF.get(origin.value)
+    if origin_pref is None:
+        LOG.error('Invalid origin value encountered %s.', origin)
+        origin_pref = 0
+
+    med = path.get_pattr(BGP_ATTR_TYPE_MULTI_EXIT_DISC)
+    med = med.value if med else 0
+
+    router_id = None
+    if not is_ebgp:
+        if source is None or not hasattr(source, 'protocol'):
+            router_id = local_bgp_id
+        else:
+            originator_id = path.get_pattr(BGP_ATTR_TYPE_ORIGINATOR_ID)
+            if originator_id:
+                router_id = originator_id.value
+            else:
+                router_id = source.protocol.recv_open_msg.bgp_identifier
+        router_id = -_router_id_to_int(router_id)
+
+    cluster_list = path.get_pattr(BGP_ATTR_TYPE_CLUSTER_LIST)
+    cluster_list_len = len(cluster_list.value) if cluster_list else 0
+
+    key = (local_pref, source is None, -as_path_len, origin_pref, -med,
+           is_ebgp, router_id, -cluster_list_len)
+    interned = _best_path_keys.get(key)
+    if interned is None:
+        if len(_best_path_keys) >= _MAX_INTERNED_BEST_PATH_KEYS:
+            _best_path_keys.clear()
+        interned = _best_path_keys[key] = key
+    return interned
+
+
+def compute_best_path_by_key(path1, key1, path2, key2):
+    """Compares given paths by their keys given by best_path_key() and
+    returns best path and the reason as compute_best_path() does.
+    """
+    if key1 is key2 or key1 == key2:
+        return None, BPR_UNKNOWN
+
+    # Local preference is compared only if both paths have it.
+    start = 0
+    if (key1[0] is None) != (key2[0] is None):
+        start = 1
+    for i in range(start, len(key1)):
+        value1 = key1[i]
+        value2 = key2[i]
+        if value1 != value2:
+            if value1 > value2:
+                return path1, _BEST_PATH_KEY_REASONS[i]
+            return path2, _BEST_PATH_KEY_REASONS[i]
+    return None, BPR_UNKNOWN
+
+
 def _cmp_by_reachable_nh(path1, path2):
     """Compares given paths and selects best path based on reachable next-hop.
 
@@ -23,6 +23,7 @@ import traceback
 from socket import IPPROTO_TCP, TCP_NODELAY
 from eventlet import semaphore
 
+from ryu.lib import recvbuf
 from ryu.lib.packet import bgp
 from ryu.lib.packet.bgp import AS_TRANS
 from ryu.lib.packet.bgp import BGPMessage
@@ -102,7 +103,7 @@ class BgpProtocol(Protocol, Activity):
         Activity.__init__(self, name=activity_name)
         # Initialize instance variables.
         self._peer = None
-        self._recv_buff = b''
+        self._recv_buff = recvbuf.RecvBuffer()
         self._socket = socket
         self._socket.setsockopt(IPPROTO_TCP, TCP_NODELAY, 1)
         self._sendlock = semaphore.Semaphore()
@@ -275,8 +276,12 @@ class BgpProtocol(Protocol, Activity):
         self._recv_loop()
 
     def data_received(self, next_bytes):
+        self._recv_buff.feed(next_bytes)
+        self._process_recv_buff()
+
+    def _process_recv_buff(self):
         try:
-            self._data_received(next_bytes)
+            self._data_received()
         except bgp.BgpExc as exc:
             LOG.error(
                 "BGPExc Exception while receiving data: "
@@ -297,28 +302,24 @@ class BgpProtocol(Protocol, Activity):
         """
         return struct.unpack('!16sHB', buff)
 
-    def _data_received(self, next_bytes):
-        """Maintains buffer of bytes received from peer and extracts bgp
-        message from this buffer if enough data is received.
+    def _data_received(self):
+        """Extracts bgp messages from the buffer of bytes received from peer
+        if enough data is received.
 
         Validates bgp message marker, length, type and data and constructs
-        appropriate bgp message instance and calls handler.
-
-        :Parameters:
-            - `next_bytes`: next set of bytes received from peer.
+        appropriate bgp message instance and calls handler. The bytes of the
+        messages handled are consumed from the buffer.
         """
-        # Append buffer with received bytes.
-        self._recv_buff += next_bytes
-
+        recv_buff = self._recv_buff
         while True:
             # If current buffer size is less then minimum bgp message size, we
             # return as we do not have a complete bgp message to work with.
-            if len(self._recv_buff) < BGP_MIN_MSG_LEN:
+            if len(recv_buff) < BGP_MIN_MSG_LEN:
                 return
 
             # Parse message header into elements.
             auth, length, ptype = BgpProtocol.parse_msg_header(
-                self._recv_buff[:BGP_MIN_MSG_LEN])
+                recv_buff.peek(BGP_MIN_MSG_LEN))
 
             # Check if we have valid bgp message marker.
             # We should get default marker since we are not supporting any
@@ -348,10 +349,11 @@ class BgpProtocol(Protocol, Activity):
                 raise bgp.BadLen(ptype, length)
 
             # If we have partial message we wait for rest of the message.
-            if len(self._recv_buff) < length:
+            if len(recv_buff) < length:
                 return
-            msg, _, rest = BGPMessage.parser(self._recv_buff)
-            self._recv_buff = rest
+            # The view is valid only until the next read, so the message is
+            # parsed from a copy.
+            msg, _, _ = BGPMessage.parser(recv_buff.consume(length).tobytes())
 
             # If we have a valid bgp message we call message handler.
             self._handle_msg(msg)
@@ -378,21 +380,26 @@ class BgpProtocol(Protocol, Activity):
                       notification)
         self._socket.close()
 
-    def _send_with_lock(self, msg):
+    def _send_with_lock(self, msg, buf=None):
         self._sendlock.acquire()
         try:
-            self._socket.sendall(msg.serialize())
+            if buf is None:
+                buf = msg.serialize()
+            self._socket.sendall(buf)
         except socket.error:
             self.connection_lost('failed to write to socket')
         finally:
             self._sendlock.release()
 
-    def send(self, msg):
+    def send(self, msg, buf=None):
+        """Sends `msg` to peer. `buf` is the serialized `msg` if it is
+        already known.
+        """
         if not self.started:
             raise BgpProtocolException('Tried to send message to peer when '
                                        'this protocol instance is not started'
                                        ' or is no longer is started state.')
-        self._send_with_lock(msg)
+        self._send_with_lock(msg, buf)
 
         if msg.type == BGP_MSG_NOTIFICATION:
             LOG.error('Sent notification to %s >> %s', self._remotename, msg)
@@ -551,15 +558,16 @@ class BgpProtocol(Protocol, Activity):
         """Sits in tight loop collecting data received from peer and
         processing it.
         """
-        required_len = BGP_MIN_MSG_LEN
         conn_lost_reason = "Connection lost as protocol is no longer active"
         try:
             while True:
-                next_bytes = self._socket.recv(required_len)
-                if len(next_bytes) == 0:
+                # Reads as much as the buffer allows, leaving room for at
+                # least one whole message.
+                if not self._recv_buff.recv_into(self._socket,
+                                                 BGP_MAX_MSG_LEN):
                     conn_lost_reason = 'Peer closed connection'
                     break
-                self.data_received(next_bytes)
+                self._process_recv_buff()
         except socket.error as err:
             conn_lost_reason = 'Connection to peer lost: %s.' % err
         except bgp.BgpExc as ex:
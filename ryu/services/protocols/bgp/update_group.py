@@ -0,0 +1,119 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+ Update groups of peers which share the same outbound policy.
+
+ Peers whose out-bound filters, attribute maps, negotiated capabilities and
+ other settings affecting the UPDATE messages sent are the same, produce the
+ same messages for the same routes. An update group caches the result of
+ the out-bound filter and of Peer._construct_update() per path, and the
+ serialized messages per batch of routes, so that the work is done once for
+ all the members of the group.
+"""
+from collections import OrderedDict
+import logging
+
+from ryu.services.protocols.bgp.utils import bgp as bgp_utils
+
+LOG = logging.getLogger('bgpspeaker.update_group')
+
+
+class UpdateGroup(object):
+    """A set of peers which share the same outbound policy.
+
+    Cached entries refer to the paths and messages they were computed from,
+    so that their ids used as the cache keys are not reused while cached.
+    """
+
+    # Max. number of paths whose Update message are cached.
+    MAX_CACHED_PATHS = 10000
+
+    # Max. number of batches whose serialized messages are cached.
+    MAX_CACHED_BATCHES = 16
+
+    def __init__(self, key):
+        self.key = key
+        self.peers = set()
+        # id(path) -> (path, block, blocked_cause, update_msg)
+        self._updates = OrderedDict()
+        # ids of update_msgs -> (update_msgs, [(packed_msg, bytes), ...])
+        self._batches = OrderedDict()
+        # Number of Update messages computed and reused.
+        self.constructed = 0
+        self.reused = 0
+
+    def __str__(self):
+        return 'UpdateGroup(peers: %s)' % ', '.join(
+            sorted(str(p.ip_address) for p in self.peers))
+
+    def add_peer(self, peer):
+        self.peers.add(peer)
+
+    def remove_peer(self, peer):
+        self.peers.discard(peer)
+        if len(self.peers) < 2:
+            self.clear()
+
+    def clear(self):
+        self._updates.clear()
+        self._batches.clear()
+
+    @staticmethod
+    def _cache(cache, key, value, max_len):
+        cache[key] = value
+        if len(cache) > max_len:
+            cache.popitem(last=False)
+
+    def construct_update(self, peer, outgoing_route):
+        """Returns (block, blocked_cause, update_msg) of `outgoing_route`
+        for `peer`, computed by the out-bound filter and
+        Peer._construct_update() of `peer` or by another member of this
+        group. `update_msg` is None if the route is blocked.
+        """
+        path = outgoing_route.path
+        if len(self.peers) > 1:
+            cached = self._updates.get(id(path))
+            if cached is not None:
+                self.reused += 1
+                return cached[1:]
+
+        block, blocked_cause = peer._apply_out_filter(path)
+        update_msg = None
+        if not block:
+            update_msg = peer._construct_update(outgoing_route)
+        self.constructed += 1
+        if len(self.peers) > 1:
+            self._cache(self._updates, id(path),
+                        (path, block, blocked_cause, update_msg),
+                        self.MAX_CACHED_PATHS)
+        return block, blocked_cause, update_msg
+
+    def pack_updates(self, update_msgs, max_len):
+        """Packs `update_msgs` with utils.bgp.pack_updates() and returns a
+        list of (packed message, serialized message). The result is shared
+        with the members which send the same batch of messages.
+        """
+        key = tuple(id(u) for u in update_msgs)
+        if len(self.peers) > 1:
+            cached = self._batches.get(key)
+            if cached is not None:
+                return cached[1]
+
+        packed = [(msg, bytes(msg.serialize()))
+                  for msg in bgp_utils.pack_updates(update_msgs, max_len)]
+        if len(self.peers) > 1:
+            self._cache(self._batches, key, (update_msgs, packed),
+                        self.MAX_CACHED_BATCHES)
+        return packed
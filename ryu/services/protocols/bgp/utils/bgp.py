@@ -16,6 +16,8 @@
 """
  Utilities related to bgp data types and models.
 """
+import collections
+import copy
 import logging
 
 import netaddr
@@ -23,6 +25,8 @@ import netaddr
 from ryu.lib import ip
 from ryu.lib.packet.bgp import (
     BGPUpdate,
+    BGP_ATTR_TYPE_MP_REACH_NLRI,
+    BGP_ATTR_TYPE_MP_UNREACH_NLRI,
     RF_IPv4_UC,
     RF_IPv6_UC,
     RF_IPv4_VPN,
@@ -167,6 +171,135 @@ def create_end_of_rib_update():
 # Bgp update message instance that can used as End of RIB marker.
 UPDATE_EOR = create_end_of_rib_update()
 
+# Length of BGP message header (19) and Withdrawn Routes Length and Total
+# Path Attribute Length fields of Update message.
+_UPDATE_HEADER_LEN = 19 + 2 + 2
+
+_UPDATE_WITHDRAWN = 'withdrawn'
+_UPDATE_NLRI = 'nlri'
+_UPDATE_MP_REACH = 'mp_reach'
+_UPDATE_MP_UNREACH = 'mp_unreach'
+
+
+def _serialize_attrs(attrs):
+    buf = bytearray()
+    for attr in attrs:
+        buf += attr.serialize()
+    return bytes(buf)
+
+
+def _classify_update(update):
+    """Returns (group key, MP_(UN)REACH_NLRI attribute, prefixes, base length)
+    of the given Update message, or None if it cannot be merged with others.
+    """
+    attrs = update.path_attributes
+    if update.withdrawn_routes:
+        if attrs or update.nlri:
+            return None
+        return ((_UPDATE_WITHDRAWN,), None, update.withdrawn_routes,
+                _UPDATE_HEADER_LEN)
+
+    mp_attrs = [a for a in attrs
+                if a.type in (BGP_ATTR_TYPE_MP_REACH_NLRI,
+                              BGP_ATTR_TYPE_MP_UNREACH_NLRI)]
+    if not mp_attrs:
+        if not update.nlri:
+            return None
+        attrs_bin = _serialize_attrs(attrs)
+        return ((_UPDATE_NLRI, attrs_bin), None, update.nlri,
+                _UPDATE_HEADER_LEN + len(attrs_bin))
+
+    if len(mp_attrs) > 1 or update.nlri:
+        return None
+    mp_attr = mp_attrs[0]
+    if mp_attr.type == BGP_ATTR_TYPE_MP_UNREACH_NLRI:
+        # Empty MP_UNREACH_NLRI is End-of-RIB marker.
+        if len(attrs) > 1 or not mp_attr.withdrawn_routes:
+            return None
+        empty = copy.copy(mp_attr)
+        empty.withdrawn_routes = []
+        key = (_UPDATE_MP_UNREACH, mp_attr.afi, mp_attr.safi)
+        prefixes = mp_attr.withdrawn_routes
+    else:
+        if not mp_attr.nlri:
+            return None
+        empty = copy.copy(mp_attr)
+        empty.nlri = []
+        others_bin = _serialize_attrs([a for a in attrs if a is not mp_attr])
+        key = (_UPDATE_MP_REACH, mp_attr.afi, mp_attr.safi,
+               tuple(mp_attr.next_hop_list), others_bin)
+        prefixes = mp_attr.nlri
+    # Reserves one more octet in case the attribute needs the extended
+    # length once it carries the prefixes.
+    base_len = (_UPDATE_HEADER_LEN + len(_serialize_attrs(attrs)) -
+                len(mp_attr.serialize()) + len(empty.serialize()) + 1)
+    return key, mp_attr, prefixes, base_len
+
+
+def _build_update(template, mp_attr, prefixes):
+    if mp_attr is None:
+        if template.withdrawn_routes:
+            return BGPUpdate(withdrawn_routes=prefixes)
+        return BGPUpdate(path_attributes=template.path_attributes,
+                         nlri=prefixes)
+
+    new_mp_attr = copy.copy(mp_attr)
+    if mp_attr.type == BGP_ATTR_TYPE_MP_UNREACH_NLRI:
+        new_mp_attr.withdrawn_routes = prefixes
+    else:
+        new_mp_attr.nlri = prefixes
+    attrs = [new_mp_attr if a is mp_attr else a
+             for a in template.path_attributes]
+    return BGPUpdate(path_attributes=attrs)
+
+
+def pack_updates(updates, max_len):
+    """Merges the given Update messages into as few messages as possible.
+
+    The prefixes of the messages which have the same path attributes are
+    carried by one message (in NLRI/Withdrawn Routes fields or in
+    MP_REACH_NLRI/MP_UNREACH_NLRI attribute) unless the message exceeds
+    `max_len` octets.  The messages which cannot be merged (e.g. End-of-RIB
+    marker) are returned as they are.
+
+    Each prefix should appear at most once in `updates`, because the order
+    of the prefixes in different groups of attributes is not preserved.
+
+    Returns a list of Update messages.
+    """
+    # group key -> [template update, MP attribute, prefixes, base length]
+    groups = collections.OrderedDict()
+    for update in updates:
+        classified = _classify_update(update)
+        if classified is None:
+            groups[id(update)] = [update, None, None, None]
+            continue
+        key, mp_attr, prefixes, base_len = classified
+        group = groups.get(key)
+        if group is None:
+            groups[key] = [update, mp_attr, list(prefixes), base_len]
+        else:
+            group[2].extend(prefixes)
+
+    packed = []
+    for template, mp_attr, prefixes, base_len in groups.values():
+        if prefixes is None:
+            packed.append(template)
+            continue
+        chunk = []
+        length = base_len
+        for prefix in prefixes:
+            prefix_len = len(prefix.serialize())
+            if chunk and length + prefix_len > max_len:
+                packed.append(_build_update(template, mp_attr, chunk))
+                chunk = []
+                length = base_len
+            chunk.append(prefix)
+            length += prefix_len
+        packed.append(_build_update(template, mp_attr, chunk))
+
+    return packed
+
 
 def create_rt_extended_community(value, subtype=2):
     """
@@ -0,0 +1,345 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+ Trie of radix 256 (a multibit trie with a stride of 8 bits) keyed by
+ prefixes.
+
+ A key is a tuple (bits, length) of a prefix of `width` bits, whose first
+ `length` bits are significant and the rest are zero, e.g. 10.0.0.0/8 is
+ (0x0a000000, 8) in a tree of width 32.  Besides the mapping interface of
+ dict, the tree answers longest prefix match, covering (less specific) and
+ covered (more specific) prefix queries, and iterates the prefixes in
+ order: a prefix comes before its more specifics and the prefixes are
+ sorted by their bits otherwise.
+"""
+import socket
+import struct
+
+from ryu.lib.packet.bgp import _RouteDistinguisher
+
+_IPV4 = struct.Struct('!I')
+_IPV6 = struct.Struct('!QQ')
+_RD = struct.Struct('!Q')
+
+# Width of route distinguisher prefixed to the prefixes of VPN tables.
+RD_WIDTH = _RD.size * 8
+IPV4_WIDTH = 32
+IPV6_WIDTH = 128
+
+
+def mask_bits(bits, length, width):
+    """Returns `bits` with the bits after the first `length` bits cleared.
+    """
+    host_len = width - length
+    return bits >> host_len << host_len
+
+
+def ipv4_prefix_key(addr, length):
+    """Returns the key of IPv4 prefix `addr`/`length` in a tree of width
+    IPV4_WIDTH.  `addr` is the text representation of the address.
+    """
+    bits = _IPV4.unpack(socket.inet_pton(socket.AF_INET, addr))[0]
+    return mask_bits(bits, length, IPV4_WIDTH), length
+
+
+def ipv6_prefix_key(addr, length):
+    """Returns the key of IPv6 prefix `addr`/`length` in a tree of width
+    IPV6_WIDTH.  `addr` is the text representation of the address.
+    """
+    hi, lo = _IPV6.unpack(socket.inet_pton(socket.AF_INET6, addr))
+    return mask_bits(hi << 64 | lo, length, IPV6_WIDTH), length
+
+
+def rd_prefix_key(route_dist, key, width):
+    """Returns `key` of a tree of `width` prefixed with route
+    distinguisher `route_dist`, for a tree of width RD_WIDTH + `width`.
+    """
+    rd = _RD.unpack(route_dist.serialize())[0]
+    bits, length = key
+    return rd << width | bits, RD_WIDTH + length
+
+
+def prefix_str_key(prefix, width):
+    """Returns the key of `prefix`, the text representation of an IPv4
+    (if `width` is IPV4_WIDTH) or IPv6 prefix e.g. '10.0.0.0/8'.
+
+    Raises ValueError if `prefix` is invalid.
+    """
+    try:
+        addr, length = prefix.split('/')
+        length = int(length)
+        if not 0 <= length <= width:
+            raise ValueError(length)
+        if width == IPV4_WIDTH:
+            return ipv4_prefix_key(addr, length)
+        return ipv6_prefix_key(addr, length)
+    except (ValueError, socket.error):
+        raise ValueError('Invalid prefix %s' % prefix)
+
+
+def vpn_prefix_str_key(prefix, width):
+    """Returns the key of `prefix`, the text representation of a VPN
+    prefix e.g. '65000:100:10.0.0.0/8', for a tree of width RD_WIDTH +
+    `width`.
+
+    Raises ValueError if `prefix` is invalid.
+    """
+    try:
+        admin, assigned, ip_prefix = prefix.split(':', 2)
+        route_dist = _RouteDistinguisher.from_str(admin + ':' + assigned)
+    except (ValueError, KeyError):
+        raise ValueError('Invalid VPN prefix %s' % prefix)
+    return rd_prefix_key(route_dist, prefix_str_key(ip_prefix, width),
+                         width)
+
+
+# Default of get() to tell missing keys.
+_NO_VALUE = object()
+
+
+class _Node(object):
+    # A node at depth d stores the prefixes whose length is in
+    # (8 * d, 8 * (d + 1)] (and the root also the prefix of length 0),
+    # and its children are keyed by the (d + 1)-th byte of the prefixes.
+    # The prefixes are keyed by _entry() of their last (partial) byte,
+    # which is smaller and cheaper to collect than a key tuple.
+    __slots__ = ('values', 'children')
+
+    def __init__(self):
+        self.values = {}
+        self.children = {}
+
+
+def _depth(length):
+    # Depth of the node which stores the prefixes of `length`.
+    return (length - 1) >> 3 if length else 0
+
+
+def _entry(chunk, rest):
+    # Key in _Node.values of the prefix whose last byte is `chunk` of
+    # which the first `rest` bits are significant.
+    return rest << 8 | chunk >> (8 - rest) << (8 - rest)
+
+
+def _order(entry):
+    # Sort key of an entry among the entries and the children (whose
+    # order is chunk << 4 | 9) of a node: a prefix comes before the
+    # child of its last byte, which has its more specifics.
+    return (entry & 0xff) << 4 | entry >> 8
+
+
+class RadixTree(object):
+    """Mapping of prefixes of `width` bits to values.
+
+    `width` must be a multiple of 8.  A prefix is stored in the node of
+    the bytes which precede its last (partial) byte, so looking it up
+    takes a dict lookup per byte.
+    """
+
+    def __init__(self, width):
+        assert width % 8 == 0
+        self.width = width
+        self._root = _Node()
+        self._len = 0
+
+    def __len__(self):
+        return self._len
+
+    def _find(self, bits, length):
+        # Returns the node to store (bits, length) in and the shift of
+        # its byte, or (None, None).
+        node = self._root
+        shift = self.width - 8
+        for _ in range(_depth(length)):
+            node = node.children.get(bits >> shift & 0xff)
+            if node is None:
+                return None, None
+            shift -= 8
+        return node, shift
+
+    def get(self, key, default=None):
+        bits, length = key
+        node, shift = self._find(bits, length)
+        if node is None:
+            return default
+        rest = length + shift + 8 - self.width
+        return node.values.get(_entry(bits >> shift & 0xff, rest), default)
+
+    def __getitem__(self, key):
+        value = self.get(key, _NO_VALUE)
+        if value is _NO_VALUE:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key):
+        return self.get(key, _NO_VALUE) is not _NO_VALUE
+
+    def __setitem__(self, key, value):
+        bits, length = key
+        width = self.width
+        if not 0 <= length <= width or bits >> width:
+            raise ValueError('Invalid key %s for width %d' % (key, width))
+        node = self._root
+        shift = width - 8
+        if length > 8:
+            end = width - 8 - ((length - 1) & ~7)
+            while shift > end:
+                children = node.children
+                chunk = bits >> shift & 0xff
+                child = children.get(chunk)
+                if child is None:
+                    child = children[chunk] = _Node()
+                node = child
+                shift -= 8
+        values = node.values
+        host_len = width - length
+        entry = ((length + shift + 8 - width) << 8 |
+                 (bits >> host_len << host_len >> shift & 0xff))
+        if entry not in values:
+            self._len += 1
+        values[entry] = value
+
+    def pop(self, key, *default):
+        bits, length = key
+        path = []
+        node = self._root
+        shift = self.width - 8
+        for _ in range(_depth(length)):
+            chunk = bits >> shift & 0xff
+            path.append((node, chunk))
+            node = node.children.get(chunk)
+            if node is None:
+                break
+            shift -= 8
+        if node is not None:
+            entry = _entry(bits >> shift & 0xff,
+                           length + shift + 8 - self.width)
+        if node is None or entry not in node.values:
+            if default:
+                return default[0]
+            raise KeyError(key)
+
+        value = node.values.pop(entry)
+        self._len -= 1
+        # Remove the nodes left empty.
+        while path and not node.values and not node.children:
+            node, chunk = path.pop()
+            del node.children[chunk]
+        return value
+
+    def __delitem__(self, key):
+        self.pop(key)
+
+    def _walk(self, node, depth, bits, entries=None):
+        # Yields (key, value) of the prefixes under `node` at `depth`,
+        # whose preceding bytes are `bits`, in order.  `entries` limits
+        # the entries and the children of `node` to walk.
+        shift = self.width - 8 * (depth + 1)
+        base = 8 * depth
+        if entries is None:
+            entries = [(_order(entry), entry, value)
+                       for entry, value in node.values.items()]
+            entries.extend((chunk << 4 | 9, None, child)
+                           for chunk, child in node.children.items())
+        entries.sort(key=lambda entry: entry[0])
+        for order, entry, value in entries:
+            if entry is None:
+                for item in self._walk(value, depth + 1,
+                                       bits | (order >> 4) << shift):
+                    yield item
+            else:
+                yield ((bits | (entry & 0xff) << shift, base + (entry >> 8)),
+                       value)
+
+    def items(self):
+        return self._walk(self._root, 0, 0)
+
+    def keys(self):
+        for key, _ in self.items():
+            yield key
+
+    def values(self):
+        for _, value in self.items():
+            yield value
+
+    __iter__ = keys
+
+    def clear(self):
+        self._root = _Node()
+        self._len = 0
+
+    def covering(self, key):
+        """Yields (key, value) of the prefixes which cover `key`, `key`
+        itself included, from the shortest to the longest.
+        """
+        bits, length = key
+        width = self.width
+        node = self._root
+        if 0 in node.values:
+            yield (0, 0), node.values[0]
+        shift = width - 8
+        for depth in range(_depth(length) + 1):
+            values = node.values
+            if values:
+                chunk = bits >> shift & 0xff
+                for rest in range(1, min(8, length - 8 * depth) + 1):
+                    entry = _entry(chunk, rest)
+                    if entry in values:
+                        plen = 8 * depth + rest
+                        yield ((bits >> (width - plen) << (width - plen),
+                                plen),
+                               values[entry])
+            node = node.children.get(bits >> shift & 0xff)
+            if node is None:
+                return
+            shift -= 8
+
+    def longest_match(self, key):
+        """Returns (key, value) of the longest prefix which covers `key`,
+        or None if there is no such prefix.
+        """
+        match = None
+        for match in self.covering(key):
+            pass
+        return match
+
+    def covered(self, key):
+        """Yields (key, value) of the prefixes covered by `key`, `key`
+        itself included, in order.
+        """
+        bits, length = key
+        node, shift = self._find(bits, length)
+        if node is None:
+            return
+        depth = _depth(length)
+        bits = bits >> (shift + 8) << (shift + 8)
+        if not length:
+            for item in self._walk(node, 0, 0):
+                yield item
+            return
+
+        # The entries and the children of `node` whose last byte starts
+        # with the rest of `key`.
+        rest = length - 8 * depth
+        prefix = (key[0] >> shift & 0xff) >> (8 - rest)
+        entries = [(_order(entry), entry, value)
+                   for entry, value in node.values.items()
+                   if entry >> 8 >= rest and
+                   (entry & 0xff) >> (8 - rest) == prefix]
+        entries.extend((chunk << 4 | 9, None, child)
+                       for chunk, child in node.children.items()
+                       if chunk >> (8 - rest) == prefix)
+        for item in self._walk(node, depth, bits, entries):
+            yield item
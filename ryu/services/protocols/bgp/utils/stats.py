@@ -44,11 +44,22 @@ LOCAL_ROUTES = 'local_routes'
 # Peer related stat constant.
 UPDATE_MSG_IN = 'update_message_in'
 UPDATE_MSG_OUT = 'update_message_out'
+UPDATE_MSG_OUT_RATE = 'update_message_out_rate'
 TOTAL_MSG_IN = 'total_message_in'
 TOTAL_MSG_OUT = 'total_message_out'
 FMS_EST_TRANS = 'fsm_established_transitions'
 UPTIME = 'uptime'
 
+# BGP processor related stat constants.
+PROCESSOR_QUEUE_DEPTH = 'queue_depth'
+PROCESSOR_MAX_QUEUE_DEPTH = 'max_queue_depth'
+PROCESSOR_CYCLES = 'cycles'
+PROCESSOR_DEST_PROCESSED = 'destinations_processed'
+PROCESSOR_WORK_UNITS = 'work_units_per_cycle'
+PROCESSOR_LAST_CYCLE_TIME = 'last_cycle_time'
+PROCESSOR_AVG_CYCLE_TIME = 'average_cycle_time'
+PROCESSOR_MAX_CYCLE_TIME = 'max_cycle_time'
+
 
 def log(stats_resource=None, stats_source=None, log_level=DEFAULT_LOG_LEVEL,
         **kwargs):
@@ -98,3 +109,33 @@ def logd(**kwargs):
 
 def logi(**kwargs):
     log(log_level=logging.INFO, **kwargs)
+
+
+class RateMeter(object):
+    """Counts events and gives their rate per second.
+
+    The rate is the average over the last interval of at least `interval`
+    seconds.
+    """
+
+    def __init__(self, interval=1.0):
+        self.interval = interval
+        self._start = time.time()
+        self._count = 0
+        self._rate = 0.0
+
+    def _roll(self, now):
+        elapsed = now - self._start
+        if elapsed >= self.interval:
+            self._rate = self._count / elapsed
+            self._start = now
+            self._count = 0
+
+    def incr(self, incr_by=1):
+        self._roll(time.time())
+        self._count += incr_by
+
+    @property
+    def rate(self):
+        self._roll(time.time())
+        return self._rate
@@ -0,0 +1,131 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark of the best path selection of BGP speaker.
+
+Selects the best path of "--dests" destinations of "--paths" paths each,
+received from iBGP and eBGP peers with random attributes, as
+Destination._compute_best_known_path() does.  Compares the comparison
+chain of ryu.services.protocols.bgp.processor.compute_best_path() with
+the precomputed best path keys, reporting the time spent for the first
+selection (including computing the keys) and for the repeated ones.
+
+Usage::
+
+    $ python -m ryu.tests.benchmark.bench_bgp_best_path [--dests N]
+"""
+
+from __future__ import print_function
+
+import argparse
+from collections import OrderedDict
+import random
+import timeit
+
+from ryu.lib.packet import bgp
+from ryu.services.protocols.bgp import processor
+from ryu.services.protocols.bgp.info_base.ipv4 import Ipv4Path
+
+LOCAL_ASN = 65000
+LOCAL_BGP_ID = '10.0.0.100'
+
+
+class _Protocol(object):
+    def __init__(self, bgp_id):
+        self.recv_open_msg = bgp.BGPOpen(my_as=0, bgp_identifier=bgp_id)
+        self.sent_open_msg = bgp.BGPOpen(my_as=LOCAL_ASN,
+                                         bgp_identifier=LOCAL_BGP_ID)
+
+
+class _Peer(object):
+    version_num = 0
+
+    def __init__(self, remote_as, bgp_id):
+        self.remote_as = remote_as
+        self.protocol = _Protocol(bgp_id)
+
+
+def _make_dests(dests, paths, peers, seed):
+    rand = random.Random(seed)
+    sources = [_Peer(rand.choice([LOCAL_ASN, 65001 + i]), '10.0.0.%d' % i)
+               for i in range(1, peers + 1)]
+    result = []
+    for i in range(dests):
+        nlri = bgp.IPAddrPrefix(24, '10.%d.%d.0' % (i >> 8 & 0xff, i & 0xff))
+        path_list = []
+        for source in rand.sample(sources, paths):
+            pattrs = OrderedDict()
+            pattrs[bgp.BGP_ATTR_TYPE_ORIGIN] = bgp.BGPPathAttributeOrigin(
+                rand.choice([bgp.BGP_ATTR_ORIGIN_IGP,
+                             bgp.BGP_ATTR_ORIGIN_INCOMPLETE]))
+            pattrs[bgp.BGP_ATTR_TYPE_AS_PATH] = bgp.BGPPathAttributeAsPath(
+                [[65100] * rand.randint(1, 4)])
+            pattrs[bgp.BGP_ATTR_TYPE_LOCAL_PREF] = \
+                bgp.BGPPathAttributeLocalPref(100)
+            pattrs[bgp.BGP_ATTR_TYPE_MULTI_EXIT_DISC] = \
+                bgp.BGPPathAttributeMultiExitDisc(rand.choice([0, 10]))
+            path_list.append(Ipv4Path(source, nlri, 0, pattrs=pattrs,
+                                      nexthop='192.0.2.1'))
+        result.append(path_list)
+    return result
+
+
+def run_compute_best_path(dests):
+    for path_list in dests:
+        best_path = path_list[0]
+        for next_path in path_list[1:]:
+            new_best_path, _ = processor.compute_best_path(
+                LOCAL_ASN, best_path, next_path)
+            if new_best_path is not None:
+                best_path = new_best_path
+
+
+def run_best_path_key(dests):
+    for path_list in dests:
+        best_path = path_list[0]
+        best_key = best_path.get_best_path_key(LOCAL_ASN, LOCAL_BGP_ID)
+        for next_path in path_list[1:]:
+            next_key = next_path.get_best_path_key(LOCAL_ASN, LOCAL_BGP_ID)
+            new_best_path, _ = processor.compute_best_path_by_key(
+                best_path, best_key, next_path, next_key)
+            if new_best_path is next_path:
+                best_path = next_path
+                best_key = next_key
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--dests', type=int, default=50000,
+                        help='number of destinations (default: %(default)s)')
+    parser.add_argument('--paths', type=int, default=4,
+                        help='number of paths per destination '
+                             '(default: %(default)s)')
+    parser.add_argument('--peers', type=int, default=8,
+                        help='number of peers (default: %(default)s)')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    dests = _make_dests(args.dests, args.paths, args.peers, args.seed)
+    print('%d destinations, %d paths each' % (args.dests, args.paths))
+    for name, run in (('compare', run_compute_best_path),
+                      ('key', run_best_path_key)):
+        first = timeit.timeit(lambda: run(dests), number=1)
+        again = timeit.timeit(lambda: run(dests), number=1)
+        print('%-9s first %7.3f sec  again %7.3f sec' % (name, first, again))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,159 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark of the receive loop of BGP speaker.
+
+Replays the BGP messages recorded in a MRT dump through
+ryu.services.protocols.bgp.speaker.BgpProtocol._recv_loop() and reports
+the number of messages framed and parsed per second.  The messages are
+not handled by a peer.
+
+Usage::
+
+    $ python -m ryu.tests.benchmark.bench_bgp_recv [--mrt FILE]
+
+FILE is a MRT dump (optionally compressed with bzip2).  The messages of
+BGP4MP records are replayed as they are, and an UPDATE message is made
+for each entry of TABLE_DUMP_V2 IPv4/IPv6 unicast RIB records, so both
+update and RIB (full table) dumps can be used.  If omitted, the update
+dump in ryu/tests/packet_data/mrt is used.
+"""
+
+from __future__ import print_function
+
+import argparse
+import bz2
+import os
+import timeit
+
+from ryu.lib import mrtlib
+from ryu.lib.packet import bgp
+from ryu.services.protocols.bgp import speaker
+
+
+DEFAULT_MRT = os.path.join(os.path.dirname(__file__),
+                           '../packet_data/mrt/updates.20161101.0000.bz2')
+
+
+class _ReplaySocket(object):
+    def __init__(self, data, chunk_size):
+        self.data = memoryview(data)
+        self.chunk_size = chunk_size
+        self.offset = 0
+
+    def setsockopt(self, *args):
+        pass
+
+    def getpeername(self):
+        return ('192.0.2.1', 179)
+
+    def getsockname(self):
+        return ('192.0.2.2', 50000)
+
+    def close(self):
+        pass
+
+    def recv(self, bufsize):
+        size = min(bufsize, self.chunk_size)
+        out = self.data[self.offset:self.offset + size].tobytes()
+        self.offset += len(out)
+        return out
+
+    def recv_into(self, buffer, nbytes=0):
+        size = min(nbytes or len(buffer), self.chunk_size)
+        out = self.data[self.offset:self.offset + size]
+        buffer[:len(out)] = out
+        self.offset += len(out)
+        return len(out)
+
+
+def _rib_updates(message):
+    if isinstance(message, mrtlib.TableDump2RibIPv4UnicastMrtMessage):
+        for entry in message.rib_entries:
+            yield bgp.BGPUpdate(path_attributes=entry.bgp_attributes,
+                                nlri=[message.prefix])
+    elif isinstance(message, mrtlib.TableDump2RibIPv6UnicastMrtMessage):
+        for entry in message.rib_entries:
+            attrs = [a for a in entry.bgp_attributes
+                     if a.type != bgp.BGP_ATTR_TYPE_MP_REACH_NLRI]
+            attrs.append(bgp.BGPPathAttributeMpReachNLRI(
+                bgp.RF_IPv6_UC.afi, bgp.RF_IPv6_UC.safi, '::',
+                [message.prefix]))
+            yield bgp.BGPUpdate(path_attributes=attrs)
+
+
+def load_mrt(path):
+    """
+    Returns the serialized BGP messages in the MRT dump and their count.
+    """
+    if path.endswith('.bz2'):
+        f = bz2.BZ2File(path, 'rb')
+    else:
+        f = open(path, 'rb')
+    data = bytearray()
+    count = 0
+    for record in mrtlib.Reader(f):
+        message = record.message
+        if isinstance(message, mrtlib.Bgp4MpMessageMrtMessage):
+            msgs = [message.bgp_message]
+        else:
+            msgs = _rib_updates(message)
+        for msg in msgs:
+            buf = msg.serialize()
+            if len(buf) > speaker.BGP_MAX_MSG_LEN:
+                continue
+            data += buf
+            count += 1
+    return data, count
+
+
+def run(data, chunk_size):
+    counter = [0]
+
+    def _handle_msg(msg):
+        counter[0] += 1
+
+    protocol = speaker.BgpProtocol(_ReplaySocket(data, chunk_size), None)
+    protocol._handle_msg = _handle_msg
+    start = timeit.default_timer()
+    protocol._recv_loop()
+    return timeit.default_timer() - start, counter[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--mrt', default=DEFAULT_MRT,
+                        help='MRT dump to replay (default: %(default)s)')
+    parser.add_argument('--repeat', type=int, default=1,
+                        help='number of times to replay the messages '
+                             '(default: %(default)s)')
+    parser.add_argument('--chunk-size', type=int, default=64 * 1024,
+                        help='maximum bytes returned per read '
+                             '(default: %(default)s)')
+    args = parser.parse_args()
+
+    data, count = load_mrt(args.mrt)
+    data *= args.repeat
+    count *= args.repeat
+    print('%d messages, %d bytes' % (count, len(data)))
+    elapsed, handled = run(data, args.chunk_size)
+    if handled != count:
+        print('only %d messages handled' % handled)
+    print('%8.3f sec %12.0f msgs/sec' % (elapsed, handled / elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,190 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark of the destination store of BGP speaker tables.
+
+Stores "--prefixes" IPv4 prefixes (about a full Internet table by default)
+in a dict keyed by the prefix strings alone, and also indexed by
+ryu.services.protocols.bgp.utils.radix.RadixTree as Ipv4Table does, and
+reports the time of inserting, exact lookups, longest prefix matches of
+random addresses and covered (more specific) prefix queries, and the
+memory used (with tracemalloc, if available).
+
+Exact lookups use the dict in both cases.  Without the index, a longest
+prefix match tries each prefix length and a covered prefix query scans
+the whole table.  Table builds the index by the first prefix lookup, so
+the insert time of the index is only paid by the tables which are looked
+up by prefixes.
+
+Usage::
+
+    $ python -m ryu.tests.benchmark.bench_bgp_table [--prefixes N]
+"""
+
+from __future__ import print_function
+
+import argparse
+import random
+import socket
+import struct
+import timeit
+
+try:
+    import tracemalloc
+except ImportError:
+    # Python 2
+    tracemalloc = None
+
+from ryu.services.protocols.bgp.utils import radix
+
+
+# Approximate share of the prefix lengths in the Internet table.
+_LENGTHS = [(24, 60), (22, 10), (23, 9), (20, 5), (21, 5), (19, 4),
+            (16, 3), (18, 2), (17, 1), (8, 1)]
+
+
+def _make_prefixes(count, seed):
+    rand = random.Random(seed)
+    lengths = []
+    for length, share in _LENGTHS:
+        lengths.extend([length] * share)
+    prefixes = set()
+    while len(prefixes) < count:
+        length = rand.choice(lengths)
+        bits = radix.mask_bits(rand.getrandbits(32), length, 32)
+        prefixes.add((socket.inet_ntoa(struct.pack('!I', bits)), length))
+    return sorted(prefixes)
+
+
+def _measure(build):
+    start = timeit.default_timer()
+    table = build()
+    elapsed = timeit.default_timer() - start
+    memory = None
+    if tracemalloc is not None:
+        # Build again, as tracing slows down allocations.
+        del table
+        tracemalloc.start()
+        table = build()
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+    return table, elapsed, memory
+
+
+def run_dict(prefixes, addrs, queries):
+    def _build():
+        table = {}
+        for addr, length in prefixes:
+            table[addr + '/{0}'.format(length)] = length
+        return table
+
+    table, build, memory = _measure(_build)
+
+    start = timeit.default_timer()
+    for addr, length in prefixes:
+        table.get(addr + '/{0}'.format(length))
+    get = timeit.default_timer() - start
+
+    lengths = sorted(set(length for _, length in prefixes), reverse=True)
+    start = timeit.default_timer()
+    for addr in addrs:
+        bits = struct.unpack('!I', socket.inet_aton(addr))[0]
+        for length in lengths:
+            key = socket.inet_ntoa(
+                struct.pack('!I', radix.mask_bits(bits, length, 32)))
+            if table.get(key + '/{0}'.format(length)) is not None:
+                break
+    lpm = timeit.default_timer() - start
+
+    start = timeit.default_timer()
+    found = 0
+    for addr, length in queries:
+        query = radix.ipv4_prefix_key(addr, length)
+        for prefix in table:
+            paddr, plength = prefix.split('/')
+            plength = int(plength)
+            if (plength >= length and
+                    radix.ipv4_prefix_key(paddr, length) == query):
+                found += 1
+    covered = timeit.default_timer() - start
+    return build, get, lpm, covered, memory, found
+
+
+def run_indexed(prefixes, addrs, queries):
+    def _build():
+        table = {}
+        index = radix.RadixTree(radix.IPV4_WIDTH)
+        for addr, length in prefixes:
+            table[addr + '/{0}'.format(length)] = length
+            index[radix.ipv4_prefix_key(addr, length)] = (length,)
+        return table, index
+
+    (table, index), build, memory = _measure(_build)
+
+    start = timeit.default_timer()
+    for addr, length in prefixes:
+        table.get(addr + '/{0}'.format(length))
+    get = timeit.default_timer() - start
+
+    start = timeit.default_timer()
+    for addr in addrs:
+        index.longest_match(radix.ipv4_prefix_key(addr, 32))
+    lpm = timeit.default_timer() - start
+
+    start = timeit.default_timer()
+    found = 0
+    for addr, length in queries:
+        for _ in index.covered(radix.ipv4_prefix_key(addr, length)):
+            found += 1
+    covered = timeit.default_timer() - start
+    return build, get, lpm, covered, memory, found
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--prefixes', type=int, default=900000,
+                        help='number of prefixes (default: %(default)s)')
+    parser.add_argument('--lookups', type=int, default=100000,
+                        help='number of longest prefix matches '
+                             '(default: %(default)s)')
+    parser.add_argument('--queries', type=int, default=10,
+                        help='number of covered prefix queries '
+                             '(default: %(default)s)')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rand = random.Random(args.seed)
+    prefixes = _make_prefixes(args.prefixes, args.seed)
+    addrs = [socket.inet_ntoa(struct.pack('!I', rand.getrandbits(32)))
+             for _ in range(args.lookups)]
+    queries = [rand.choice(prefixes)[0] for _ in range(args.queries)]
+    queries = [(addr, 12) for addr in queries]
+    rand.shuffle(prefixes)
+    print('%d prefixes, %d lookups, %d queries'
+          % (len(prefixes), len(addrs), len(queries)))
+    print('%-9s %9s %9s %9s %9s %9s' % ('', 'insert', 'get', 'lpm',
+                                        'covered', 'MiB'))
+    for name, run in (('dict', run_dict), ('indexed', run_indexed)):
+        build, get, lpm, covered, memory, found = run(prefixes, addrs,
+                                                      queries)
+        print('%-9s %8.3fs %8.3fs %8.3fs %8.3fs %9s  (%d covered)'
+              % (name, build, get, lpm, covered,
+                 '-' if memory is None else '%.1f' % (memory / 2.0 ** 20),
+                 found))
+
+
+if __name__ == '__main__':
+    main()
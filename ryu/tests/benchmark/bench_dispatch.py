@@ -0,0 +1,108 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Microbenchmark of the per-event dispatch overhead of RyuApp.
+
+Measures the cost of looking up the handlers and the observers of an event
+as done by Datapath and RyuApp for every OpenFlow message, with the
+dispatch tables of RyuApp and with the former list rebuilding and
+filtering on every event.
+
+Usage::
+
+    $ python -m ryu.tests.benchmark.bench_dispatch [--observers N]
+"""
+
+from __future__ import print_function
+
+import argparse
+import timeit
+
+from ryu.base import app_manager
+from ryu.controller import handler
+from ryu.controller import ofp_event
+from ryu.controller.handler import CONFIG_DISPATCHER
+from ryu.controller.handler import MAIN_DISPATCHER
+from ryu.controller.handler import set_ev_handler
+
+
+class _BenchApp(app_manager.RyuApp):
+    @set_ev_handler(ofp_event.EventOFPPacketIn, MAIN_DISPATCHER)
+    def packet_in_handler(self, ev):
+        pass
+
+    @set_ev_handler(ofp_event.EventOFPPacketIn, CONFIG_DISPATCHER)
+    def packet_in_config_handler(self, ev):
+        pass
+
+
+def _get_handlers_uncached(app, ev, state):
+    # RyuApp.get_handlers() and Datapath._recv_loop() without the dispatch
+    # tables.
+    ev_cls = ev.__class__
+    handlers = app.event_handlers.get(ev_cls, [])
+
+    def test(h):
+        if not hasattr(h, 'callers') or ev_cls not in h.callers:
+            return True
+        states = h.callers[ev_cls].dispatchers
+        if not states:
+            return True
+        return state in states
+
+    return [h for h in filter(test, handlers)
+            if state in h.callers[ev_cls].dispatchers]
+
+
+def _get_observers_uncached(app, ev, state):
+    observers = []
+    for k, v in app.observers.get(ev.__class__, {}).items():
+        if not state or not v or state in v:
+            observers.append(k)
+    return observers
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--observers', type=int, default=8,
+                        help='number of observing apps (default: %(default)s)')
+    parser.add_argument('--events', type=int, default=1000000,
+                        help='number of events (default: %(default)s)')
+    args = parser.parse_args()
+
+    app = _BenchApp()
+    handler.register_instance(app)
+    for i in range(args.observers):
+        states = [MAIN_DISPATCHER] if i % 2 else []
+        app.register_observer(ofp_event.EventOFPPacketIn, 'app%d' % i, states)
+    ev = ofp_event.EventOFPPacketIn(None)
+    state = MAIN_DISPATCHER
+
+    def uncached():
+        _get_observers_uncached(app, ev, state)
+        _get_handlers_uncached(app, ev, state)
+
+    def cached():
+        app.get_observers(ev, state)
+        app.get_handlers(ev, state)
+
+    for name, func in (('uncached', uncached), ('cached', cached)):
+        elapsed = timeit.timeit(func, number=args.events)
+        print('%-10s %8.3f usec/event' % (name, elapsed / args.events * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark of the header-only extraction of ryu.lib.packet.header_fields.
+
+Reads the frames of the PCAP files under ryu/tests/packet_data/pcap and
+decodes each of them "--rounds" times with packet.Packet(), as the
+learning applications did, and with header_fields.extract(), reporting
+the time per frame of each.
+
+Usage::
+
+    $ python -m ryu.tests.benchmark.bench_header_fields [--rounds N]
+"""
+
+from __future__ import print_function
+
+import argparse
+import glob
+import os
+import timeit
+
+from ryu.lib import pcaplib
+from ryu.lib.packet import header_fields
+from ryu.lib.packet import packet
+
+PCAP_DIR = os.path.join(os.path.dirname(__file__), '..', 'packet_data',
+                        'pcap')
+
+
+def _read_frames(pcap_dir):
+    frames = []
+    for path in sorted(glob.glob(os.path.join(pcap_dir, '*.pcap'))):
+        frames.extend(buf for (_ts, buf) in
+                      pcaplib.Reader(open(path, 'rb')))
+    return frames
+
+
+def run(func, frames, rounds):
+    timer = timeit.default_timer
+    start = timer()
+    for _ in range(rounds):
+        for buf in frames:
+            func(buf)
+    return (timer() - start) / (rounds * len(frames))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rounds', type=int, default=200,
+                        help='decodes per frame (default: %(default)s)')
+    parser.add_argument('--pcap-dir', default=PCAP_DIR,
+                        help='directory of the PCAP files')
+    args = parser.parse_args()
+
+    frames = _read_frames(args.pcap_dir)
+    print('%d frames, %d rounds' % (len(frames), args.rounds))
+    for (name, func) in (('Packet', packet.Packet),
+                         ('extract', header_fields.extract)):
+        elapsed = run(func, frames, args.rounds)
+        print('%-8s %8.2f usec/frame' % (name, elapsed * 1000000))
+
+
+if __name__ == '__main__':
+    main()
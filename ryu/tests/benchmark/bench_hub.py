@@ -0,0 +1,238 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark of the hub backends with a cbench like workload.
+
+Runs ryu.app.simple_switch_13 with the real OpenFlowController and emulated
+OpenFlow 1.3 switches connected over TCP, in the same process.  Like cbench,
+each switch keeps "--window" PACKET_IN messages of "--hosts" hosts
+outstanding and sends a new one for every PACKET_OUT it receives.  The
+number of PACKET_OUT messages per second is reported for each hub type
+(RYU_HUB_TYPE), which is run in a separate process.
+
+Usage::
+
+    $ python -m ryu.tests.benchmark.bench_hub [--hubs eventlet,asyncio]
+
+With "--uvloop", the asyncio hub uses uvloop if it is installed.
+"""
+
+from __future__ import print_function
+
+import argparse
+import os
+import socket
+import struct
+import subprocess
+import sys
+
+
+def _free_port():
+    sock = socket.socket()
+    sock.bind(('127.0.0.1', 0))
+    port = sock.getsockname()[1]
+    sock.close()
+    return port
+
+
+class _Switch(object):
+    # An emulated switch sending PACKET_IN messages like cbench.
+    def __init__(self, dpid, hosts, window):
+        from ryu.lib.packet import ethernet
+        from ryu.lib.packet import ipv4
+        from ryu.lib.packet import packet
+        from ryu.lib.packet import udp
+        from ryu.ofproto import ofproto_v1_3 as ofp
+        from ryu.ofproto import ofproto_v1_3_parser as parser
+
+        self.dpid = dpid
+        self.window = window
+        self.responses = 0
+        self.xid = 0
+        self.packet_ins = []
+        macs = ['02:00:%02x:%02x:%02x:%02x' % ((dpid >> 8) & 0xff, dpid & 0xff,
+                                               i >> 8, i & 0xff)
+                for i in range(hosts)]
+        for i in range(hosts):
+            pkt = packet.Packet()
+            pkt.add_protocol(ethernet.ethernet(dst=macs[(i + 1) % hosts],
+                                               src=macs[i]))
+            pkt.add_protocol(ipv4.ipv4(src='10.0.0.1', dst='10.0.0.2',
+                                       proto=17))
+            pkt.add_protocol(udp.udp(src_port=1000, dst_port=2000))
+            pkt.serialize()
+            data = bytes(pkt.data)
+
+            buf = bytearray()
+            match = parser.OFPMatch(in_port=i % 0xff + 1)
+            match_len = match.serialize(buf, ofp.OFP_PACKET_IN_SIZE -
+                                        ofp.OFP_MATCH_SIZE)
+            length = ofp.OFP_PACKET_IN_SIZE - ofp.OFP_MATCH_SIZE + \
+                match_len + 2 + len(data)
+            head = bytearray(length)
+            struct.pack_into(ofp.OFP_HEADER_PACK_STR, head, 0,
+                             ofp.OFP_VERSION, ofp.OFPT_PACKET_IN, length, 0)
+            struct.pack_into(ofp.OFP_PACKET_IN_PACK_STR, head,
+                             ofp.OFP_HEADER_SIZE, ofp.OFP_NO_BUFFER,
+                             len(data), ofp.OFPR_NO_MATCH, 0, 0)
+            offset = ofp.OFP_PACKET_IN_SIZE - ofp.OFP_MATCH_SIZE
+            head[offset:offset + len(buf) - offset] = buf[offset:]
+            head[length - len(data):] = data
+            self.packet_ins.append(bytes(head))
+
+    def _send_packet_in(self, sock):
+        sock.sendall(self.packet_ins[self.xid % len(self.packet_ins)])
+        self.xid += 1
+
+    def run(self, port, settle):
+        from ryu.lib import hub
+        from ryu.lib import recvbuf
+        from ryu.ofproto import ofproto_v1_3 as ofp
+
+        sock = hub.connect(('127.0.0.1', port))
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        hello = struct.pack(ofp.OFP_HEADER_PACK_STR, ofp.OFP_VERSION,
+                            ofp.OFPT_HELLO, ofp.OFP_HEADER_SIZE, 0)
+        sock.sendall(hello)
+        rbuf = recvbuf.RecvBuffer()
+        while rbuf.recv_into(sock, ofp.OFP_HEADER_SIZE):
+            while len(rbuf) >= ofp.OFP_HEADER_SIZE:
+                (_v, msg_type, msg_len, xid) = struct.unpack_from(
+                    ofp.OFP_HEADER_PACK_STR, rbuf.peek())
+                if len(rbuf) < msg_len:
+                    break
+                msg = rbuf.consume(msg_len)
+                if msg_type == ofp.OFPT_PACKET_OUT:
+                    self.responses += 1
+                    self._send_packet_in(sock)
+                elif msg_type == ofp.OFPT_FEATURES_REQUEST:
+                    body = struct.pack(ofp.OFP_SWITCH_FEATURES_PACK_STR,
+                                       self.dpid, 256, 254, 0, 0, 0)
+                    sock.sendall(struct.pack(
+                        ofp.OFP_HEADER_PACK_STR, ofp.OFP_VERSION,
+                        ofp.OFPT_FEATURES_REPLY,
+                        ofp.OFP_HEADER_SIZE + len(body), xid) + body)
+                elif msg_type == ofp.OFPT_MULTIPART_REQUEST:
+                    (mp_type, _flags) = struct.unpack_from(
+                        '!HH', msg, ofp.OFP_HEADER_SIZE)
+                    sock.sendall(struct.pack(
+                        ofp.OFP_HEADER_PACK_STR + 'HH4x', ofp.OFP_VERSION,
+                        ofp.OFPT_MULTIPART_REPLY,
+                        ofp.OFP_MULTIPART_REPLY_SIZE, xid, mp_type, 0))
+                    # The handshake completes with the reply of
+                    # PORT_DESC.  Start after the controller processed it.
+                    hub.spawn_after(settle, self._start, sock)
+                elif msg_type == ofp.OFPT_ECHO_REQUEST:
+                    sock.sendall(struct.pack(
+                        ofp.OFP_HEADER_PACK_STR, ofp.OFP_VERSION,
+                        ofp.OFPT_ECHO_REPLY, msg_len, xid) +
+                        bytes(msg[ofp.OFP_HEADER_SIZE:]))
+
+    def _start(self, sock):
+        for _ in range(self.window):
+            self._send_packet_in(sock)
+
+
+def _run(args):
+    if args.uvloop:
+        import uvloop
+        uvloop.install()
+
+    from ryu import cfg
+    from ryu import flags  # register the options
+    from ryu.base import app_manager
+    from ryu.lib import hub
+
+    port = _free_port()
+    cfg.CONF(args=['--ofp-listen-host', '127.0.0.1',
+                   '--ofp-tcp-listen-port', str(port)],
+             project='ryu', default_config_files=[])
+    hub.patch(thread=False)
+
+    app_mgr = app_manager.AppManager.get_instance()
+    app_mgr.load_apps(['ryu.app.simple_switch_13'])
+    contexts = app_mgr.create_contexts()
+    app_mgr.instantiate_apps(**contexts)
+    # Wait for the server to listen.
+    hub.sleep(0.5)
+
+    switches = [_Switch(i + 1, args.hosts, args.window)
+                for i in range(args.switches)]
+    for switch in switches:
+        hub.spawn(switch.run, port, args.settle)
+
+    hub.sleep(args.settle + args.warmup)
+    start = sum(s.responses for s in switches)
+    hub.sleep(args.duration)
+    count = sum(s.responses for s in switches) - start
+    print('%d %f' % (count, args.duration))
+    sys.stdout.flush()
+    # Don't bother to stop the threads and the sockets.
+    os._exit(0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--hubs', default='eventlet,asyncio',
+                        help='comma separated hub types '
+                             '(default: %(default)s)')
+    parser.add_argument('--switches', type=int, default=16,
+                        help='number of switches (default: %(default)s)')
+    parser.add_argument('--hosts', type=int, default=100,
+                        help='number of hosts (MAC addresses) per switch '
+                             '(default: %(default)s)')
+    parser.add_argument('--window', type=int, default=1,
+                        help='outstanding PACKET_IN messages per switch; '
+                             '1 is the latency mode of cbench '
+                             '(default: %(default)s)')
+    parser.add_argument('--duration', type=float, default=5,
+                        help='seconds to measure (default: %(default)s)')
+    parser.add_argument('--warmup', type=float, default=1,
+                        help='seconds before measuring (default: %(default)s)')
+    parser.add_argument('--settle', type=float, default=0.5,
+                        help=argparse.SUPPRESS)
+    parser.add_argument('--uvloop', action='store_true',
+                        help='use uvloop with the asyncio hub')
+    parser.add_argument('--run', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run:
+        _run(args)
+        return
+
+    print('%d switches, %d hosts per switch, window %d'
+          % (args.switches, args.hosts, args.window))
+    for hub_type in args.hubs.split(','):
+        cmd = [sys.executable, '-m', 'ryu.tests.benchmark.bench_hub', '--run',
+               '--switches', str(args.switches), '--hosts', str(args.hosts),
+               '--window', str(args.window),
+               '--duration', str(args.duration),
+               '--warmup', str(args.warmup), '--settle', str(args.settle)]
+        if args.uvloop and hub_type == 'asyncio':
+            cmd.append('--uvloop')
+        env = dict(os.environ, RYU_HUB_TYPE=hub_type)
+        proc = subprocess.Popen(cmd, env=env, stdout=subprocess.PIPE)
+        out = proc.communicate()[0].decode().split()
+        if proc.returncode or len(out) != 2:
+            print('%-10s failed' % hub_type)
+            continue
+        (count, elapsed) = (int(out[0]), float(out[1]))
+        print('%-10s %10d responses %12.0f responses/sec'
+              % (hub_type, count, count / elapsed))
+
+
+if __name__ == '__main__':
+    main()
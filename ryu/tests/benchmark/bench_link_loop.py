@@ -0,0 +1,142 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark of the link liveness check of ryu.topology.switches.
+
+Models the links of a large fabric in simulated time: every link is
+updated by LLDP "--updates" times per TIMEOUT_CHECK_PERIOD, except a
+fraction of links which went down, and the liveness check of
+Switches.link_loop() runs once per period.  Compares the full scan of all
+links with the timestamp index of LinkState, reporting the time spent on
+updating the links (LinkState.update_link() called by
+lldp_packet_in_handler) and on the checks.
+
+Usage::
+
+    $ python -m ryu.tests.benchmark.bench_link_loop [--links N]
+"""
+
+from __future__ import print_function
+
+import argparse
+import timeit
+
+from ryu.ofproto import ofproto_v1_3
+from ryu.ofproto import ofproto_v1_3_parser
+from ryu.topology import switches
+
+Switches = switches.Switches
+
+
+def _make_links(count):
+    def _port(dpid, port_no):
+        ofpport = ofproto_v1_3_parser.OFPPort(
+            port_no, '00:00:00:00:00:00', b'', 0, 0, 0, 0, 0, 0, 0, 0)
+        return switches.Port(dpid, ofproto_v1_3, ofpport)
+
+    return [switches.Link(_port(i // 48 + 1, i % 48 + 1),
+                          _port(i // 48 + 100001, i % 48 + 1))
+            for i in range(count)]
+
+
+class _Clock(object):
+    # Replaces the time module of ryu.topology.switches.
+    def __init__(self):
+        self.now = 0.0
+
+    def time(self):
+        return self.now
+
+
+class _ScanLinkState(switches.LinkState):
+    # LinkState and Switches.link_loop() before the timestamp index.
+    def update_link(self, src, dst):
+        link = switches.Link(src, dst)
+
+        self[link] = switches.time.time()
+        self._map[src] = dst
+
+        rev_link = switches.Link(dst, src)
+        return rev_link in self
+
+    def expired(self, now):
+        expired = []
+        for (link, timestamp) in self.items():
+            if timestamp + Switches.LINK_TIMEOUT < now:
+                expired.append(link)
+        return expired
+
+
+def run(links, state, periods, updates, down):
+    period = Switches.TIMEOUT_CHECK_PERIOD
+    alive = links[:len(links) - int(len(links) * down)]
+    clock = _Clock()
+    saved_time = switches.time
+    switches.time = clock
+    try:
+        for link in links:
+            state.update_link(link.src, link.dst)
+        update_time = 0.0
+        check_time = 0.0
+        expired = 0
+        timer = timeit.default_timer
+        for _ in range(periods):
+            start_time = clock.now
+            for i in range(updates):
+                clock.now = start_time + period * (i + 1) / updates
+                start = timer()
+                for link in alive:
+                    state.update_link(link.src, link.dst)
+                update_time += timer() - start
+            start = timer()
+            expired += len(state.expired(clock.now))
+            check_time += timer() - start
+    finally:
+        switches.time = saved_time
+    return update_time, check_time, expired
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--links', type=int, default=50000,
+                        help='number of links (default: %(default)s)')
+    parser.add_argument('--periods', type=int, default=10,
+                        help='number of checks (default: %(default)s)')
+    parser.add_argument('--updates', type=int, default=5,
+                        help='LLDP updates per link per check period '
+                             '(default: %(default)s)')
+    parser.add_argument('--down', type=float, default=0.01,
+                        help='fraction of links which are down '
+                             '(default: %(default)s)')
+    args = parser.parse_args()
+
+    links = _make_links(args.links)
+    print('%d links, %d checks, %d updates per link per check'
+          % (args.links, args.periods, args.updates))
+    for name, state in (
+            ('scan', _ScanLinkState(Switches.LINK_TIMEOUT)),
+            ('index', switches.LinkState(Switches.LINK_TIMEOUT))):
+        update_time, check_time, expired = run(
+            links, state, args.periods, args.updates, args.down)
+        print('%-6s update %7.3f sec  check %8.3f msec/check  expired %d'
+              % (name, update_time, check_time / args.periods * 1000,
+                 expired))
+        if name == 'index':
+            print('       %s' % state.stats())
+
+
+if __name__ == '__main__':
+    main()
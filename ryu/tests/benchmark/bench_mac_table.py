@@ -0,0 +1,108 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark of the L2 learning table of the simple_switch applications.
+
+Replays "--packets" packet-ins from "--hosts" MAC addresses in simulated
+time, learning the source and looking up the destination of each packet
+as _packet_in_handler() does.  Compares the former dict keyed by the MAC
+address strings with ryu.controller.mac_to_port.MacTable, reporting the
+time spent and the number of entries left.
+
+Usage::
+
+    $ python -m ryu.tests.benchmark.bench_mac_table [--packets N]
+"""
+
+from __future__ import print_function
+
+import argparse
+import random
+import timeit
+
+from ryu.controller import mac_to_port
+from ryu.lib.mac import haddr_to_int
+from ryu.lib.mac import int_to_haddr
+
+
+def _make_packets(count, hosts, ports, seed):
+    rand = random.Random(seed)
+    macs = [int_to_haddr(0x020000000000 + i) for i in range(hosts)]
+    port_of = dict((mac, rand.randint(1, ports)) for mac in macs)
+    packets = []
+    for _ in range(count):
+        src = macs[rand.randrange(hosts)]
+        dst = macs[rand.randrange(hosts)]
+        packets.append((src, dst, port_of[src]))
+    return packets
+
+
+def run_dict(packets):
+    table = {}
+    start = timeit.default_timer()
+    for (src, dst, in_port) in packets:
+        table[src] = in_port
+        table.get(dst)
+    return timeit.default_timer() - start, len(table)
+
+
+def run_mac_table(packets, rate, ttl, max_entries):
+    table = mac_to_port.MacTable(ttl, max_entries)
+    learn = table.learn
+    get = table.get
+    now = 0.0
+    step = 1.0 / rate
+    start = timeit.default_timer()
+    for (src, dst, in_port) in packets:
+        now += step
+        learn(haddr_to_int(src), in_port, now)
+        get(haddr_to_int(dst), now)
+    return timeit.default_timer() - start, len(table)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--packets', type=int, default=1000000,
+                        help='number of packet-ins (default: %(default)s)')
+    parser.add_argument('--hosts', type=int, default=200000,
+                        help='number of MAC addresses (default: %(default)s)')
+    parser.add_argument('--ports', type=int, default=48,
+                        help='number of ports (default: %(default)s)')
+    parser.add_argument('--rate', type=float, default=10000,
+                        help='packet-ins per second in simulated time '
+                             '(default: %(default)s)')
+    parser.add_argument('--ttl', type=float,
+                        default=mac_to_port.MacTable.DEFAULT_TTL,
+                        help='TTL of MacTable (default: %(default)s)')
+    parser.add_argument('--max-entries', type=int,
+                        default=mac_to_port.MacTable.DEFAULT_MAX_ENTRIES,
+                        help='capacity of MacTable (default: %(default)s)')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    packets = _make_packets(args.packets, args.hosts, args.ports, args.seed)
+    print('%d packet-ins from %d hosts' % (args.packets, args.hosts))
+    elapsed, entries = run_dict(packets)
+    print('%-9s %7.3f sec  %8d entries'
+          % ('dict', elapsed, entries))
+    elapsed, entries = run_mac_table(packets, args.rate, args.ttl,
+                                     args.max_entries)
+    print('%-9s %7.3f sec  %8d entries'
+          % ('MacTable', elapsed, entries))
+
+
+if __name__ == '__main__':
+    main()
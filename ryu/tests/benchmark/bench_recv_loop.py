@@ -0,0 +1,142 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark of the OpenFlow receive loop of ryu.controller.controller.Datapath.
+
+Replays an OpenFlow byte stream through Datapath._recv_loop() with both the
+recv() based framing and the recv_into() based framing (ofp-recv-into), and
+reports the number of messages processed per second.
+
+Usage::
+
+    $ python -m ryu.tests.benchmark.bench_recv_loop [--stream FILE]
+
+FILE is a raw capture of the messages sent by a switch, i.e. the
+concatenated TCP payload of the switch to controller direction (e.g.
+exported with "tshark -z follow,tcp,raw,0").  If omitted, a stream of
+OpenFlow 1.3 PACKET_IN messages from ryu/tests/packet_data is used.
+"""
+
+from __future__ import print_function
+
+import argparse
+import os
+import timeit
+
+from ryu.base import app_manager
+from ryu.controller import controller
+from ryu.controller import handler
+from ryu.ofproto import ofproto_v1_3_parser  # register the parser
+
+
+PACKET_DATA_DIR = os.path.join(os.path.dirname(__file__),
+                               '../packet_data/of13')
+
+
+class _NullBrick(object):
+    name = 'ofp_event'
+
+    def send_event_to_observers(self, ev, state=None):
+        pass
+
+    def get_handlers(self, ev, state=None):
+        return []
+
+
+class _ReplaySocket(object):
+    def __init__(self, data, chunk_size):
+        self.data = memoryview(data)
+        self.chunk_size = chunk_size
+        self.offset = 0
+
+    def setsockopt(self, *args):
+        pass
+
+    def settimeout(self, timeout):
+        pass
+
+    def shutdown(self, how):
+        pass
+
+    def close(self):
+        pass
+
+    def recv(self, bufsize):
+        size = min(bufsize, self.chunk_size)
+        out = self.data[self.offset:self.offset + size].tobytes()
+        self.offset += len(out)
+        return out
+
+    def recv_into(self, buffer, nbytes=0):
+        size = min(nbytes or len(buffer), self.chunk_size)
+        out = self.data[self.offset:self.offset + size]
+        buffer[:len(out)] = out
+        self.offset += len(out)
+        return len(out)
+
+
+def _default_stream(count):
+    with open(os.path.join(PACKET_DATA_DIR,
+                           '4-4-ofp_packet_in.packet'), 'rb') as f:
+        return f.read() * count
+
+
+def _count_msgs(data):
+    count = 0
+    offset = 0
+    while offset + 8 <= len(data):
+        offset += (data[offset + 2] << 8) | data[offset + 3]
+        count += 1
+    return count
+
+
+def run(data, recv_into, chunk_size):
+    dp = controller.Datapath(_ReplaySocket(data, chunk_size), ('bench', 0))
+    dp.set_state(handler.MAIN_DISPATCHER)
+    dp.recv_into = recv_into
+    start = timeit.default_timer()
+    dp._recv_loop()
+    return timeit.default_timer() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--stream', help='raw OpenFlow stream to replay')
+    parser.add_argument('--count', type=int, default=50000,
+                        help='number of PACKET_IN messages in the default '
+                             'stream (default: %(default)s)')
+    parser.add_argument('--chunk-size', type=int, default=256 * 1024,
+                        help='maximum bytes returned per read '
+                             '(default: %(default)s)')
+    args = parser.parse_args()
+
+    if args.stream:
+        with open(args.stream, 'rb') as f:
+            data = bytearray(f.read())
+    else:
+        data = bytearray(_default_stream(args.count))
+    msgs = _count_msgs(data)
+
+    app_manager.SERVICE_BRICKS['ofp_event'] = _NullBrick()
+    print('%d messages, %d bytes' % (msgs, len(data)))
+    for name, recv_into in (('recv', False), ('recv_into', True)):
+        elapsed = run(data, recv_into, args.chunk_size)
+        print('%-10s %8.3f sec %12.0f msgs/sec'
+              % (name, elapsed, msgs / elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -87,8 +87,13 @@ class Test_ofctl_rest(unittest.TestCase):
         req.method = method
 
         with mock.patch('ryu.lib.ofctl_utils.send_stats_request'),\
+                mock.patch('ryu.lib.ofctl_utils.send_stats_request_iter',
+                           return_value=iter([])),\
                 mock.patch('ryu.lib.ofctl_utils.send_msg'):
             res = req.get_response(wsgi)
+            if res.content_type == 'application/json':
+                # The body may be streamed.
+                json.loads(res.body)
         eq_(res.status, '200 OK')
 
 
@@ -0,0 +1,151 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+import unittest
+
+from nose.tools import eq_
+from nose.tools import ok_
+from nose.tools import raises
+
+from ryu.app.ofctl import api
+from ryu.app.ofctl import event
+from ryu.app.ofctl import exception
+from ryu.app.ofctl import service
+from ryu.controller import ofp_event
+from ryu.lib import timer_wheel
+from ryu.ofproto import ofproto_v1_3
+from ryu.ofproto import ofproto_v1_3_parser
+
+parser = ofproto_v1_3_parser
+
+
+class _Datapath(object):
+    ofproto = ofproto_v1_3
+    ofproto_parser = ofproto_v1_3_parser
+
+    def __init__(self, dpid, capacity=None):
+        self.id = dpid
+        self.xid = 0
+        self.sent = []
+        self.capacity = capacity
+
+    def set_xid(self, msg):
+        self.xid += 1
+        msg.set_xid(self.xid)
+
+    def send_msgs(self, msgs):
+        if self.capacity is not None:
+            msgs = msgs[:self.capacity]
+        self.sent.extend(msgs)
+        return len(msgs)
+
+
+def _requests(requests, timeout=None):
+    reqs = []
+    for r in requests:
+        req = event.SendMsgRequest(*r)
+        req.future = event.Future()
+        reqs.append(req)
+    return event.SendMsgsRequest(reqs, timeout=timeout)
+
+
+class Test_OfctlService(unittest.TestCase):
+    """ Test case for ryu.app.ofctl.service.OfctlService
+    """
+
+    def setUp(self):
+        self.service = service.OfctlService()
+        self.dps = [_Datapath(1), _Datapath(2)]
+        for dp in self.dps:
+            self.service._switches[dp.id] = service._SwitchInfo(dp)
+
+    def _barrier_reply(self, dp, req):
+        msg = parser.OFPBarrierReply(dp)
+        msg.xid = req.xid
+        self.service._handle_barrier(ofp_event.EventOFPBarrierReply(msg))
+
+    def test_send_msgs(self):
+        req = _requests(
+            [(parser.OFPPortDescStatsRequest(dp),
+              parser.OFPPortDescStatsReply, True) for dp in self.dps] +
+            [(parser.OFPBarrierRequest(self.dps[0]),
+              parser.OFPBarrierReply)])
+        self.service._handle_send_msgs(req)
+        futures = [r.future for r in req.requests]
+        # A request and its barrier for each datapath, then a barrier
+        eq_(3, len(self.dps[0].sent))
+        eq_(2, len(self.dps[1].sent))
+
+        (stats, barrier) = self.dps[1].sent
+        reply = parser.OFPPortDescStatsReply(self.dps[1], body=[])
+        reply.xid = stats.xid
+        self.service._handle_reply(ofp_event.EventOFPPortDescStatsReply(reply))
+        self._barrier_reply(self.dps[1], barrier)
+        ok_(not futures[0].done())
+        eq_([reply], futures[1].result())
+
+        self._barrier_reply(self.dps[0], self.dps[0].sent[2])
+        ok_(futures[2].done())
+        ok_(isinstance(futures[2].result(), parser.OFPBarrierReply))
+        eq_(([futures[1], futures[2]], [futures[0]]),
+            api.wait_all(futures, timeout=0))
+
+    @raises(exception.InvalidDatapath)
+    def test_unknown_datapath(self):
+        req = _requests([(parser.OFPBarrierRequest(_Datapath(3)),)])
+        self.service._handle_send_msgs(req)
+        req.requests[0].future.result()
+
+    @raises(exception.InvalidDatapath)
+    def test_send_failure(self):
+        dp = _Datapath(3, capacity=1)
+        self.service._switches[dp.id] = service._SwitchInfo(dp)
+        req = _requests([(parser.OFPEchoRequest(dp),)])
+        self.service._handle_send_msgs(req)
+        # The barrier is not queued.
+        eq_(1, len(dp.sent))
+        req.requests[0].future.result()
+
+    def test_timeout(self):
+        req = _requests([(parser.OFPBarrierRequest(dp),)
+                         for dp in self.dps], timeout=1)
+        self.service._handle_send_msgs(req)
+        (f1, f2) = [r.future for r in req.requests]
+        self._barrier_reply(self.dps[0], self.dps[0].sent[0])
+        now = time.time()
+        self.service._expire(now)
+        ok_(not f2.done())
+        self.service._expire(now + 2)
+        eq_(None, f1.result())
+        self.assertRaises(exception.RequestTimeout, f2.result)
+        eq_({}, self.service._switches[2].barriers)
+        eq_(0, len(self.service._wheel))
+
+    def test_timeout_after_idle(self):
+        # Nothing advances the wheel while no request has a timeout, e.g.
+        # for a day.  The first timeout after that must not stall the hub.
+        now = time.time()
+        self.service._wheel = timer_wheel.TimerWheel(start=now - 24 * 3600)
+        req = _requests([(parser.OFPBarrierRequest(self.dps[0]),)],
+                        timeout=1)
+        self.service._handle_send_msgs(req)
+        start = time.time()
+        self.service._expire(now)
+        ok_(not req.requests[0].future.done())
+        self.service._expire(now + 2)
+        ok_(time.time() - start < 0.1)
+        self.assertRaises(exception.RequestTimeout,
+                          req.requests[0].future.result)
@@ -0,0 +1,211 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from nose.tools import eq_
+
+from ryu.base import app_manager
+from ryu.controller import event
+from ryu.controller import handler
+from ryu.controller.handler import CONFIG_DISPATCHER
+from ryu.controller.handler import MAIN_DISPATCHER
+from ryu.lib import event_queue
+from ryu.lib import hub
+
+
+class _EventTest(event.EventBase):
+    pass
+
+
+class _TestApp(app_manager.RyuApp):
+    @handler.set_ev_handler(_EventTest, MAIN_DISPATCHER)
+    def main_handler(self, ev):
+        pass
+
+    @handler.set_ev_handler(_EventTest)
+    def any_handler(self, ev):
+        pass
+
+
+class Test_RyuApp(unittest.TestCase):
+    """ Test case for the dispatch tables of RyuApp
+    """
+
+    def setUp(self):
+        self.app = _TestApp()
+        handler.register_instance(self.app)
+        self.ev = _EventTest()
+
+    def test_get_handlers(self):
+        eq_([self.app.any_handler, self.app.main_handler],
+            self.app.get_handlers(self.ev, MAIN_DISPATCHER))
+        eq_([self.app.any_handler],
+            self.app.get_handlers(self.ev, CONFIG_DISPATCHER))
+        eq_([self.app.any_handler, self.app.main_handler],
+            self.app.get_handlers(self.ev))
+
+    def test_get_handlers_invalidate(self):
+        eq_(2, len(self.app.get_handlers(self.ev, MAIN_DISPATCHER)))
+
+        self.app.unregister_handler(_EventTest, self.app.main_handler)
+        eq_([self.app.any_handler],
+            self.app.get_handlers(self.ev, MAIN_DISPATCHER))
+
+        self.app.unregister_handler(_EventTest, self.app.any_handler)
+        eq_([], self.app.get_handlers(self.ev, MAIN_DISPATCHER))
+
+        self.app.register_handler(_EventTest, self.app.main_handler)
+        eq_([self.app.main_handler],
+            self.app.get_handlers(self.ev, MAIN_DISPATCHER))
+
+    def test_get_observers(self):
+        self.app.register_observer(_EventTest, 'main', [MAIN_DISPATCHER])
+        self.app.register_observer(_EventTest, 'any')
+        eq_(['main', 'any'], self.app.get_observers(self.ev, MAIN_DISPATCHER))
+        eq_(['any'], self.app.get_observers(self.ev, CONFIG_DISPATCHER))
+
+        self.app.unregister_observer(_EventTest, 'main')
+        eq_(['any'], self.app.get_observers(self.ev, MAIN_DISPATCHER))
+
+        self.app.unregister_observer_all_event('any')
+        eq_([], self.app.get_observers(self.ev, MAIN_DISPATCHER))
+
+
+class _KeyedEvent(event.EventBase):
+    def __init__(self, key, value):
+        super(_KeyedEvent, self).__init__()
+        self.key = key
+        self.value = value
+
+
+class _CoalescingApp(app_manager.RyuApp):
+    EVENT_QUEUE_SIZE = 2
+    EVENT_QUEUE_POLICY = event_queue.POLICY_COALESCE
+
+    def event_queue_key(self, ev):
+        return getattr(ev, 'key', None)
+
+
+class Test_RyuAppEventQueue(unittest.TestCase):
+    """ Test case for the event queue of RyuApp
+    """
+
+    def test_coalesce(self):
+        app = _CoalescingApp()
+        app._send_event(_KeyedEvent('a', 1), None)
+        app._send_event(_KeyedEvent('b', 1), None)
+        app._send_event(_KeyedEvent('a', 2), None)
+        eq_(2, app.events.qsize())
+        ev = app.events.get()[0]
+        eq_(('a', 2), (ev.key, ev.value))
+        eq_(1, app.event_queue_stats()['coalesced'])
+
+    def test_stop_event_is_not_dropped(self):
+        app = _TestApp()
+        app.set_event_queue(1, event_queue.POLICY_DROP_NEW)
+        app._send_event(_EventTest(), None)
+        app._send_event(_EventTest(), None)
+        app._send_event(app._event_stop, None)
+        eq_(2, app.events.qsize())
+        eq_(1, app.events.dropped)
+
+    def test_configure(self):
+        app = _TestApp()
+        app.set_event_queue(1)
+        app._send_event(_EventTest(), None)
+        app_manager.CONF.set_override(
+            'app_event_queue', ['other:4', '_TestApp:16:drop-oldest'])
+        try:
+            app_manager.AppManager._configure_event_queue(app)
+        finally:
+            app_manager.CONF.clear_override('app_event_queue')
+        eq_(16, app.events.maxsize)
+        eq_(event_queue.POLICY_DROP_OLD, app.events.policy)
+        eq_(1, app.events.qsize())
+        eq_(False, app.event_queue_metrics)
+
+    def test_configure_metrics(self):
+        app = _TestApp()
+        app_manager.CONF.set_override(
+            'app_event_queue', ['_TestApp:16:metrics'])
+        try:
+            app_manager.AppManager._configure_event_queue(app)
+        finally:
+            app_manager.CONF.clear_override('app_event_queue')
+        eq_(16, app.events.maxsize)
+        eq_(event_queue.POLICY_BLOCK, app.events.policy)
+        eq_(True, app.event_queue_metrics)
+
+    def test_no_handler_latency(self):
+        app = _TestApp()
+        handler.register_instance(app)
+        app._send_event(_EventTest(), MAIN_DISPATCHER)
+        app.is_active = False
+        app._event_loop()
+        eq_({}, app.event_queue_stats()['handler_latency'])
+
+    def test_handler_latency(self):
+        app = _TestApp()
+        app.set_event_queue(metrics=True)
+        handler.register_instance(app)
+        app._send_event(_EventTest(), MAIN_DISPATCHER)
+        app.is_active = False
+        app._event_loop()
+        latency = app.event_queue_stats()['handler_latency']
+        eq_(['any_handler', 'main_handler'], sorted(latency))
+        eq_(1, latency['main_handler']['count'])
+
+
+class _CoalescedEventApp(app_manager.RyuApp):
+    EVENT_COALESCE = {
+        _KeyedEvent: (lambda ev: ev.key, 0.01),
+    }
+
+
+class Test_RyuAppEventCoalesce(unittest.TestCase):
+    """ Test case for the event coalescing of RyuApp
+    """
+
+    def _drain(self, app):
+        events = []
+        while not app.events.empty():
+            ev = app.events.get()[0]
+            events.append((ev.key, ev.value))
+        return events
+
+    def test_coalesce(self):
+        app = _CoalescedEventApp()
+        for i in range(3):
+            app._send_event(_KeyedEvent('a', i), None)
+            app._send_event(_KeyedEvent('b', i), None)
+        app._send_event(_EventTest(), None)
+        eq_(1, app.events.qsize())
+        app.events.get()
+        eq_(2, app.event_queue_stats()['coalesce_pending'])
+
+        hub.sleep(0.05)
+        eq_([('a', 2), ('b', 2)], self._drain(app))
+        stats = app.event_queue_stats()
+        eq_({'_KeyedEvent': 4}, stats['coalesce_dropped'])
+        eq_(0, stats['coalesce_pending'])
+
+    def test_no_key(self):
+        app = _CoalescedEventApp()
+        app._send_event(_KeyedEvent('a', 1), None)
+        app._send_event(_KeyedEvent(None, 2), None)
+        eq_([('a', 1), (None, 2)], self._drain(app))
+        hub.sleep(0.05)
+        eq_([], self._drain(app))
@@ -35,6 +35,7 @@ from ryu.base import app_manager  # To suppress cyclic import
 from ryu.controller import controller
 from ryu.controller import handler
 from ryu.lib import hub
+from ryu.ofproto import ofproto_v1_3
 from ryu.ofproto import ofproto_v1_3_parser
 from ryu.ofproto import ofproto_v1_2_parser
 from ryu.ofproto import ofproto_v1_0_parser
@@ -117,8 +118,51 @@ class Test_Datapath(unittest.TestCase):
     def test_ports_accessibility_v10(self):
         self._test_ports_accessibility(ofproto_v1_0_parser, 0)
 
+    def test_send_loop_batch(self):
+        with mock.patch('ryu.controller.controller.Datapath.set_state'):
+            sock_mock = mock.Mock()
+            addr_mock = mock.Mock()
+            dp = controller.Datapath(sock_mock, addr_mock)
+            dp.send_batch_size = 20
+
+            dp.send(b'a' * 8)
+            dp.send(b'b' * 8)
+            dp.send(b'c' * 8)
+            dp.send(b'd' * 8, close_socket=True)
+            dp._send_loop()
+
+            eq_([mock.call(bytearray(b'a' * 8 + b'b' * 8)),
+                 mock.call(bytearray(b'c' * 8 + b'd' * 8))],
+                sock_mock.sendall.call_args_list)
+            eq_(32, dp.sent_bytes)
+            eq_(4, dp.sent_msgs)
+            eq_(2, dp.send_flushes)
+
+    def test_send_msgs(self):
+        with mock.patch('ryu.controller.controller.Datapath.set_state'):
+            sock_mock = mock.Mock()
+            addr_mock = mock.Mock()
+            dp = controller.Datapath(sock_mock, addr_mock)
+            dp.ofproto = ofproto_v1_3
+            dp.ofproto_parser = ofproto_v1_3_parser
+            # Room for two OFPT_ECHO_REQUEST messages per send request
+            dp.send_batch_size = 16
+
+            msgs = [ofproto_v1_3_parser.OFPEchoRequest(dp) for _ in range(5)]
+            eq_(5, dp.send_msgs(msgs))
+            eq_(3, dp.send_q.qsize())
+            msgs.append(ofproto_v1_3_parser.OFPEchoRequest(dp))
+            dp.send_msg(msgs[-1], close_socket=True)
+            dp.send_batch_size = 64
+            dp._send_loop()
+
+            expected = bytearray().join(msg.buf for msg in msgs)
+            eq_([mock.call(expected)], sock_mock.sendall.call_args_list)
+            eq_(6, dp.sent_msgs)
+            eq_(1, dp.send_flushes)
+
     @mock.patch("ryu.base.app_manager", spec=app_manager)
-    def test_recv_loop(self, app_manager_mock):
+    def _test_recv_loop(self, recv_into, app_manager_mock):
         # Prepare test data
         test_messages = [
             "4-6-ofp_features_reply.packet",
@@ -153,6 +197,13 @@ class Test_Datapath(unittest.TestCase):
                 self.buf = self.buf[size:]
                 return out
 
+            def recv_into(self, buffer, nbytes=0):
+                size = self.random.randint(1, nbytes or len(buffer))
+                out = self.buf[:size]
+                self.buf = self.buf[size:]
+                buffer[:len(out)] = out
+                return len(out)
+
         # Prepare mock
         ofp_brick_mock = mock.MagicMock(spec=app_manager.RyuApp)
         app_manager_mock.lookup_service_brick.return_value = ofp_brick_mock
@@ -163,6 +214,9 @@ class Test_Datapath(unittest.TestCase):
 
         # Prepare test target
         dp = controller.Datapath(sock_mock, addr_mock)
+        dp.recv_into = recv_into
+        # Start with the smallest buffer to make it grow.
+        dp.recv_buffer_size = 8
         dp.set_state(handler.MAIN_DISPATCHER)
         ofp_brick_mock.reset_mock()
 
@@ -181,6 +235,12 @@ class Test_Datapath(unittest.TestCase):
             self.assertEqual(kwargs, {})
         self.assertEqual(expected_json, output_json)
 
+    def test_recv_loop(self):
+        self._test_recv_loop(False)
+
+    def test_recv_loop_recv_into(self):
+        self._test_recv_loop(True)
+
 
 class TestOpenFlowController(unittest.TestCase):
     """
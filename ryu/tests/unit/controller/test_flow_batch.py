@@ -0,0 +1,139 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from nose.tools import eq_
+from nose.tools import ok_
+
+from ryu.controller import flow_batch
+from ryu.lib import hub
+from ryu.ofproto import ofproto_v1_3
+from ryu.ofproto import ofproto_v1_3_parser
+
+parser = ofproto_v1_3_parser
+
+
+class _Datapath(object):
+    ofproto = ofproto_v1_3
+    ofproto_parser = ofproto_v1_3_parser
+
+    def __init__(self):
+        self.id = 1
+        self.xid = 0
+        self.sent = []
+        self.capacity = None
+        self._flow_batches = {}
+
+    def set_xid(self, msg):
+        self.xid += 1
+        msg.set_xid(self.xid)
+
+    def send_msgs(self, msgs):
+        if self.capacity is not None:
+            msgs = msgs[:self.capacity]
+        self.sent.extend(msgs)
+        return len(msgs)
+
+    # the same as ryu.controller.controller.Datapath
+    def acknowledge_barrier_reply(self, xid):
+        batch = self._flow_batches.get(xid)
+        if batch is not None:
+            batch.barrier_reply(xid)
+
+    def acknowledge_error(self, msg):
+        batch = self._flow_batches.get(msg.xid)
+        if batch is not None:
+            batch.error(msg)
+
+
+class Test_FlowBatch(unittest.TestCase):
+    """ Test case for ryu.controller.flow_batch.FlowBatch
+    """
+
+    def setUp(self):
+        self.dp = _Datapath()
+
+    def _flow_mod(self, in_port):
+        return parser.OFPFlowMod(self.dp, match=parser.OFPMatch(
+            in_port=in_port))
+
+    def _barriers(self):
+        return [m for m in self.dp.sent
+                if isinstance(m, parser.OFPBarrierRequest)]
+
+    def _error(self, msg):
+        error = parser.OFPErrorMsg(self.dp, type_=ofproto_v1_3.
+                                   OFPET_FLOW_MOD_FAILED,
+                                   code=ofproto_v1_3.OFPFMFC_TABLE_FULL)
+        error.xid = msg.xid
+        self.dp.acknowledge_error(error)
+        return error
+
+    def test_commit(self):
+        batch = flow_batch.FlowBatch(self.dp, barrier_interval=2)
+        msgs = [self._flow_mod(i) for i in range(5)]
+        for msg in msgs:
+            batch.add(msg)
+        eq_(6, len(self.dp.sent))
+        batch.commit()
+        eq_(8, len(self.dp.sent))
+        barriers = self._barriers()
+        eq_(3, len(barriers))
+
+        error = self._error(msgs[1])
+        self.dp.acknowledge_barrier_reply(barriers[0].xid)
+        eq_(msgs[:1], batch.succeeded)
+        eq_([(msgs[1], error)], batch.failed)
+        ok_(not batch.done())
+        # The last barrier confirms the earlier ones.
+        self.dp.acknowledge_barrier_reply(barriers[2].xid)
+        ok_(batch.wait(0))
+        eq_(msgs[:1] + msgs[2:], batch.succeeded)
+        eq_({}, self.dp._flow_batches)
+
+    def test_flow_control(self):
+        batch = flow_batch.FlowBatch(self.dp, barrier_interval=1,
+                                     max_outstanding=2)
+        batch.add(self._flow_mod(1))
+        batch.add(self._flow_mod(2))
+        thr = hub.spawn(batch.add, self._flow_mod(3))
+        hub.sleep(0)
+        # Blocked until a barrier is answered.
+        eq_(2, len(self._barriers()))
+        self.dp.acknowledge_barrier_reply(self._barriers()[0].xid)
+        hub.joinall([thr])
+        eq_(3, len(self._barriers()))
+
+    def test_abort(self):
+        batch = flow_batch.FlowBatch(self.dp, barrier_interval=2)
+        msgs = [self._flow_mod(i) for i in range(3)]
+        for msg in msgs:
+            batch.add(msg)
+        error = self._error(msgs[0])
+        batch.abort()
+        ok_(batch.done())
+        eq_([(msgs[0], error)], batch.failed)
+        eq_(msgs[1:], batch.unconfirmed)
+        eq_({}, self.dp._flow_batches)
+
+    def test_send_failure(self):
+        self.dp.capacity = 1
+        batch = flow_batch.FlowBatch(self.dp)
+        msg = self._flow_mod(1)
+        batch.add(msg)
+        batch.commit()
+        ok_(batch.done())
+        eq_([msg], batch.unconfirmed)
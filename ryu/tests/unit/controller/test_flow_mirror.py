@@ -0,0 +1,213 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from nose.tools import eq_
+from nose.tools import ok_
+
+from ryu.controller import flow_mirror
+from ryu.controller import ofp_event
+from ryu.controller.handler import DEAD_DISPATCHER
+from ryu.controller.handler import MAIN_DISPATCHER
+from ryu.ofproto import ofproto_v1_3
+from ryu.ofproto import ofproto_v1_3_parser
+from ryu.ofproto.flow_mod_template import FlowModTemplate
+
+ofp = ofproto_v1_3
+parser = ofproto_v1_3_parser
+
+
+class _Datapath(object):
+    ofproto = ofproto_v1_3
+    ofproto_parser = ofproto_v1_3_parser
+
+    def __init__(self, dpid):
+        self.id = dpid
+        self.xid = 0
+        self.sent = []
+        self.send_msg_hooks = []
+
+    def next_xid(self):
+        self.xid += 1
+        return self.xid
+
+    def set_xid(self, msg):
+        msg.set_xid(self.next_xid())
+
+    def send(self, buf):
+        self.sent.append(buf)
+
+    def send_msg(self, msg):
+        if msg.xid is None:
+            self.set_xid(msg)
+        msg.serialize()
+        for hook in self.send_msg_hooks:
+            hook(self, msg)
+        self.sent.append(msg)
+
+
+def _state_change(dp, state):
+    ev = ofp_event.EventOFPStateChange(dp)
+    ev.state = state
+    return ev
+
+
+class Test_FlowTableMirror(unittest.TestCase):
+    """ Test case for ryu.controller.flow_mirror.FlowTableMirror
+    """
+
+    def setUp(self):
+        # The handlers do not need RyuApp.__init__().
+        self.mirror = flow_mirror.FlowTableMirror.__new__(
+            flow_mirror.FlowTableMirror)
+        self.mirror.dps = {}
+        self.mirror.flows = {}
+        self.dp = _Datapath(1)
+        self.mirror._state_change_handler(
+            _state_change(self.dp, MAIN_DISPATCHER))
+        # The whole table is requested.
+        self._reply(self.dp.sent.pop(), [])
+
+    def _reply(self, req, flows, flags=0):
+        msg = parser.OFPFlowStatsReply(self.dp, flags=flags, body=flows)
+        msg.xid = req.xid
+        self.mirror._flow_stats_reply_handler(
+            ofp_event.EventOFPFlowStatsReply(msg))
+
+    def _add(self, priority, cookie=0, table_id=0, **match):
+        self.dp.send_msg(parser.OFPFlowMod(
+            self.dp, cookie=cookie, table_id=table_id, priority=priority,
+            match=parser.OFPMatch(**match)))
+
+    def _delete(self, command=ofp.OFPFC_DELETE, priority=0, cookie=0,
+                cookie_mask=0, table_id=ofp.OFPTT_ALL, **match):
+        self.dp.send_msg(parser.OFPFlowMod(
+            self.dp, cookie=cookie, cookie_mask=cookie_mask,
+            table_id=table_id, command=command, priority=priority,
+            out_port=ofp.OFPP_ANY, out_group=ofp.OFPG_ANY,
+            match=parser.OFPMatch(**match)))
+
+    def test_add(self):
+        ok_(self.mirror.synced(1))
+        self._add(10, cookie=1, in_port=1)
+        self._add(10, cookie=2, in_port=2)
+        self._add(20, cookie=2, table_id=1, in_port=2)
+        entry = self.mirror.get_flow(1, 0, 10, parser.OFPMatch(in_port=1))
+        eq_(1, entry.cookie)
+        eq_(None, self.mirror.get_flow(1, 0, 20, parser.OFPMatch(in_port=1)))
+        eq_(3, len(self.mirror.get_flows(1)))
+        eq_(2, len(self.mirror.get_flows(1, cookie=2)))
+        eq_(2, len(self.mirror.get_flows(1, table_id=0)))
+        eq_(1, len(self.mirror.get_flows(1, table_id=0, cookie=2)))
+        eq_(2, len(self.mirror.get_flows(1, match=parser.OFPMatch(
+            in_port=2))))
+        eq_(1, len(self.mirror.get_flows(1, priority=20)))
+        # The same table_id, priority and match replaces the entry.
+        self._add(10, cookie=3, in_port=1)
+        eq_(3, len(self.mirror.get_flows(1)))
+        eq_([], self.mirror.get_flows(1, cookie=1))
+
+    def test_flow_mod_template(self):
+        template = FlowModTemplate(
+            parser.OFPFlowMod(self.dp, priority=10,
+                              match=parser.OFPMatch(in_port=1)),
+            attrs=['cookie'], match=['in_port'])
+        template.send(in_port=5, cookie=7)
+        entry = self.mirror.get_flow(1, 0, 10, parser.OFPMatch(in_port=5))
+        eq_(7, entry.cookie)
+
+    def test_delete(self):
+        self._add(10, cookie=1, in_port=1, eth_type=0x800)
+        self._add(20, cookie=1, in_port=1)
+        self._add(10, cookie=2, in_port=2)
+        self._delete(command=ofp.OFPFC_DELETE_STRICT, priority=20,
+                     table_id=0, in_port=1)
+        eq_(2, len(self.mirror.get_flows(1)))
+        self._delete(in_port=1)
+        eq_(1, len(self.mirror.get_flows(1)))
+        self._delete(cookie=2, cookie_mask=0xffffffffffffffff)
+        eq_([], self.mirror.get_flows(1))
+
+    def test_delete_masked(self):
+        self._add(10, eth_type=0x800, ipv4_dst='10.0.0.1')
+        self._add(10, eth_type=0x800, ip_proto=6, tcp_dst=80)
+        self._add(10, eth_type=0x800, ip_proto=17)
+        # Covers tcp (6) but not udp (17).
+        self._delete(eth_type=0x800, ip_proto=(6, 0xfe))
+        eq_(2, len(self.mirror.get_flows(1)))
+        ok_(self.mirror.synced(1))
+        # Whether it covers the address cannot be told.
+        self._delete(eth_type=0x800, ipv4_dst=('10.0.0.0', '255.0.0.0'))
+        ok_(not self.mirror.synced(1))
+        eq_(2, len(self.mirror.get_flows(1)))
+
+    def test_flow_removed(self):
+        self._add(10, cookie=1, in_port=1)
+        msg = parser.OFPFlowRemoved(
+            self.dp, cookie=1, priority=10, table_id=0,
+            match=parser.OFPMatch(in_port=1))
+        self.mirror._flow_removed_handler(ofp_event.EventOFPFlowRemoved(msg))
+        eq_([], self.mirror.get_flows(1))
+
+    def test_reconcile(self):
+        # Entries removed by the switch silently
+        self.dp.send_msg(parser.OFPFlowMod(
+            self.dp, cookie=5, priority=1, idle_timeout=10,
+            match=parser.OFPMatch(in_port=1)))
+        self._add(10, cookie=6, in_port=2)
+        del self.dp.sent[:]
+        self.mirror._reconcile(self.dp, self.mirror.flows[1], 0)
+        req = self.dp.sent.pop()
+        eq_(5, req.cookie)
+        eq_(0xffffffffffffffff, req.cookie_mask)
+        eq_([], self.dp.sent)
+        # A flow mod sent before the reply arrives
+        self._add(20, cookie=5, in_port=3)
+        self._reply(req, [])
+        eq_([20], [e.priority for e in self.mirror.get_flows(1, cookie=5)])
+        eq_(1, len(self.mirror.get_flows(1, cookie=6)))
+        eq_([], self.mirror.flows[1].log)
+
+    def test_full_reconcile(self):
+        self._add(10, cookie=1, in_port=1)
+        self.mirror.reconcile(1)
+        req = self.dp.sent.pop()
+        eq_(0, req.cookie_mask)
+        self._delete(in_port=1)
+        # The reply does not reflect the delete.
+        stats = [parser.OFPFlowStats(
+            table_id=0, priority=10, cookie=cookie, instructions=[],
+            match=parser.OFPMatch(in_port=cookie)) for cookie in (1, 2)]
+        self._reply(req, stats, flags=ofp.OFPMPF_REPLY_MORE)
+        eq_(0, len(self.mirror.get_flows(1)))
+        self._reply(req, [])
+        eq_([2], [e.cookie for e in self.mirror.get_flows(1)])
+
+    def test_error(self):
+        self._add(10, cookie=7, in_port=1)
+        msg = parser.OFPErrorMsg(self.dp, type_=ofp.OFPET_FLOW_MOD_FAILED,
+                                 code=ofp.OFPFMFC_TABLE_FULL)
+        msg.xid = self.dp.xid
+        self.mirror._error_msg_handler(ofp_event.EventOFPErrorMsg(msg))
+        ok_(not self.mirror.synced(1))
+        self.mirror._reconcile(self.dp, self.mirror.flows[1], 0)
+        eq_(7, self.dp.sent.pop().cookie)
+
+    def test_dead(self):
+        self.mirror._state_change_handler(
+            _state_change(self.dp, DEAD_DISPATCHER))
+        eq_([], self.dp.send_msg_hooks)
+        eq_([], self.mirror.get_flows(1))
@@ -0,0 +1,88 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from nose.tools import eq_
+from nose.tools import ok_
+
+from ryu.controller.mac_to_port import MacTable
+from ryu.controller.mac_to_port import MacToPortTable
+
+
+class Test_MacTable(unittest.TestCase):
+    """ Test case for ryu.controller.mac_to_port.MacTable
+    """
+
+    def test_learn(self):
+        table = MacTable()
+        eq_(None, table.learn(1, 10))
+        eq_(10, table.learn(1, 11))
+        eq_(11, table.get(1))
+        eq_(None, table.get(2))
+        ok_(1 in table)
+        eq_(1, len(table))
+        eq_(11, table.delete(1))
+        eq_(None, table.delete(1))
+
+    def test_ttl(self):
+        table = MacTable(ttl=10)
+        table.learn(1, 1, now=0)
+        table.learn(2, 2, now=5)
+        # Within REFRESH_INTERVAL, the timestamp is kept.
+        table.learn(1, 1, now=0.5)
+        eq_([(1, 1, 0)], table.export()[:1])
+        eq_(None, table.get(1, now=10))
+        eq_(2, table.get(2, now=10))
+        table.learn(3, 3, now=12)
+        eq_([(2, 2)], table.expire(now=15))
+        eq_([(3, 3, 12)], table.export())
+        eq_(2, table.expired)
+
+    def test_max_entries(self):
+        table = MacTable(ttl=None, max_entries=2)
+        table.learn(1, 1, now=0)
+        table.learn(2, 2, now=1)
+        # Seen again, 1 becomes the most recent.
+        table.learn(1, 1, now=2)
+        table.learn(3, 3, now=3)
+        eq_([1, 3], [mac for (mac, _port, _ts) in table.export()])
+        eq_(1, table.evicted)
+        eq_([], table.expire(now=1000))
+
+    def test_delete_port(self):
+        table = MacTable()
+        table.learn(1, 1)
+        table.learn(2, 2)
+        table.learn(3, 1)
+        eq_([1, 3], table.delete_port(1))
+        eq_(1, len(table))
+
+
+class Test_MacToPortTable(unittest.TestCase):
+    """ Test case for ryu.controller.mac_to_port.MacToPortTable
+    """
+
+    def test_port(self):
+        mac = b'\x00\x01\x02\x03\x04\x05'
+        table = MacToPortTable()
+        table.dpid_add(1)
+        eq_(None, table.port_add(1, 3, mac))
+        eq_(3, table.port_add(1, 4, mac))
+        eq_(4, table.port_get(1, mac))
+        eq_([mac], table.mac_list(1, 4))
+        table.mac_del(1, mac)
+        eq_(None, table.port_get(1, mac))
+        self.assertRaises(KeyError, table.mac_del, 1, mac)
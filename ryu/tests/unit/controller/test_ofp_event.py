@@ -0,0 +1,52 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from nose.tools import eq_
+
+from ryu.controller import ofp_event
+from ryu.ofproto import ofproto_protocol
+from ryu.ofproto import ofproto_v1_0
+from ryu.ofproto import ofproto_v1_3
+
+
+class Test_coalesce_keys(unittest.TestCase):
+    def _datapath(self, version):
+        dp = ofproto_protocol.ProtocolDesc(version)
+        dp.id = 1
+        return dp
+
+    def test_port_status_key(self):
+        dp = self._datapath(ofproto_v1_3.OFP_VERSION)
+        parser = dp.ofproto_parser
+        desc = parser.OFPPort(3, '00:00:00:00:00:01', 'eth3', 0, 0, 0, 0,
+                              0, 0, 0, 0)
+        msg = parser.OFPPortStatus(dp, dp.ofproto.OFPPR_MODIFY, desc)
+        eq_((1, 3), ofp_event.port_status_key(ofp_event.ofp_msg_to_ev(msg)))
+
+    def test_stats_reply_key(self):
+        dp = self._datapath(ofproto_v1_3.OFP_VERSION)
+        msg = dp.ofproto_parser.OFPPortStatsReply(dp, flags=0)
+        ev = ofp_event.ofp_msg_to_ev(msg)
+        eq_(1, ofp_event.stats_reply_key(ev))
+        msg.flags = dp.ofproto.OFPMPF_REPLY_MORE
+        eq_(None, ofp_event.stats_reply_key(ev))
+
+    def test_stats_reply_key_of10(self):
+        dp = self._datapath(ofproto_v1_0.OFP_VERSION)
+        msg = dp.ofproto_parser.OFPPortStatsReply(dp)
+        msg.flags = dp.ofproto.OFPSF_REPLY_MORE
+        eq_(None, ofp_event.stats_reply_key(ofp_event.ofp_msg_to_ev(msg)))
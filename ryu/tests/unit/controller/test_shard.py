@@ -0,0 +1,90 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+try:
+    import mock  # Python 2
+except ImportError:
+    from unittest import mock  # Python 3
+
+import socket
+import unittest
+
+from nose.tools import eq_, ok_
+
+from ryu.app import wsgi
+from ryu.base import app_manager
+from ryu.controller import event
+from ryu.controller import shard
+from ryu.topology import switches
+
+
+class _EventTest(event.EventBase):
+    def __init__(self, value):
+        super(_EventTest, self).__init__()
+        self.value = value
+
+
+class _LocalApp(app_manager.RyuApp):
+    pass
+
+
+class _RestApp(app_manager.RyuApp):
+    _CONTEXTS = {'wsgi': wsgi.WSGIApplication}
+
+
+class _ShardedRestApp(_RestApp):
+    GLOBAL_VIEW = False
+
+
+class Test_shard(unittest.TestCase):
+    """ Test case for ryu.controller.shard
+    """
+
+    def test_not_sharded(self):
+        with mock.patch.dict('os.environ', clear=True):
+            eq_(None, shard.worker_id())
+            ok_(shard.is_assigned(0))
+            ok_(shard.is_assigned(1))
+
+    def test_is_assigned(self):
+        env = {shard.WORKER_ID_ENV: '1', shard.WORKERS_ENV: '3'}
+        with mock.patch.dict('os.environ', env):
+            eq_(1, shard.worker_id())
+            eq_([1, 4], [i for i in range(6) if shard.is_assigned(i)])
+
+    def test_frames(self):
+        s1, s2 = socket.socketpair()
+        events = [_EventTest(i) for i in range(3)]
+        s1.sendall(b''.join(shard.encode(ev) for ev in events))
+        s1.close()
+
+        received = [shard.decode(f) for f in shard.frames(s2)]
+        s2.close()
+        eq_([0, 1, 2], [ev.value for ev in received])
+
+    def test_register_global_event(self):
+        eq_(_EventTest, shard.register_global_event(_EventTest))
+        ok_(_EventTest in shard.global_events())
+
+    def test_global_view_apps(self):
+        app_mgr = mock.Mock()
+        app_mgr.applications_cls = {'local': _LocalApp,
+                                    'rest': _RestApp,
+                                    'sharded_rest': _ShardedRestApp}
+        app_mgr.contexts_cls = {'wsgi': wsgi.WSGIApplication,
+                                'switches': switches.Switches}
+        eq_([_RestApp.__module__ + '._RestApp',
+             'ryu.topology.switches.Switches'],
+            sorted(shard.global_view_apps(app_mgr)))
@@ -0,0 +1,348 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import base64
+import select
+import socket
+import struct
+import threading
+import time
+import unittest
+
+from nose.tools import eq_
+from nose.tools import ok_
+from nose.tools import raises
+
+# Tested directly so that the hub selected by RYU_HUB_TYPE is not affected.
+from ryu.lib import _asyncio_hub as hub
+
+
+class MyException(BaseException):
+    pass
+
+
+def _block(seconds):
+    # Block the hub, even if time.sleep() is patched.
+    end = time.time() + seconds
+    while time.time() < end:
+        pass
+
+
+class Test_asyncio_hub(unittest.TestCase):
+    """ Test case for ryu.lib._asyncio_hub
+    """
+
+    @raises(hub.Timeout)
+    def test_timeout(self):
+        with hub.Timeout(0.1):
+            hub.sleep(1)
+
+    @raises(MyException)
+    def test_timeout_exception(self):
+        with hub.Timeout(0.1, MyException):
+            hub.sleep(1)
+
+    def test_timeout_cancel(self):
+        with hub.Timeout(0.1):
+            hub.sleep(0.01)
+        # The timer must have been cancelled.
+        hub.sleep(0.2)
+
+    def test_spawn_joinall(self):
+        result = []
+
+        def _child(n):
+            hub.sleep(n * 0.01)
+            result.append(n)
+
+        threads = [hub.spawn(_child, n) for n in (3, 1, 2)]
+        hub.joinall(threads)
+        eq_([1, 2, 3], result)
+
+    def test_spawn_after(self):
+        result = []
+        start = time.time()
+        thread = hub.spawn_after(0.1, lambda: result.append(time.time()))
+        hub.joinall([thread])
+        ok_(result[0] - start >= 0.09)
+
+    def test_wait_result(self):
+        thread = hub.spawn(lambda: 42)
+        eq_(42, thread.wait())
+
+    def test_spawn_kill_joinall(self):
+        result = []
+
+        def _child():
+            try:
+                hub.sleep(10)
+            except hub.TaskExit:
+                result.append('killed')
+                raise
+
+        thread = hub.spawn(_child)
+        hub.sleep(0)
+        hub.kill(thread)
+        hub.joinall([thread])
+        eq_(['killed'], result)
+        ok_(thread.dead())
+
+    def test_kill_before_start(self):
+        result = []
+        thread = hub.spawn(result.append, 1)
+        hub.kill(thread)
+        hub.joinall([thread])
+        hub.sleep(0)
+        eq_([], result)
+
+    @raises(MyException)
+    def test_raise_error(self):
+        def _child():
+            raise MyException()
+
+        hub.spawn(_child, raise_error=True).wait()
+
+    def test_event(self):
+        ev = hub.Event()
+        hub.spawn_after(0.01, ev.set)
+        ok_(ev.wait(1))
+        ok_(ev.is_set())
+        ev.clear()
+        ok_(not ev.wait(0.01))
+
+    def test_queue(self):
+        q = hub.Queue(2)
+
+        def _producer():
+            for i in range(5):
+                q.put(i)
+
+        thread = hub.spawn(_producer)
+        hub.sleep(0)
+        ok_(q.full())
+        eq_([0, 1, 2, 3, 4], [q.get() for _ in range(5)])
+        hub.joinall([thread])
+        self.assertRaises(hub.QueueEmpty, q.get_nowait)
+        self.assertRaises(hub.QueueEmpty, q.get, timeout=0.01)
+
+    def test_semaphore(self):
+        sem = hub.BoundedSemaphore(1)
+        ok_(sem.acquire())
+        ok_(not sem.acquire(blocking=False))
+        ok_(not sem.acquire(timeout=0.01))
+        hub.spawn_after(0.01, sem.release)
+        ok_(sem.acquire())
+        sem.release()
+        self.assertRaises(ValueError, sem.release)
+
+    def test_semaphore_timeout_notified(self):
+        # The waiter times out in the same iteration of the loop as it is
+        # notified by release().
+        sem = hub.Semaphore(0)
+        result = []
+
+        def _waiter():
+            result.append(sem.acquire(timeout=0.01))
+            start = time.time()
+            hub.sleep(0.05)
+            result.append(time.time() - start)
+
+        thread = hub.spawn(_waiter)
+        hub.sleep(0)
+        _block(0.02)
+        hub.sleep(0)
+        sem.release()
+        hub.joinall([thread])
+        ok_(result[0])
+        eq_(0, sem.counter)
+        ok_(result[1] >= 0.05)
+
+    def test_semaphore_interrupted_notified(self):
+        # The waiter is interrupted in the same iteration of the loop as
+        # it is notified by release(), and the next waiter gets it.
+        sem = hub.Semaphore(0)
+        result = []
+
+        def _waiter1():
+            try:
+                with hub.Timeout(0.01):
+                    sem.acquire()
+            except hub.Timeout:
+                result.append('timeout')
+            start = time.time()
+            hub.sleep(0.05)
+            result.append(time.time() - start)
+
+        def _waiter2():
+            result.append(sem.acquire(timeout=1))
+
+        threads = [hub.spawn(_waiter1), hub.spawn(_waiter2)]
+        hub.sleep(0)
+        _block(0.02)
+        hub.sleep(0)
+        sem.release()
+        hub.joinall(threads)
+        eq_('timeout', result[0])
+        eq_(True, result[1])
+        ok_(result[2] >= 0.05)
+        eq_(0, sem.counter)
+
+    def test_stream_server(self):
+        def _echo(sock, addr):
+            while True:
+                data = sock.recv(100)
+                if not data:
+                    break
+                sock.sendall(data)
+            sock.close()
+
+        server = hub.StreamServer(('127.0.0.1', 0), _echo)
+        port = server.server.getsockname()[1]
+        thread = hub.spawn(server.serve_forever)
+        try:
+            client = hub.StreamClient(('127.0.0.1', port)).connect()
+            client.sendall(b'hello')
+            buf = bytearray(5)
+            eq_(5, client.recv_into(buf))
+            eq_(b'hello', bytes(buf))
+            client.settimeout(0.01)
+            self.assertRaises(hub.socket.timeout, client.recv, 100)
+            client.close()
+        finally:
+            hub.kill(thread)
+
+    def test_wsgi_server(self):
+        def _app(environ, start_response):
+            start_response('200 OK', [('Content-Type', 'text/plain')])
+            return [environ['PATH_INFO'].encode()]
+
+        server = hub.WSGIServer(('127.0.0.1', 0), _app)
+        port = server.server.getsockname()[1]
+        thread = hub.spawn(server.serve_forever)
+        try:
+            client = hub.connect(('127.0.0.1', port))
+            client.sendall(b'GET /test HTTP/1.0\r\n\r\n')
+            data = b''
+            while True:
+                buf = client.recv(1024)
+                if not buf:
+                    break
+                data += buf
+            client.close()
+            ok_(data.startswith(b'HTTP/1.0 200 OK'))
+            ok_(data.endswith(b'/test'))
+        finally:
+            hub.kill(thread)
+
+    def _ws_request(self, port, headers):
+        client = hub.connect(('127.0.0.1', port))
+        client.sendall(b'GET /ws HTTP/1.1\r\nHost: localhost\r\n' +
+                       b''.join(b'%s: %s\r\n' % h for h in headers) +
+                       b'\r\n')
+        rfile = client.makefile('rb')
+        status = rfile.readline()
+        while rfile.readline() != b'\r\n':
+            pass
+        return client, rfile, status
+
+    def _ws_send(self, client, opcode, data):
+        # A masked frame of a client.
+        mask = b'\x01\x02\x03\x04'
+        masked = bytes(b ^ mask[i % 4] for i, b in enumerate(data))
+        client.sendall(struct.pack('!BB', 0x80 | opcode, 0x80 | len(data)) +
+                       mask + masked)
+
+    def _ws_recv(self, rfile):
+        b0, b1 = struct.unpack('!BB', rfile.read(2))
+        return b0 & 0x0f, rfile.read(b1)
+
+    def test_websocket(self):
+        received = []
+
+        def _handler(ws):
+            while True:
+                msg = ws.wait()
+                received.append(msg)
+                if msg is None:
+                    break
+                ws.send(msg)
+
+        server = hub.WSGIServer(('127.0.0.1', 0), hub.WebSocketWSGI(_handler))
+        port = server.server.getsockname()[1]
+        thread = hub.spawn(server.serve_forever)
+        try:
+            key = base64.b64encode(b'0123456789abcdef')
+            client, rfile, status = self._ws_request(
+                port, [(b'Upgrade', b'websocket'),
+                       (b'Connection', b'Upgrade'),
+                       (b'Sec-WebSocket-Key', key),
+                       (b'Sec-WebSocket-Version', b'13')])
+            ok_(status.startswith(b'HTTP/1.1 101'))
+
+            self._ws_send(client, 0x1, b'hello')
+            eq_((0x1, b'hello'), self._ws_recv(rfile))
+            self._ws_send(client, 0x9, b'ping')
+            eq_((0xa, b'ping'), self._ws_recv(rfile))
+            # Fragmented binary message
+            client.sendall(b'\x02\x81\x00\x00\x00\x00a'
+                           b'\x80\x81\x00\x00\x00\x00b')
+            eq_((0x2, b'ab'), self._ws_recv(rfile))
+            self._ws_send(client, 0x8, struct.pack('!H', 1000))
+            eq_((0x8, struct.pack('!H', 1000)), self._ws_recv(rfile))
+            client.close()
+            eq_(['hello', b'ab', None], received)
+        finally:
+            hub.kill(thread)
+
+    def test_websocket_bad_request(self):
+        server = hub.WSGIServer(('127.0.0.1', 0),
+                                hub.WebSocketWSGI(lambda ws: None))
+        port = server.server.getsockname()[1]
+        thread = hub.spawn(server.serve_forever)
+        try:
+            client, _, status = self._ws_request(port, [])
+            ok_(status.startswith(b'HTTP/1.1 400'))
+            client.close()
+        finally:
+            hub.kill(thread)
+
+    def test_patch(self):
+        if hub._socket_socket.__module__ != 'socket':
+            raise unittest.SkipTest('socket is patched by eventlet')
+        saved = time.sleep, select.select, socket.socket
+        try:
+            hub.patch(os=False, thread=False)
+            s1, s2 = socket.socketpair()
+            s2.settimeout(1)
+
+            def _child():
+                time.sleep(0.01)
+                s1.sendall(b'x')
+
+            thread = hub.spawn(_child)
+            eq_(([s2], [], []), select.select([s2], [], [], 1))
+            eq_(b'x', s2.recv(1))
+            hub.joinall([thread])
+            s2.settimeout(0.01)
+            self.assertRaises(socket.timeout, s2.recv, 1)
+            s1.close()
+            s2.close()
+
+            # Blocks as before in the other threads.
+            other = threading.Thread(target=time.sleep, args=(0.01, ))
+            other.start()
+            other.join()
+        finally:
+            time.sleep, select.select, socket.socket = saved
@@ -0,0 +1,114 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from nose.tools import eq_, ok_, raises
+
+from ryu.lib import event_queue
+from ryu.lib import hub
+
+
+class Test_EventQueue(unittest.TestCase):
+    def _drain(self, q):
+        items = []
+        while not q.empty():
+            items.append(q.get())
+        return items
+
+    def test_block(self):
+        q = event_queue.EventQueue(2)
+        q.put(1)
+        q.put(2)
+        ok_(q.full())
+        t = hub.spawn(q.put, 3)
+        hub.sleep(0)
+        eq_(2, q.qsize())
+        eq_(1, q.get())
+        hub.joinall([t])
+        eq_([2, 3], self._drain(q))
+        eq_(1, q.blocked)
+        eq_(2, q.high_water)
+
+    def test_drop_oldest(self):
+        q = event_queue.EventQueue(2, event_queue.POLICY_DROP_OLD)
+        for i in range(5):
+            ok_(q.put(i))
+        eq_([3, 4], self._drain(q))
+        eq_(3, q.dropped)
+
+    def test_drop_newest(self):
+        q = event_queue.EventQueue(2, event_queue.POLICY_DROP_NEW)
+        results = [q.put(i) for i in range(4)]
+        eq_([True, True, False, False], results)
+        eq_([0, 1], self._drain(q))
+        eq_(2, q.dropped)
+
+    def test_block_overrides_policy(self):
+        q = event_queue.EventQueue(1, event_queue.POLICY_DROP_NEW)
+        q.put(1)
+        t = hub.spawn(q.put, 2, block=True)
+        hub.sleep(0)
+        eq_(1, q.get())
+        hub.joinall([t])
+        eq_([2], self._drain(q))
+        eq_(0, q.dropped)
+
+    def test_coalesce(self):
+        q = event_queue.EventQueue(2, event_queue.POLICY_COALESCE,
+                                   key=lambda item: item[0])
+        q.put(('a', 1))
+        q.put(('b', 1))
+        q.put(('a', 2))
+        q.put(('b', 2))
+        eq_([('a', 2), ('b', 2)], self._drain(q))
+        eq_(2, q.coalesced)
+
+        # coalesced only when the queue is full
+        q.put(('a', 3))
+        q.put(('a', 4))
+        eq_([('a', 3), ('a', 4)], self._drain(q))
+
+    def test_force(self):
+        q = event_queue.EventQueue(1, event_queue.POLICY_DROP_NEW)
+        q.put(1)
+        ok_(q.put(2, force=True))
+        eq_(2, q.qsize())
+        eq_([1, 2], self._drain(q))
+        # the capacity is not changed
+        q.put(3)
+        ok_(not q.put(4))
+
+    @raises(ValueError)
+    def test_unknown_policy(self):
+        event_queue.EventQueue(1, 'unknown')
+
+    def test_stats(self):
+        q = event_queue.EventQueue(4)
+        q.put(1)
+        stats = q.stats()
+        eq_(1, stats['depth'])
+        eq_(4, stats['maxsize'])
+        eq_('block', stats['policy'])
+
+
+class Test_LatencyHistogram(unittest.TestCase):
+    def test_add(self):
+        h = event_queue.LatencyHistogram([0.1, 1])
+        for value in [0.05, 0.1, 0.5, 2]:
+            h.add(value)
+        eq_([2, 1, 1], h.counts)
+        eq_(4, h.count)
+        eq_(2, h.max)
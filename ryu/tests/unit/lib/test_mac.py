@@ -68,6 +68,10 @@ class Test_mac(unittest.TestCase):
 
         res = mac.haddr_to_str(val)
 
+    def test_mac_int_to_haddr(self):
+        eq_('00:0a:0b:0c:0d:0e', mac.int_to_haddr(0x0a0b0c0d0e))
+        eq_(0x0a0b0c0d0e, mac.haddr_to_int(mac.int_to_haddr(0x0a0b0c0d0e)))
+
     def test_mac_haddr_to_bin_false(self):
         """ len(hexes) = 6 (False)
         """
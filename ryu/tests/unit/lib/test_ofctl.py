@@ -113,6 +113,36 @@ class Test_ofctl(unittest.TestCase):
             raise e
 
 
+class Test_iter_flow_stats(unittest.TestCase):
+    """ Test case for ofctl_v1_*.iter_flow_stats
+    """
+
+    def _test(self, ofctl, version, ofp_ver, reply):
+        this_dir = os.path.dirname(sys.modules[__name__].__file__)
+        json_dir = os.path.join(this_dir, '../ofproto/json/', ofp_ver)
+        dp = DummyDatapath(version)
+        reply = ofproto_parser.ofp_msg_from_jsondict(
+            dp, json.load(open(os.path.join(json_dir, reply))))
+        waiters = {}
+        dp.set_reply(reply, waiters)
+        expected = ofctl.get_flow_stats(dp, waiters)
+        flows = ofctl.iter_flow_stats(dp, waiters)
+        eq_(expected, {str(dp.id): list(flows)})
+        eq_({}, waiters[dp.id])
+
+    def test_of13(self):
+        self._test(ofctl_v1_3, 0x04, 'of13',
+                   '4-12-ofp_flow_stats_reply.packet.json')
+
+    def test_of14(self):
+        self._test(ofctl_v1_4, 0x05, 'of14',
+                   '5-12-ofp_flow_stats_reply.packet.json')
+
+    def test_of15(self):
+        self._test(ofctl_v1_5, 0x06, 'of15',
+                   'libofproto-OFP15-flow_stats_reply.packet.json')
+
+
 def _add_tests():
     _ofp_vers = {
         'of10': 0x01,
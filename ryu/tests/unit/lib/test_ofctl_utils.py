@@ -15,7 +15,15 @@
 
 import logging
 import unittest
+try:
+    import mock  # Python 2
+except ImportError:
+    from unittest import mock  # Python 3
 
+from nose.tools import eq_
+from nose.tools import ok_
+
+from ryu.lib import hub
 from ryu.lib import ofctl_utils
 from ryu.ofproto import ofproto_v1_3
 
@@ -140,3 +148,100 @@ class Test_ofctl_utils(unittest.TestCase):
             'ALL',
             self.util.ofp_queue_to_user(ofproto_v1_3.OFPQ_ALL)
         )
+
+
+class _Datapath(object):
+    ofproto = ofproto_v1_3
+
+    def __init__(self, dpid):
+        self.id = dpid
+        self.sent = []
+
+    @staticmethod
+    def set_xid(msg):
+        msg.xid = 1
+
+    def send_msg(self, msg):
+        self.sent.append(msg)
+
+
+class _Msg(object):
+    def __init__(self, xid=None):
+        self.xid = xid
+
+
+class Test_send_stats_request_iter(unittest.TestCase):
+
+    def test_replies(self):
+        dp = _Datapath(1)
+        waiters = {}
+        msgs = ofctl_utils.send_stats_request_iter(dp, _Msg(), waiters)
+        eq_(1, len(dp.sent))
+        lock, replies = waiters[1][1]
+        # The replies are generated as they arrive.
+        replies.append(_Msg(1))
+        eq_(1, next(msgs).xid)
+        replies.append(_Msg(2))
+        replies.append(_Msg(3))
+        del waiters[1][1]
+        lock.set()
+        eq_([2, 3], [msg.xid for msg in msgs])
+
+    def test_timeout(self):
+        dp = _Datapath(1)
+        waiters = {}
+        with mock.patch.object(ofctl_utils, 'DEFAULT_TIMEOUT', 0.01):
+            msgs = ofctl_utils.send_stats_request_iter(dp, _Msg(), waiters)
+            waiters[1][1][1].append(_Msg(1))
+            eq_([1], [msg.xid for msg in msgs])
+        eq_({}, waiters[1])
+
+    def test_stalled_consumer(self):
+        dp = _Datapath(1)
+        waiters = {}
+        with mock.patch.multiple(ofctl_utils, DEFAULT_TIMEOUT=0.01,
+                                 REPLY_QUEUE_SIZE=2):
+            msgs = ofctl_utils.send_stats_request_iter(dp, _Msg(), waiters)
+            replies = waiters[1][1][1]
+            replies.append(_Msg(1))
+            eq_(1, next(msgs).xid)
+            # The consumer stops reading, and the queue does not grow
+            # beyond its size.
+            for xid in range(2, 10):
+                replies.append(_Msg(xid))
+            eq_(2, replies._queue.qsize())
+            ok_(replies.stalled)
+            eq_({}, waiters[1])
+            eq_([2, 3], [msg.xid for msg in msgs])
+
+
+class Test_get_stats_all(unittest.TestCase):
+
+    def _get_stats(self, dp, waiters, delay):
+        hub.sleep(delay * dp.id)
+        if dp.id == 2:
+            raise ValueError()
+        return {str(dp.id): waiters}
+
+    def test_order_of_completion(self):
+        dps = [_Datapath(3), _Datapath(1), _Datapath(2)]
+        results = list(ofctl_utils.get_stats_all(
+            dps, self._get_stats, 'w', 0.01))
+        self.assertEqual([1, 2, 3], [dp.id for dp, _ in results])
+        self.assertEqual({'1': 'w'}, results[0][1])
+        self.assertTrue(isinstance(results[1][1], ValueError))
+
+    def test_timeout(self):
+        dps = [_Datapath(1), _Datapath(3)]
+        results = list(ofctl_utils.get_stats_all(
+            dps, self._get_stats, 'w', 0.1, timeout=0.2))
+        self.assertEqual([(dps[0], {'1': 'w'}), (dps[1], None)], results)
+
+    def test_version(self):
+        methods = {ofproto_v1_3.OFP_VERSION: self._get_stats}
+        results = list(ofctl_utils.get_stats_all(
+            [_Datapath(1)], methods, 'w', 0))
+        self.assertEqual({'1': 'w'}, results[0][1])
+        results = list(ofctl_utils.get_stats_all(
+            [_Datapath(1)], {}, 'w', 0))
+        self.assertTrue(isinstance(results[0][1], ValueError))
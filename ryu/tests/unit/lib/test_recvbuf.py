@@ -0,0 +1,75 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from nose.tools import eq_
+
+from ryu.lib import recvbuf
+
+
+class _SocketMock(object):
+    def __init__(self, chunks):
+        self.chunks = list(chunks)
+
+    def recv_into(self, buffer, nbytes=0):
+        if not self.chunks:
+            return 0
+        chunk = self.chunks.pop(0)
+        assert len(chunk) <= len(buffer)
+        buffer[:len(chunk)] = chunk
+        return len(chunk)
+
+
+class Test_RecvBuffer(unittest.TestCase):
+    """ Test case for ryu.lib.recvbuf.RecvBuffer
+    """
+
+    def test_consume(self):
+        rbuf = recvbuf.RecvBuffer(16)
+        rbuf.feed(b'abcdefgh')
+        eq_(8, len(rbuf))
+        eq_(b'abc', rbuf.peek(3).tobytes())
+        eq_(b'abc', rbuf.consume(3).tobytes())
+        eq_(5, len(rbuf))
+        eq_(b'defgh', rbuf.peek().tobytes())
+        eq_(b'defgh', rbuf.consume(5).tobytes())
+        eq_(0, len(rbuf))
+
+    def test_compact(self):
+        rbuf = recvbuf.RecvBuffer(8)
+        rbuf.feed(b'abcdef')
+        rbuf.consume(4)
+        # Moves the unconsumed tail to the head instead of growing.
+        rbuf.feed(b'ghijkl')
+        eq_(8, rbuf.capacity)
+        eq_(b'efghijkl', rbuf.peek().tobytes())
+
+    def test_grow(self):
+        rbuf = recvbuf.RecvBuffer(4)
+        rbuf.feed(b'abc')
+        rbuf.feed(b'defghij')
+        eq_(16, rbuf.capacity)
+        eq_(b'abcdefghij', rbuf.consume(10).tobytes())
+
+    def test_recv_into(self):
+        sock = _SocketMock([b'abcd', b'efgh', b'ij'])
+        rbuf = recvbuf.RecvBuffer(4)
+        eq_(4, rbuf.recv_into(sock, 4))
+        eq_(b'ab', rbuf.consume(2).tobytes())
+        eq_(4, rbuf.recv_into(sock, 4))
+        eq_(2, rbuf.recv_into(sock, 2))
+        eq_(0, rbuf.recv_into(sock, 2))
+        eq_(b'cdefghij', rbuf.peek().tobytes())
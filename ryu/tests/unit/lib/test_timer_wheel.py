@@ -0,0 +1,104 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import random
+import timeit
+import unittest
+
+from nose.tools import eq_
+from nose.tools import ok_
+
+from ryu.lib.timer_wheel import TimerWheel
+
+
+class Test_TimerWheel(unittest.TestCase):
+    """ Test case for ryu.lib.timer_wheel.TimerWheel
+    """
+
+    def test_expire(self):
+        wheel = TimerWheel(resolution=1, size=4, levels=2, start=0)
+        wheel.schedule('a', 3)
+        wheel.schedule('b', 0)
+        wheel.schedule('c', 10)
+        eq_(3, len(wheel))
+        eq_(['b'], wheel.pop_expired(0))
+        eq_([], wheel.pop_expired(2))
+        eq_(['a'], wheel.pop_expired(3))
+        eq_(['c'], wheel.pop_expired(100))
+        eq_(0, len(wheel))
+
+    def test_reschedule_and_cancel(self):
+        wheel = TimerWheel(resolution=1, size=4, levels=2, start=0)
+        wheel.schedule('a', 3)
+        wheel.schedule('a', 6)
+        eq_(6, wheel.deadline('a'))
+        eq_([], wheel.pop_expired(5))
+        ok_(wheel.cancel('a'))
+        ok_(not wheel.cancel('a'))
+        eq_([], wheel.pop_expired(10))
+
+    def test_beyond_wheel(self):
+        # The wheel spans 4 ** 2 ticks.
+        wheel = TimerWheel(resolution=1, size=4, levels=2, start=0)
+        wheel.schedule('a', 40)
+        eq_([], wheel.pop_expired(39))
+        eq_(['a'], wheel.pop_expired(40))
+
+    def test_long_idle(self):
+        # Nothing advances the wheel while it is empty, e.g. a day without
+        # any switch.  Catching up must not step through every tick.
+        wheel = TimerWheel(start=0)
+        day = 24 * 60 * 60
+        wheel.schedule('a', day + 0.9)
+        wheel.schedule('b', day + 60)
+        start = timeit.default_timer()
+        eq_([], wheel.pop_expired(day))
+        eq_(['a'], wheel.pop_expired(day + 1))
+        ok_(timeit.default_timer() - start < 0.1)
+        ok_(0 < wheel.next_timeout(day + 1) <= 59)
+        eq_([], wheel.pop_expired(day + 59.9))
+        eq_(['b'], wheel.pop_expired(day + 60))
+
+    def test_next_timeout(self):
+        wheel = TimerWheel(resolution=0.5, size=4, levels=2, start=0)
+        eq_(None, wheel.next_timeout(0))
+        wheel.schedule('a', 1)
+        eq_(1, wheel.next_timeout(0))
+        eq_(0.5, wheel.next_timeout(0.5))
+        wheel.schedule('b', 0)
+        eq_(0, wheel.next_timeout(0))
+
+    def test_random(self):
+        rand = random.Random(0)
+        wheel = TimerWheel(resolution=1, size=4, levels=3, start=0)
+        deadlines = {}
+        now = 0
+        for _ in range(2000):
+            if rand.random() < 0.6:
+                key = rand.randrange(50)
+                when = now + rand.choice([0, rand.randrange(8),
+                                          rand.randrange(300)])
+                wheel.schedule(key, when)
+                deadlines[key] = when
+                continue
+            timeout = wheel.next_timeout(now)
+            if deadlines:
+                ok_(now + timeout <= max(now, min(deadlines.values())))
+            now += rand.choice([1, rand.randrange(10), rand.randrange(200)])
+            expired = [k for k, v in deadlines.items() if v <= now]
+            eq_(sorted(expired), sorted(wheel.pop_expired(now)))
+            for key in expired:
+                del deadlines[key]
+        eq_(len(deadlines), len(wheel))
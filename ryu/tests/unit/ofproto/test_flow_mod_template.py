@@ -0,0 +1,146 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from nose.tools import eq_, ok_, raises
+
+from ryu.ofproto import ofproto_parser
+from ryu.ofproto import ofproto_protocol
+from ryu.ofproto import ofproto_v1_0
+from ryu.ofproto import ofproto_v1_3
+from ryu.ofproto import ofproto_v1_4
+from ryu.ofproto import ofproto_v1_5
+from ryu.ofproto.flow_mod_template import FlowModTemplate
+
+
+class _Datapath(ofproto_protocol.ProtocolDesc):
+    def __init__(self, version):
+        super(_Datapath, self).__init__(version)
+        self.xid = 0
+        self.sent = []
+        self.send_msg_hooks = []
+
+    def next_xid(self):
+        self.xid += 1
+        return self.xid
+
+    def send(self, buf):
+        self.sent.append(bytes(buf))
+        return True
+
+
+class Test_FlowModTemplate(unittest.TestCase):
+    def _make(self, dp, cookie=0, in_port=1,
+              eth_dst='00:00:00:00:00:00',
+              ipv4_dst=('0.0.0.0', '255.255.255.255'),
+              set_dst='00:00:00:00:00:00', port=1, table_id=0):
+        ofp = dp.ofproto
+        parser = dp.ofproto_parser
+        output = parser.OFPActionOutput(port)
+        set_field = parser.OFPActionSetField(eth_dst=set_dst)
+        goto = parser.OFPInstructionGotoTable(table_id)
+        mod = parser.OFPFlowMod(
+            dp, cookie=cookie, priority=10,
+            match=parser.OFPMatch(in_port=in_port, eth_dst=eth_dst,
+                                  eth_type=0x0800, ipv4_dst=ipv4_dst),
+            instructions=[
+                parser.OFPInstructionActions(ofp.OFPIT_APPLY_ACTIONS,
+                                             [set_field, output]),
+                goto])
+        return mod, output, set_field, goto
+
+    def _template(self, dp):
+        mod, output, set_field, goto = self._make(dp)
+        return FlowModTemplate(
+            mod, attrs=['cookie'], match=['in_port', 'eth_dst', 'ipv4_dst'],
+            objects={'port': (output, 'port'),
+                     'table_id': (goto, 'table_id'),
+                     'set_dst': (set_field, 'value')})
+
+    def _test_same_bytes(self, version):
+        dp = _Datapath(version)
+        template = self._template(dp)
+        values = [
+            {},
+            {'cookie': 3, 'in_port': 2},
+            {'eth_dst': 'aa:bb:cc:dd:ee:ff', 'port': 5, 'table_id': 2,
+             'set_dst': '00:11:22:33:44:55'},
+            {'ipv4_dst': ('10.1.2.3', '255.255.0.0'), 'in_port': 0xfffffff0},
+        ]
+        for i, kwargs in enumerate(values):
+            mod = self._make(dp, **kwargs)[0]
+            mod.set_xid(i)
+            mod.serialize()
+            eq_(bytes(mod.buf), bytes(template.serialize(i, **kwargs)))
+
+    def test_same_bytes_v13(self):
+        self._test_same_bytes(ofproto_v1_3.OFP_VERSION)
+
+    def test_same_bytes_v14(self):
+        self._test_same_bytes(ofproto_v1_4.OFP_VERSION)
+
+    def test_same_bytes_v15(self):
+        self._test_same_bytes(ofproto_v1_5.OFP_VERSION)
+
+    def test_send(self):
+        dp = _Datapath(ofproto_v1_3.OFP_VERSION)
+        template = self._template(dp)
+        template.send(in_port=3)
+        template.send(in_port=4)
+        msg = ofproto_parser.msg(dp, dp.ofproto.OFP_VERSION,
+                                 dp.ofproto.OFPT_FLOW_MOD,
+                                 len(dp.sent[1]), 2, dp.sent[1])
+        eq_(2, msg.xid)
+        eq_(4, msg.match['in_port'])
+
+    def test_send_msg_hooks(self):
+        dp = _Datapath(ofproto_v1_3.OFP_VERSION)
+        template = self._template(dp)
+        msgs = []
+        dp.send_msg_hooks.append(lambda dp, msg: msgs.append(msg))
+        template.send(in_port=3, cookie=5)
+
+        eq_(1, len(msgs))
+        ok_(isinstance(msgs[0], dp.ofproto_parser.OFPFlowMod))
+        eq_(1, msgs[0].xid)
+        eq_(5, msgs[0].cookie)
+        eq_(3, msgs[0].match['in_port'])
+        eq_(dp.sent[0], bytes(msgs[0].buf))
+
+    @raises(ValueError)
+    def test_unknown_variable(self):
+        dp = _Datapath(ofproto_v1_3.OFP_VERSION)
+        self._template(dp).serialize(0, eth_src='00:00:00:00:00:01')
+
+    @raises(ValueError)
+    def test_mask_mismatch(self):
+        dp = _Datapath(ofproto_v1_3.OFP_VERSION)
+        self._template(dp).serialize(0, eth_dst=('00:00:00:00:00:01',
+                                                 'ff:ff:ff:ff:ff:ff'))
+
+    @raises(ValueError)
+    def test_no_field(self):
+        dp = _Datapath(ofproto_v1_3.OFP_VERSION)
+        mod = self._make(dp)[0]
+        FlowModTemplate(mod, match=['eth_src'])
+
+    @raises(ValueError)
+    def test_unsupported_version(self):
+        dp = _Datapath(ofproto_v1_0.OFP_VERSION)
+        mod = dp.ofproto_parser.OFPFlowMod(
+            dp, dp.ofproto_parser.OFPMatch(), 0, dp.ofproto.OFPFC_ADD,
+            0, 0, 0, 0, 0, 0, [])
+        FlowModTemplate(mod)
@@ -0,0 +1,94 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import struct
+import unittest
+
+import ryu.ofproto.ofproto_v1_3 as ofp
+import ryu.ofproto.ofproto_v1_3_parser as ofpp
+
+
+FIELDS = [
+    [('in_port', 1), ('eth_type', 0x0800),
+     ('ipv4_src', ('10.0.0.0', '255.255.255.0')), ('ip_proto', 6),
+     ('tcp_dst', 80)],
+    [('eth_dst', 'aa:bb:cc:dd:ee:ff'),
+     ('eth_src', ('00:11:22:00:00:00', 'ff:ff:ff:00:00:00')),
+     ('vlan_vid', 0x1000 | 10), ('metadata', (0x1234, 0xffff))],
+    [('eth_type', 0x86dd), ('ipv6_src', '2001:db8::1'),
+     ('ipv6_dst', ('2001:db8::', 'ffff:ffff::')), ('pbb_isid', 0xabcdef)],
+    # experimenter fields and unknown fields
+    [('pbb_uca', 1), ('tcp_flags', (0x2, 0x12)), ('actset_output', 3)],
+    [('in_port', 1), ('field_100', 'AAECAw==')],
+    [('tunnel_id', 2 ** 64 - 1), ('reg0', 1), ('conj_id', 0)],
+]
+
+
+class Test_OXMFieldsCodec(unittest.TestCase):
+    def _serialize_generic(self, fields):
+        buf = bytearray()
+        offset = 0
+        for (k, uv) in fields:
+            (n, v, m) = ofp.oxm_from_user(k, uv)
+            offset += ofp.oxm_serialize(n, v, m, buf, offset)
+        return buf
+
+    def _parse_generic(self, buf):
+        fields = []
+        offset = 0
+        while offset < len(buf):
+            n, v, m, field_len = ofp.oxm_parse(buf, offset)
+            fields.append(ofp.oxm_to_user(n, v, m))
+            offset += field_len
+        return fields
+
+    def test_same_as_generic(self):
+        for fields in FIELDS:
+            expected = self._serialize_generic(fields)
+            # twice to use the cached codec
+            for _ in range(2):
+                buf = bytearray(b'\xff' * 3)
+                length = ofp.oxm_serialize_fields(fields, buf, 3)
+                self.assertEqual(len(expected), length)
+                self.assertEqual(expected, buf[3:])
+                self.assertEqual(self._parse_generic(expected),
+                                 ofp.oxm_parse_fields(buf, 3, length))
+
+    def test_fallback(self):
+        # out of range of the field is truncated by the generic functions
+        fields = [('vlan_pcp', 0x107)]
+        buf = bytearray()
+        ofp.oxm_serialize_fields(fields, buf, 0)
+        self.assertEqual(self._serialize_generic(fields), buf)
+        self.assertEqual([('vlan_pcp', 7)], ofp.oxm_parse_fields(buf, 0, 5))
+
+    def test_invalid_value(self):
+        buf = bytearray()
+        self.assertRaises(Exception, ofp.oxm_serialize_fields,
+                          [('eth_dst', 'invalid')], buf, 0)
+
+    def test_truncated(self):
+        buf = self._serialize_generic([('in_port', 1), ('eth_type', 1)])
+        self.assertRaises(struct.error, ofp.oxm_parse_fields,
+                          buf[:-1], 0, len(buf))
+
+    def test_ofpmatch(self):
+        for fields in FIELDS:
+            match = ofpp.OFPMatch(_ordered_fields=fields)
+            buf = bytearray()
+            length = match.serialize(buf, 0)
+            self.assertEqual(len(buf), length)
+            match2 = ofpp.OFPMatch.parser(bytes(buf), 0)
+            self.assertEqual(match.items(), match2.items())
@@ -0,0 +1,82 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import unittest
+
+from nose.tools import eq_, ok_
+
+from ryu.ofproto import ofproto_parser
+from ryu.ofproto import ofproto_protocol
+from ryu.ofproto import ofproto_v1_3
+from ryu.ofproto import ofproto_v1_4
+
+
+PACKET_DATA_DIR = os.path.join(os.path.dirname(__file__),
+                               '../../packet_data')
+
+
+class Test_LazyParsing(unittest.TestCase):
+    """ Test case for lazy parsing of received messages
+    """
+
+    def _parse(self, ofp, name, lazy_parsing=False):
+        dp = ofproto_protocol.ProtocolDesc(version=ofp.OFP_VERSION)
+        dp.lazy_parsing = lazy_parsing
+        with open(os.path.join(PACKET_DATA_DIR, name), 'rb') as f:
+            buf = f.read()
+        version, msg_type, msg_len, xid = ofproto_parser.header(buf)
+        return ofproto_parser.msg(dp, version, msg_type, msg_len, xid, buf)
+
+    def _test_lazy(self, ofp, name, attrs):
+        eager = self._parse(ofp, name)
+        ok_('_lazy_decoders' not in eager.__dict__)
+
+        lazy = self._parse(ofp, name, lazy_parsing=True)
+        eq_(set(attrs), set(lazy._lazy_decoders))
+
+        # Accessing an attribute decodes it alone.
+        getattr(lazy, attrs[0])
+        eq_(set(attrs[1:]), set(lazy._lazy_decoders))
+        eq_(eager.to_jsondict(), lazy.to_jsondict())
+
+    def _test_set(self, ofp, name, attr):
+        msg = self._parse(ofp, name, lazy_parsing=True)
+        setattr(msg, attr, None)
+        eq_(None, getattr(msg, attr))
+        ok_(attr not in msg._lazy_decoders)
+
+    def test_packet_in_v13(self):
+        self._test_lazy(ofproto_v1_3, 'of13/4-4-ofp_packet_in.packet',
+                        ['data', 'match'])
+
+    def test_packet_in_v14(self):
+        self._test_lazy(ofproto_v1_4, 'of14/5-4-ofp_packet_in.packet',
+                        ['match', 'data'])
+
+    def test_flow_stats_reply_v13(self):
+        self._test_lazy(ofproto_v1_3, 'of13/4-12-ofp_flow_stats_reply.packet',
+                        ['body'])
+
+    def test_flow_stats_reply_v14(self):
+        self._test_lazy(ofproto_v1_4, 'of14/5-12-ofp_flow_stats_reply.packet',
+                        ['body'])
+
+    def test_set_packet_in(self):
+        self._test_set(ofproto_v1_3, 'of13/4-4-ofp_packet_in.packet', 'match')
+
+    def test_set_flow_stats_reply(self):
+        self._test_set(ofproto_v1_4, 'of14/5-12-ofp_flow_stats_reply.packet',
+                       'body')
@@ -0,0 +1,107 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from nose.tools import eq_
+
+from ryu.lib.packet import arp
+from ryu.lib.packet import ether_types
+from ryu.lib.packet import ethernet
+from ryu.lib.packet import header_fields
+from ryu.lib.packet import icmpv6
+from ryu.lib.packet import in_proto
+from ryu.lib.packet import ipv4
+from ryu.lib.packet import ipv6
+from ryu.lib.packet import packet
+from ryu.lib.packet import tcp
+from ryu.lib.packet import udp
+from ryu.lib.packet import vlan
+
+DST = 0x0a0000000001
+SRC = 0x0a0000000002
+
+
+def _serialize(*protocols):
+    pkt = packet.Packet()
+    for proto in protocols:
+        pkt.add_protocol(proto)
+    pkt.serialize()
+    return pkt.data
+
+
+def _ethernet(ethertype):
+    return ethernet.ethernet(dst='0a:00:00:00:00:01',
+                             src='0a:00:00:00:00:02',
+                             ethertype=ethertype)
+
+
+class Test_header_fields(unittest.TestCase):
+    """ Test case for ryu.lib.packet.header_fields
+    """
+
+    def test_ipv4_tcp(self):
+        data = _serialize(
+            _ethernet(ether_types.ETH_TYPE_8021Q),
+            vlan.vlan(vid=10, ethertype=ether_types.ETH_TYPE_IP),
+            ipv4.ipv4(src='10.0.0.1', dst='10.0.0.2',
+                      proto=in_proto.IPPROTO_TCP),
+            tcp.tcp(src_port=1234, dst_port=80, option=b'\x01\x01\x01\x01'))
+        eq_((DST, SRC, 10, ether_types.ETH_TYPE_IP, 0x0a000001, 0x0a000002,
+             in_proto.IPPROTO_TCP, 1234, 80),
+            header_fields.extract(data))
+
+    def test_ipv4_fragment(self):
+        data = _serialize(
+            _ethernet(ether_types.ETH_TYPE_IP),
+            ipv4.ipv4(src='10.0.0.1', dst='10.0.0.2', offset=100,
+                      proto=in_proto.IPPROTO_UDP),
+            udp.udp(src_port=1, dst_port=2))
+        eq_((0x0a000001, 0x0a000002, in_proto.IPPROTO_UDP, None, None),
+            header_fields.extract(data)[header_fields.IP_SRC:])
+
+    def test_ipv6_icmpv6(self):
+        data = _serialize(
+            _ethernet(ether_types.ETH_TYPE_IPV6),
+            ipv6.ipv6(src='fe80::1', dst='ff02::1',
+                      nxt=in_proto.IPPROTO_ICMPV6),
+            icmpv6.icmpv6(type_=icmpv6.ICMPV6_ECHO_REQUEST, code=0,
+                          data=icmpv6.echo()))
+        eq_((0xfe800000000000000000000000000001,
+             0xff020000000000000000000000000001,
+             in_proto.IPPROTO_ICMPV6, icmpv6.ICMPV6_ECHO_REQUEST, 0),
+            header_fields.extract(data)[header_fields.IP_SRC:])
+
+    def test_arp(self):
+        data = _serialize(
+            _ethernet(ether_types.ETH_TYPE_ARP),
+            arp.arp_ip(arp.ARP_REQUEST, '0a:00:00:00:00:02', '10.0.0.2',
+                       '00:00:00:00:00:00', '10.0.0.1'))
+        eq_((None, ether_types.ETH_TYPE_ARP, 0x0a000002, 0x0a000001,
+             arp.ARP_REQUEST, None, None),
+            header_fields.extract(data)[header_fields.VLAN_VID:])
+
+    def test_truncated(self):
+        data = _serialize(
+            _ethernet(ether_types.ETH_TYPE_IP),
+            ipv4.ipv4(src='10.0.0.1', dst='10.0.0.2',
+                      proto=in_proto.IPPROTO_UDP),
+            udp.udp(src_port=1, dst_port=2))
+        eq_((DST, SRC, None, ether_types.ETH_TYPE_IP,
+             None, None, None, None, None),
+            header_fields.extract(data[:20]))
+        eq_((0x0a000001, 0x0a000002, in_proto.IPPROTO_UDP, None, None),
+            header_fields.extract(data[:36])[header_fields.IP_SRC:])
+        eq_(None, header_fields.extract(data[:10]))
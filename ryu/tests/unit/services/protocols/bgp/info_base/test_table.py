@@ -0,0 +1,174 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import unittest
+try:
+    import mock  # Python 2
+except ImportError:
+    from unittest import mock  # Python 3
+
+from nose.tools import eq_, ok_, raises
+
+from ryu.lib.packet.bgp import IPAddrPrefix
+from ryu.lib.packet.bgp import IP6AddrPrefix
+from ryu.lib.packet.bgp import LabelledVPNIPAddrPrefix
+from ryu.services.protocols.bgp.info_base.ipv4 import Ipv4Path
+from ryu.services.protocols.bgp.info_base.ipv4 import Ipv4Table
+from ryu.services.protocols.bgp.info_base.ipv6 import Ipv6Path
+from ryu.services.protocols.bgp.info_base.ipv6 import Ipv6Table
+from ryu.services.protocols.bgp.info_base.rtc import RtcTable
+from ryu.services.protocols.bgp.info_base.vpnv4 import Vpnv4Path
+from ryu.services.protocols.bgp.info_base.vpnv4 import Vpnv4Table
+
+
+LOG = logging.getLogger(__name__)
+
+
+class Test_Table(unittest.TestCase):
+    """
+    Test case for ryu.services.protocols.bgp.info_base.base.Table
+    """
+
+    PREFIXES = ['10.0.0.0/8', '10.0.0.0/16', '10.0.0.0/24', '10.1.0.0/16',
+                '192.168.0.0/16']
+
+    def _ipv4_table(self, prefixes):
+        table = Ipv4Table(mock.MagicMock(), mock.MagicMock())
+        for prefix in prefixes:
+            addr, length = prefix.split('/')
+            table.insert(Ipv4Path(None, IPAddrPrefix(int(length), addr), 0,
+                                  is_withdraw=True))
+        return table
+
+    def _nlri(self, prefix):
+        addr, length = prefix.split('/')
+        return IPAddrPrefix(int(length), addr)
+
+    def _nlri_strs(self, dests):
+        return [d.nlri_str for d in dests]
+
+    def test_sorted_values(self):
+        table = self._ipv4_table(reversed(self.PREFIXES))
+
+        eq_(self.PREFIXES, self._nlri_strs(table.sorted_values()))
+        eq_(set(self.PREFIXES), set(table._destinations))
+
+    def test_sorted_values_host_bits(self):
+        prefixes = ['9.0.0.0/8', '10.0.0.0/8', '10.0.0.1/8', '10.0.0.0/16',
+                    '100.0.0.0/8']
+        table = self._ipv4_table(reversed(prefixes))
+
+        # NLRIs which differ only in host bits share a prefix, and do not
+        # change the order of the others.
+        eq_(prefixes, self._nlri_strs(table.sorted_values()))
+        eq_(['10.0.0.0/8', '10.0.0.1/8', '10.0.0.0/16'],
+            self._nlri_strs(table.covering('10.0.0.0/16')))
+        table.delete_dest_by_nlri(self._nlri('10.0.0.0/8'))
+        eq_('10.0.0.1/8', table.longest_match('10.1.0.0/16').nlri_str)
+
+    def test_prefix_index(self):
+        table = self._ipv4_table(self.PREFIXES[:2])
+
+        # Built by the first prefix lookup and kept up to date after that
+        eq_(None, table._prefix_index)
+        eq_('10.0.0.0/16', table.longest_match('10.0.0.0/24').nlri_str)
+        table.insert(Ipv4Path(None, self._nlri('10.0.0.0/24'), 0,
+                              is_withdraw=True))
+        eq_('10.0.0.0/24', table.longest_match('10.0.0.0/24').nlri_str)
+        table.delete_dest_by_nlri(self._nlri('10.0.0.0/24'))
+        eq_('10.0.0.0/16', table.longest_match('10.0.0.0/24').nlri_str)
+
+    def test_get_dest(self):
+        table = self._ipv4_table(self.PREFIXES)
+
+        dest = table._get_dest(self._nlri('10.0.0.0/16'))
+        eq_('10.0.0.0/16', dest.nlri_str)
+        eq_(None, table._get_dest(self._nlri('10.0.0.0/12')))
+
+    def test_delete_dest(self):
+        table = self._ipv4_table(self.PREFIXES)
+
+        table.delete_dest(table._get_dest(self._nlri('10.0.0.0/16')))
+        dest = table.delete_dest_by_nlri(self._nlri('10.1.0.0/16'))
+
+        eq_('10.1.0.0/16', dest.nlri_str)
+        eq_(['10.0.0.0/8', '10.0.0.0/24', '192.168.0.0/16'],
+            self._nlri_strs(table.sorted_values()))
+        eq_(['10.0.0.0/8', '10.0.0.0/24'],
+            self._nlri_strs(table.covered('10.0.0.0/8')))
+
+    def test_longest_match(self):
+        table = self._ipv4_table(self.PREFIXES)
+
+        eq_('10.0.0.0/24',
+            table.longest_match('10.0.0.1/32').nlri_str)
+        eq_('10.0.0.0/8',
+            table.longest_match('10.2.0.0/16').nlri_str)
+        eq_(None, table.longest_match('172.16.0.0/12'))
+
+    def test_covering(self):
+        table = self._ipv4_table(self.PREFIXES)
+
+        eq_(['10.0.0.0/8', '10.0.0.0/16', '10.0.0.0/24'],
+            self._nlri_strs(table.covering('10.0.0.128/25')))
+
+    def test_covered(self):
+        table = self._ipv4_table(self.PREFIXES)
+
+        eq_(['10.0.0.0/16', '10.0.0.0/24', '10.1.0.0/16'],
+            self._nlri_strs(table.covered('10.0.0.0/15')))
+
+    def test_ipv6(self):
+        table = Ipv6Table(mock.MagicMock(), mock.MagicMock())
+        for prefix in ['2001:db8::/32', '2001:db8:1::/48']:
+            addr, length = prefix.split('/')
+            table.insert(Ipv6Path(None, IP6AddrPrefix(int(length), addr), 0,
+                                  is_withdraw=True))
+
+        eq_('2001:db8:1::/48',
+            table.longest_match('2001:db8:1:1::/64').nlri_str)
+        eq_(['2001:db8::/32', '2001:db8:1::/48'],
+            self._nlri_strs(table.covered('2001::/16')))
+
+    def test_vpnv4(self):
+        table = Vpnv4Table(mock.MagicMock(), mock.MagicMock())
+        for route_dist, prefix in [('65000:1', '10.0.0.0/8'),
+                                   ('65000:1', '10.0.0.0/16'),
+                                   ('65000:2', '10.0.0.0/16')]:
+            addr, length = prefix.split('/')
+            nlri = LabelledVPNIPAddrPrefix(int(length), addr, [100],
+                                           route_dist=route_dist)
+            table.insert(Vpnv4Path(None, nlri, 0, is_withdraw=True))
+
+        eq_(3, len(list(table.values())))
+        # Route distinguishers separate the prefixes
+        eq_(['65000:2:10.0.0.0/16'],
+            self._nlri_strs(table.covering('65000:2:10.0.0.0/24')))
+        eq_(['65000:1:10.0.0.0/8', '65000:1:10.0.0.0/16'],
+            self._nlri_strs(table.covered('65000:1:10.0.0.0/8')))
+        nlri = LabelledVPNIPAddrPrefix(8, '10.0.0.0', [100],
+                                       route_dist='65000:1')
+        ok_(table._get_dest(nlri) is not None)
+
+    @raises(ValueError)
+    def test_invalid_prefix(self):
+        table = self._ipv4_table(self.PREFIXES)
+        table.covered('10.0.0.0/33')
+
+    @raises(NotImplementedError)
+    def test_prefix_lookup_unsupported(self):
+        table = RtcTable(mock.MagicMock(), mock.MagicMock())
+        table.covered('65000:65000:1')
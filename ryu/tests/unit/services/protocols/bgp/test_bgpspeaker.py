@@ -1086,3 +1086,25 @@ class Test_BGPSpeaker(unittest.TestCase):
         # Check
         mock_call.assert_called_with(
             'flowspec.del_local', **expected_kwargs)
+
+    @mock.patch(
+        'ryu.services.protocols.bgp.bgpspeaker.BGPSpeaker.__init__',
+        mock.MagicMock(return_value=None))
+    @mock.patch('ryu.services.protocols.bgp.bgpspeaker.call')
+    def test_rib_get_prefix(self, mock_call):
+        # Prepare test data
+        family = 'ipv4'
+        prefix = '10.0.0.0/8'
+
+        expected_kwargs = {
+            'params': ['rib', family, prefix],
+            'format': 'json',
+        }
+
+        # Test
+        speaker = bgpspeaker.BGPSpeaker(65000, '10.0.0.1')
+        speaker.rib_get(family=family, prefix=prefix)
+
+        # Check
+        mock_call.assert_called_with(
+            'operator.show', **expected_kwargs)
@@ -21,9 +21,14 @@ except ImportError:
     from unittest import mock  # Python 3
 
 from nose.tools import eq_
+from nose.tools import ok_
 
 from ryu.lib.packet import bgp
 from ryu.services.protocols.bgp import peer
+from ryu.services.protocols.bgp.info_base.ipv4 import Ipv4Path
+from ryu.services.protocols.bgp.model import OutgoingRoute
+from ryu.services.protocols.bgp.update_group import UpdateGroup
+from ryu.services.protocols.bgp.utils.bgp import create_end_of_rib_update
 
 
 LOG = logging.getLogger(__name__)
@@ -373,3 +378,89 @@ class Test_Peer(unittest.TestCase):
         self._test_extract_and_reconstruct_as_path(
             path_attributes, ex_as_path_value,
             ex_aggregator_as_number, ex_aggregator_addr)
+
+    def _ipv4_path(self, prefix, is_withdraw=False):
+        nlri = bgp.IPAddrPrefix(24, prefix)
+        if is_withdraw:
+            return Ipv4Path(None, nlri, 1, is_withdraw=True)
+        pattrs = {
+            bgp.BGP_ATTR_TYPE_ORIGIN: bgp.BGPPathAttributeOrigin(0),
+            bgp.BGP_ATTR_TYPE_AS_PATH: bgp.BGPPathAttributeAsPath([[65000]]),
+        }
+        return Ipv4Path(None, nlri, 1, pattrs=pattrs, nexthop='10.0.0.1')
+
+    def _construct_update(self, outgoing_route):
+        path = outgoing_route.path
+        if path.is_withdraw:
+            return bgp.BGPUpdate(withdrawn_routes=[path.nlri])
+        attrs = [
+            bgp.BGPPathAttributeOrigin(0),
+            bgp.BGPPathAttributeAsPath([[65001, 65000]]),
+            bgp.BGPPathAttributeNextHop('192.168.0.1'),
+        ]
+        return bgp.BGPUpdate(path_attributes=attrs, nlri=[path.nlri])
+
+    @mock.patch.object(
+        peer.Peer, '__init__', mock.MagicMock(return_value=None))
+    def test_send_outgoing_routes(self):
+        _peer = peer.Peer(None, None, None, None, None)
+        _peer.version_num = 1
+        _peer._adj_rib_out = {}
+        _peer._signal_bus = mock.MagicMock()
+        _peer._core_service = mock.MagicMock()
+        _peer._protocol = mock.MagicMock()
+        _peer.state = mock.MagicMock()
+        _peer._update_group = UpdateGroup(None)
+        _peer._update_group.add_peer(_peer)
+        _peer._construct_update = self._construct_update
+        _peer._apply_out_filter = lambda path: (
+            (path.nlri.formatted_nlri_str == '10.0.9.0/24', None))
+
+        outgoing_routes = [
+            OutgoingRoute(self._ipv4_path('10.0.0.0')),
+            OutgoingRoute(self._ipv4_path('10.0.1.0')),
+            OutgoingRoute(self._ipv4_path('10.0.9.0')),
+            OutgoingRoute(self._ipv4_path('10.0.2.0')),
+            # supersedes the first one
+            OutgoingRoute(self._ipv4_path('10.0.0.0', is_withdraw=True)),
+        ]
+
+        # Test
+        _peer._send_outgoing_routes(outgoing_routes)
+
+        # Adj-RIB-Out keeps the last route of each prefix.
+        eq_(['10.0.0.0/24', '10.0.1.0/24', '10.0.2.0/24', '10.0.9.0/24'],
+            sorted(_peer._adj_rib_out.keys()))
+        ok_(_peer._adj_rib_out['10.0.0.0/24'].path.is_withdraw)
+        ok_(_peer._adj_rib_out['10.0.9.0/24'].filtered)
+        eq_(5, _peer._signal_bus.adj_rib_out_changed.call_count)
+        # Sent routes are remembered for the non-withdrawn paths only.
+        tm = _peer._core_service.table_manager
+        eq_(4, tm.remember_sent_route.call_count)
+
+        # One message for the announced prefixes and one for the withdrawn.
+        sent = [c[0][0] for c in _peer._protocol.send.call_args_list]
+        eq_(2, len(sent))
+        eq_(['10.0.1.0/24', '10.0.2.0/24'],
+            [n.formatted_nlri_str for n in sent[0].nlri])
+        eq_(['10.0.0.0/24'],
+            [n.formatted_nlri_str for n in sent[1].withdrawn_routes])
+        eq_(2, _peer.state.incr.call_count)
+
+    @mock.patch.object(
+        peer.Peer, '__init__', mock.MagicMock(return_value=None))
+    def test_pop_outgoing_routes(self):
+        _peer = peer.Peer(None, None, None, None, None)
+        _peer.outgoing_msg_list = peer.Peer.OutgoingMsgList()
+        routes = [OutgoingRoute(self._ipv4_path('10.0.%d.0' % i))
+                  for i in range(4)]
+        eor = create_end_of_rib_update()
+        for msg in routes[1:3] + [eor, routes[3]]:
+            _peer.outgoing_msg_list.append(msg)
+
+        # Test
+        popped = _peer._pop_outgoing_routes(routes[0])
+
+        # The routes after EOR are left in the queue.
+        eq_(routes[:3], popped)
+        eq_([eor, routes[3]], list(_peer.outgoing_msg_list))
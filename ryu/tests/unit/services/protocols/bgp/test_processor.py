@@ -0,0 +1,222 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections import OrderedDict
+import itertools
+import logging
+import random
+import unittest
+try:
+    import mock  # Python 2
+except ImportError:
+    from unittest import mock  # Python 3
+
+from nose.tools import eq_, ok_
+
+from ryu.lib.packet import bgp
+from ryu.services.protocols.bgp import processor
+from ryu.services.protocols.bgp.info_base.ipv4 import Ipv4Path
+from ryu.services.protocols.bgp.operator.command import STATUS_OK
+from ryu.services.protocols.bgp.operator.commands.show import ShowCmd
+from ryu.services.protocols.bgp.operator.internal_api import InternalApi
+from ryu.services.protocols.bgp.utils import stats
+
+
+LOG = logging.getLogger(__name__)
+
+LOCAL_ASN = 65000
+LOCAL_BGP_ID = '10.0.0.100'
+
+
+class _Dest(object):
+    route_family = bgp.RF_IPv4_UC
+
+    def __init__(self):
+        self.processed = 0
+
+    def process(self):
+        self.processed += 1
+
+
+class Test_BgpProcessor(unittest.TestCase):
+    """
+    Test case for bgp.processor.BgpProcessor
+    """
+
+    def test_enqueue(self):
+        bgp_processor = processor.BgpProcessor(mock.MagicMock())
+        dests = [_Dest() for _ in range(3)]
+        for dest in dests:
+            bgp_processor.enqueue(dest)
+        # Already queued
+        bgp_processor.enqueue(dests[0])
+
+        eq_(3, bgp_processor.queue_depth)
+        eq_(3, bgp_processor.max_queue_depth)
+
+        # Test
+        bgp_processor._process_dest()
+
+        eq_([1, 1, 1], [d.processed for d in dests])
+        eq_(0, bgp_processor.queue_depth)
+        summary = bgp_processor.get_stats_summary_dict()
+        eq_(0, summary[stats.PROCESSOR_QUEUE_DEPTH])
+        eq_(3, summary[stats.PROCESSOR_MAX_QUEUE_DEPTH])
+        eq_(1, summary[stats.PROCESSOR_CYCLES])
+        eq_(3, summary[stats.PROCESSOR_DEST_PROCESSED])
+
+    def test_show_processor(self):
+        bgp_processor = processor.BgpProcessor(mock.MagicMock())
+        bgp_processor.enqueue(_Dest())
+        api = InternalApi()
+        api.get_core_service = mock.MagicMock()
+        api.get_core_service().bgp_processor = bgp_processor
+
+        # Test
+        resp = ShowCmd.Processor(api).action([])
+
+        eq_(STATUS_OK, resp.status)
+        eq_(bgp_processor.get_stats_summary_dict(), resp.value)
+        eq_(1, resp.value[stats.PROCESSOR_QUEUE_DEPTH])
+
+    def test_process_dest_work_units(self):
+        bgp_processor = processor.BgpProcessor(mock.MagicMock(),
+                                               work_units_per_cycle=2)
+        for _ in range(5):
+            bgp_processor.enqueue(_Dest())
+
+        # Test
+        bgp_processor._process_dest()
+
+        eq_(3, bgp_processor.queue_depth)
+        eq_(2, bgp_processor.work_units_per_cycle)
+
+    def test_adapt_work_units(self):
+        bgp_processor = processor.BgpProcessor(mock.MagicMock())
+        eq_(processor.BgpProcessor.MAX_DEST_PROCESSED_PER_CYCLE,
+            bgp_processor.work_units_per_cycle)
+
+        # 0.1 msec per destination
+        bgp_processor._end_cycle(100, 0.01)
+        eq_(int(processor.BgpProcessor.TARGET_CYCLE_TIME / 0.0001),
+            bgp_processor.work_units_per_cycle)
+        eq_(0.01, bgp_processor.last_cycle_time)
+
+        # Slow destinations
+        for _ in range(50):
+            bgp_processor._end_cycle(10, 1.0)
+        eq_(processor.BgpProcessor.MIN_WORK_UNITS_PER_CYCLE,
+            bgp_processor.work_units_per_cycle)
+        eq_(1.0, bgp_processor.max_cycle_time)
+
+        # Fast destinations
+        for _ in range(50):
+            bgp_processor._end_cycle(1000, 0.0)
+        eq_(processor.BgpProcessor.MAX_WORK_UNITS_PER_CYCLE,
+            bgp_processor.work_units_per_cycle)
+
+    def test_fixed_work_units(self):
+        bgp_processor = processor.BgpProcessor(mock.MagicMock(),
+                                               work_units_per_cycle=50)
+
+        # Test
+        bgp_processor._end_cycle(10, 1.0)
+
+        eq_(50, bgp_processor.work_units_per_cycle)
+        eq_(1, bgp_processor.cycles)
+
+
+class Test_BestPathKey(unittest.TestCase):
+    """
+    Test case for best path keys of bgp.processor
+    """
+
+    def _source(self, remote_as, bgp_id):
+        source = mock.MagicMock()
+        source.remote_as = remote_as
+        source.protocol.recv_open_msg.bgp_identifier = bgp_id
+        source.protocol.sent_open_msg.bgp_identifier = LOCAL_BGP_ID
+        return source
+
+    def _path(self, source, local_pref=None, as_path_len=1,
+              origin=bgp.BGP_ATTR_ORIGIN_IGP, med=None, originator_id=None,
+              cluster_list_len=0):
+        pattrs = OrderedDict()
+        pattrs[bgp.BGP_ATTR_TYPE_ORIGIN] = bgp.BGPPathAttributeOrigin(origin)
+        pattrs[bgp.BGP_ATTR_TYPE_AS_PATH] = bgp.BGPPathAttributeAsPath(
+            [list(range(65100, 65100 + as_path_len))])
+        if local_pref is not None:
+            pattrs[bgp.BGP_ATTR_TYPE_LOCAL_PREF] = \
+                bgp.BGPPathAttributeLocalPref(local_pref)
+        if med is not None:
+            pattrs[bgp.BGP_ATTR_TYPE_MULTI_EXIT_DISC] = \
+                bgp.BGPPathAttributeMultiExitDisc(med)
+        if originator_id is not None:
+            pattrs[bgp.BGP_ATTR_TYPE_ORIGINATOR_ID] = \
+                bgp.BGPPathAttributeOriginatorId(originator_id)
+        if cluster_list_len:
+            pattrs[bgp.BGP_ATTR_TYPE_CLUSTER_LIST] = \
+                bgp.BGPPathAttributeClusterList(
+                    ['10.0.1.%d' % i for i in range(cluster_list_len)])
+        return Ipv4Path(source, bgp.IPAddrPrefix(24, '192.168.0.0'), 0,
+                        pattrs=pattrs, nexthop='192.0.2.1')
+
+    def _key(self, path):
+        return processor.best_path_key(LOCAL_ASN, LOCAL_BGP_ID, path)
+
+    def test_interned(self):
+        source = self._source(65001, '10.0.0.1')
+        path1 = self._path(source, med=10)
+        path2 = self._path(source, med=10)
+        path3 = self._path(source, med=20)
+
+        ok_(self._key(path1) is self._key(path2))
+        ok_(self._key(path1) is not self._key(path3))
+        ok_(path1.get_best_path_key(LOCAL_ASN, LOCAL_BGP_ID) is
+            path2.get_best_path_key(LOCAL_ASN, LOCAL_BGP_ID))
+
+    def test_local_pref_only_if_both(self):
+        source1 = self._source(LOCAL_ASN, '10.0.0.1')
+        source2 = self._source(LOCAL_ASN, '10.0.0.2')
+        path1 = self._path(source1, local_pref=200, as_path_len=2)
+        path2 = self._path(source2, as_path_len=1)
+
+        eq_((path2, processor.BPR_ASPATH),
+            processor.compute_best_path_by_key(
+                path1, self._key(path1), path2, self._key(path2)))
+
+    def test_same_as_compute_best_path(self):
+        rand = random.Random(0)
+        sources = [None,
+                   self._source(LOCAL_ASN, '10.0.0.1'),
+                   self._source(LOCAL_ASN, '10.0.0.2'),
+                   self._source(65001, '10.0.0.3'),
+                   self._source(65002, '10.0.0.4')]
+        paths = []
+        for _ in range(60):
+            paths.append(self._path(
+                rand.choice(sources),
+                local_pref=rand.choice([None, 100, 200]),
+                as_path_len=rand.randint(1, 2),
+                origin=rand.choice([bgp.BGP_ATTR_ORIGIN_IGP,
+                                    bgp.BGP_ATTR_ORIGIN_INCOMPLETE]),
+                med=rand.choice([None, 0, 10]),
+                originator_id=rand.choice([None, '10.0.0.5']),
+                cluster_list_len=rand.randint(0, 1)))
+
+        for path1, path2 in itertools.permutations(paths, 2):
+            eq_(processor.compute_best_path(LOCAL_ASN, path1, path2),
+                processor.compute_best_path_by_key(
+                    path1, self._key(path1), path2, self._key(path2)))
@@ -0,0 +1,122 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import unittest
+try:
+    import mock  # Python 2
+except ImportError:
+    from unittest import mock  # Python 3
+
+from nose.tools import eq_
+from nose.tools import raises
+
+from ryu.lib.packet import bgp
+from ryu.services.protocols.bgp import speaker
+
+
+LOG = logging.getLogger(__name__)
+
+
+class _Socket(object):
+    def __init__(self, chunks):
+        self.chunks = list(chunks)
+
+    def setsockopt(self, *args):
+        pass
+
+    def getpeername(self):
+        return ('192.0.2.1', 179)
+
+    def getsockname(self):
+        return ('192.0.2.2', 50000)
+
+    def close(self):
+        pass
+
+    def recv_into(self, buffer, nbytes=0):
+        if not self.chunks:
+            return 0
+        chunk = self.chunks.pop(0)
+        buffer[:len(chunk)] = chunk
+        return len(chunk)
+
+
+class Test_BgpProtocol(unittest.TestCase):
+    """
+    Test case for speaker.BgpProtocol
+    """
+
+    def _updates(self, count):
+        return [bgp.BGPUpdate(
+            path_attributes=[bgp.BGPPathAttributeOrigin(0),
+                             bgp.BGPPathAttributeAsPath([[65000]]),
+                             bgp.BGPPathAttributeNextHop('192.0.2.1')],
+            nlri=[bgp.IPAddrPrefix(24, '10.0.%d.0' % i)])
+            for i in range(count)]
+
+    def _protocol(self, chunks):
+        protocol = speaker.BgpProtocol(_Socket(chunks), mock.MagicMock())
+        protocol._handle_msg = mock.MagicMock()
+        protocol.connection_lost = mock.MagicMock()
+        return protocol
+
+    def _received_nlri(self, protocol):
+        return [c[0][0].nlri[0].formatted_nlri_str
+                for c in protocol._handle_msg.call_args_list
+                if c[0][0].type == bgp.BGP_MSG_UPDATE]
+
+    def test_recv_loop(self):
+        msgs = self._updates(100) + [bgp.BGPKeepAlive()]
+        data = b''.join(bytes(m.serialize()) for m in msgs)
+        # split messages across reads
+        chunks = [data[i:i + 1000] for i in range(0, len(data), 1000)]
+        protocol = self._protocol(chunks)
+
+        # Test
+        protocol._recv_loop()
+
+        eq_(101, protocol._handle_msg.call_count)
+        eq_(['10.0.%d.0/24' % i for i in range(100)],
+            self._received_nlri(protocol))
+        eq_(bgp.BGP_MSG_KEEPALIVE,
+            protocol._handle_msg.call_args_list[-1][0][0].type)
+        protocol.connection_lost.assert_called_once_with(
+            'Peer closed connection')
+
+    def test_data_received(self):
+        data = b''.join(bytes(m.serialize()) for m in self._updates(3))
+        protocol = self._protocol([])
+
+        # Test
+        protocol.data_received(data[:10])
+        eq_(0, protocol._handle_msg.call_count)
+        protocol.data_received(data[10:-1])
+        eq_(2, protocol._handle_msg.call_count)
+        protocol.data_received(data[-1:])
+
+        eq_(['10.0.0.0/24', '10.0.1.0/24', '10.0.2.0/24'],
+            self._received_nlri(protocol))
+        eq_(0, len(protocol._recv_buff))
+
+    @raises(bgp.NotSync)
+    def test_data_received_bad_marker(self):
+        data = bytearray(bgp.BGPKeepAlive().serialize())
+        data[0] = 0
+        protocol = self._protocol([])
+        protocol.send_notification = mock.MagicMock()
+
+        # Test
+        protocol.data_received(bytes(data))
@@ -0,0 +1,167 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import unittest
+try:
+    import mock  # Python 2
+except ImportError:
+    from unittest import mock  # Python 3
+
+from nose.tools import eq_
+from nose.tools import ok_
+
+from ryu.lib.packet import bgp
+from ryu.services.protocols.bgp.core_managers.peer_manager import PeerManager
+from ryu.services.protocols.bgp.info_base.ipv4 import Ipv4Path
+from ryu.services.protocols.bgp.model import OutgoingRoute
+from ryu.services.protocols.bgp.update_group import UpdateGroup
+
+
+LOG = logging.getLogger(__name__)
+
+
+class Test_UpdateGroup(unittest.TestCase):
+    """
+    Test case for update_group.UpdateGroup
+    """
+
+    def setUp(self):
+        self._peers = 0
+
+    def _peer(self, block=False):
+        self._peers += 1
+        peer = mock.MagicMock()
+        peer.ip_address = '10.0.0.%d' % self._peers
+        peer._apply_out_filter.return_value = (block, None)
+        peer._construct_update.side_effect = lambda route: bgp.BGPUpdate(
+            path_attributes=[bgp.BGPPathAttributeOrigin(0),
+                             bgp.BGPPathAttributeAsPath([[65000]]),
+                             bgp.BGPPathAttributeNextHop('192.0.2.1')],
+            nlri=[route.path.nlri])
+        return peer
+
+    def _route(self, prefix):
+        pattrs = {
+            bgp.BGP_ATTR_TYPE_ORIGIN: bgp.BGPPathAttributeOrigin(0),
+            bgp.BGP_ATTR_TYPE_AS_PATH: bgp.BGPPathAttributeAsPath([[65000]]),
+        }
+        path = Ipv4Path(None, bgp.IPAddrPrefix(24, prefix), 1,
+                        pattrs=pattrs, nexthop='10.0.0.1')
+        return OutgoingRoute(path)
+
+    def test_construct_update(self):
+        group = UpdateGroup(None)
+        peer1 = self._peer()
+        peer2 = self._peer()
+        group.add_peer(peer1)
+        group.add_peer(peer2)
+        route = self._route('10.0.0.0')
+
+        # Test
+        block1, _, update1 = group.construct_update(peer1, route)
+        # Another OutgoingRoute of the same path for the other member.
+        block2, _, update2 = group.construct_update(
+            peer2, OutgoingRoute(route.path))
+
+        ok_(not block1)
+        ok_(not block2)
+        ok_(update1 is update2)
+        eq_(1, peer1._construct_update.call_count)
+        eq_(0, peer2._construct_update.call_count)
+        eq_(1, group.constructed)
+        eq_(1, group.reused)
+
+    def test_construct_update_blocked(self):
+        group = UpdateGroup(None)
+        peer = self._peer(block=True)
+        group.add_peer(peer)
+
+        # Test
+        block, _, update = group.construct_update(peer, self._route('10.0.0.0'))
+
+        ok_(block)
+        eq_(None, update)
+        eq_(0, peer._construct_update.call_count)
+
+    def test_construct_update_single_peer(self):
+        group = UpdateGroup(None)
+        peer = self._peer()
+        group.add_peer(peer)
+        route = self._route('10.0.0.0')
+
+        # Test
+        group.construct_update(peer, route)
+        group.construct_update(peer, route)
+
+        # Nothing is cached for a group of one peer.
+        eq_(2, peer._construct_update.call_count)
+        eq_(0, group.reused)
+
+    def test_pack_updates(self):
+        group = UpdateGroup(None)
+        peer1 = self._peer()
+        peer2 = self._peer()
+        group.add_peer(peer1)
+        group.add_peer(peer2)
+        updates = [group.construct_update(peer1, self._route(p))[2]
+                   for p in ('10.0.0.0', '10.0.1.0')]
+
+        # Test
+        packed1 = group.pack_updates(list(updates), 4096)
+        packed2 = group.pack_updates(list(updates), 4096)
+
+        eq_(1, len(packed1))
+        ok_(packed1 is packed2)
+        msg, buf = packed1[0]
+        eq_(bytes(msg.serialize()), buf)
+        eq_(2, len(msg.nlri))
+
+    def test_remove_peer(self):
+        group = UpdateGroup(None)
+        peer1 = self._peer()
+        peer2 = self._peer()
+        group.add_peer(peer1)
+        group.add_peer(peer2)
+        route = self._route('10.0.0.0')
+        group.construct_update(peer1, route)
+
+        # Test
+        group.remove_peer(peer2)
+        group.add_peer(peer2)
+        group.construct_update(peer2, route)
+
+        # Cache is cleared when the group has only one member.
+        eq_(1, peer2._construct_update.call_count)
+
+    def test_peer_manager(self):
+        peer_manager = PeerManager(mock.MagicMock(), mock.MagicMock())
+        peer1 = self._peer()
+        peer2 = self._peer()
+        peer3 = self._peer()
+
+        # Test
+        group1 = peer_manager.join_update_group(peer1, ('a',))
+        group2 = peer_manager.join_update_group(peer2, ('a',))
+        group3 = peer_manager.join_update_group(peer3, ('b',))
+
+        ok_(group1 is group2)
+        ok_(group1 is not group3)
+        eq_(set([peer1, peer2]), group1.peers)
+        eq_('UpdateGroup(peers: 10.0.0.1, 10.0.0.2)', str(group1))
+        eq_(2, len(peer_manager.update_groups))
+
+        peer_manager.leave_update_group(peer3, group3)
+        eq_([group1], peer_manager.update_groups)
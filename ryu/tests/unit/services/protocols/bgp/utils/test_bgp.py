@@ -17,9 +17,21 @@
 import logging
 import unittest
 
-from nose.tools import eq_, raises
+from nose.tools import eq_, ok_, raises
 
 from ryu.lib.packet.bgp import (
+    BGPUpdate,
+    BGPPathAttributeOrigin,
+    BGPPathAttributeAsPath,
+    BGPPathAttributeNextHop,
+    BGPPathAttributeMultiExitDisc,
+    BGPPathAttributeMpReachNLRI,
+    BGPPathAttributeMpUnreachNLRI,
+    IPAddrPrefix,
+    IP6AddrPrefix,
+    BGP_ATTR_TYPE_MP_REACH_NLRI,
+    BGP_ATTR_TYPE_MP_UNREACH_NLRI,
+    BGP_ATTR_TYPE_MULTI_EXIT_DISC,
     BGPFlowSpecTrafficRateCommunity,
     BGPFlowSpecTrafficActionCommunity,
     BGPFlowSpecRedirectCommunity,
@@ -32,6 +44,8 @@ from ryu.services.protocols.bgp.core import BgpCoreError
 from ryu.services.protocols.bgp.utils.bgp import create_v4flowspec_actions
 from ryu.services.protocols.bgp.utils.bgp import create_v6flowspec_actions
 from ryu.services.protocols.bgp.utils.bgp import create_l2vpnflowspec_actions
+from ryu.services.protocols.bgp.utils.bgp import create_end_of_rib_update
+from ryu.services.protocols.bgp.utils.bgp import pack_updates
 
 
 LOG = logging.getLogger(__name__)
@@ -209,3 +223,95 @@ class Test_Utils_BGP(unittest.TestCase):
         }
         expected_communities = []
         self._test_create_l2vpnflowspec_actions(actions, expected_communities)
+
+    def _ipv4_update(self, prefix, med=100):
+        attrs = [
+            BGPPathAttributeOrigin(0),
+            BGPPathAttributeAsPath([[65000]]),
+            BGPPathAttributeNextHop('10.0.0.1'),
+            BGPPathAttributeMultiExitDisc(med),
+        ]
+        return BGPUpdate(path_attributes=attrs,
+                         nlri=[IPAddrPrefix(24, prefix)])
+
+    def _ipv6_update(self, prefix):
+        attrs = [
+            BGPPathAttributeOrigin(0),
+            BGPPathAttributeAsPath([[65000]]),
+            BGPPathAttributeMpReachNLRI(
+                2, 1, ['2001:db8::1'], [IP6AddrPrefix(64, prefix)]),
+        ]
+        return BGPUpdate(path_attributes=attrs)
+
+    def test_pack_updates_nlri(self):
+        updates = [self._ipv4_update('10.1.%d.0' % i) for i in range(10)]
+        updates += [self._ipv4_update('10.2.%d.0' % i, med=200)
+                    for i in range(5)]
+
+        packed = pack_updates(updates, 4096)
+
+        eq_(2, len(packed))
+        eq_(['10.1.%d.0/24' % i for i in range(10)],
+            [n.formatted_nlri_str for n in packed[0].nlri])
+        eq_(str(updates[0].path_attributes), str(packed[0].path_attributes))
+        eq_(['10.2.%d.0/24' % i for i in range(5)],
+            [n.formatted_nlri_str for n in packed[1].nlri])
+        eq_(200, packed[1].get_path_attr(
+            BGP_ATTR_TYPE_MULTI_EXIT_DISC).value)
+
+    def test_pack_updates_max_len(self):
+        updates = [self._ipv4_update('10.%d.%d.0' % (i // 256, i % 256))
+                   for i in range(3000)]
+
+        packed = pack_updates(updates, 4096)
+
+        ok_(len(packed) > 1)
+        eq_(3000, sum(len(u.nlri) for u in packed))
+        for update in packed:
+            ok_(len(update.serialize()) <= 4096)
+            # All but the last messages should be full.
+            if update is not packed[-1]:
+                ok_(len(update.serialize()) > 4096 - 4)
+
+    def test_pack_updates_withdrawn_routes(self):
+        updates = [BGPUpdate(withdrawn_routes=[IPAddrPrefix(24, '10.%d.0.0' % i)])
+                   for i in range(3)]
+
+        packed = pack_updates(updates, 4096)
+
+        eq_(1, len(packed))
+        eq_(3, len(packed[0].withdrawn_routes))
+        eq_([], packed[0].path_attributes)
+
+    def test_pack_updates_mp_reach_nlri(self):
+        updates = [self._ipv6_update('2001:db8:%x::' % i)
+                   for i in range(1, 1001)]
+
+        packed = pack_updates(updates, 4096)
+
+        ok_(len(packed) > 1)
+        prefixes = []
+        for update in packed:
+            ok_(len(update.serialize()) <= 4096)
+            mp_reach = update.get_path_attr(BGP_ATTR_TYPE_MP_REACH_NLRI)
+            eq_('2001:db8::1', mp_reach.next_hop)
+            prefixes.extend(mp_reach.nlri)
+        eq_(['2001:db8:%x::/64' % i for i in range(1, 1001)],
+            [n.formatted_nlri_str for n in prefixes])
+        # The original attributes are not modified.
+        eq_(1, len(updates[0].get_path_attr(
+            BGP_ATTR_TYPE_MP_REACH_NLRI).nlri))
+
+    def test_pack_updates_mp_unreach_nlri_and_eor(self):
+        eor = create_end_of_rib_update()
+        updates = [
+            BGPUpdate(path_attributes=[BGPPathAttributeMpUnreachNLRI(
+                2, 1, [IP6AddrPrefix(64, '2001:db8:%x::' % i)])])
+            for i in range(3)]
+
+        packed = pack_updates(updates + [eor], 4096)
+
+        eq_(2, len(packed))
+        mp_unreach = packed[0].get_path_attr(BGP_ATTR_TYPE_MP_UNREACH_NLRI)
+        eq_(3, len(mp_unreach.withdrawn_routes))
+        ok_(packed[1] is eor)
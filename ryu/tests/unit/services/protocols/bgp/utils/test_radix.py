@@ -0,0 +1,178 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import random
+import unittest
+
+from nose.tools import eq_, ok_, raises
+
+from ryu.lib.packet.bgp import _RouteDistinguisher
+from ryu.services.protocols.bgp.utils import radix
+
+
+LOG = logging.getLogger(__name__)
+
+
+def _key(prefix):
+    addr, length = prefix.split('/')
+    return radix.ipv4_prefix_key(addr, int(length))
+
+
+def _prefix(key):
+    bits, length = key
+    return '%d.%d.%d.%d/%d' % ((bits >> 24) & 0xff, (bits >> 16) & 0xff,
+                               (bits >> 8) & 0xff, bits & 0xff, length)
+
+
+class Test_Utils_Radix(unittest.TestCase):
+    """
+    Test case for ryu.services.protocols.bgp.utils.radix
+    """
+
+    PREFIXES = ['0.0.0.0/0', '10.0.0.0/8', '10.0.0.0/16', '10.0.0.0/24',
+                '10.1.0.0/16', '10.1.128.0/17', '11.0.0.0/8',
+                '192.168.0.0/16', '192.168.1.0/24']
+
+    def _tree(self, prefixes):
+        tree = radix.RadixTree(radix.IPV4_WIDTH)
+        for prefix in prefixes:
+            tree[_key(prefix)] = prefix
+        return tree
+
+    def test_ipv4_prefix_key(self):
+        eq_((0x0a000000, 8), radix.ipv4_prefix_key('10.1.2.3', 8))
+        eq_((0xc0a80100, 24), radix.ipv4_prefix_key('192.168.1.0', 24))
+
+    def test_ipv6_prefix_key(self):
+        eq_((0x20010db8 << 96, 32), radix.ipv6_prefix_key('2001:db8::1', 32))
+
+    def test_rd_prefix_key(self):
+        rd = _RouteDistinguisher.from_str('65000:100')
+        eq_(((65000 << 32 | 100) << 32 | 0x0a000000, 72),
+            radix.rd_prefix_key(rd, _key('10.0.0.0/8'), radix.IPV4_WIDTH))
+
+    def test_mapping(self):
+        tree = self._tree(reversed(self.PREFIXES))
+
+        eq_(len(self.PREFIXES), len(tree))
+        eq_(self.PREFIXES, list(tree.values()))
+        eq_(self.PREFIXES, [_prefix(k) for k in tree.keys()])
+        eq_('10.1.0.0/16', tree[_key('10.1.0.0/16')])
+        ok_(_key('10.1.0.0/16') in tree)
+        # 10.0.0.0/12 is only a branching point
+        ok_(_key('10.0.0.0/12') not in tree)
+        eq_(None, tree.get(_key('10.0.0.0/15')))
+        eq_('x', tree.get(_key('10.2.0.0/16'), 'x'))
+
+    def test_set_masks_host_bits(self):
+        tree = self._tree(['10.0.0.0/8'])
+        tree[(0x0a010203, 8)] = 'masked'
+
+        eq_(1, len(tree))
+        eq_('masked', tree[_key('10.0.0.0/8')])
+
+    @raises(ValueError)
+    def test_set_bad_length(self):
+        tree = radix.RadixTree(radix.IPV4_WIDTH)
+        tree[(0, 33)] = None
+
+    @raises(KeyError)
+    def test_getitem_missing(self):
+        tree = self._tree(self.PREFIXES)
+        tree[_key('10.0.0.0/12')]
+
+    def test_delete(self):
+        tree = self._tree(self.PREFIXES)
+
+        eq_('10.0.0.0/16', tree.pop(_key('10.0.0.0/16')))
+        del tree[_key('0.0.0.0/0')]
+        del tree[_key('10.1.0.0/16')]
+        eq_(None, tree.pop(_key('10.1.0.0/16'), None))
+
+        expected = [p for p in self.PREFIXES
+                    if p not in ('0.0.0.0/0', '10.0.0.0/16', '10.1.0.0/16')]
+        eq_(len(expected), len(tree))
+        eq_(expected, list(tree.values()))
+        for prefix in expected:
+            del tree[_key(prefix)]
+        eq_(0, len(tree))
+        eq_({}, tree._root.children)
+
+    @raises(KeyError)
+    def test_delete_missing(self):
+        tree = self._tree(self.PREFIXES)
+        del tree[_key('10.0.0.0/12')]
+
+    def test_longest_match(self):
+        tree = self._tree(self.PREFIXES)
+
+        eq_('10.0.0.0/24', tree.longest_match(_key('10.0.0.1/32'))[1])
+        eq_('10.0.0.0/16', tree.longest_match(_key('10.0.1.1/32'))[1])
+        eq_('10.1.128.0/17', tree.longest_match(_key('10.1.200.0/24'))[1])
+        eq_('10.0.0.0/8', tree.longest_match(_key('10.0.0.0/8'))[1])
+        eq_('0.0.0.0/0', tree.longest_match(_key('172.16.0.0/12'))[1])
+        del tree[_key('0.0.0.0/0')]
+        eq_(None, tree.longest_match(_key('172.16.0.0/12')))
+
+    def test_covering(self):
+        tree = self._tree(self.PREFIXES)
+
+        eq_(['0.0.0.0/0', '10.0.0.0/8', '10.1.0.0/16', '10.1.128.0/17'],
+            [v for _, v in tree.covering(_key('10.1.128.0/17'))])
+        eq_(['0.0.0.0/0', '192.168.0.0/16'],
+            [v for _, v in tree.covering(_key('192.168.2.0/24'))])
+
+    def test_covered(self):
+        tree = self._tree(self.PREFIXES)
+
+        eq_(['10.0.0.0/8', '10.0.0.0/16', '10.0.0.0/24', '10.1.0.0/16',
+             '10.1.128.0/17'],
+            [v for _, v in tree.covered(_key('10.0.0.0/8'))])
+        eq_(['10.1.0.0/16', '10.1.128.0/17'],
+            [v for _, v in tree.covered(_key('10.1.0.0/16'))])
+        eq_([], list(tree.covered(_key('10.2.0.0/16'))))
+        eq_(self.PREFIXES, [v for _, v in tree.covered(_key('0.0.0.0/0'))])
+
+    def test_random(self):
+        rand = random.Random(0)
+        tree = radix.RadixTree(radix.IPV4_WIDTH)
+        ref = {}
+        for _ in range(2000):
+            length = rand.randint(0, 32)
+            key = (radix.mask_bits(rand.getrandbits(32), length, 32), length)
+            if rand.random() < 0.7:
+                tree[key] = ref[key] = length
+            else:
+                eq_(ref.pop(key, None), tree.pop(key, None))
+
+        eq_(len(ref), len(tree))
+        eq_(sorted(ref, key=lambda k: bin(k[0] | 1 << 32)[3:3 + k[1]]),
+            list(tree.keys()))
+        for key, value in ref.items():
+            eq_(value, tree[key])
+
+        for _ in range(200):
+            length = rand.randint(0, 32)
+            key = (radix.mask_bits(rand.getrandbits(32), length, 32), length)
+            covering = [k for k in ref
+                        if k[1] <= length and
+                        radix.mask_bits(key[0], k[1], 32) == k[0]]
+            eq_(sorted(covering, key=lambda k: k[1]),
+                [k for k, _ in tree.covering(key)])
+            covered = [k for k in ref
+                       if k[1] >= length and
+                       radix.mask_bits(k[0], length, 32) == key[0]]
+            eq_(sorted(covered), sorted(k for k, _ in tree.covered(key)))
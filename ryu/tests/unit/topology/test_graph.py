@@ -0,0 +1,171 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from nose.tools import eq_
+from nose.tools import ok_
+
+from ryu.ofproto import ofproto_v1_3
+from ryu.ofproto import ofproto_v1_3_parser
+from ryu.topology import event
+from ryu.topology import graph
+from ryu.topology import switches
+
+
+class _Datapath(object):
+    ofproto = ofproto_v1_3
+
+    def __init__(self, dpid):
+        self.id = dpid
+
+
+def _ofpport(port_no):
+    return ofproto_v1_3_parser.OFPPort(
+        port_no, '00:00:00:00:00:01', b'eth%d' % port_no, 0, 0, 0, 0, 0, 0,
+        0, 0)
+
+
+def _port(dpid, port_no):
+    return switches.Port(dpid, ofproto_v1_3, _ofpport(port_no))
+
+
+class Test_TopologyGraph(unittest.TestCase):
+    """ Test case for ryu.topology.graph.TopologyGraph
+    """
+
+    def setUp(self):
+        # The handlers do not need RyuApp.__init__().
+        self.graph = graph.TopologyGraph.__new__(graph.TopologyGraph)
+        self.graph._clear()
+        for dpid in range(1, 6):
+            self._switch_enter(dpid)
+
+    def _switch_enter(self, dpid):
+        switch = switches.Switch(_Datapath(dpid))
+        for port_no in range(1, 5):
+            switch.add_port(_ofpport(port_no))
+        self.graph._switch_enter_handler(event.EventSwitchEnter(switch))
+
+    def _link(self, src, src_port, dst, dst_port, add=True):
+        link = switches.Link(_port(src, src_port), _port(dst, dst_port))
+        if add:
+            self.graph._link_add_handler(event.EventLinkAdd(link))
+        else:
+            self.graph._link_delete_handler(event.EventLinkDelete(link))
+        return link
+
+    def _bilink(self, src, src_port, dst, dst_port, add=True):
+        self._link(src, src_port, dst, dst_port, add)
+        self._link(dst, dst_port, src, src_port, add)
+
+    def test_query(self):
+        link = self._link(1, 1, 2, 1)
+        eq_(5, len(self.graph.switches()))
+        eq_(4, len(self.graph.ports(1)))
+        eq_([2], list(self.graph.neighbors(1)))
+        eq_({}, dict(self.graph.neighbors(2)))
+        eq_(link, self.graph.port_link(1, 1))
+        eq_([link], self.graph.links(1))
+        eq_(None, self.graph.port_link(2, 1))
+
+        ports = self.graph.ports(1)
+        self.graph._port_delete_handler(event.EventPortDelete(_port(1, 4)))
+        eq_(3, len(self.graph.ports(1)))
+        # The returned ports and the Switch of the event are not modified
+        eq_(4, len(ports))
+        eq_(4, len(self.graph.switch(1).ports))
+
+        host = switches.Host('00:00:00:00:00:0a', _port(1, 3))
+        self.graph._host_add_handler(event.EventHostAdd(host))
+        eq_(host, self.graph.host(host.mac))
+        eq_([host], self.graph.hosts(1))
+        eq_([], self.graph.hosts(2))
+
+    def test_read_only(self):
+        self._link(1, 1, 2, 1)
+        neighbors = self.graph.neighbors(1)
+        try:
+            neighbors[3] = {}
+        except TypeError:
+            pass
+        eq_([2], list(self.graph.neighbors(1)))
+
+    def test_shortest_path(self):
+        # 1 - 2 - 3 - 4,  5 isolated
+        self._bilink(1, 1, 2, 1)
+        self._bilink(2, 2, 3, 1)
+        self._bilink(3, 2, 4, 1)
+        eq_((1, 2, 3, 4), self.graph.shortest_path(1, 4))
+        eq_((4, 3, 2, 1), self.graph.shortest_path(4, 1))
+        eq_((1,), self.graph.shortest_path(1, 1))
+        eq_(None, self.graph.shortest_path(1, 5))
+        eq_(3, self.graph.distance(1, 4))
+        eq_(self.graph.port_link(1, 1), self.graph.next_hop(1, 4))
+        eq_(None, self.graph.next_hop(1, 1))
+        eq_([self.graph.port_link(1, 1), self.graph.port_link(2, 2),
+             self.graph.port_link(3, 2)], self.graph.path_links(1, 4))
+
+        # The short cut 1 - 4
+        self._bilink(1, 2, 4, 2)
+        eq_((1, 4), self.graph.shortest_path(1, 4))
+        eq_(2, self.graph.distance(1, 3))
+
+        self._bilink(1, 2, 4, 2, add=False)
+        eq_((1, 2, 3, 4), self.graph.shortest_path(1, 4))
+
+    def test_invalidate(self):
+        self._bilink(1, 1, 2, 1)
+        self._bilink(2, 2, 3, 1)
+        self.graph.shortest_path(1, 3)
+        self.graph.shortest_path(4, 4)
+        eq_(2, self.graph.stats()['trees'])
+        self.graph.shortest_path(1, 2)
+        eq_(1, self.graph.path_hits)
+
+        # A link among the unreachable switches doesn't change the trees.
+        self._bilink(4, 1, 5, 1)
+        eq_(1, self.graph.invalidations)  # only the tree from 4
+        eq_((1, 2, 3), self.graph.shortest_path(1, 3))
+
+        # A parallel link doesn't either.
+        self._bilink(1, 3, 2, 3)
+        eq_(1, self.graph.invalidations)
+
+        # Nor does deleting one of the parallel links.
+        self._bilink(1, 1, 2, 1, add=False)
+        eq_(1, self.graph.invalidations)
+        eq_((1, 2, 3), self.graph.shortest_path(1, 3))
+        eq_(self.graph.port_link(1, 3), self.graph.next_hop(1, 3))
+
+        # A link not in the tree doesn't.
+        self._bilink(3, 2, 4, 2)
+        self.graph.shortest_path(1, 3)
+        invalidations = self.graph.invalidations
+        self._link(3, 2, 4, 2, add=False)
+        self._link(4, 2, 3, 2, add=False)
+        eq_(invalidations + 1, self.graph.invalidations)
+        eq_((1, 2, 3), self.graph.shortest_path(1, 3))
+
+    def test_switch_leave(self):
+        self._bilink(1, 1, 2, 1)
+        self._bilink(2, 2, 3, 1)
+        eq_((1, 2, 3), self.graph.shortest_path(1, 3))
+        switch = self.graph.switch(2)
+        self.graph._switch_leave_handler(event.EventSwitchLeave(switch))
+        eq_(None, self.graph.switch(2))
+        eq_(None, self.graph.shortest_path(1, 3))
+        eq_([], self.graph.links())
+        ok_(2 not in self.graph.neighbors(1))
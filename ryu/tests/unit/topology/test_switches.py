@@ -0,0 +1,189 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+import unittest
+
+from nose.tools import eq_
+from nose.tools import ok_
+
+from ryu.ofproto import ofproto_v1_3
+from ryu.ofproto import ofproto_v1_3_parser
+from ryu.topology import switches
+
+
+class _Datapath(object):
+    ofproto = ofproto_v1_3
+    ofproto_parser = ofproto_v1_3_parser
+
+    def __init__(self, dpid):
+        self.id = dpid
+        self.xid = 0
+        self.sent = []
+
+    def next_xid(self):
+        self.xid += 1
+        return self.xid
+
+    def send(self, buf):
+        self.sent.append(bytes(buf))
+
+
+def _port(dpid, port_no, hw_addr='00:00:00:00:00:01', state=0):
+    ofpport = ofproto_v1_3_parser.OFPPort(
+        port_no, hw_addr, b'eth%d' % port_no, 0, state, 0, 0, 0, 0, 0, 0)
+    return switches.Port(dpid, ofproto_v1_3, ofpport)
+
+
+class Test_PortDataState(unittest.TestCase):
+    """ Test case for ryu.topology.switches.PortDataState
+    """
+
+    def test_schedule(self):
+        ports = switches.PortDataState(0.5)
+        p1 = _port(1, 1)
+        p2 = _port(1, 2)
+        ports.add_port(p1, b'')
+        ports.add_port(p2, b'')
+        now = time.time()
+        eq_(set([p1, p2]), set(ports.expired(now)))
+        ports.lldp_sent(p1)
+        ports.lldp_sent(p2)
+        eq_([], ports.expired(now))
+        ports.move_front(p2)
+        eq_([p2], ports.expired(time.time()))
+        ok_(ports.next_timeout(time.time()) <= 0.5)
+        eq_([p1], ports.expired(time.time() + 0.5))
+
+    def test_del_port(self):
+        ports = switches.PortDataState(0.5)
+        p1 = _port(1, 1)
+        ports.add_port(p1, b'')
+        ports.del_port(p1)
+        eq_([], ports.expired(time.time() + 1))
+        eq_(None, ports.next_timeout(time.time()))
+
+
+class Test_Switches(unittest.TestCase):
+    """ Test case for ryu.topology.switches.Switches
+    """
+
+    def setUp(self):
+        # Only the LLDP part of the application is tested, which does not
+        # need RyuApp.__init__().
+        self.app = switches.Switches.__new__(switches.Switches)
+        self.app.dps = {}
+        self.app.ports = switches.PortDataState(
+            self.app.LLDP_SEND_PERIOD_PER_PORT)
+        self.app.lldp_pacers = {}
+        self.dp = _Datapath(1)
+        self.app.dps[1] = self.dp
+        self.port = _port(1, 1)
+        self.app._port_added(self.port)
+
+    def test_send_lldp_packet(self):
+        self.app.send_lldp_packet(self.port)
+        self.app.send_lldp_packet(self.port)
+        eq_(2, len(self.dp.sent))
+
+        parser = ofproto_v1_3_parser
+        out = parser.OFPPacketOut(
+            self.dp, buffer_id=ofproto_v1_3.OFP_NO_BUFFER,
+            in_port=ofproto_v1_3.OFPP_CONTROLLER,
+            actions=[parser.OFPActionOutput(1)],
+            data=self.app.ports.get_port(self.port).lldp_data)
+        out.xid = 1
+        out.serialize()
+        eq_(bytes(out.buf), self.dp.sent[0])
+        # Only xid differs.
+        eq_(self.dp.sent[0][8:], self.dp.sent[1][8:])
+        eq_(self.dp.sent[0][:4], self.dp.sent[1][:4])
+        ok_(self.dp.sent[0][4:8] != self.dp.sent[1][4:8])
+
+    def test_invalidate_on_modify(self):
+        self.app.send_lldp_packet(self.port)
+        port_data = self.app.ports.get_port(self.port)
+        ok_(port_data.packet_out is not None)
+        port = _port(1, 1, hw_addr='00:00:00:00:00:02')
+        port_data.set_lldp_data(self.app._lldp_data(port))
+        eq_(None, port_data.packet_out)
+        self.app.send_lldp_packet(port)
+        ok_(self.dp.sent[0][8:] != self.dp.sent[1][8:])
+
+    def test_down_port(self):
+        port = _port(1, 1, state=ofproto_v1_3.OFPPS_LINK_DOWN)
+        self.app.ports.set_down(port)
+        self.app.send_lldp_packet(port)
+        eq_([], self.dp.sent)
+
+    def test_pacer(self):
+        pacer = switches._Pacer(10., 2)
+        eq_(0, pacer.reserve(0))
+        eq_(0, pacer.reserve(0))
+        ok_(abs(pacer.reserve(0) - 0.1) < 1e-9)
+        ok_(abs(pacer.reserve(0) - 0.2) < 1e-9)
+        # The reserved packets are paid first.
+        ok_(abs(pacer.reserve(0.2) - 0.1) < 1e-9)
+
+
+class Test_LinkState(unittest.TestCase):
+    """ Test case for ryu.topology.switches.LinkState
+    """
+
+    def setUp(self):
+        self.links = switches.LinkState(10)
+        self.p1 = _port(1, 1)
+        self.p2 = _port(2, 1)
+        self.p3 = _port(3, 1)
+
+    def test_update_link(self):
+        ok_(not self.links.update_link(self.p1, self.p2))
+        ok_(self.links.update_link(self.p2, self.p1))
+        eq_(self.p2, self.links.get_peer(self.p1))
+        eq_(2, len(self.links))
+
+    def test_expired(self):
+        self.links.update_link(self.p1, self.p2)
+        self.links.update_link(self.p2, self.p1)
+        now = time.time()
+        eq_([], self.links.expired(now))
+        eq_(0, self.links.checked)
+        expired = self.links.expired(now + 21)
+        eq_(set([switches.Link(self.p1, self.p2),
+                 switches.Link(self.p2, self.p1)]), set(expired))
+        # Expired links are reported until they are deleted or updated.
+        eq_(2, len(self.links.expired(now + 21)))
+        self.links.link_down(switches.Link(self.p1, self.p2))
+        self.links.update_link(self.p2, self.p1)
+        eq_([], self.links.expired(now + 1))
+        eq_(1, len(self.links.expired(now + 21)))
+
+    def test_rev_link_set_timestamp(self):
+        self.links.update_link(self.p1, self.p2)
+        self.links.update_link(self.p2, self.p1)
+        now = time.time()
+        rev_link = switches.Link(self.p2, self.p1)
+        self.links.rev_link_set_timestamp(rev_link, now - 10)
+        eq_([rev_link], self.links.expired(now + 1))
+
+    def test_port_deleted(self):
+        self.links.update_link(self.p1, self.p2)
+        self.links.update_link(self.p2, self.p1)
+        self.links.update_link(self.p3, self.p1)
+        self.links.port_deleted(self.p1)
+        eq_([switches.Link(self.p3, self.p1)],
+            self.links.expired(time.time() + 21))
+        eq_({}, dict((k, v) for k, v in self.links._bucket_of.items()
+                     if k not in self.links))
@@ -0,0 +1,372 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Topology graph with cached shortest paths.
+
+TopologyGraph keeps the switches, the links and the hosts discovered by
+ryu.topology.switches in an adjacency index updated from the topology
+events, so that applications can query the topology in-process, without
+the request/reply round trip of ryu.topology.api and without copying the
+whole topology for every query.
+
+Shortest paths (in hops) are computed on demand by a breadth first search
+from the source switch, and the search tree is cached for the following
+queries from the same source.  When a link is added, only the trees which
+the new link makes shorter are discarded; when a link is deleted, only the
+trees which use it.
+
+Example::
+
+    from ryu.base import app_manager
+    from ryu.topology import graph
+
+    app_manager.require_app('ryu.topology.graph')
+
+    class MyRouter(app_manager.RyuApp):
+        def _route(self, src_dpid, dst_dpid):
+            topo = graph.get_graph()
+            link = topo.next_hop(src_dpid, dst_dpid)
+            if link is not None:
+                return link.src.port_no
+
+The objects returned by the queries (Switch, Port, Link and Host of
+ryu.topology.switches) are shared with TopologyGraph and must not be
+modified.  Start ryu-manager with --observe-links to discover links.
+"""
+
+import collections
+import logging
+
+from ryu.base import app_manager
+from ryu.controller.handler import set_ev_cls
+from ryu.topology import event
+
+try:
+    from types import MappingProxyType as _readonly
+except ImportError:
+    # Python 2
+    _readonly = dict
+
+LOG = logging.getLogger(__name__)
+
+NAME = 'topology_graph'
+
+
+def get_graph():
+    """
+    Returns the TopologyGraph instance, or None if it is not running.
+    """
+    return app_manager.lookup_service_brick(NAME)
+
+
+class _Tree(object):
+    # The result of a breadth first search from src.
+    def __init__(self, src, dist, parent):
+        self.src = src
+        self.dist = dist      # dpid -> hops from src
+        self.parent = parent  # dpid -> the previous dpid on the path
+        self.paths = {}       # dpid -> path from src (cache)
+
+
+class TopologyGraph(app_manager.RyuApp):
+    def __init__(self, *args, **kwargs):
+        super(TopologyGraph, self).__init__(*args, **kwargs)
+        self.name = NAME
+        self._clear()
+
+    def _clear(self):
+        self._switches = {}   # dpid -> Switch
+        self._ports = {}      # dpid -> {port_no: Port}
+        # dpid -> {peer dpid: {src port_no: Link}}
+        self._adj = {}
+        self._links = {}      # (dpid, port_no) -> Link from the port
+        self._hosts = {}      # mac -> Host
+        self._trees = {}      # dpid -> _Tree
+        # counters
+        self.path_hits = 0
+        self.path_misses = 0
+        self.invalidations = 0
+
+    #
+    # Event handlers
+    #
+
+    @set_ev_cls([event.EventSwitchEnter, event.EventSwitchReconnected])
+    def _switch_enter_handler(self, ev):
+        switch = ev.switch
+        dpid = switch.dp.id
+        self._switches[dpid] = switch
+        self._ports[dpid] = dict((port.port_no, port)
+                                 for port in switch.ports)
+        self._adj.setdefault(dpid, {})
+
+    @set_ev_cls(event.EventSwitchLeave)
+    def _switch_leave_handler(self, ev):
+        dpid = ev.switch.dp.id
+        self._switches.pop(dpid, None)
+        self._ports.pop(dpid, None)
+        for peers in list(self._adj.get(dpid, {}).values()):
+            for link in list(peers.values()):
+                self._del_link(link)
+        for link in [l for l in self._links.values()
+                     if l.dst.dpid == dpid]:
+            self._del_link(link)
+        self._adj.pop(dpid, None)
+        self._invalidate([t for t in self._trees.values()
+                          if dpid in t.dist])
+
+    @set_ev_cls([event.EventPortAdd, event.EventPortModify])
+    def _port_add_handler(self, ev):
+        port = ev.port
+        ports = self._ports.get(port.dpid)
+        if ports is None:
+            return
+        ports[port.port_no] = port
+
+    @set_ev_cls(event.EventPortDelete)
+    def _port_delete_handler(self, ev):
+        port = ev.port
+        ports = self._ports.get(port.dpid)
+        if ports is not None:
+            ports.pop(port.port_no, None)
+
+    @set_ev_cls(event.EventLinkAdd)
+    def _link_add_handler(self, ev):
+        self._add_link(ev.link)
+
+    @set_ev_cls(event.EventLinkDelete)
+    def _link_delete_handler(self, ev):
+        self._del_link(ev.link)
+
+    @set_ev_cls(event.EventHostAdd)
+    def _host_add_handler(self, ev):
+        self._hosts[ev.host.mac] = ev.host
+
+    @set_ev_cls(event.EventHostMove)
+    def _host_move_handler(self, ev):
+        self._hosts[ev.dst.mac] = ev.dst
+
+    @set_ev_cls(event.EventHostDelete)
+    def _host_delete_handler(self, ev):
+        self._hosts.pop(ev.host.mac, None)
+
+    #
+    # Index maintenance
+    #
+
+    def _invalidate(self, trees):
+        for tree in trees:
+            if self._trees.pop(tree.src, None) is not None:
+                self.invalidations += 1
+
+    def _add_link(self, link):
+        src = link.src.dpid
+        dst = link.dst.dpid
+        key = (src, link.src.port_no)
+        old = self._links.get(key)
+        if old is not None:
+            if old == link:
+                return
+            self._del_link(old)
+        self._links[key] = link
+        peers = self._adj.setdefault(src, {})
+        self._adj.setdefault(dst, {})
+        if dst in peers:
+            # A parallel link doesn't change the distances.
+            peers[dst][link.src.port_no] = link
+            return
+        peers[dst] = {link.src.port_no: link}
+        # Discard the trees to which the link gives a shorter path.
+        self._invalidate([t for t in self._trees.values()
+                          if src in t.dist and
+                          (dst not in t.dist or
+                           t.dist[src] + 1 < t.dist[dst])])
+
+    def _del_link(self, link):
+        src = link.src.dpid
+        dst = link.dst.dpid
+        key = (src, link.src.port_no)
+        if self._links.get(key) != link:
+            return
+        del self._links[key]
+        peers = self._adj[src]
+        del peers[dst][link.src.port_no]
+        if peers[dst]:
+            # Parallel links remain.
+            return
+        del peers[dst]
+        # Discard the trees using the link.
+        self._invalidate([t for t in self._trees.values()
+                          if t.parent.get(dst) == src])
+
+    def _tree(self, src):
+        tree = self._trees.get(src)
+        if tree is not None:
+            self.path_hits += 1
+            return tree
+        self.path_misses += 1
+        dist = {src: 0}
+        parent = {}
+        queue = collections.deque([src])
+        adj = self._adj
+        while queue:
+            dpid = queue.popleft()
+            hops = dist[dpid] + 1
+            for peer in adj.get(dpid, ()):
+                if peer not in dist:
+                    dist[peer] = hops
+                    parent[peer] = dpid
+                    queue.append(peer)
+        tree = _Tree(src, dist, parent)
+        self._trees[src] = tree
+        return tree
+
+    #
+    # Query API
+    #
+
+    def switch(self, dpid):
+        """
+        Returns the Switch of dpid, or None.
+        """
+        return self._switches.get(dpid)
+
+    def switches(self):
+        """
+        Returns a read-only mapping of dpid to Switch.
+        """
+        return _readonly(self._switches)
+
+    def ports(self, dpid):
+        """
+        Returns a dict of port_no to Port of dpid, updated by the port
+        events unlike the ports of the Switch, which are those the switch
+        entered with.
+        """
+        return dict(self._ports.get(dpid, {}))
+
+    def neighbors(self, dpid):
+        """
+        Returns a read-only mapping of the dpids of the switches linked
+        from dpid to the sets of the links, as mappings of the source
+        port_no to Link.
+        """
+        return _readonly(self._adj.get(dpid, {}))
+
+    def links(self, dpid=None):
+        """
+        Returns the list of the links from dpid, or all links if dpid is
+        None.
+        """
+        if dpid is None:
+            return list(self._links.values())
+        return [link for peers in self._adj.get(dpid, {}).values()
+                for link in peers.values()]
+
+    def link(self, src, dst):
+        """
+        Returns a Link from src dpid to dst dpid (the one with the lowest
+        source port number), or None.
+        """
+        links = self._adj.get(src, {}).get(dst)
+        if not links:
+            return None
+        return links[min(links)]
+
+    def port_link(self, dpid, port_no):
+        """
+        Returns the Link from the port, or None.
+        """
+        return self._links.get((dpid, port_no))
+
+    def host(self, mac):
+        """
+        Returns the Host of mac, or None.
+        """
+        return self._hosts.get(mac)
+
+    def hosts(self, dpid=None):
+        """
+        Returns the list of the hosts attached to dpid, or all hosts if
+        dpid is None.
+        """
+        if dpid is None:
+            return list(self._hosts.values())
+        return [host for host in self._hosts.values()
+                if host.port.dpid == dpid]
+
+    def shortest_path(self, src, dst):
+        """
+        Returns a shortest path from src dpid to dst dpid as a tuple of
+        dpids including src and dst, or None if dst is unreachable.
+        """
+        tree = self._tree(src)
+        path = tree.paths.get(dst)
+        if path is not None:
+            return path
+        if dst not in tree.dist:
+            return None
+        path = [dst]
+        while path[-1] != src:
+            path.append(tree.parent[path[-1]])
+        path = tuple(reversed(path))
+        tree.paths[dst] = path
+        return path
+
+    def path_links(self, src, dst):
+        """
+        Returns the links along shortest_path(src, dst) as a list, or None
+        if dst is unreachable.
+        """
+        path = self.shortest_path(src, dst)
+        if path is None:
+            return None
+        return [self.link(path[i], path[i + 1])
+                for i in range(len(path) - 1)]
+
+    def next_hop(self, src, dst):
+        """
+        Returns the first Link on a shortest path from src dpid to dst
+        dpid, or None if dst is src or unreachable.
+        """
+        tree = self._tree(src)
+        if dst == src or dst not in tree.dist:
+            return None
+        hop = dst
+        while tree.parent[hop] != src:
+            hop = tree.parent[hop]
+        return self.link(src, hop)
+
+    def distance(self, src, dst):
+        """
+        Returns the number of hops from src dpid to dst dpid, or None if
+        dst is unreachable.
+        """
+        return self._tree(src).dist.get(dst)
+
+    def stats(self):
+        return {
+            'switches': len(self._switches),
+            'links': len(self._links),
+            'hosts': len(self._hosts),
+            'trees': len(self._trees),
+            'path_hits': self.path_hits,
+            'path_misses': self.path_misses,
+            'invalidations': self.invalidations,
+        }
+
+
+app_manager.require_app('ryu.topology.switches')
@@ -26,6 +26,7 @@ from ryu.controller.handler import set_ev_cls
 from ryu.controller.handler import MAIN_DISPATCHER, DEAD_DISPATCHER
 from ryu.exception import RyuException
 from ryu.lib import addrconv, hub
+from ryu.lib import timer_wheel
 from ryu.lib.mac import DONTCARE_STR
 from ryu.lib.dpid import dpid_to_str, str_to_dpid
 from ryu.lib.port_no import port_no_to_str
@@ -140,6 +141,7 @@ class Link(object):
         super(Link, self).__init__()
         self.src = src
         self.dst = dst
+        self._hash = None
 
     def to_dict(self):
         d = {'src': self.src.to_dict(),
@@ -154,7 +156,9 @@ class Link(object):
         return not self.__eq__(other)
 
     def __hash__(self):
-        return hash((self.src, self.dst))
+        if self._hash is None:
+            self._hash = hash((self.src, self.dst))
+        return self._hash
 
     def __str__(self):
         return 'Link: %s to %s' % (self.src, self.dst)
@@ -249,6 +253,10 @@ class PortData(object):
         self.lldp_data = lldp_data
         self.timestamp = None
         self.sent = 0
+        # (Datapath, serialized PACKET_OUT of lldp_data) for send_lldp_packet
+        self.packet_out = None
+        # True if the next LLDP was delayed by the pacing of the datapath
+        self.paced = False
 
     def lldp_sent(self):
         self.timestamp = time.time()
@@ -266,6 +274,10 @@ class PortData(object):
     def set_down(self, is_down):
         self.is_down = is_down
 
+    def set_lldp_data(self, lldp_data):
+        self.lldp_data = lldp_data
+        self.packet_out = None
+
     def __str__(self):
         return 'PortData<live=%s, timestamp=%s, sent=%d>' \
             % (not self.is_down, self.timestamp, self.sent)
@@ -273,53 +285,31 @@ class PortData(object):
 
 class PortDataState(dict):
     # dict: Port class -> PortData class
-    # slimed down version of OrderedDict as python 2.6 doesn't support it.
-    _PREV = 0
-    _NEXT = 1
-    _KEY = 2
+    # The time to send the next LLDP of each port is kept in a timer wheel;
+    # the ports without timestamp are due immediately.
 
-    def __init__(self):
+    def __init__(self, period):
         super(PortDataState, self).__init__()
-        self._root = root = []  # sentinel node
-        root[:] = [root, root, None]  # [_PREV, _NEXT, _KEY] doubly linked list
-        self._map = {}
-
-    def _remove_key(self, key):
-        link_prev, link_next, key = self._map.pop(key)
-        link_prev[self._NEXT] = link_next
-        link_next[self._PREV] = link_prev
-
-    def _append_key(self, key):
-        root = self._root
-        last = root[self._PREV]
-        last[self._NEXT] = root[self._PREV] = self._map[key] = [last, root,
-                                                                key]
-
-    def _prepend_key(self, key):
-        root = self._root
-        first = root[self._NEXT]
-        first[self._PREV] = root[self._NEXT] = self._map[key] = [root, first,
-                                                                 key]
+        self.period = period
+        self._wheel = timer_wheel.TimerWheel()
 
-    def _move_last_key(self, key):
-        self._remove_key(key)
-        self._append_key(key)
-
-    def _move_front_key(self, key):
-        self._remove_key(key)
-        self._prepend_key(key)
+    def _schedule_now(self, port):
+        self._wheel.schedule(port, time.time())
 
     def add_port(self, port, lldp_data):
         if port not in self:
-            self._prepend_key(port)
             self[port] = PortData(port.is_down(), lldp_data)
+            self._schedule_now(port)
         else:
-            self[port].is_down = port.is_down()
+            port_data = self[port]
+            port_data.is_down = port.is_down()
+            port_data.set_lldp_data(lldp_data)
 
     def lldp_sent(self, port):
         port_data = self[port]
         port_data.lldp_sent()
-        self._move_last_key(port)
+        port_data.paced = False
+        self._wheel.schedule(port, port_data.timestamp + self.period)
         return port_data
 
     def lldp_received(self, port):
@@ -329,76 +319,161 @@ class PortDataState(dict):
         port_data = self.get(port, None)
         if port_data is not None:
             port_data.clear_timestamp()
-            self._move_front_key(port)
+            port_data.paced = False
+            self._schedule_now(port)
 
     def set_down(self, port):
         is_down = port.is_down()
         port_data = self[port]
         port_data.set_down(is_down)
         port_data.clear_timestamp()
+        port_data.packet_out = None
         if not is_down:
-            self._move_front_key(port)
+            port_data.paced = False
+            self._schedule_now(port)
         return is_down
 
+    def defer(self, port, when):
+        """
+        Delay the next LLDP of port until when, which the pacing of the
+        datapath allows.
+        """
+        self[port].paced = True
+        self._wheel.schedule(port, when)
+
+    def expired(self, now):
+        """
+        Returns the list of the ports whose next LLDP is due.
+        """
+        return [port for port in self._wheel.pop_expired(now)
+                if port in self]
+
+    def next_timeout(self, now):
+        """
+        Returns the seconds until the next LLDP is due, or None.
+        """
+        return self._wheel.next_timeout(now)
+
     def get_port(self, port):
         return self[port]
 
     def del_port(self, port):
         del self[port]
-        self._remove_key(port)
-
-    def __iter__(self):
-        root = self._root
-        curr = root[self._NEXT]
-        while curr is not root:
-            yield curr[self._KEY]
-            curr = curr[self._NEXT]
+        self._wheel.cancel(port)
 
     def clear(self):
-        for node in self._map.values():
-            del node[:]
-        root = self._root
-        root[:] = [root, root, None]
-        self._map.clear()
+        self._wheel.clear()
         dict.clear(self)
 
     def items(self):
-        'od.items() -> list of (key, value) pairs in od'
-        return [(key, self[key]) for key in self]
+        return list(dict.items(self))
 
     def iteritems(self):
-        'od.iteritems -> an iterator over the (key, value) pairs in od'
-        for k in self:
-            yield (k, self[k])
+        return iter(dict.items(self))
 
 
 class LinkState(dict):
     # dict: Link class -> timestamp
-    def __init__(self):
+    # The links are also indexed by their timestamps in buckets of
+    # timeout / 2 seconds so that expired() visits only the buckets old
+    # enough to contain expired links, rather than all links.  A link
+    # moves to another bucket at most once per bucket, not on every update.
+    # Deleted links are removed from the index lazily by expired().
+
+    def __init__(self, timeout):
         super(LinkState, self).__init__()
         self._map = {}
+        self._links = {}      # src Port class -> the last Link class from it
+        self.timeout = timeout
+        self._width = timeout / 2.
+        self._buckets = {}    # bucket number -> {Link class: None}
+        self._bucket_of = {}  # Link class -> bucket number
+        # counters
+        self.checked = 0      # links visited by expired()
+        self.moves = 0        # moves of links between the buckets
+
+    def _index(self, link, timestamp):
+        bucket = timestamp // self._width
+        old = self._bucket_of.get(link)
+        if old == bucket:
+            return
+        if old is not None:
+            self._unindex(link, old)
+        self._buckets.setdefault(bucket, {})[link] = None
+        self._bucket_of[link] = bucket
+        self.moves += 1
+
+    def _unindex(self, link, bucket):
+        links = self._buckets[bucket]
+        del links[link]
+        if not links:
+            del self._buckets[bucket]
+
+    def expired(self, now):
+        """
+        Returns the list of the links which have not been updated for
+        timeout.
+        """
+        cutoff = now - self.timeout
+        last = cutoff // self._width
+        expired = []
+        for bucket in [b for b in self._buckets if b <= last]:
+            links = self._buckets[bucket]
+            self.checked += len(links)
+            for link in list(links):
+                timestamp = self.get(link)
+                if timestamp is None:
+                    del self._bucket_of[link]
+                    self._unindex(link, bucket)
+                elif timestamp < cutoff:
+                    expired.append(link)
+                else:
+                    self._index(link, timestamp)
+        return expired
+
+    def stats(self):
+        return {
+            'links': len(self),
+            'buckets': len(self._buckets),
+            'checked': self.checked,
+            'moves': self.moves,
+        }
 
     def get_peer(self, src):
         return self._map.get(src, None)
 
+    def _get_link(self, src, dst):
+        # Reuse the Link instance so that its hash is computed once.
+        link = self._links.get(src)
+        if link is None or link.dst != dst:
+            link = Link(src, dst)
+            self._links[src] = link
+        return link
+
     def update_link(self, src, dst):
-        link = Link(src, dst)
+        link = self._get_link(src, dst)
 
-        self[link] = time.time()
+        self[link] = timestamp = time.time()
         self._map[src] = dst
+        if self._bucket_of.get(link) != timestamp // self._width:
+            self._index(link, timestamp)
 
         # return if the reverse link is also up or not
-        rev_link = Link(dst, src)
+        rev_link = self._links.get(dst)
+        if rev_link is None or rev_link.dst != src:
+            rev_link = Link(dst, src)
         return rev_link in self
 
     def link_down(self, link):
         del self[link]
         del self._map[link.src]
+        self._links.pop(link.src, None)
 
     def rev_link_set_timestamp(self, rev_link, timestamp):
         # rev_link may or may not in LinkSet
         if rev_link in self:
             self[rev_link] = timestamp
+            self._index(rev_link, timestamp)
 
     def port_deleted(self, src):
         dst = self.get_peer(src)
@@ -409,9 +484,11 @@ class LinkState(dict):
         rev_link = Link(dst, src)
         del self[link]
         del self._map[src]
+        self._links.pop(src, None)
         # reverse link might not exist
         self.pop(rev_link, None)
         rev_link_dst = self._map.pop(dst, None)
+        self._links.pop(dst, None)
 
         return dst, rev_link_dst
 
@@ -493,6 +570,28 @@ class LLDPPacket(object):
         return src_dpid, src_port_no
 
 
+class _Pacer(object):
+    # Token bucket limiting the rate of LLDP packets sent to a datapath.
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.last = None
+
+    def reserve(self, now):
+        """
+        Reserve a packet and return the seconds to wait before sending it.
+        """
+        if self.last is not None:
+            self.tokens = min(self.burst,
+                              self.tokens + (now - self.last) * self.rate)
+        self.last = now
+        self.tokens -= 1
+        if self.tokens >= 0:
+            return 0
+        return -self.tokens / self.rate
+
+
 class Switches(app_manager.RyuApp):
     OFP_VERSIONS = [ofproto_v1_0.OFP_VERSION, ofproto_v1_2.OFP_VERSION,
                     ofproto_v1_3.OFP_VERSION, ofproto_v1_4.OFP_VERSION]
@@ -502,12 +601,17 @@ class Switches(app_manager.RyuApp):
                event.EventPortModify,
                event.EventLinkAdd, event.EventLinkDelete,
                event.EventHostAdd]
+    # Links between the datapaths of different worker processes can not be
+    # discovered.
+    GLOBAL_VIEW = True
 
     DEFAULT_TTL = 120  # unused. ignored.
     LLDP_PACKET_LEN = len(LLDPPacket.lldp_packet(0, 0, DONTCARE_STR, 0))
 
-    LLDP_SEND_GUARD = .05
     LLDP_SEND_PERIOD_PER_PORT = .9
+    # LLDP packets are paced per datapath (packets per second and burst)
+    LLDP_SEND_RATE_PER_DP = 100.
+    LLDP_SEND_BURST_PER_DP = 10
     TIMEOUT_CHECK_PERIOD = 5.
     LINK_TIMEOUT = TIMEOUT_CHECK_PERIOD * 2
     LINK_LLDP_DROP = 5
@@ -518,8 +622,10 @@ class Switches(app_manager.RyuApp):
         self.name = 'switches'
         self.dps = {}                 # datapath_id => Datapath class
         self.port_state = {}          # datapath_id => ports
-        self.ports = PortDataState()  # Port class -> PortData class
-        self.links = LinkState()      # Link class -> timestamp
+        # Port class -> PortData class
+        self.ports = PortDataState(self.LLDP_SEND_PERIOD_PER_PORT)
+        self.lldp_pacers = {}         # datapath_id => _Pacer
+        self.links = LinkState(self.LINK_TIMEOUT)  # Link class -> timestamp
         self.hosts = HostState()      # mac address -> Host class list
         self.is_active = True
 
@@ -553,6 +659,7 @@ class Switches(app_manager.RyuApp):
             if (self.dps[dp.id] == dp):
                 del self.dps[dp.id]
                 del self.port_state[dp.id]
+                self.lldp_pacers.pop(dp.id, None)
 
     def _get_switch(self, dpid):
         if dpid in self.dps:
@@ -568,10 +675,12 @@ class Switches(app_manager.RyuApp):
                 if p.port_no == port_no:
                     return p
 
-    def _port_added(self, port):
-        lldp_data = LLDPPacket.lldp_packet(
+    def _lldp_data(self, port):
+        return LLDPPacket.lldp_packet(
             port.dpid, port.port_no, port.hw_addr, self.DEFAULT_TTL)
-        self.ports.add_port(port, lldp_data)
+
+    def _port_added(self, port):
+        self.ports.add_port(port, self._lldp_data(port))
         # LOG.debug('_port_added dpid=%s, port_no=%s, live=%s',
         #           port.dpid, port.port_no, port.is_live())
 
@@ -745,6 +854,10 @@ class Switches(app_manager.RyuApp):
 
             port = self._get_port(dp.id, ofpport.port_no)
             if port and not port.is_reserved():
+                port_data = self.ports.get(port)
+                if port_data is not None:
+                    # hw_addr may have changed
+                    port_data.set_lldp_data(self._lldp_data(port))
                 if self.ports.set_down(port):
                     self._link_down(port)
                 self.lldp_event.set()
@@ -890,6 +1003,35 @@ class Switches(app_manager.RyuApp):
             ipv6_pkt, _, _ = pkt_type.parser(pkt_data)
             self.hosts.update_ip(host, ip_v6=ipv6_pkt.src)
 
+    @staticmethod
+    def _lldp_packet_out(dp, port, port_data):
+        # The PACKET_OUT is serialized once per port and datapath.
+        cache = port_data.packet_out
+        if cache is not None and cache[0] is dp:
+            return cache[1]
+
+        # TODO:XXX
+        if dp.ofproto.OFP_VERSION == ofproto_v1_0.OFP_VERSION:
+            actions = [dp.ofproto_parser.OFPActionOutput(port.port_no)]
+            out = dp.ofproto_parser.OFPPacketOut(
+                datapath=dp, buffer_id=0xffffffff,
+                in_port=dp.ofproto.OFPP_NONE, actions=actions,
+                data=port_data.lldp_data)
+        elif dp.ofproto.OFP_VERSION >= ofproto_v1_2.OFP_VERSION:
+            actions = [dp.ofproto_parser.OFPActionOutput(port.port_no)]
+            out = dp.ofproto_parser.OFPPacketOut(
+                datapath=dp, in_port=dp.ofproto.OFPP_CONTROLLER,
+                buffer_id=dp.ofproto.OFP_NO_BUFFER, actions=actions,
+                data=port_data.lldp_data)
+        else:
+            LOG.error('cannot send lldp packet. unsupported version. %x',
+                      dp.ofproto.OFP_VERSION)
+            return None
+        out.xid = 0
+        out.serialize()
+        port_data.packet_out = (dp, bytes(out.buf))
+        return port_data.packet_out[1]
+
     def send_lldp_packet(self, port):
         try:
             port_data = self.ports.lldp_sent(port)
@@ -906,50 +1048,37 @@ class Switches(app_manager.RyuApp):
             return
 
         # LOG.debug('lldp sent dpid=%s, port_no=%d', dp.id, port.port_no)
-        # TODO:XXX
-        if dp.ofproto.OFP_VERSION == ofproto_v1_0.OFP_VERSION:
-            actions = [dp.ofproto_parser.OFPActionOutput(port.port_no)]
-            dp.send_packet_out(actions=actions, data=port_data.lldp_data)
-        elif dp.ofproto.OFP_VERSION >= ofproto_v1_2.OFP_VERSION:
-            actions = [dp.ofproto_parser.OFPActionOutput(port.port_no)]
-            out = dp.ofproto_parser.OFPPacketOut(
-                datapath=dp, in_port=dp.ofproto.OFPP_CONTROLLER,
-                buffer_id=dp.ofproto.OFP_NO_BUFFER, actions=actions,
-                data=port_data.lldp_data)
-            dp.send_msg(out)
-        else:
-            LOG.error('cannot send lldp packet. unsupported version. %x',
-                      dp.ofproto.OFP_VERSION)
+        buf = self._lldp_packet_out(dp, port, port_data)
+        if buf is None:
+            return
+        buf = bytearray(buf)
+        struct.pack_into('!I', buf, 4, dp.next_xid())
+        dp.send(buf)
+
+    def _lldp_pacer(self, dpid):
+        pacer = self.lldp_pacers.get(dpid)
+        if pacer is None:
+            pacer = _Pacer(self.LLDP_SEND_RATE_PER_DP,
+                           self.LLDP_SEND_BURST_PER_DP)
+            self.lldp_pacers[dpid] = pacer
+        return pacer
 
     def lldp_loop(self):
         while self.is_active:
             self.lldp_event.clear()
 
             now = time.time()
-            timeout = None
-            ports_now = []
-            ports = []
-            for (key, data) in self.ports.items():
-                if data.timestamp is None:
-                    ports_now.append(key)
-                    continue
-
-                expire = data.timestamp + self.LLDP_SEND_PERIOD_PER_PORT
-                if expire <= now:
-                    ports.append(key)
-                    continue
-
-                timeout = expire - now
-                break
-
-            for port in ports_now:
-                self.send_lldp_packet(port)
-            for port in ports:
+            for port in self.ports.expired(now):
+                port_data = self.ports.get_port(port)
+                if not port_data.paced and not port_data.is_down:
+                    # don't burst
+                    delay = self._lldp_pacer(port.dpid).reserve(now)
+                    if delay > 0:
+                        self.ports.defer(port, now + delay)
+                        continue
                 self.send_lldp_packet(port)
-                hub.sleep(self.LLDP_SEND_GUARD)      # don't burst
 
-            if timeout is not None and ports:
-                timeout = 0     # We have already slept
+            timeout = self.ports.next_timeout(time.time())
             # LOG.debug('lldp sleep %s', timeout)
             self.lldp_event.wait(timeout=timeout)
 
@@ -959,15 +1088,15 @@ class Switches(app_manager.RyuApp):
 
             now = time.time()
             deleted = []
-            for (link, timestamp) in self.links.items():
-                # LOG.debug('%s timestamp %d (now %d)', link, timestamp, now)
-                if timestamp + self.LINK_TIMEOUT < now:
-                    src = link.src
-                    if src in self.ports:
-                        port_data = self.ports.get_port(src)
-                        # LOG.debug('port_data %s', port_data)
-                        if port_data.lldp_dropped() > self.LINK_LLDP_DROP:
-                            deleted.append(link)
+            # Only the links not updated for LINK_TIMEOUT are visited.
+            for link in self.links.expired(now):
+                # LOG.debug('%s expired (now %d)', link, now)
+                src = link.src
+                if src in self.ports:
+                    port_data = self.ports.get_port(src)
+                    # LOG.debug('port_data %s', port_data)
+                    if port_data.lldp_dropped() > self.LINK_LLDP_DROP:
+                        deleted.append(link)
 
             for link in deleted:
                 self.links.link_down(link)